@@ -0,0 +1,60 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+"""Transactional outbox tablosu — KR-081.
+
+Amaç: Domain event'lerini iş verisiyle aynı transaction'da event_outbox
+    tablosuna yazmak; OutboxRelay bu tabloyu RabbitMQ'ya aktarır.
+Sorumluluk: Bekleyen kayıtlar için kısmi indeks (relay taraması) ve
+    teslim edilmiş kayıtlar için compaction indeksi.
+
+Revision ID: kr081_outbox
+Revises: kr011_ba
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "kr081_outbox"
+down_revision: Union[str, None] = "kr011_ba"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_outbox",
+        sa.Column("seq", sa.BigInteger(), sa.Identity(always=True), primary_key=True),
+        sa.Column("event_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("event_type", sa.String(100), nullable=False),
+        sa.Column("payload", postgresql.JSONB(), nullable=False),
+        sa.Column("correlation_id", sa.String(64), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.Column("published_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_error", sa.String(500), nullable=True),
+        sa.UniqueConstraint("event_id", name="uq_event_outbox_event_id"),
+    )
+    # Relay taraması: yalnızca bekleyen kayıtlar, seq sırasıyla (FOR UPDATE SKIP LOCKED)
+    op.create_index(
+        "ix_event_outbox_pending",
+        "event_outbox",
+        ["seq"],
+        postgresql_where=sa.text("published_at IS NULL"),
+    )
+    # Compaction: teslim edilmiş kayıtların yaşa göre silinmesi
+    op.create_index(
+        "ix_event_outbox_published_at",
+        "event_outbox",
+        ["published_at"],
+        postgresql_where=sa.text("published_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_event_outbox_published_at", table_name="event_outbox")
+    op.drop_index("ix_event_outbox_pending", table_name="event_outbox")
+    op.drop_table("event_outbox")
@@ -3,10 +3,14 @@
 
 from __future__ import annotations
 
+import uuid
 from dataclasses import dataclass
 from time import perf_counter
 from typing import Any, Protocol
 
+from src.core.domain.events.payment_events import PaymentApproved
+from src.core.ports.messaging.event_outbox import EventOutboxPort
+
 
 @dataclass(frozen=True, slots=True)
 class RequestContext:
@@ -65,6 +69,8 @@ class ApprovePaymentDeps(Protocol):
     contract_validator: ContractValidatorPort
     audit_log: AuditLogPort
     idempotency: IdempotencyPort | None
+    # KR-081: Opsiyonel; None ise event yazılmaz.
+    outbox: EventOutboxPort | None
 
 
 def _require_any_role(ctx: RequestContext, allowed: set[str]) -> None:
@@ -72,6 +78,13 @@ def _require_any_role(ctx: RequestContext, allowed: set[str]) -> None:
         raise PermissionError("forbidden")
 
 
+def _parse_id(value: str, error_code: str) -> uuid.UUID:
+    try:
+        return uuid.UUID(value)
+    except ValueError:
+        raise ValueError(error_code) from None
+
+
 def handle(command: ApprovePaymentCommand, *, ctx: RequestContext, deps: ApprovePaymentDeps) -> ApprovePaymentResult:
     started_at = perf_counter()
     _require_any_role(ctx, {"admin", "ops", "finance"})
@@ -96,6 +109,11 @@ def handle(command: ApprovePaymentCommand, *, ctx: RequestContext, deps: Approve
         },
     )
 
+    # KR-081: Event ID'leri UUID'dir; geçersiz ID onay yan etkisinden önce reddedilir.
+    if deps.outbox is not None:
+        intent_uuid = _parse_id(command.payment_intent_id, "invalid_payment_intent_id")
+        approver_uuid = _parse_id(ctx.actor_id, "invalid_actor_id")
+
     # KR-033: PaymentIntent olmadan paid transition yok.
     intent = deps.payment_service.get_payment_intent(payment_intent_id=command.payment_intent_id)
     if intent is None:
@@ -117,6 +135,13 @@ def handle(command: ApprovePaymentCommand, *, ctx: RequestContext, deps: Approve
         correlation_id=ctx.correlation_id,
     )
 
+    # KR-081: PaymentApproved aynı unit of work içinde outbox'a yazılır; relay broker'a aktarır.
+    if deps.outbox is not None:
+        deps.outbox.collect(
+            PaymentApproved(payment_intent_id=intent_uuid, approved_by=approver_uuid),
+            correlation_id=ctx.correlation_id,
+        )
+
     deps.audit_log.log(
         action="approve_payment",
         correlation_id=ctx.correlation_id,
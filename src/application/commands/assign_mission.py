@@ -3,9 +3,14 @@
 
 from __future__ import annotations
 
+import uuid
 from dataclasses import dataclass
 from typing import Any, Protocol
 
+from src.core.domain.entities.mission import AssignmentSource
+from src.core.domain.events.mission_events import MissionAssigned
+from src.core.ports.messaging.event_outbox import EventOutboxPort
+
 
 @dataclass(frozen=True, slots=True)
 class RequestContext:
@@ -30,6 +35,7 @@ class AssignMissionResult:
 
 
 class MissionServicePort(Protocol):
+    # Dönen kayıt (dict veya Mission entity'si) field_id ve assignment_source taşır (MissionAssigned gövdesi).
     def assign_mission(self, *, mission_id: str, pilot_id: str, correlation_id: str) -> dict[str, Any]: ...
 
 
@@ -51,12 +57,21 @@ class ContractValidatorPort(Protocol):
     def validate(self, *, schema_key: str, payload: dict[str, Any]) -> None: ...
 
 
+class AvailabilityCachePort(Protocol):
+    """Pilot müsaitlik önbelleği (PilotCapacityAvailabilityReader)."""
+
+    def invalidate(self, pilot_id: str | None = None) -> None: ...
+
+
 class AssignMissionDeps(Protocol):
     mission_service: MissionServicePort
     planning_capacity: PlanningCapacityPort
     contract_validator: ContractValidatorPort
     audit_log: AuditLogPort
     idempotency: IdempotencyPort | None
+    # KR-081: Opsiyonel; None ise event yazılmaz.
+    outbox: EventOutboxPort | None
+    availability_cache: AvailabilityCachePort | None
 
 
 def _require_role(ctx: RequestContext) -> None:
@@ -64,6 +79,19 @@ def _require_role(ctx: RequestContext) -> None:
         raise PermissionError("forbidden")
 
 
+def _parse_id(value: str, error_code: str) -> uuid.UUID:
+    try:
+        return uuid.UUID(value)
+    except ValueError:
+        raise ValueError(error_code) from None
+
+
+def _assigned_value(assigned: Any, name: str) -> Any:
+    # MissionServicePort dict döner; MissionService ise Mission entity'si döner.
+    value = assigned.get(name) if isinstance(assigned, dict) else getattr(assigned, name, None)
+    return getattr(value, "value", value)
+
+
 def handle(command: AssignMissionCommand, *, ctx: RequestContext, deps: AssignMissionDeps) -> AssignMissionResult:
     _require_role(ctx)
 
@@ -83,6 +111,11 @@ def handle(command: AssignMissionCommand, *, ctx: RequestContext, deps: AssignMi
         payload={"mission_id": command.mission_id, "pilot_id": command.pilot_id},
     )
 
+    # KR-081: Event ID'leri UUID'dir; geçersiz ID atama yan etkisinden önce reddedilir.
+    if deps.outbox is not None:
+        mission_uuid = _parse_id(command.mission_id, "invalid_mission_id")
+        pilot_uuid = _parse_id(command.pilot_id, "invalid_pilot_id")
+
     # KR-015: atama öncesi kapasite/planning uygunluğu servis üzerinden doğrulanır.
     deps.planning_capacity.ensure_assignment_allowed(pilot_id=command.pilot_id, mission_id=command.mission_id)
 
@@ -92,6 +125,30 @@ def handle(command: AssignMissionCommand, *, ctx: RequestContext, deps: AssignMi
         correlation_id=ctx.correlation_id,
     )
 
+    # KR-081: MissionAssigned aynı unit of work içinde outbox'a yazılır; relay broker'a aktarır.
+    # Gövde event.to_dict() ile tam serileştirilir; consumer'lar field_id/assignment_source'u kaybetmez.
+    # Hata transaction'ı geri alır (atama da yazılmaz).
+    if deps.outbox is not None:
+        field_id = _assigned_value(assigned, "field_id")
+        if field_id is None:
+            raise ValueError("mission_field_id_missing")
+        deps.outbox.collect(
+            MissionAssigned(
+                mission_id=mission_uuid,
+                pilot_id=pilot_uuid,
+                field_id=_parse_id(str(field_id), "invalid_field_id"),
+                # Operatör ataması PULL değildir; servis kaynağı bildirmezse sistem ataması sayılır.
+                assignment_source=str(
+                    _assigned_value(assigned, "assignment_source") or AssignmentSource.SYSTEM_SEED.value
+                ),
+            ),
+            correlation_id=ctx.correlation_id,
+        )
+
+    # KR-015: yeni atama pilotun kalan kapasitesini düşürür.
+    if deps.availability_cache is not None:
+        deps.availability_cache.invalidate(command.pilot_id)
+
     deps.audit_log.log(
         action="assign_mission",
         correlation_id=ctx.correlation_id,
@@ -105,13 +162,13 @@ def handle(command: AssignMissionCommand, *, ctx: RequestContext, deps: AssignMi
             value={
                 "mission_id": command.mission_id,
                 "pilot_id": command.pilot_id,
-                "status": assigned.get("status", "assigned"),
+                "status": _assigned_value(assigned, "status") or "assigned",
             },
         )
 
     return AssignMissionResult(
         mission_id=command.mission_id,
         pilot_id=command.pilot_id,
-        status=str(assigned.get("status", "assigned")),
+        status=str(_assigned_value(assigned, "status") or "assigned"),
         correlation_id=ctx.correlation_id,
     )
@@ -46,10 +46,17 @@ class IdempotencyPort(Protocol):
     def set(self, *, key: str, value: dict[str, Any]) -> None: ...
 
 
+class AvailabilityCachePort(Protocol):
+    """Pilot müsaitlik önbelleği (PilotCapacityAvailabilityReader)."""
+
+    def invalidate(self, pilot_id: str | None = None) -> None: ...
+
+
 class UpdatePilotCapacityDeps(Protocol):
     planning_capacity: PlanningCapacityPort
     audit_log: AuditLogPort
     idempotency: IdempotencyPort | None
+    availability_cache: AvailabilityCachePort | None
 
 
 def handle(
@@ -85,6 +92,9 @@ def handle(
         work_days=command.work_days,
         daily_capacity=command.daily_capacity,
     )
+    # KR-015: kapasite değişti; pilotun önbelleklenmiş slotları geçersiz.
+    if deps.availability_cache is not None:
+        deps.availability_cache.invalidate(command.pilot_id)
 
     deps.audit_log.log(
         action="update_pilot_capacity",
@@ -0,0 +1,42 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-016: Field spatial index is kept in sync with field lifecycle events.
+"""Application handler that keeps the field spatial index up to date."""
+
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+from typing import Protocol
+
+from src.core.domain.entities.field import Field
+from src.core.domain.events.field_events import FieldCreated, FieldDeleted, FieldUpdated
+from src.core.ports.repositories.field_spatial_index import FieldSpatialIndex
+
+
+class FieldReader(Protocol):
+    """Port to load the current field state (geometry included)."""
+
+    async def find_by_id(self, field_id: uuid.UUID) -> Field | None: ...
+
+
+@dataclass(slots=True)
+class FieldSpatialIndexHandler:
+    """Applies FieldCreated/FieldUpdated/FieldDeleted to the spatial index.
+
+    Events carry only ids, so the current geometry is re-read from the
+    repository; a field that no longer exists is removed from the index.
+    """
+
+    field_reader: FieldReader
+    spatial_index: FieldSpatialIndex
+
+    async def handle(self, event: FieldCreated | FieldUpdated | FieldDeleted) -> None:
+        if isinstance(event, FieldDeleted):
+            await self.spatial_index.remove_field(event.field_id)
+            return
+
+        field = await self.field_reader.find_by_id(event.field_id)
+        if field is None:
+            await self.spatial_index.remove_field(event.field_id)
+            return
+        await self.spatial_index.upsert_field(field)
@@ -1,4 +1,5 @@
 # BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-015: Weekly planning job orchestration (single run and per-province shards).
 """Weekly planning application job orchestrator."""
 
 from __future__ import annotations
@@ -7,6 +8,8 @@ from dataclasses import dataclass
 from datetime import date
 from typing import Protocol
 
+from src.application.services.province_shard_planner import ShardedScheduleResult
+
 
 class WeeklyPlanner(Protocol):
     """Port to compute and persist weekly schedule."""
@@ -14,6 +17,18 @@ class WeeklyPlanner(Protocol):
     async def plan_week(self, *, week_start: date, correlation_id: str) -> int: ...
 
 
+class ShardedWeeklyPlanner(Protocol):
+    """Port to compute and persist weekly schedule in per-province shards."""
+
+    async def plan_week_sharded(
+        self,
+        *,
+        week_start: date,
+        correlation_id: str,
+        max_workers: int,
+    ) -> ShardedScheduleResult: ...
+
+
 class AuditWriter(Protocol):
     """Port to append planning audit entries."""
 
@@ -46,3 +61,53 @@ class WeeklyPlanningJob:
             affected_count=planned_count,
         )
         return planned_count
+
+
+class ShardAuditWriter(AuditWriter, Protocol):
+    """Port to append per-shard planning audit entries."""
+
+    async def append_shard_log(
+        self,
+        *,
+        correlation_id: str,
+        province_code: str,
+        demand_count: int,
+        scheduled_count: int,
+        unscheduled_count: int,
+        elapsed_ms: float,
+    ) -> None: ...
+
+
+@dataclass(slots=True)
+class ShardedWeeklyPlanningJob:
+    """Runs weekly planning in province shards and logs per-shard timing/counts."""
+
+    planner: ShardedWeeklyPlanner
+    audit_writer: ShardAuditWriter
+    max_workers: int = 1
+
+    # KR-015: provinces are independent (pilot province must match field province).
+    async def run(self, *, week_start: date, correlation_id: str) -> int:
+        outcome = await self.planner.plan_week_sharded(
+            week_start=week_start,
+            correlation_id=correlation_id,
+            max_workers=self.max_workers,
+        )
+
+        for shard in outcome.shards:
+            await self.audit_writer.append_shard_log(
+                correlation_id=correlation_id,
+                province_code=shard.province_code,
+                demand_count=shard.demand_count,
+                scheduled_count=shard.scheduled_count,
+                unscheduled_count=shard.unscheduled_count,
+                elapsed_ms=shard.elapsed_ms,
+            )
+
+        planned_count = len(outcome.result.scheduled)
+        await self.audit_writer.append_job_log(
+            correlation_id=correlation_id,
+            outcome="SUCCESS",
+            affected_count=planned_count,
+        )
+        return planned_count
@@ -13,10 +13,18 @@ Notlar/SSOT: Contract-first (KR-081) ve kritik kapılar (KR-018/KR-033/KR-015) a
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+import uuid
+from dataclasses import dataclass, field
 from datetime import date
 from typing import Protocol
 
+from src.core.domain.services.capacity_manager import (
+    CapacityManager,
+    PilotAssignment,
+    PilotCapacity,
+)
+
 
 class QueryAuthzError(PermissionError):
     pass
@@ -58,6 +66,83 @@ class PilotAvailabilityReadPort(Protocol):
     ) -> list[PilotAvailableSlot]: ...
 
 
+class PilotCapacitySourcePort(Protocol):
+    async def get_pilot_capacity(self, *, pilot_id: uuid.UUID) -> PilotCapacity | None: ...
+
+    async def list_assignments(
+        self,
+        *,
+        pilot_id: uuid.UUID,
+        start_date: date,
+        end_date: date,
+    ) -> list[PilotAssignment]: ...
+
+
+@dataclass(slots=True)
+class PilotCapacityAvailabilityReader:
+    """PilotAvailabilityReadPort: tek pilotun kapasitesi ve atamalarıyla slot üretir.
+
+    KR-015: Yalnızca sorgulanan pilot okunur; slotlar CapacityManager.fleet_capacity
+    ile tek geçişte hesaplanır. Sonuç (pilot, pencere) başına ttl_s boyunca tutulur;
+    kapasite veya atama değiştiren komutlar invalidate(pilot_id) çağırır
+    (update_pilot_capacity, assign_mission).
+    """
+
+    source: PilotCapacitySourcePort
+    capacity_manager: CapacityManager = field(default_factory=CapacityManager)
+    ttl_s: float = 30.0
+    max_entries: int = 1024
+    _slots: dict[tuple[uuid.UUID, date, date], tuple[float, tuple[PilotAvailableSlot, ...]]] = field(
+        default_factory=dict
+    )
+
+    async def list_available_slots(
+        self,
+        *,
+        pilot_id: str,
+        start_date: date,
+        end_date: date,
+    ) -> list[PilotAvailableSlot]:
+        try:
+            pid = uuid.UUID(pilot_id)
+        except ValueError:
+            return []
+
+        key = (pid, start_date, end_date)
+        now = time.monotonic()
+        cached = self._slots.get(key)
+        if cached is not None and now - cached[0] < self.ttl_s:
+            return list(cached[1])
+
+        pilot = await self.source.get_pilot_capacity(pilot_id=pid)
+        if pilot is None:
+            return []
+        assignments = await self.source.list_assignments(pilot_id=pid, start_date=start_date, end_date=end_date)
+        report = self.capacity_manager.fleet_capacity([pilot], start_date, end_date, assignments)
+        slots = tuple(
+            PilotAvailableSlot(date=slot.date, remaining_capacity=slot.remaining_capacity)
+            for slot in report.available_slots(pid)
+        )
+
+        self._slots.pop(key, None)
+        if len(self._slots) >= self.max_entries:
+            self._slots.pop(next(iter(self._slots)))
+        self._slots[key] = (now, slots)
+        return list(slots)
+
+    def invalidate(self, pilot_id: str | None = None) -> None:
+        """Pilotun (None ise tüm pilotların) önbelleklenmiş slotlarını düşürür."""
+        if pilot_id is None:
+            self._slots.clear()
+            return
+        try:
+            pid = uuid.UUID(pilot_id)
+        except ValueError:
+            return
+        for key in [key for key in self._slots if key[0] == pid]:
+            del self._slots[key]
+
+
 class AuthorizerPort(Protocol):
     async def can_view_pilot_slots(self, actor_user_id: str, pilot_id: str) -> bool: ...
 
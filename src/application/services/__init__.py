@@ -20,6 +20,7 @@ from .mission_lifecycle_manager import MissionLifecycleManager
 from .mission_service import MissionOrchestrationService, MissionService
 from .planning_capacity import PlanningCapacityService
 from .pricebook_service import PricebookService
+from .province_shard_planner import ProvinceShardPlanner, ShardedScheduleResult, ShardReport
 from .qc_gate_service import QcGateService
 from .reassignment_handler import ReassignmentHandler
 from .subscription_scheduler import SeasonSlotBuilder, SubscriptionScheduler
@@ -41,6 +42,9 @@ __all__ = [
     "MissionService",
     "PlanningCapacityService",
     "PricebookService",
+    "ProvinceShardPlanner",
+    "ShardedScheduleResult",
+    "ShardReport",
     "QcGateService",
     "ReassignmentHandler",
     "SeasonSlotBuilder",
@@ -0,0 +1,156 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-015: Weekly planning is sharded per province; pilot/field province match keeps shards independent.
+"""
+Amaç: Haftalık planlamayı il bazında parçalayıp süreç havuzunda paralel çalıştırmak.
+Sorumluluk: Talep/slot bölme, shard yürütme (ProcessPoolExecutor), deterministik birleştirme.
+Girdi/Çıktı (Contract/DTO/Event): Girdi: MissionDemand/PilotSlot listeleri. Çıktı: ShardedScheduleResult.
+Güvenlik (RBAC/PII/Audit): PII taşımaz; shard raporları job log'una yazılır.
+Hata Modları (idempotency/retry/rate limit): Shard hatası tüm koşuyu düşürür (kısmi plan yayınlanmaz).
+Observability (log fields/metrics/traces): Shard başına il kodu, talep/planlanan/planlanamayan sayısı, süre (ms).
+Testler: Unit (tek süreç ve çok süreç sonucu tek parça plan ile aynı).
+Bağımlılıklar: Domain planlama motorları + standart kütüphane.
+Notlar/SSOT: Pilot province_code tarla ile eşleşmek zorunda olduğundan iller arası ortak durum yoktur.
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from src.core.domain.services.optimal_planning_engine import OptimalPlanningEngine
+from src.core.domain.services.planning_engine import MissionDemand, PilotSlot, PlanningEngine, ScheduleResult
+
+PLANNING_ENGINES = ("greedy", "indexed", "optimal")
+
+
+@dataclass(frozen=True, slots=True)
+class ShardReport:
+    province_code: str
+    demand_count: int
+    slot_count: int
+    scheduled_count: int
+    unscheduled_count: int
+    elapsed_ms: float
+
+
+@dataclass(frozen=True, slots=True)
+class ShardedScheduleResult:
+    result: ScheduleResult
+    shards: tuple[ShardReport, ...]
+
+
+def _plan_shard(
+    engine: str,
+    province_code: str,
+    demands: list[MissionDemand],
+    slots: list[PilotSlot],
+) -> tuple[str, ScheduleResult, float]:
+    # Süreç havuzunda çalışır; modül seviyesinde ve picklable kalmalıdır.
+    started = time.perf_counter()
+    if engine == "optimal":
+        result = OptimalPlanningEngine().optimize_schedule(demands, slots)
+    elif engine == "indexed":
+        result = PlanningEngine().optimize_schedule_indexed(demands, slots)
+    else:
+        result = PlanningEngine().optimize_schedule(demands, slots)
+    return province_code, result, (time.perf_counter() - started) * 1000.0
+
+
+@dataclass(slots=True)
+class ProvinceShardPlanner:
+    """İl bazlı shard'larla PlanningEngine koşusu.
+
+    ``max_workers`` 1 ise shard'lar aynı süreçte sırayla çalışır. Birleştirilmiş
+    sonuç tek parça koşu ile aynı sıradadır: planlanan/planlanamayan talepler
+    (öncelik, girdi sırası) ile sıralanır, kullanım oranı tüm slotlar
+    üzerinden yeniden hesaplanır.
+    """
+
+    max_workers: int = 1
+    engine: str = "indexed"
+
+    def __post_init__(self) -> None:
+        if self.max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        if self.engine not in PLANNING_ENGINES:
+            raise ValueError(f"engine must be one of {PLANNING_ENGINES}")
+
+    def plan(self, demands: list[MissionDemand], pilot_slots: list[PilotSlot]) -> ShardedScheduleResult:
+        shard_demands: dict[str, list[MissionDemand]] = {}
+        shard_slots: dict[str, list[PilotSlot]] = {}
+        for demand in demands:
+            shard_demands.setdefault(demand.province_code, []).append(demand)
+        for slot in pilot_slots:
+            shard_slots.setdefault(slot.province_code, []).append(slot)
+
+        # Talebi olmayan il shard'ı çalıştırılmaz; slotları yalnızca kullanım oranına girer.
+        provinces = sorted(shard_demands)
+        outputs: dict[str, tuple[ScheduleResult, float]] = {}
+
+        if self.max_workers == 1 or len(provinces) <= 1:
+            for province in provinces:
+                _, result, elapsed_ms = _plan_shard(
+                    self.engine, province, shard_demands[province], shard_slots.get(province, [])
+                )
+                outputs[province] = (result, elapsed_ms)
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, len(provinces))) as pool:
+                futures = [
+                    pool.submit(
+                        _plan_shard, self.engine, province, shard_demands[province], shard_slots.get(province, [])
+                    )
+                    for province in provinces
+                ]
+                for future in futures:
+                    province, result, elapsed_ms = future.result()
+                    outputs[province] = (result, elapsed_ms)
+
+        reports = tuple(
+            ShardReport(
+                province_code=province,
+                demand_count=len(shard_demands[province]),
+                slot_count=len(shard_slots.get(province, [])),
+                scheduled_count=len(outputs[province][0].scheduled),
+                unscheduled_count=len(outputs[province][0].unscheduled),
+                elapsed_ms=outputs[province][1],
+            )
+            for province in provinces
+        )
+        return ShardedScheduleResult(
+            result=self._merge(demands, pilot_slots, [outputs[p][0] for p in provinces]),
+            shards=reports,
+        )
+
+    @staticmethod
+    def _merge(
+        demands: list[MissionDemand],
+        pilot_slots: list[PilotSlot],
+        results: list[ScheduleResult],
+    ) -> ScheduleResult:
+        # Tek parça koşudaki stable sıralama: (öncelik, girdi sırası)
+        order = {d.demand_id: (d.priority, index) for index, d in enumerate(demands)}
+
+        scheduled = sorted((s for r in results for s in r.scheduled), key=lambda s: order[s.demand_id])
+        unscheduled_with_warnings = sorted(
+            (pair for r in results for pair in zip(r.unscheduled, r.warnings, strict=False)),
+            key=lambda pair: order[pair[0]],
+        )
+        extra_warnings = [w for r in results for w in r.warnings[len(r.unscheduled) :]]
+
+        pilot_total: dict[uuid.UUID, int] = {}
+        for slot in pilot_slots:
+            pilot_total[slot.pilot_id] = pilot_total.get(slot.pilot_id, 0) + slot.daily_capacity
+        pilot_assigned: dict[uuid.UUID, int] = {}
+        for item in scheduled:
+            pilot_assigned[item.pilot_id] = pilot_assigned.get(item.pilot_id, 0) + 1
+
+        return ScheduleResult(
+            scheduled=tuple(scheduled),
+            unscheduled=tuple(demand_id for demand_id, _ in unscheduled_with_warnings),
+            pilot_utilization={
+                pid: pilot_assigned.get(pid, 0) / total for pid, total in pilot_total.items() if total > 0
+            },
+            warnings=tuple(warning for _, warning in unscheduled_with_warnings) + tuple(extra_warnings),
+        )
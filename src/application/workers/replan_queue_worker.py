@@ -4,9 +4,12 @@
 from __future__ import annotations
 
 import time
+from collections import deque
 from dataclasses import dataclass
 from typing import Protocol
 
+from src.core.domain.services.planning_engine import ScheduleDiff
+
 
 @dataclass(frozen=True, slots=True)
 class ReplanTask:
@@ -25,26 +28,65 @@ class QueueClient(Protocol):
 
 
 class MissionReplanner(Protocol):
-    def replan(self, *, mission_id: str, reason: str, correlation_id: str) -> None: ...
+    # Artımlı replan yapan implementasyonlar PlanningEngine.replan_incremental farkını döner.
+    def replan(self, *, mission_id: str, reason: str, correlation_id: str) -> ScheduleDiff | None: ...
+
+
+class ScheduleDiffSink(Protocol):
+    # Yalnızca farktaki mission'lar için atama olayı yayınlar.
+    def apply(self, *, diff: ScheduleDiff, correlation_id: str) -> None: ...
 
 
 class ReplanQueueWorker:
-    def __init__(self, *, queue: QueueClient, replanner: MissionReplanner, queue_name: str = "replan") -> None:
+    def __init__(
+        self,
+        *,
+        queue: QueueClient,
+        replanner: MissionReplanner,
+        queue_name: str = "replan",
+        diff_sink: ScheduleDiffSink | None = None,
+    ) -> None:
         self._queue = queue
         self._replanner = replanner
         self._queue_name = queue_name
+        self._diff_sink = diff_sink
+        # Ack'lenmiş replan'ların teslim edilemeyen farkları; sırayla yeniden denenir.
+        self._pending_diffs: deque[tuple[ScheduleDiff, str]] = deque()
+
+    @property
+    def pending_diff_count(self) -> int:
+        return len(self._pending_diffs)
 
     def run_once(self) -> bool:
+        self._deliver_pending_diffs()
         task = self._queue.pop(self._queue_name)
         if task is None:
             return False
         try:
-            self._replanner.replan(mission_id=task.mission_id, reason=task.reason, correlation_id=task.correlation_id)
+            diff = self._replanner.replan(
+                mission_id=task.mission_id, reason=task.reason, correlation_id=task.correlation_id
+            )
             self._queue.ack(self._queue_name, task.task_id)
-            return True
         except Exception:
             self._queue.nack(self._queue_name, task.task_id, requeue=True)
             return True
+        # Replan kalıcılaştı ve ack'lendi: teslim hatası görevi yeniden kuyruğa almaz,
+        # yalnızca fark teslimi sonraki turda tekrar denenir.
+        if diff is not None and not diff.is_empty and self._diff_sink is not None:
+            self._pending_diffs.append((diff, task.correlation_id))
+            self._deliver_pending_diffs()
+        return True
+
+    def _deliver_pending_diffs(self) -> None:
+        if self._diff_sink is None:
+            return
+        while self._pending_diffs:
+            diff, correlation_id = self._pending_diffs[0]
+            try:
+                self._diff_sink.apply(diff=diff, correlation_id=correlation_id)
+            except Exception:
+                return
+            self._pending_diffs.popleft()
 
     def run_forever(self, *, poll_interval_s: float = 1.0) -> None:
         while True:
@@ -1,3 +1,5 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: Domain event sınıfları ve event_type registry'si.
 # PATH: src/core/domain/events/__init__.py
 # DESC: Domain events module: __init__.py.
 
@@ -56,10 +58,14 @@ from src.core.domain.events.training_feedback_events import (
     TrainingFeedbackRejected,
     TrainingFeedbackSubmitted,
 )
+from src.core.domain.events.registry import EventRegistry, build_default_registry
 
 __all__: list[str] = [
     # Base
     "DomainEvent",
+    # Registry (KR-081)
+    "EventRegistry",
+    "build_default_registry",
     # Analysis (KR-017, KR-018)
     "AnalysisRequested",
     "AnalysisStarted",
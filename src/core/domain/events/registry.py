@@ -0,0 +1,154 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: event_type -> somut DomainEvent sınıfı eşlemesi ve tipli yeniden oluşturma.
+# PATH: src/core/domain/events/registry.py
+# DESC: Event tipi registry'si; to_dict() gövdesinden immutable event nesnesi üretir.
+
+from __future__ import annotations
+
+import dataclasses
+import types
+import typing
+import uuid
+from datetime import date, datetime
+from typing import Any, Callable, Iterable, Optional
+
+from src.core.domain.events import (
+    analysis_events,
+    expert_events,
+    expert_review_events,
+    field_events,
+    mission_events,
+    payment_events,
+    subscription_events,
+    training_feedback_events,
+)
+from src.core.domain.events.base import DomainEvent
+
+FieldDecoder = Callable[[Any], Any]
+# (alan adı, decoder, zorunlu mu)
+FieldSpec = tuple[str, FieldDecoder, bool]
+
+_EVENT_MODULES = (
+    analysis_events,
+    expert_events,
+    expert_review_events,
+    field_events,
+    mission_events,
+    payment_events,
+    subscription_events,
+    training_feedback_events,
+)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _decoder_for(annotation: Any) -> FieldDecoder:
+    """Alan tip ipucundan JSON değerini alan tipine çeviren fonksiyon üretir.
+
+    to_dict() karşılıkları: UUID/date/datetime -> str, tuple -> list.
+    """
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union or origin is types.UnionType:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        inner = _decoder_for(args[0]) if len(args) == 1 else _identity
+        return lambda value: None if value is None else inner(value)
+    if annotation is uuid.UUID:
+        return lambda value: value if isinstance(value, uuid.UUID) else uuid.UUID(value)
+    if annotation is datetime:
+        return lambda value: value if isinstance(value, datetime) else datetime.fromisoformat(value)
+    if annotation is date:
+        return lambda value: value if isinstance(value, date) else date.fromisoformat(value)
+    if annotation is float:
+        return float
+    if origin is tuple:
+        return tuple
+    if origin is list:
+        return list
+    return _identity
+
+
+class EventRegistry:
+    """event_type (sınıf adı) -> DomainEvent alt sınıfı registry'si.
+
+    Alan decoder'ları sınıf başına ilk kullanımda bir kez hesaplanır ve
+    cache'lenir; sonraki decode çağrıları tip çözümlemesi yapmaz.
+    """
+
+    def __init__(self, event_classes: Iterable[type[DomainEvent]] = ()) -> None:
+        self._classes: dict[str, type[DomainEvent]] = {}
+        self._decoders: dict[type[DomainEvent], tuple[FieldSpec, ...]] = {}
+        for event_class in event_classes:
+            self.register(event_class)
+
+    def register(self, event_class: type[DomainEvent]) -> type[DomainEvent]:
+        """Sınıfı adıyla kaydeder (decorator olarak da kullanılabilir)."""
+        existing = self._classes.get(event_class.__name__)
+        if existing is not None and existing is not event_class:
+            raise ValueError(f"event_type already registered: {event_class.__name__}")
+        self._classes[event_class.__name__] = event_class
+        return event_class
+
+    def __contains__(self, event_type: object) -> bool:
+        return event_type in self._classes
+
+    def __len__(self) -> int:
+        return len(self._classes)
+
+    def get(self, event_type: str) -> Optional[type[DomainEvent]]:
+        return self._classes.get(event_type)
+
+    def decode(self, body: dict[str, Any]) -> DomainEvent:
+        """to_dict() gövdesinden immutable event nesnesi oluşturur.
+
+        Bilinmeyen event_type için yalnızca zarf alanlarını (event_id,
+        occurred_at) taşıyan taban DomainEvent döner. Yalnızca sabit varsayılanı
+        olan alanlar (ör. ``assignment_source: str = ""``) gövdede olmadığında
+        varsayılanı alır; default_factory alanları (ID'ler, occurred_at) zorunludur,
+        aksi halde rastgele bir uuid4 sessizce gerçek kimliğin yerine geçerdi.
+        Bilinmeyen anahtarlar yok sayılır.
+
+        Raises:
+            ValueError: Zorunlu alan eksikse veya alan değeri tipine
+                çevrilemezse (ör. geçersiz UUID).
+        """
+        event_class = self._classes.get(body.get("event_type", ""), DomainEvent)
+        specs = self._decoders.get(event_class)
+        if specs is None:
+            specs = self._build_decoders(event_class)
+        kwargs: dict[str, Any] = {}
+        missing: list[str] = []
+        for name, decode, required in specs:
+            if name in body:
+                kwargs[name] = decode(body[name])
+            elif required:
+                missing.append(name)
+        if missing:
+            raise ValueError(f"{event_class.__name__} missing required fields: {', '.join(missing)}")
+        return event_class(**kwargs)
+
+    def _build_decoders(self, event_class: type[DomainEvent]) -> tuple[FieldSpec, ...]:
+        hints = typing.get_type_hints(event_class)
+        specs = tuple(
+            (f.name, _decoder_for(hints[f.name]), f.default is dataclasses.MISSING)
+            for f in dataclasses.fields(event_class)
+            if f.init
+        )
+        self._decoders[event_class] = specs
+        return specs
+
+
+def _discover(modules: Iterable[types.ModuleType]) -> list[type[DomainEvent]]:
+    discovered: list[type[DomainEvent]] = []
+    for module in modules:
+        for obj in vars(module).values():
+            # Yalnızca modülün kendi tanımladığı somut event sınıfları (import edilenler değil)
+            if isinstance(obj, type) and issubclass(obj, DomainEvent) and obj.__module__ == module.__name__:
+                discovered.append(obj)
+    return discovered
+
+
+def build_default_registry() -> EventRegistry:
+    """src/core/domain/events altındaki tüm somut event sınıflarıyla registry oluşturur."""
+    return EventRegistry(_discover(_EVENT_MODULES))
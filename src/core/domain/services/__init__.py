@@ -13,6 +13,7 @@ from src.core.domain.services.capacity_manager import (
     CapacityCheckResult,
     CapacityError,
     CapacityManager,
+    FleetCapacityReport,
     PilotAssignment,
     PilotCapacity,
 )
@@ -26,6 +27,7 @@ from src.core.domain.services.confidence_evaluator import (
 from src.core.domain.services.coverage_calculator import (
     CoverageCalculationError,
     CoverageCalculator,
+    CoverageMeasurement,
     CoverageResult,
     Polygon,
 )
@@ -44,11 +46,15 @@ from src.core.domain.services.mission_planner import (
     MissionRequest,
     PlannedMission,
 )
+from src.core.domain.services.optimal_planning_engine import OptimalPlanningEngine
 from src.core.domain.services.planning_engine import (
     MissionDemand,
     PilotSlot,
     PlanningEngine,
     PlanningEngineError,
+    ReplanResult,
+    ScheduleDelta,
+    ScheduleDiff,
     ScheduleResult,
     ScheduledSlot,
 )
@@ -100,6 +106,7 @@ from src.core.domain.services.band_compliance_checker import (
 from src.core.domain.services.plan_window_segmenter import (
     MissionSegment,
     PlanWindowSegmenter,
+    SpatialSegment,
 )
 from src.core.domain.services.reschedule_service import (
     RescheduleService,
@@ -126,6 +133,7 @@ __all__: list[str] = [
     "CapacityManager",
     "CapacityCheckResult",
     "CapacityError",
+    "FleetCapacityReport",
     "PilotCapacity",
     "PilotAssignment",
     "AvailabilitySlot",
@@ -138,6 +146,7 @@ __all__: list[str] = [
     # Coverage Calculator (KR-016)
     "CoverageCalculator",
     "CoverageResult",
+    "CoverageMeasurement",
     "CoverageCalculationError",
     "Polygon",
     # Expert Assignment Service (KR-019)
@@ -160,6 +169,10 @@ __all__: list[str] = [
     "ScheduledSlot",
     "MissionDemand",
     "PilotSlot",
+    "ScheduleDelta",
+    "ScheduleDiff",
+    "ReplanResult",
+    "OptimalPlanningEngine",
     # Pricebook Calculator (KR-022)
     "PricebookCalculator",
     "PricebookError",
@@ -200,6 +213,7 @@ __all__: list[str] = [
     # Plan Window Segmenter (KR-015)
     "PlanWindowSegmenter",
     "MissionSegment",
+    "SpatialSegment",
     # Reschedule Service (KR-015)
     "RescheduleService",
     "DomainRescheduleResult",
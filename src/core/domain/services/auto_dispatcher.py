@@ -6,10 +6,12 @@ Amaç: Yaklaşan mission'ları pilotlara kural bazlı atamak.
 
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
-from typing import List, Optional, Protocol, Sequence
+from typing import Dict, List, Mapping, Optional, Protocol, Sequence, Tuple
 
 from ..value_objects.assignment_policy import AssignmentPolicy, AssignmentSource, AssignmentReason
+from ..value_objects.crop_ops_profile import CropOpsProfile
 
 
 class MissionLike(Protocol):
@@ -64,3 +66,73 @@ class AutoDispatcher:
                 )
             )
         return decisions
+
+    def dispatch_balanced(
+        self,
+        missions: Sequence[MissionLike],
+        pilots: Sequence[PilotLike],
+        capacity_profile: CropOpsProfile,
+        existing_load_donum: Optional[Mapping[Tuple[str, str], int]] = None,
+    ) -> List[DispatchDecision]:
+        """Yük dengeli ve kapasite kontrollü atama (KR-015-1, KR-015-2).
+
+        Her (bölge, gün) için pilotlar (günlük yük, -güvenilirlik) anahtarlı
+        bir heap'te tutulur; her mission en az yüklü pilota, eşitlikte en
+        güvenilir pilota gider. Atamalar SYSTEM_SEED olduğundan pilotun
+        günlük sınırı ``capacity_profile.system_seed_quota`` dönümdür; en az
+        yüklü pilot da sığmıyorsa mission atanmaz. Maliyet
+        O(mission log pilot + bölge-gün x pilot).
+
+        Args:
+            missions: Atanacak mission'lar.
+            pilots: Aday pilotlar.
+            capacity_profile: Günlük dönüm kapasitesi profili.
+            existing_load_donum: (pilot_id, scheduled_date) -> mevcut yük (dönüm).
+
+        Returns:
+            Atama kararları (atanamayan mission'lar dahil edilmez).
+        """
+        existing = existing_load_donum or {}
+        quota = capacity_profile.system_seed_quota
+
+        pilots_by_territory: Dict[str, List[PilotLike]] = {}
+        for p in pilots:
+            pilots_by_territory.setdefault(p.territory_id, []).append(p)
+
+        # (bölge, gün) -> heap[(yük, -güvenilirlik, sıra, pilot)]
+        heaps: Dict[Tuple[str, str], List[Tuple[int, float, int, str]]] = {}
+        decisions: List[DispatchDecision] = []
+
+        for m in missions:
+            key = (m.territory_id, m.scheduled_date)
+            heap = heaps.get(key)
+            if heap is None:
+                heap = [
+                    (
+                        existing.get((p.id, m.scheduled_date), 0),
+                        -getattr(p, "reliability_score", 0.0),
+                        order,
+                        p.id,
+                    )
+                    for order, p in enumerate(pilots_by_territory.get(m.territory_id, []))
+                ]
+                heapq.heapify(heap)
+                heaps[key] = heap
+            if not heap:
+                continue
+
+            load, neg_reliability, order, pilot_id = heap[0]
+            if load + m.area_donum > quota:
+                continue
+            heapq.heapreplace(heap, (load + m.area_donum, neg_reliability, order, pilot_id))
+            decisions.append(
+                DispatchDecision(
+                    mission_id=m.id,
+                    pilot_id=pilot_id,
+                    policy=AssignmentPolicy(
+                        source=AssignmentSource.SYSTEM_SEED,
+                        reason=AssignmentReason.AUTO_DISPATCH,
+                    ),
+                )
+            )
+        return decisions
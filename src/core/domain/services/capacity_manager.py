@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import uuid
+from collections import Counter
 from dataclasses import dataclass
 from datetime import date, timedelta
 
@@ -54,6 +55,40 @@ class CapacityCheckResult:
     reason: str = ""
 
 
+@dataclass(frozen=True)
+class FleetCapacityReport:
+    """Filo geneli kapasite raporu (tarih aralığı için tek geçişte üretilir)."""
+
+    start_date: date
+    end_date: date
+    remaining: dict[uuid.UUID, tuple[int, ...]]  # pilot_id -> gün sırasıyla kalan kapasite (çalışma dışı gün = 0)
+    utilization: dict[uuid.UUID, float]  # pilot_id -> kullanım oranı (0.0 - 1.0)
+
+    def remaining_capacity(self, pilot_id: uuid.UUID, day: date) -> int:
+        """Pilotun ilgili gündeki kalan kapasitesi; aralık dışı veya bilinmeyen pilot için 0."""
+        if not self.start_date <= day <= self.end_date:
+            return 0
+        days = self.remaining.get(pilot_id)
+        if days is None:
+            return 0
+        return days[(day - self.start_date).days]
+
+    def is_available(self, pilot_id: uuid.UUID, day: date) -> bool:
+        return self.remaining_capacity(pilot_id, day) > 0
+
+    def available_slots(self, pilot_id: uuid.UUID) -> list[AvailabilitySlot]:
+        """Pilotun aralıktaki müsait slotları (``find_available_slots`` ile aynı sonuç)."""
+        return [
+            AvailabilitySlot(
+                pilot_id=pilot_id,
+                date=self.start_date + timedelta(days=offset),
+                remaining_capacity=remaining,
+            )
+            for offset, remaining in enumerate(self.remaining.get(pilot_id, ()))
+            if remaining > 0
+        ]
+
+
 class CapacityManager:
     """Pilot kapasite hesaplama ve müsaitlik sorgusu servisi (KR-015-1, KR-015-2).
 
@@ -137,27 +172,12 @@ class CapacityManager:
             Müsait slotların listesi.
 
         Raises:
-            CapacityError: start_date > end_date ise.
+            CapacityError: start_date > end_date veya daily_capacity <= 0 ise.
         """
-        if start_date > end_date:
-            raise CapacityError("start_date, end_date'den sonra olamaz.")
-
-        slots: list[AvailabilitySlot] = []
-        current = start_date
-
-        while current <= end_date:
-            result = self.check_availability(pilot, current, existing_assignments)
-            if result.is_available:
-                slots.append(
-                    AvailabilitySlot(
-                        pilot_id=pilot.pilot_id,
-                        date=current,
-                        remaining_capacity=result.remaining,
-                    )
-                )
-            current += timedelta(days=1)
-
-        return slots
+        report = self.fleet_capacity([pilot], start_date, end_date, existing_assignments)
+        if pilot.daily_capacity <= 0:
+            raise CapacityError(f"Pilot {pilot.pilot_id}: daily_capacity > 0 olmalıdır.")
+        return report.available_slots(pilot.pilot_id)
 
     def calculate_utilization(
         self,
@@ -177,27 +197,75 @@ class CapacityManager:
         Returns:
             Kullanım oranı (0.0 - 1.0).
         """
+        report = self.fleet_capacity([pilot], start_date, end_date, existing_assignments)
+        return report.utilization[pilot.pilot_id]
+
+    def fleet_capacity(
+        self,
+        pilots: list[PilotCapacity],
+        start_date: date,
+        end_date: date,
+        existing_assignments: list[PilotAssignment],
+    ) -> FleetCapacityReport:
+        """Tüm pilotlar için tarih aralığındaki kapasite ve kullanımı tek geçişte hesaplar.
+
+        Atamalar bir kez (pilot_id, tarih) -> yük indeksine toplanır; aralığın
+        hafta günü maskesi bir kez çıkarılır. Böylece maliyet
+        O(atama + pilot x gün) olur; gün başına atama listesi taranmaz.
+
+        Args:
+            pilots: Pilot kapasite bilgileri.
+            start_date: Başlangıç tarihi (dahil).
+            end_date: Bitiş tarihi (dahil).
+            existing_assignments: Mevcut görev atamaları.
+
+        daily_capacity <= 0 olan pilotun kalan kapasitesi her gün 0'dır;
+        kullanım oranı calculate_utilization'ın önceki davranışıyla aynıdır.
+
+        Returns:
+            FleetCapacityReport: Pilot bazında günlük kalan kapasite ve kullanım oranı.
+
+        Raises:
+            CapacityError: start_date > end_date ise.
+        """
         if start_date > end_date:
             raise CapacityError("start_date, end_date'den sonra olamaz.")
 
-        total_capacity = 0
-        total_used = 0
-        current = start_date
+        day_count = (end_date - start_date).days + 1
+        weekdays = [(start_date + timedelta(days=offset)).weekday() for offset in range(day_count)]
+
+        pilot_ids = {pilot.pilot_id for pilot in pilots}
+        loads: Counter[tuple[uuid.UUID, int]] = Counter(
+            (a.pilot_id, (a.scheduled_date - start_date).days)
+            for a in existing_assignments
+            if a.pilot_id in pilot_ids and start_date <= a.scheduled_date <= end_date
+        )
+
+        remaining: dict[uuid.UUID, tuple[int, ...]] = {}
+        utilization: dict[uuid.UUID, float] = {}
 
-        while current <= end_date:
-            weekday = current.weekday()
-            if weekday in pilot.work_days:
-                total_capacity += pilot.daily_capacity
-                day_load = sum(
-                    1 for a in existing_assignments if a.pilot_id == pilot.pilot_id and a.scheduled_date == current
-                )
-                total_used += min(day_load, pilot.daily_capacity)
-            current += timedelta(days=1)
+        for pilot in pilots:
+            cap = pilot.daily_capacity
+            work_mask = [weekday in pilot.work_days for weekday in weekdays]
+            day_loads = [loads.get((pilot.pilot_id, offset), 0) for offset in range(day_count)]
 
-        if total_capacity == 0:
-            return 0.0
+            remaining[pilot.pilot_id] = tuple(
+                max(0, cap - load) if is_work_day else 0 for is_work_day, load in zip(work_mask, day_loads, strict=True)
+            )
 
-        return total_used / total_capacity
+            work_day_count = sum(work_mask)
+            if work_day_count == 0 or cap == 0:
+                utilization[pilot.pilot_id] = 0.0
+                continue
+            used = sum(min(load, cap) for is_work_day, load in zip(work_mask, day_loads, strict=True) if is_work_day)
+            utilization[pilot.pilot_id] = used / (work_day_count * cap)
+
+        return FleetCapacityReport(
+            start_date=start_date,
+            end_date=end_date,
+            remaining=remaining,
+            utilization=utilization,
+        )
 
     def is_province_authorized(
         self,
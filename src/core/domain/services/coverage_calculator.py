@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 
@@ -48,6 +49,17 @@ class CoverageResult:
     minimum_coverage_ratio: float
 
 
+@dataclass(frozen=True)
+class CoverageMeasurement:
+    """Infrastructure katmanında hesaplanmış alan değerleri (toplu değerlendirme girdisi)."""
+
+    mission_id: uuid.UUID
+    field_id: uuid.UUID
+    field_area_m2: float
+    footprint_area_m2: float
+    intersection_area_m2: float
+
+
 class CoverageCalculator:
     """Mission footprint ↔ field boundary kesişim hesabı servisi (KR-016).
 
@@ -61,7 +73,7 @@ class CoverageCalculator:
     Not: Gerçek geometrik kesişim hesabı için Shapely gibi bir kütüphane
     gerekir. Bu servis saf domain mantığını sağlar; karmaşık geometri
     hesaplamaları infrastructure katmanında yapılarak sonuçlar bu servise
-    iletilir.
+    iletilir (toplu hesap: ``infrastructure.geospatial.BatchPolygonEngine``).
     """
 
     DEFAULT_MINIMUM_COVERAGE_RATIO: float = 0.80  # %80 minimum kapsam
@@ -126,6 +138,35 @@ class CoverageCalculator:
             minimum_coverage_ratio=self._min_coverage,
         )
 
+    def evaluate_coverage_batch(
+        self,
+        measurements: Iterable[CoverageMeasurement],
+    ) -> list[CoverageResult]:
+        """Toplu kapsam değerlendirmesi (ör. günün tüm uçuş sonrası kontrolleri).
+
+        Her ölçüm ``evaluate_coverage`` ile aynı kurallarla değerlendirilir;
+        geçersiz bir ölçüm tüm çağrıyı düşürür.
+
+        Args:
+            measurements: Önceden hesaplanmış alan değerleri.
+
+        Returns:
+            Girdi sırasıyla kapsam sonuçları.
+
+        Raises:
+            CoverageCalculationError: Geçersiz alan değerleri.
+        """
+        return [
+            self.evaluate_coverage(
+                mission_id=m.mission_id,
+                field_id=m.field_id,
+                field_area_m2=m.field_area_m2,
+                footprint_area_m2=m.footprint_area_m2,
+                intersection_area_m2=m.intersection_area_m2,
+            )
+            for m in measurements
+        ]
+
     @staticmethod
     def shoelace_area(polygon: Polygon) -> float:
         """Shoelace formülü ile polygon alanını hesaplar (yaklaşık, düzlemsel).
@@ -1,10 +1,12 @@
 # BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
 # PATH: src/core/domain/services/mission_planner.py
-# DESC: Mission planlama kuralları.
+# DESC: Mission planlama kuralları (KR-015).
 
 from __future__ import annotations
 
 import uuid
+from bisect import bisect_left, bisect_right
+from collections.abc import AsyncIterable, AsyncIterator, Callable
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 from enum import Enum
@@ -23,6 +25,15 @@ class MissionPriority(Enum):
     LOW = "low"  # Esnek zamanlama
 
 
+# Planlama sırası (CRITICAL > HIGH > NORMAL > LOW)
+_PRIORITY_ORDER: dict[MissionPriority, int] = {
+    MissionPriority.CRITICAL: 0,
+    MissionPriority.HIGH: 1,
+    MissionPriority.NORMAL: 2,
+    MissionPriority.LOW: 3,
+}
+
+
 @dataclass(frozen=True)
 class MissionRequest:
     """Mission planlama talebi."""
@@ -149,15 +160,9 @@ class MissionPlanner:
         warnings: list[str] = []
 
         # Önceliğe göre sırala (CRITICAL > HIGH > NORMAL > LOW)
-        priority_order = {
-            MissionPriority.CRITICAL: 0,
-            MissionPriority.HIGH: 1,
-            MissionPriority.NORMAL: 2,
-            MissionPriority.LOW: 3,
-        }
         sorted_requests = sorted(
             requests,
-            key=lambda r: priority_order.get(r.priority, 99),
+            key=lambda r: _PRIORITY_ORDER.get(r.priority, 99),
         )
 
         planned: list[PlannedMission] = []
@@ -216,6 +221,86 @@ class MissionPlanner:
             warnings=tuple(warnings),
         )
 
+    async def plan_missions_stream(
+        self,
+        requests: AsyncIterable[MissionRequest],
+        available_dates: list[date],
+        field_existing_dates: dict[uuid.UUID, set[date]] | None = None,
+        on_unplanned: Callable[[MissionRequest, str], None] | None = None,
+    ) -> AsyncIterator[PlannedMission]:
+        """Öncelik gruplu talep akışını sınırlı bellekle planlar.
+
+        ``plan_missions`` ile aynı kararları verir; fark, taleplerin
+        listelenip sıralanmaması ve kararların verildiği anda üretilmesidir.
+        Tarla başına kullanılan tarihler, müsait tarih indekslerinden oluşan
+        bir bitset (int) olarak tutulur; pencere başı bisect ile bulunur ve
+        ilk boş tarih en düşük sıfır bit ile seçilir.
+
+        Args:
+            requests: Önceliğe göre gruplanmış (CRITICAL -> LOW) talep akışı.
+            available_dates: Müsait tarihler.
+            field_existing_dates: Tarla bazında mevcut mission tarihleri.
+            on_unplanned: Planlanamayan talep için (talep, uyarı) geri çağrısı.
+
+        Yields:
+            PlannedMission: Karar verildikçe planlanan mission.
+
+        Raises:
+            MissionPlanningError: Akış öncelik sırasına uymuyorsa.
+        """
+        existing_dates = field_existing_dates or {}
+        ordinals = sorted({d.toordinal() for d in available_dates})
+        position = {ordinal: index for index, ordinal in enumerate(ordinals)}
+        used_masks: dict[uuid.UUID, int] = {}
+        last_rank = -1
+
+        async for request in requests:
+            rank = _PRIORITY_ORDER.get(request.priority, 99)
+            if rank < last_rank:
+                raise MissionPlanningError(
+                    f"Talep akışı öncelik sırasına uymuyor "
+                    f"(tarla: {request.field_id}, öncelik: {request.priority.value})."
+                )
+            last_rank = rank
+
+            mask = used_masks.get(request.field_id)
+            if mask is None:
+                mask = 0
+                for existing in existing_dates.get(request.field_id, ()):
+                    index = position.get(existing.toordinal())
+                    if index is not None:
+                        mask |= 1 << index
+
+            lo = 0
+            hi = len(ordinals)
+            if request.earliest_date is not None:
+                lo = bisect_left(ordinals, request.earliest_date.toordinal())
+            if request.latest_date is not None:
+                hi = bisect_right(ordinals, request.latest_date.toordinal())
+
+            # lo'dan itibaren ilk boş (sıfır) bit
+            free = ~mask >> lo
+            index = lo + (free & -free).bit_length() - 1
+
+            if index >= hi:
+                used_masks[request.field_id] = mask
+                if on_unplanned is not None:
+                    on_unplanned(
+                        request,
+                        f"Tarla {request.field_id}: uygun tarih bulunamadı (öncelik: {request.priority.value}).",
+                    )
+                continue
+
+            used_masks[request.field_id] = mask | (1 << index)
+            yield PlannedMission(
+                mission_request_id=uuid.uuid4(),
+                field_id=request.field_id,
+                planned_date=date.fromordinal(ordinals[index]),
+                pilot_id=None,  # Pilot ataması PlanningEngine'de yapılır
+                priority=request.priority,
+                estimated_duration_minutes=self.estimate_duration(request.area_m2),
+            )
+
     def calculate_replan_window(
         self,
         *,
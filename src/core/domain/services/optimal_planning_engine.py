@@ -0,0 +1,298 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# PATH: src/core/domain/services/optimal_planning_engine.py
+# DESC: Global atama ile mission takvimi optimizasyonu (KR-015).
+
+from __future__ import annotations
+
+import heapq
+import time
+import uuid
+from collections import deque
+from datetime import date
+
+from src.core.domain.services.planning_engine import (
+    MissionDemand,
+    PilotSlot,
+    PlanningEngine,
+    PlanningEngineError,
+    ScheduledSlot,
+    ScheduleResult,
+)
+
+# (il, tarih) hücresi: aynı hücredeki pilotlar atama açısından birbirinin yerine geçer.
+_Cell = tuple[str, date]
+
+
+class OptimalPlanningEngine:
+    """Global atama ile mission takvimi optimizasyonu servisi (KR-015).
+
+    ``PlanningEngine`` ile aynı girdi/çıktı tiplerini kullanır. Problem
+    talep -> (il, tarih) hücresi -> pilot kapasitesi şeklinde iki parçalı
+    bir akış ağı olarak modellenir. Talepler ağırlık sırasıyla (öncelik,
+    ardından pencere darlığı) eklenir; her ekleme artık (residual) ağda
+    artırıcı yol arar ve gerekirse daha önce yerleşmiş talepleri kendi
+    pencereleri içinde başka hücreye kaydırır. Ağırlıkları yalnızca talep
+    tarafında olan bu akış probleminde sıralı artırma optimumdur:
+
+    - Planlanan talep sayısı greedy sonucundan az olamaz.
+    - Her öncelik seviyesi için o seviyeye kadar planlanan talep sayısı
+      mümkün olan en yüksek değerdedir.
+
+    Hücre içi pilot seçimi greedy ile aynı kuralı izler: en az yüklü pilot,
+    eşitlikte slot sırası.
+
+    Zaman bütçesi aşılırsa greedy (indeksli) sonuca dönülür ve bir uyarı
+    eklenir.
+
+    Domain invariants:
+    - Her pilot günlük kapasitesini aşamaz.
+    - Mission tarihi talep edilen pencere içinde olmalıdır.
+    - Pilot bölge yetkisi tarla bölgesi ile eşleşmelidir.
+    """
+
+    def __init__(self, time_budget_seconds: float = 5.0) -> None:
+        if time_budget_seconds <= 0:
+            raise PlanningEngineError("time_budget_seconds > 0 olmalıdır.")
+        self.time_budget_seconds = time_budget_seconds
+
+    def optimize_schedule(
+        self,
+        demands: list[MissionDemand],
+        pilot_slots: list[PilotSlot],
+    ) -> ScheduleResult:
+        """Mission taleplerini global olarak pilot slotlarına yerleştirir.
+
+        Args:
+            demands: Planlanması gereken mission talepleri.
+            pilot_slots: Pilot müsaitlik slotları.
+
+        Returns:
+            ScheduleResult: Optimizasyon sonucu.
+        """
+        if not demands:
+            return ScheduleResult(
+                scheduled=(),
+                unscheduled=(),
+                pilot_utilization={},
+                warnings=(),
+            )
+
+        deadline = time.monotonic() + self.time_budget_seconds
+
+        # Greedy ile aynı slot tekilleştirmesi (son slot kazanır, sıra ilk görülmeden).
+        slot_capacity: dict[tuple[uuid.UUID, date], int] = {}
+        slot_province: dict[tuple[uuid.UUID, date], str] = {}
+        pilot_total_slots: dict[uuid.UUID, int] = {}
+        for slot in pilot_slots:
+            key = (slot.pilot_id, slot.date)
+            slot_capacity[key] = slot.remaining_capacity
+            slot_province[key] = slot.province_code
+            pilot_total_slots[slot.pilot_id] = pilot_total_slots.get(slot.pilot_id, 0) + slot.daily_capacity
+
+        cell_capacity: dict[_Cell, int] = {}
+        province_dates: dict[str, list[date]] = {}
+        for key, cap in slot_capacity.items():
+            if cap <= 0:
+                continue
+            cell = (slot_province[key], key[1])
+            if cell not in cell_capacity:
+                province_dates.setdefault(cell[0], []).append(cell[1])
+            cell_capacity[cell] = cell_capacity.get(cell, 0) + cap
+        for dates in province_dates.values():
+            dates.sort()
+
+        ordered = sorted(demands, key=self._demand_weight_key)
+
+        cell_load: dict[_Cell, int] = dict.fromkeys(cell_capacity, 0)
+        # Talep penceresindeki hücreler (tarih sırasıyla)
+        demand_cells: dict[uuid.UUID, list[_Cell]] = {}
+        # Talebin bulunduğu hücre
+        placement: dict[uuid.UUID, _Cell] = {}
+        # movers[A][B]: A hücresinde olup B hücresine kayabilecek talepler
+        movers: dict[_Cell, dict[_Cell, dict[uuid.UUID, None]]] = {}
+        rejected: set[uuid.UUID] = set()
+
+        for index, demand in enumerate(ordered):
+            if index % 256 == 0 and time.monotonic() > deadline:
+                return self._fallback(demands, pilot_slots)
+
+            cells = [
+                (demand.province_code, d)
+                for d in province_dates.get(demand.province_code, [])
+                if demand.earliest_date <= d <= demand.latest_date
+            ]
+            demand_cells[demand.demand_id] = cells
+
+            path = self._find_augmenting_path(cells, cell_capacity, cell_load, movers)
+            if path is None:
+                rejected.add(demand.demand_id)
+                continue
+
+            # Yol: talep -> cells[0] ... -> son hücre (boş kapasiteli).
+            # Her adımda önceki hücreden bir talep sonraki hücreye kayar.
+            self._place(demand.demand_id, path[0], demand_cells, placement, movers)
+            for src, dst in zip(path, path[1:], strict=False):
+                moved_id = next(iter(movers[src][dst]))
+                self._unplace(moved_id, demand_cells, placement, movers)
+                self._place(moved_id, dst, demand_cells, placement, movers)
+            cell_load[path[-1]] += 1
+
+        return self._assign_pilots(
+            demands=demands,
+            placement=placement,
+            rejected=rejected,
+            slot_capacity=slot_capacity,
+            slot_province=slot_province,
+            pilot_total_slots=pilot_total_slots,
+        )
+
+    @staticmethod
+    def _demand_weight_key(demand: MissionDemand) -> tuple[int, int, date]:
+        """Ağırlık sırası: öncelik, ardından dar pencere, ardından erken başlangıç."""
+        window_days = (demand.latest_date - demand.earliest_date).days
+        return (demand.priority, window_days, demand.earliest_date)
+
+    @staticmethod
+    def _find_augmenting_path(
+        start_cells: list[_Cell],
+        cell_capacity: dict[_Cell, int],
+        cell_load: dict[_Cell, int],
+        movers: dict[_Cell, dict[_Cell, dict[uuid.UUID, None]]],
+    ) -> list[_Cell] | None:
+        """Pencere hücrelerinden boş kapasiteli bir hücreye en kısa yolu bulur (BFS)."""
+        for cell in start_cells:
+            if cell_load[cell] < cell_capacity[cell]:
+                return [cell]
+
+        parent: dict[_Cell, _Cell | None] = dict.fromkeys(start_cells)
+        queue: deque[_Cell] = deque(start_cells)
+        while queue:
+            cell = queue.popleft()
+            for nxt, ids in movers.get(cell, {}).items():
+                if not ids or nxt in parent:
+                    continue
+                parent[nxt] = cell
+                if cell_load[nxt] < cell_capacity[nxt]:
+                    path = [nxt]
+                    prev = parent[nxt]
+                    while prev is not None:
+                        path.append(prev)
+                        prev = parent[prev]
+                    path.reverse()
+                    return path
+                queue.append(nxt)
+        return None
+
+    @staticmethod
+    def _place(
+        demand_id: uuid.UUID,
+        cell: _Cell,
+        demand_cells: dict[uuid.UUID, list[_Cell]],
+        placement: dict[uuid.UUID, _Cell],
+        movers: dict[_Cell, dict[_Cell, dict[uuid.UUID, None]]],
+    ) -> None:
+        placement[demand_id] = cell
+        outgoing = movers.setdefault(cell, {})
+        for other in demand_cells[demand_id]:
+            if other != cell:
+                outgoing.setdefault(other, {})[demand_id] = None
+
+    @staticmethod
+    def _unplace(
+        demand_id: uuid.UUID,
+        demand_cells: dict[uuid.UUID, list[_Cell]],
+        placement: dict[uuid.UUID, _Cell],
+        movers: dict[_Cell, dict[_Cell, dict[uuid.UUID, None]]],
+    ) -> None:
+        cell = placement.pop(demand_id)
+        outgoing = movers[cell]
+        for other in demand_cells[demand_id]:
+            if other != cell:
+                outgoing[other].pop(demand_id, None)
+
+    @staticmethod
+    def _assign_pilots(
+        demands: list[MissionDemand],
+        placement: dict[uuid.UUID, _Cell],
+        rejected: set[uuid.UUID],
+        slot_capacity: dict[tuple[uuid.UUID, date], int],
+        slot_province: dict[tuple[uuid.UUID, date], str],
+        pilot_total_slots: dict[uuid.UUID, int],
+    ) -> ScheduleResult:
+        """Hücre atamalarını en az yüklü pilot kuralıyla pilot slotlarına dağıtır."""
+        # (il, tarih) -> heap[(pilot yükü, slot sırası, pilot_id)]
+        cell_pilots: dict[_Cell, list[tuple[int, int, uuid.UUID]]] = {}
+        remaining = dict(slot_capacity)
+        for order, (key, cap) in enumerate(slot_capacity.items()):
+            if cap > 0:
+                cell_pilots.setdefault((slot_province[key], key[1]), []).append((0, order, key[0]))
+        for heap in cell_pilots.values():
+            heapq.heapify(heap)
+
+        scheduled: list[ScheduledSlot] = []
+        unscheduled: list[uuid.UUID] = []
+        warnings: list[str] = []
+        pilot_assigned: dict[uuid.UUID, int] = {}
+
+        for demand in sorted(demands, key=lambda d: d.priority):
+            cell = placement.get(demand.demand_id)
+            if cell is None or demand.demand_id in rejected:
+                unscheduled.append(demand.demand_id)
+                warnings.append(
+                    f"Talep {demand.demand_id}: uygun pilot/tarih bulunamadı "
+                    f"(bölge: {demand.province_code}, "
+                    f"pencere: {demand.earliest_date} - {demand.latest_date})."
+                )
+                continue
+
+            heap = cell_pilots[cell]
+            while True:
+                load, order, pilot_id = heapq.heappop(heap)
+                if load == pilot_assigned.get(pilot_id, 0):
+                    break
+                # Pilot başka hücrede atama almış; güncel yükle yeniden sırala
+                heapq.heappush(heap, (pilot_assigned.get(pilot_id, 0), order, pilot_id))
+
+            key = (pilot_id, cell[1])
+            remaining[key] -= 1
+            pilot_assigned[pilot_id] = load + 1
+            if remaining[key] > 0:
+                heapq.heappush(heap, (load + 1, order, pilot_id))
+
+            scheduled.append(
+                ScheduledSlot(
+                    demand_id=demand.demand_id,
+                    field_id=demand.field_id,
+                    pilot_id=pilot_id,
+                    scheduled_date=cell[1],
+                    estimated_duration_minutes=demand.estimated_duration_minutes,
+                )
+            )
+
+        utilization: dict[uuid.UUID, float] = {}
+        for pid, total in pilot_total_slots.items():
+            if total > 0:
+                utilization[pid] = pilot_assigned.get(pid, 0) / total
+
+        return ScheduleResult(
+            scheduled=tuple(scheduled),
+            unscheduled=tuple(unscheduled),
+            pilot_utilization=utilization,
+            warnings=tuple(warnings),
+        )
+
+    def _fallback(
+        self,
+        demands: list[MissionDemand],
+        pilot_slots: list[PilotSlot],
+    ) -> ScheduleResult:
+        greedy = PlanningEngine().optimize_schedule_indexed(demands, pilot_slots)
+        return ScheduleResult(
+            scheduled=greedy.scheduled,
+            unscheduled=greedy.unscheduled,
+            pilot_utilization=greedy.pilot_utilization,
+            warnings=(
+                *greedy.warnings,
+                f"Optimal planlama {self.time_budget_seconds:.1f} sn zaman bütçesini aştı; greedy sonuç kullanıldı.",
+            ),
+        )
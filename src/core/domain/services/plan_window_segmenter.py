@@ -6,8 +6,18 @@ Amaç: Büyük alanlarda (örn. 10.000 dönüm) aynı pencere içinde çoklu pil
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from typing import List
+from typing import List, Sequence, Tuple
+
+from .coverage_calculator import CoverageCalculationError, Polygon
+
+# Yerel eşdikdörtgen projeksiyon katsayıları (derece -> metre)
+_METERS_PER_DEG_LAT = 110_540.0
+_METERS_PER_DEG_LON_AT_EQUATOR = 111_320.0
+_M2_PER_DONUM = 1_000.0
+
+_Point = Tuple[float, float]
 
 
 @dataclass(frozen=True)
@@ -17,6 +27,24 @@ class MissionSegment:
     assigned_pilot_id: str = ""  # optional at this stage
 
 
+@dataclass(frozen=True)
+class SpatialSegment:
+    """Tarla polygonundan kesilmiş bitişik segment (şerit veya grid hücresi)."""
+
+    segment_no: int
+    area_donum: int
+    area_m2: float
+    geometry: Polygon  # (lon, lat) kapalı halka
+    assigned_pilot_id: str = ""
+
+    def to_mission_segment(self) -> MissionSegment:
+        return MissionSegment(
+            segment_no=self.segment_no,
+            area_donum=self.area_donum,
+            assigned_pilot_id=self.assigned_pilot_id,
+        )
+
+
 class PlanWindowSegmenter:
     def __init__(self, threshold_donum: int = 10000, segment_size_donum: int = 2500):
         self.threshold_donum = threshold_donum
@@ -35,3 +63,208 @@ class PlanWindowSegmenter:
             remaining -= chunk
             no += 1
         return segs
+
+    def segment_polygon(
+        self,
+        field_polygon: Polygon,
+        pilot_ids: Sequence[str] = (),
+        layout: str = "strips",
+    ) -> List[SpatialSegment]:
+        """Tarla polygonunu yaklaşık ``segment_size_donum`` büyüklüğünde bitişik parçalara böler.
+
+        Polygon yerel metrik projeksiyona alınır; kesim çizgileri, kesilen
+        parçanın alanı hedefe eşit olacak şekilde ikili arama ile bulunur.
+        ``strips`` uzun eksene dik şeritler, ``grid`` satır/sütun hücreleri
+        üretir (satırlar yılan sırasıyla gezilir). Segmentler bu sırayla
+        pilotlara bitişik bloklar halinde dağıtılır; böylece bir pilotun
+        segmentleri arasında geçiş mesafesi komşu segment kadardır.
+
+        Konkav parsellerde bir şerit/hücre birden fazla kopuk parçaya
+        düşebilir (ör. U biçimli parselin kolları); her bağlı bileşen ayrı
+        segment olur, böylece her segment tek uçuşla taranabilen bitişik
+        bir alandır (bileşenler hedef alandan küçük kalır).
+
+        Args:
+            field_polygon: Tarla sınırı ((lon, lat) kapalı halka).
+            pilot_ids: Segmentlerin dağıtılacağı pilotlar (boşsa atama yapılmaz).
+            layout: "strips" veya "grid".
+
+        Returns:
+            Segment listesi (gezinti sırasıyla).
+        """
+        if layout not in ("strips", "grid"):
+            raise CoverageCalculationError("layout 'strips' veya 'grid' olmalıdır.")
+
+        ring = list(field_polygon.coordinates[:-1])
+        lat0 = sum(lat for _, lat in ring) / len(ring)
+        kx = _METERS_PER_DEG_LON_AT_EQUATOR * math.cos(math.radians(lat0))
+        ky = _METERS_PER_DEG_LAT
+        lon0 = min(lon for lon, _ in ring)
+        lat_min = min(lat for _, lat in ring)
+        local = [((lon - lon0) * kx, (lat - lat_min) * ky) for lon, lat in ring]
+
+        total_m2 = _area(local)
+        total_donum = total_m2 / _M2_PER_DONUM
+        if total_donum <= self.threshold_donum:
+            count = 1
+        else:
+            count = max(1, math.ceil(total_donum / self.segment_size_donum))
+
+        xs = [x for x, _ in local]
+        ys = [y for _, y in local]
+        width, height = max(xs) - min(xs), max(ys) - min(ys)
+
+        pieces: List[List[_Point]] = []
+        if count == 1:
+            pieces = [local]
+        elif layout == "strips":
+            axis = 0 if width >= height else 1
+            pieces = [part for strip in _split_equal_area(local, axis, [1] * count) for part in strip]
+        else:
+            # Hücreleri kareye yakın tutacak satır sayısı
+            rows = round(math.sqrt(count * height / width)) if width > 0 else count
+            rows = max(1, min(count, rows))
+            per_row = [count // rows + (1 if r < count % rows else 0) for r in range(rows)]
+            for r, row in enumerate(_split_equal_area(local, 1, per_row)):
+                # Kopuk satır bileşenleri hücre sayısını alanlarıyla orantılı paylaşır
+                row_area = sum(_area(part) for part in row)
+                cells: List[List[_Point]] = []
+                for part in row:
+                    share = max(1, round(per_row[r] * _area(part) / row_area)) if row_area > 0 else 1
+                    cells.extend(cell for column in _split_equal_area(part, 0, [1] * share) for cell in column)
+                pieces.extend(cells if r % 2 == 0 else reversed(cells))
+
+        pieces = [piece for piece in pieces if len(piece) >= 3 and _area(piece) > 0.0]
+        segments: List[SpatialSegment] = []
+        for index, piece in enumerate(pieces):
+            coords = tuple((x / kx + lon0, y / ky + lat_min) for x, y in piece)
+            area_m2 = _area(piece)
+            pilot = pilot_ids[index * len(pilot_ids) // len(pieces)] if pilot_ids else ""
+            segments.append(
+                SpatialSegment(
+                    segment_no=index + 1,
+                    area_donum=round(area_m2 / _M2_PER_DONUM),
+                    area_m2=area_m2,
+                    geometry=Polygon(coordinates=(*coords, coords[0])),
+                    assigned_pilot_id=pilot,
+                )
+            )
+        return segments
+
+
+def _area(points: Sequence[_Point]) -> float:
+    total = 0.0
+    n = len(points)
+    for i in range(n):
+        x1, y1 = points[i]
+        x2, y2 = points[(i + 1) % n]
+        total += x1 * y2 - x2 * y1
+    return abs(total) / 2.0
+
+
+def _clip(points: Sequence[_Point], axis: int, value: float, keep_below: bool) -> List[_Point]:
+    """Sutherland-Hodgman: polygonu eksene dik tek bir yarı düzleme kırpar."""
+    out: List[_Point] = []
+    n = len(points)
+    for i in range(n):
+        cur, nxt = points[i], points[(i + 1) % n]
+        cur_in = (cur[axis] <= value) if keep_below else (cur[axis] >= value)
+        nxt_in = (nxt[axis] <= value) if keep_below else (nxt[axis] >= value)
+        if cur_in:
+            out.append(cur)
+        if cur_in != nxt_in:
+            t = (value - cur[axis]) / (nxt[axis] - cur[axis])
+            out.append((cur[0] + t * (nxt[0] - cur[0]), cur[1] + t * (nxt[1] - cur[1])))
+    return out
+
+
+def _clip_parts(points: Sequence[_Point], axis: int, value: float, keep_below: bool) -> List[List[_Point]]:
+    """_clip sonucunu bağlı bileşenlerine ayırır.
+
+    Sutherland-Hodgman konkav polygonda kopuk parçaları kesim çizgisi
+    üzerindeki köprü kenarlarıyla tek halkaya bağlar. Kesişim noktaları çizgi
+    boyunca sıralanıp ikişer eşlenir (basit polygonda aralarındaki kirişler
+    polygon içindedir); her çıkış noktasından eşi olan giriş noktasına atlanarak
+    halkalar ayrı ayrı kapatılır. Dejenere kesişimlerde (eş yönlü eşleşme) tek
+    halka döner.
+    """
+    out: List[_Point] = []
+    flags: List[int] = []  # 0 köşe, 1 giriş, -1 çıkış
+    n = len(points)
+    for i in range(n):
+        cur, nxt = points[i], points[(i + 1) % n]
+        cur_in = (cur[axis] <= value) if keep_below else (cur[axis] >= value)
+        nxt_in = (nxt[axis] <= value) if keep_below else (nxt[axis] >= value)
+        if cur_in:
+            out.append(cur)
+            flags.append(0)
+        if cur_in != nxt_in:
+            t = (value - cur[axis]) / (nxt[axis] - cur[axis])
+            out.append((cur[0] + t * (nxt[0] - cur[0]), cur[1] + t * (nxt[1] - cur[1])))
+            flags.append(-1 if cur_in else 1)
+
+    crossings = [i for i, flag in enumerate(flags) if flag]
+    if len(crossings) <= 2:
+        return [out] if len(out) >= 3 else []
+    along = sorted(crossings, key=lambda i: out[i][1 - axis])
+    partner = {}
+    for a, b in zip(along[::2], along[1::2]):
+        partner[a], partner[b] = b, a
+    if len(along) % 2 or any(flags[i] == flags[partner[i]] for i in crossings):
+        return [out]
+
+    parts: List[List[_Point]] = []
+    visited: set[int] = set()
+    for start in crossings:
+        if flags[start] != 1 or start in visited:
+            continue
+        ring: List[_Point] = []
+        i = start
+        while i not in visited:
+            visited.add(i)
+            ring.append(out[i])
+            j = (i + 1) % len(out)
+            while flags[j] != -1:
+                ring.append(out[j])
+                j = (j + 1) % len(out)
+            ring.append(out[j])
+            i = partner[j]
+        parts.append(ring)
+    return parts
+
+
+def _split_equal_area(points: List[_Point], axis: int, weights: Sequence[int]) -> List[List[List[_Point]]]:
+    """Polygonu eksen boyunca ağırlıklarla orantılı alanlara ayırır.
+
+    Her dilim bağlı bileşenlerinin listesidir; bileşenler diğer eksen boyunca sıralıdır.
+    """
+    total = _area(points)
+    lo = min(p[axis] for p in points)
+    hi = max(p[axis] for p in points)
+    weight_sum = sum(weights)
+
+    cuts: List[float] = []
+    cumulative = 0
+    for weight in weights[:-1]:
+        cumulative += weight
+        target = total * cumulative / weight_sum
+        a, b = (cuts[-1] if cuts else lo), hi
+        for _ in range(60):
+            mid = (a + b) / 2.0
+            if _area(_clip(points, axis, mid, keep_below=True)) < target:
+                a = mid
+            else:
+                b = mid
+        cuts.append((a + b) / 2.0)
+
+    bounds = [lo, *cuts, hi]
+    slices: List[List[List[_Point]]] = []
+    for start, end in zip(bounds, bounds[1:]):
+        parts = [
+            part
+            for upper in _clip_parts(points, axis, start, keep_below=False)
+            for part in _clip_parts(upper, axis, end, keep_below=True)
+        ]
+        parts.sort(key=lambda part: min(p[1 - axis] for p in part))
+        slices.append(parts)
+    return slices
@@ -1,9 +1,12 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
 # PATH: src/core/domain/services/planning_engine.py
 # DESC: Mission takvimi optimizasyonu (KR-015).
 
 from __future__ import annotations
 
+import heapq
 import uuid
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 
@@ -59,6 +62,37 @@ class ScheduleResult:
     warnings: tuple[str, ...]
 
 
+@dataclass(frozen=True)
+class ScheduleDelta:
+    """Mevcut plana uygulanacak değişiklikler (hava bloğu, pilot iptali vb.)."""
+
+    removed_slots: tuple[tuple[uuid.UUID, date], ...] = ()  # (pilot_id, date)
+    added_demands: tuple[MissionDemand, ...] = ()
+    capacity_changes: tuple[PilotSlot, ...] = ()  # Yeni/değişen slotun plan öncesi kapasitesi
+
+
+@dataclass(frozen=True)
+class ScheduleDiff:
+    """Artımlı yeniden planlamanın önceki plana göre minimal farkı."""
+
+    added: tuple[ScheduledSlot, ...]  # Önceden planlanmamış, şimdi planlanan
+    moved: tuple[tuple[ScheduledSlot, ScheduledSlot], ...]  # (eski, yeni)
+    dropped: tuple[ScheduledSlot, ...]  # Önceden planlanmış, şimdi planlanamayan
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.moved or self.dropped)
+
+
+@dataclass(frozen=True)
+class ReplanResult:
+    """Artımlı yeniden planlama sonucu."""
+
+    schedule: ScheduleResult
+    diff: ScheduleDiff
+    affected_cells: frozenset[tuple[str, date]]  # (il, tarih)
+
+
 class PlanningEngine:
     """Mission takvimi optimizasyonu servisi (KR-015).
 
@@ -181,6 +215,287 @@ class PlanningEngine:
             warnings=tuple(warnings),
         )
 
+    def optimize_schedule_indexed(
+        self,
+        demands: list[MissionDemand],
+        pilot_slots: list[PilotSlot],
+    ) -> ScheduleResult:
+        """İndeksli aday arama ile ``optimize_schedule`` ile birebir aynı sonucu üretir.
+
+        Slotlar il ve tarih bazında kovalanır; her (il, tarih) kovası
+        (pilot yükü, slot sırası) anahtarlı bir min-heap tutar. Her talep
+        yalnızca kendi ilinin pencere içindeki kovalarının tepesine bakar.
+        Pilot yükü değiştiğinde eski heap girdileri tembel olarak
+        geçersizleşir ve pilotun slotları güncel yükle yeniden eklenir.
+
+        Seçim sırası greedy ile aynıdır: (pilot yükü, tarih, slot ekleme
+        sırası) en küçük olan aday kazanır.
+
+        Args:
+            demands: Planlanması gereken mission talepleri.
+            pilot_slots: Pilot müsaitlik slotları.
+
+        Returns:
+            ScheduleResult: Optimizasyon sonucu.
+        """
+        if not demands:
+            return ScheduleResult(
+                scheduled=(),
+                unscheduled=(),
+                pilot_utilization={},
+                warnings=(),
+            )
+
+        slot_capacity, slot_province, pilot_total_slots = self._index_slots(pilot_slots)
+        pilot_assigned: dict[uuid.UUID, int] = {}
+
+        scheduled, unscheduled = self._assign_indexed(
+            sorted(demands, key=lambda d: d.priority),
+            slot_capacity,
+            slot_province,
+            pilot_assigned,
+        )
+
+        return ScheduleResult(
+            scheduled=tuple(scheduled),
+            unscheduled=tuple(d.demand_id for d in unscheduled),
+            pilot_utilization=self._utilization(pilot_total_slots, pilot_assigned),
+            warnings=tuple(self._unscheduled_warning(d) for d in unscheduled),
+        )
+
+    def replan_incremental(
+        self,
+        previous: ScheduleResult,
+        demands: list[MissionDemand],
+        pilot_slots: list[PilotSlot],
+        delta: ScheduleDelta,
+    ) -> ReplanResult:
+        """Mevcut planı yalnızca değişen (il, tarih) hücrelerinde onarır.
+
+        Etkilenmeyen hücrelerdeki atamalar olduğu gibi korunur. Etkilenen
+        hücrelerde slot hâlâ varsa atamalar yeni kapasiteye sığdığı kadar
+        (öncelik sırasıyla) yerinde kalır; sığmayanlar, yeni talepler ve
+        etkilenen hücrelere penceresi değen eski planlanamamış talepler
+        indeksli greedy kuralıyla boş kapasiteye yerleştirilir. Bu yüzden
+        dönen fark yalnızca gerçekten değişen mission'ları içerir.
+
+        Args:
+            previous: ``demands`` ve ``pilot_slots`` ile üretilmiş mevcut plan.
+            demands: Mevcut planın talepleri.
+            pilot_slots: Mevcut planın pilot slotları (plan öncesi kapasite).
+            delta: Kaldırılan slotlar, eklenen talepler, kapasite değişiklikleri.
+
+        Returns:
+            ReplanResult: Güncel plan ve önceki plana göre minimal fark.
+
+        Raises:
+            PlanningEngineError: Eklenen talep zaten planda ise.
+        """
+        demand_by_id: dict[uuid.UUID, MissionDemand] = {d.demand_id: d for d in demands}
+        for demand in delta.added_demands:
+            if demand.demand_id in demand_by_id:
+                raise PlanningEngineError(f"Talep {demand.demand_id} zaten mevcut planda.")
+            demand_by_id[demand.demand_id] = demand
+
+        removed = set(delta.removed_slots)
+        changed = {(slot.pilot_id, slot.date): slot for slot in delta.capacity_changes}
+        new_slots = [
+            changed.pop((slot.pilot_id, slot.date), slot)
+            for slot in pilot_slots
+            if (slot.pilot_id, slot.date) not in removed
+        ]
+        new_slots.extend(slot for key, slot in changed.items() if key not in removed)
+
+        # Etkilenen (il, tarih) hücreleri: eski ve yeni il bilgisiyle birlikte
+        old_province = {(slot.pilot_id, slot.date): slot.province_code for slot in pilot_slots}
+        affected: set[tuple[str, date]] = set()
+        for key in removed:
+            if key in old_province:
+                affected.add((old_province[key], key[1]))
+        for slot in delta.capacity_changes:
+            key = (slot.pilot_id, slot.date)
+            affected.add((slot.province_code, slot.date))
+            if key in old_province:
+                affected.add((old_province[key], slot.date))
+
+        slot_capacity, slot_province, pilot_total_slots = self._index_slots(new_slots)
+        pilot_assigned: dict[uuid.UUID, int] = {}
+
+        # Etkilenen slotlardaki atamalar önceliğe göre yeni kapasiteye sığdırılır.
+        kept: dict[uuid.UUID, ScheduledSlot] = {}
+        evicted: list[MissionDemand] = []
+        for item in sorted(previous.scheduled, key=lambda s: demand_by_id[s.demand_id].priority):
+            key = (item.pilot_id, item.scheduled_date)
+            demand = demand_by_id[item.demand_id]
+            if slot_capacity.get(key, 0) > 0 and slot_province.get(key) == demand.province_code:
+                kept[item.demand_id] = item
+                slot_capacity[key] -= 1
+                pilot_assigned[item.pilot_id] = pilot_assigned.get(item.pilot_id, 0) + 1
+            else:
+                evicted.append(demand)
+
+        retried = [
+            demand_by_id[demand_id]
+            for demand_id in previous.unscheduled
+            if self._touches_cells(demand_by_id[demand_id], affected)
+        ]
+        pending = sorted([*evicted, *delta.added_demands, *retried], key=lambda d: d.priority)
+        placed, still_unscheduled = self._assign_indexed(pending, slot_capacity, slot_province, pilot_assigned)
+
+        previous_by_id = {item.demand_id: item for item in previous.scheduled}
+        added: list[ScheduledSlot] = []
+        moved: list[tuple[ScheduledSlot, ScheduledSlot]] = []
+        for item in placed:
+            old = previous_by_id.get(item.demand_id)
+            if old is None:
+                added.append(item)
+            elif (old.pilot_id, old.scheduled_date) != (item.pilot_id, item.scheduled_date):
+                moved.append((old, item))
+        dropped = [previous_by_id[d.demand_id] for d in still_unscheduled if d.demand_id in previous_by_id]
+
+        # Korunan atamalar önceki sırasıyla, yeniden yerleşenler sonra gelir.
+        scheduled = [item for item in previous.scheduled if item.demand_id in kept] + [
+            item for item in placed if item.demand_id not in kept
+        ]
+        pending_ids = {d.demand_id for d in pending}
+        unscheduled = [
+            demand_by_id[demand_id] for demand_id in previous.unscheduled if demand_id not in pending_ids
+        ] + still_unscheduled
+
+        schedule = ScheduleResult(
+            scheduled=tuple(scheduled),
+            unscheduled=tuple(d.demand_id for d in unscheduled),
+            pilot_utilization=self._utilization(pilot_total_slots, pilot_assigned),
+            warnings=tuple(self._unscheduled_warning(d) for d in unscheduled),
+        )
+        return ReplanResult(
+            schedule=schedule,
+            diff=ScheduleDiff(added=tuple(added), moved=tuple(moved), dropped=tuple(dropped)),
+            affected_cells=frozenset(affected),
+        )
+
+    @staticmethod
+    def _index_slots(
+        pilot_slots: list[PilotSlot],
+    ) -> tuple[dict[tuple[uuid.UUID, date], int], dict[tuple[uuid.UUID, date], str], dict[uuid.UUID, int]]:
+        """Greedy ile aynı tekilleştirme: aynı (pilot_id, date) için son slot
+        kapasite/il değerini belirler, ekleme sırası ilk görülmeden gelir."""
+        slot_capacity: dict[tuple[uuid.UUID, date], int] = {}
+        slot_province: dict[tuple[uuid.UUID, date], str] = {}
+        pilot_total_slots: dict[uuid.UUID, int] = {}
+
+        for slot in pilot_slots:
+            key = (slot.pilot_id, slot.date)
+            slot_capacity[key] = slot.remaining_capacity
+            slot_province[key] = slot.province_code
+            pilot_total_slots[slot.pilot_id] = pilot_total_slots.get(slot.pilot_id, 0) + slot.daily_capacity
+        return slot_capacity, slot_province, pilot_total_slots
+
+    @staticmethod
+    def _assign_indexed(
+        sorted_demands: list[MissionDemand],
+        slot_capacity: dict[tuple[uuid.UUID, date], int],
+        slot_province: dict[tuple[uuid.UUID, date], str],
+        pilot_assigned: dict[uuid.UUID, int],
+    ) -> tuple[list[ScheduledSlot], list[MissionDemand]]:
+        """Sıralı talepleri (il, tarih) kovalı heap'lerle yerleştirir.
+
+        ``slot_capacity`` ve ``pilot_assigned`` yerinde güncellenir.
+        """
+        # (il, tarih) -> heap[(pilot yükü, slot sırası, pilot_id)]
+        buckets: dict[tuple[str, date], list[tuple[int, int, uuid.UUID]]] = {}
+        province_dates: dict[str, list[date]] = {}
+        pilot_keys: dict[uuid.UUID, list[tuple[int, tuple[uuid.UUID, date]]]] = {}
+
+        for order, (key, cap) in enumerate(slot_capacity.items()):
+            if cap <= 0:
+                continue
+            pid, slot_date = key
+            province = slot_province[key]
+            buckets.setdefault((province, slot_date), []).append((pilot_assigned.get(pid, 0), order, pid))
+            pilot_keys.setdefault(pid, []).append((order, key))
+
+        for (province, slot_date), heap in buckets.items():
+            heapq.heapify(heap)
+            province_dates.setdefault(province, []).append(slot_date)
+        for dates in province_dates.values():
+            dates.sort()
+
+        scheduled: list[ScheduledSlot] = []
+        unscheduled: list[MissionDemand] = []
+
+        for demand in sorted_demands:
+            dates = province_dates.get(demand.province_code, [])
+            lo = bisect_left(dates, demand.earliest_date)
+            hi = bisect_right(dates, demand.latest_date)
+
+            best: tuple[int, date, int, uuid.UUID] | None = None
+            for slot_date in dates[lo:hi]:
+                heap = buckets[(demand.province_code, slot_date)]
+                # Tembel silme: güncel olmayan yük veya dolmuş slot girdilerini at
+                while heap:
+                    load, order, pid = heap[0]
+                    if load == pilot_assigned.get(pid, 0) and slot_capacity[(pid, slot_date)] > 0:
+                        break
+                    heapq.heappop(heap)
+                if not heap:
+                    continue
+                load, order, pid = heap[0]
+                candidate = (load, slot_date, order, pid)
+                if best is None or candidate < best:
+                    best = candidate
+
+            if best is None:
+                unscheduled.append(demand)
+                continue
+
+            _, sched_date, _, pilot_id = best
+            scheduled.append(
+                ScheduledSlot(
+                    demand_id=demand.demand_id,
+                    field_id=demand.field_id,
+                    pilot_id=pilot_id,
+                    scheduled_date=sched_date,
+                    estimated_duration_minutes=demand.estimated_duration_minutes,
+                )
+            )
+            slot_capacity[(pilot_id, sched_date)] -= 1
+            new_load = pilot_assigned.get(pilot_id, 0) + 1
+            pilot_assigned[pilot_id] = new_load
+
+            # Pilotun kapasitesi kalan tüm slotlarını yeni yükle yeniden ekle
+            for order, key in pilot_keys[pilot_id]:
+                if slot_capacity[key] > 0:
+                    heapq.heappush(buckets[(slot_province[key], key[1])], (new_load, order, pilot_id))
+
+        return scheduled, unscheduled
+
+    @staticmethod
+    def _touches_cells(demand: MissionDemand, cells: set[tuple[str, date]]) -> bool:
+        return any(
+            province == demand.province_code and demand.earliest_date <= cell_date <= demand.latest_date
+            for province, cell_date in cells
+        )
+
+    @staticmethod
+    def _utilization(
+        pilot_total_slots: dict[uuid.UUID, int],
+        pilot_assigned: dict[uuid.UUID, int],
+    ) -> dict[uuid.UUID, float]:
+        utilization: dict[uuid.UUID, float] = {}
+        for pid, total in pilot_total_slots.items():
+            if total > 0:
+                utilization[pid] = pilot_assigned.get(pid, 0) / total
+        return utilization
+
+    @staticmethod
+    def _unscheduled_warning(demand: MissionDemand) -> str:
+        return (
+            f"Talep {demand.demand_id}: uygun pilot/tarih bulunamadı "
+            f"(bölge: {demand.province_code}, "
+            f"pencere: {demand.earliest_date} - {demand.latest_date})."
+        )
+
     @staticmethod
     def generate_date_range(start: date, end: date) -> list[date]:
         """Tarih aralığı üretir (dahil-dahil).
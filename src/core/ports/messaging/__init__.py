@@ -1,10 +1,14 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: Messaging portları (event bus, transactional outbox).
 # PATH: src/core/ports/messaging/__init__.py
 # DESC: Messaging ports module: event publish/subscribe.
 """Messaging ports public API."""
 
 from src.core.ports.messaging.event_bus import EventBus, EventHandler
+from src.core.ports.messaging.event_outbox import EventOutboxPort
 
 __all__: list[str] = [
     "EventBus",
     "EventHandler",
+    "EventOutboxPort",
 ]
@@ -0,0 +1,35 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# PATH: src/core/ports/messaging/event_outbox.py
+# DESC: EventOutbox portu: domain event'ini iş verisiyle aynı transaction'da outbox'a ekler.
+# SSOT: KR-081 (transactional outbox)
+"""
+EventOutbox portu: command handler'larının domain event'lerini outbox'a yazdığı arayüz.
+
+Sorumluluk: Event'i broker'ı beklemeden, iş verisiyle aynı unit of work içinde
+  kaydetmek. Gövde event.to_dict() ile tam serileştirilir; consumer tarafı
+  EventRegistry.decode ile aynı tipli event'i geri üretir.
+
+Girdi/Çıktı (Contract/DTO/Event):
+  Girdi: DomainEvent + correlation_id.
+  Çıktı: Event ID (consumer dedup anahtarı).
+
+Hata Modları (idempotency/retry/rate limit):
+  Transaction rollback olursa event de yazılmaz; relay yalnızca commit edilmiş
+  kayıtları yayınlar.
+
+Testler: Unit (command handler outbox round-trip).
+Bağımlılıklar: Standart kütüphane + domain tipleri.
+Notlar/SSOT: Infrastructure implementasyonu SqlAlchemyUnitOfWork.collect'tir.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Protocol
+
+from src.core.domain.events.base import DomainEvent
+
+
+class EventOutboxPort(Protocol):
+    """Event'i iş verisiyle aynı transaction'da outbox'a ekler (broker'ı beklemez)."""
+
+    def collect(self, event: DomainEvent, *, correlation_id: str | None = None) -> Any: ...
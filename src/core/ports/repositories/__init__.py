@@ -21,6 +21,10 @@ from src.core.ports.repositories.feedback_record_repository import (
     FeedbackRecordRepository,
 )
 from src.core.ports.repositories.field_repository import FieldRepository
+from src.core.ports.repositories.field_spatial_index import (
+    FieldDistance,
+    FieldSpatialIndex,
+)
 from src.core.ports.repositories.mission_repository import MissionRepository
 from src.core.ports.repositories.payment_intent_repository import (
     PaymentIntentRepository,
@@ -51,6 +55,8 @@ __all__ = [
     "ExpertReviewRepository",
     "FeedbackRecordRepository",
     "FieldRepository",
+    "FieldDistance",
+    "FieldSpatialIndex",
     "MissionRepository",
     "PaymentIntentRepository",
     "PilotRepository",
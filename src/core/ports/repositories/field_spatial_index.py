@@ -0,0 +1,84 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# PATH: src/core/ports/repositories/field_spatial_index.py
+# DESC: FieldSpatialIndex portu: tarla geometrileri üzerinde bbox/nokta/en yakın sorguları.
+# SSOT: KR-013 (tarla yönetimi), KR-016 (eşleştirme)
+"""
+FieldSpatialIndex abstract port.
+
+Sorumluluk: "Bu nokta/bbox hangi tarlaların içinde veya yakınında?" sorgularını
+  soyutlar. İl bazlı liste taraması yerine uzamsal indeks kullanılır.
+
+Girdi/Çıktı (Contract/DTO/Event):
+  Girdi: WGS84 (EPSG:4326) boylam/enlem ve bbox değerleri.
+  Çıktı: field_id listeleri; en yakın sorgusunda FieldDistance (metre).
+
+Güvenlik (RBAC/PII/Audit):
+  Yalnızca konum verisi ve field_id döner; sahiplik/RBAC kontrolü çağıranın sorumluluğundadır.
+
+Hata Modları (idempotency/retry/rate limit):
+  Upsert/remove idempotenttir; aynı event'in tekrar işlenmesi indeksi bozmaz.
+
+Observability (log fields/metrics/traces):
+  latency, candidate_count, result_count.
+
+Testler: Unit (in-process indeks, tam tarama ile eşdeğerlik).
+Bağımlılıklar: Standart kütüphane + domain tipleri.
+Notlar/SSOT: Port interface core'da; infrastructure in-process grid ve PostGIS (GiST) implementasyonu taşır.
+"""
+
+from __future__ import annotations
+
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import List
+
+from src.core.domain.entities.field import Field
+
+
+@dataclass(frozen=True)
+class FieldDistance:
+    """En yakın tarla sorgusu sonucu (0.0 = nokta tarla içinde)."""
+
+    field_id: uuid.UUID
+    distance_m: float
+
+
+class FieldSpatialIndex(ABC):
+    """Tarla geometrileri üzerinde uzamsal sorgu portu (KR-013, KR-016).
+
+    Koordinatlar (boylam, enlem) sırasıyla verilir. Geometrisi olmayan
+    tarlalar indekse girmez.
+    """
+
+    # ------------------------------------------------------------------
+    # Güncelleme (FieldCreated / FieldUpdated / FieldDeleted)
+    # ------------------------------------------------------------------
+    @abstractmethod
+    async def upsert_field(self, field: Field) -> None:
+        """Tarla geometrisini indekse ekle veya güncelle (geometri yoksa çıkar)."""
+
+    @abstractmethod
+    async def remove_field(self, field_id: uuid.UUID) -> None:
+        """Tarlayı indeksten çıkar (yoksa sessizce geçer)."""
+
+    # ------------------------------------------------------------------
+    # Sorgular
+    # ------------------------------------------------------------------
+    @abstractmethod
+    async def find_by_bbox(
+        self,
+        min_lon: float,
+        min_lat: float,
+        max_lon: float,
+        max_lat: float,
+    ) -> List[uuid.UUID]:
+        """Bbox ile kesişen tarlaları getir."""
+
+    @abstractmethod
+    async def find_containing_point(self, lon: float, lat: float) -> List[uuid.UUID]:
+        """Noktayı içeren tarlaları getir."""
+
+    @abstractmethod
+    async def find_nearest(self, lon: float, lat: float, k: int = 1) -> List[FieldDistance]:
+        """Noktaya en yakın k tarlayı mesafe sırasıyla getir."""
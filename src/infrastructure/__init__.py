@@ -5,6 +5,7 @@
 Alt paketler:
   - config: Uygulama yapılandırması (Settings).
   - external: Dış servis adapter'ları (S3, SMS, Payment, AV Scanner, vb.).
+  - geospatial: Toplu polygon alan/kesişim hesapları (numpy + shapely).
   - integrations: Provider-spesifik entegrasyonlar (Cloudflare, NetGSM, Twilio, vb.).
   - messaging: Event bus ve kuyruk implementasyonları (RabbitMQ, WebSocket).
   - monitoring: Sağlık kontrolü, metrikler, güvenlik olay kaydı.
@@ -18,6 +19,7 @@ from . import (
     config,
     contracts,
     external,
+    geospatial,
     integrations,
     messaging,
     monitoring,
@@ -30,6 +32,7 @@ __all__: list[str] = [
     "config",
     "contracts",
     "external",
+    "geospatial",
     "integrations",
     "messaging",
     "monitoring",
@@ -0,0 +1,13 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-016: Geospatial infrastructure — toplu geometri hesapları.
+"""Geospatial infrastructure: vektörel polygon hesapları ve in-process tarla indeksi."""
+
+from src.infrastructure.geospatial.batch_polygon_engine import BatchPolygonEngine, PolygonBatch
+from src.infrastructure.geospatial.field_grid_index import GridFieldSpatialIndex, rings_from_geojson
+
+__all__: list[str] = [
+    "BatchPolygonEngine",
+    "PolygonBatch",
+    "GridFieldSpatialIndex",
+    "rings_from_geojson",
+]
@@ -0,0 +1,199 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# PATH: src/infrastructure/geospatial/batch_polygon_engine.py
+# DESC: Toplu polygon alan/kesişim/nokta-içerme hesabı; CoverageCalculator girdisi (KR-016).
+"""
+Batch polygon engine: çok sayıda tarla/footprint polygonu üzerinde vektörel geometri.
+
+Amaç: Günün tüm uçuş sonrası kapsam kontrollerini tek çağrıda hesaplamak.
+Sorumluluk: Polygonları düz NumPy koordinat dizisi + offset indeksinde tutmak;
+  alan (derece² ve metre²), footprint ∩ tarla kesişim alanı ve nokta içerme
+  hesaplarını toplu yapmak; sonuçları CoverageMeasurement olarak üretmek.
+
+Girdi/Çıktı (Contract/DTO/Event):
+  Girdi: Domain Polygon listeleri ((lon, lat) kapalı halka).
+  Çıktı: NumPy dizileri ve CoverageMeasurement listesi
+  (CoverageCalculator.evaluate_coverage_batch ile değerlendirilir).
+
+Güvenlik (RBAC/PII/Audit): PII taşımaz; yalnızca geometri.
+Hata Modları (idempotency/retry/rate limit):
+  Saf hesaplama, yan etkisizdir. Geçersiz (kendini kesen) polygonlar
+  kesişim öncesi make_valid ile onarılır. Uzunluk uyuşmazlığında
+  CoverageCalculationError.
+Observability (log fields/metrics/traces): N/A (çağıran servis loglar).
+Testler: Unit (tekil CoverageCalculator hesaplarıyla eşdeğerlik).
+Bağımlılıklar: numpy, shapely>=2 (vektörel GEOS API).
+Notlar/SSOT: Metre² hesabı, her tarlanın ortalama enlemi etrafında yerel
+  eşdikdörtgen projeksiyonla yapılır; footprint aynı tarla referansıyla
+  projekte edilir, böylece kesişim alanı tarla alanını aşmaz.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import shapely
+
+from src.core.domain.services.coverage_calculator import (
+    CoverageCalculationError,
+    CoverageMeasurement,
+    Polygon,
+)
+
+# Yerel eşdikdörtgen projeksiyon katsayıları (derece -> metre)
+_METERS_PER_DEG_LAT = 110_540.0
+_METERS_PER_DEG_LON_AT_EQUATOR = 111_320.0
+
+
+@dataclass(frozen=True)
+class PolygonBatch:
+    """Düz koordinat dizisi + offset indeksi ile saklanan polygon kümesi.
+
+    ``coords[offsets[k]:offsets[k + 1]]`` k. polygonun kapalı halkasıdır
+    (ilk ve son nokta aynı).
+    """
+
+    coords: np.ndarray  # (V, 2) float64, (lon, lat)
+    offsets: np.ndarray  # (n + 1,) int64
+
+    @classmethod
+    def from_polygons(cls, polygons: Sequence[Polygon]) -> PolygonBatch:
+        counts = np.fromiter((len(p.coordinates) for p in polygons), dtype=np.int64, count=len(polygons))
+        offsets = np.zeros(len(polygons) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        coords = np.fromiter(
+            (value for p in polygons for point in p.coordinates for value in point),
+            dtype=np.float64,
+            count=int(offsets[-1]) * 2,
+        ).reshape(-1, 2)
+        return cls(coords=coords, offsets=offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def ring_index(self) -> np.ndarray:
+        """Her köşenin ait olduğu polygon indeksi."""
+        return np.repeat(np.arange(len(self)), np.diff(self.offsets))
+
+
+class BatchPolygonEngine:
+    """Toplu polygon geometri hesapları (KR-016).
+
+    Alan hesapları saf NumPy (shoelace, kümülatif toplam ile polygon başına
+    indirgeme); kesişim ve nokta içerme shapely 2 vektörel API'si ile yapılır.
+    """
+
+    def areas(self, batch: PolygonBatch) -> np.ndarray:
+        """Düzlemsel shoelace alanları (koordinat birimi², ``CoverageCalculator.shoelace_area`` ile aynı)."""
+        return self._shoelace(batch.coords, batch.offsets)
+
+    def reference_points(self, batch: PolygonBatch) -> np.ndarray:
+        """Polygon başına projeksiyon referansı: (ilk köşe boylamı, köşelerin ortalama enlemi)."""
+        if len(batch) == 0:
+            return np.empty((0, 2), dtype=np.float64)
+        starts, ends = batch.offsets[:-1], batch.offsets[1:] - 1  # kapanış noktası hariç
+        lat_cumsum = np.concatenate(([0.0], np.cumsum(batch.coords[:, 1])))
+        mean_lat = (lat_cumsum[ends] - lat_cumsum[starts]) / (ends - starts)
+        return np.column_stack((batch.coords[starts, 0], mean_lat))
+
+    def project(self, batch: PolygonBatch, references: np.ndarray | None = None) -> np.ndarray:
+        """Koordinatları polygon başına referans etrafında yerel metreye çevirir."""
+        if references is None:
+            references = self.reference_points(batch)
+        per_vertex = references[batch.ring_index]
+        kx = _METERS_PER_DEG_LON_AT_EQUATOR * np.cos(np.radians(per_vertex[:, 1]))
+        x = (batch.coords[:, 0] - per_vertex[:, 0]) * kx
+        y = (batch.coords[:, 1] - per_vertex[:, 1]) * _METERS_PER_DEG_LAT
+        return np.column_stack((x, y))
+
+    def projected_areas_m2(self, batch: PolygonBatch, references: np.ndarray | None = None) -> np.ndarray:
+        """Yerel projeksiyonla metre² alanlar."""
+        return self._shoelace(self.project(batch, references), batch.offsets)
+
+    def intersection_areas_m2(
+        self,
+        fields: PolygonBatch,
+        footprints: PolygonBatch,
+        references: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """i. footprint ∩ i. tarla kesişim alanları (metre², tarla referansıyla projekte)."""
+        self._require_same_length(fields, footprints)
+        if references is None:
+            references = self.reference_points(fields)
+        field_geoms = self._to_geometries(fields, self.project(fields, references))
+        footprint_geoms = self._to_geometries(footprints, self.project(footprints, references))
+        return np.asarray(shapely.area(shapely.intersection(field_geoms, footprint_geoms)), dtype=np.float64)
+
+    def contains_points(
+        self,
+        batch: PolygonBatch,
+        polygon_index: np.ndarray,
+        points: np.ndarray,
+    ) -> np.ndarray:
+        """``points[j]`` noktası ``polygon_index[j]`` polygonunun içinde mi (sınır üzeri hariç)."""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        geoms = self._to_geometries(batch, batch.coords)
+        return np.asarray(
+            shapely.contains_xy(geoms[np.asarray(polygon_index, dtype=np.int64)], points[:, 0], points[:, 1]),
+            dtype=bool,
+        )
+
+    def measure_coverage(
+        self,
+        mission_ids: Sequence[uuid.UUID],
+        field_ids: Sequence[uuid.UUID],
+        fields: PolygonBatch,
+        footprints: PolygonBatch,
+    ) -> list[CoverageMeasurement]:
+        """Tüm (mission, tarla) çiftleri için CoverageCalculator girdisini tek geçişte üretir.
+
+        Kayan nokta hatası nedeniyle tarla alanını birkaç ulp aşan kesişimler
+        tarla alanına kırpılır.
+        """
+        self._require_same_length(fields, footprints)
+        if not len(mission_ids) == len(field_ids) == len(fields):
+            raise CoverageCalculationError("mission_ids, field_ids ve polygon sayıları eşit olmalıdır.")
+
+        references = self.reference_points(fields)
+        field_areas = self.projected_areas_m2(fields, references)
+        footprint_areas = self.projected_areas_m2(footprints, references)
+        intersections = np.minimum(self.intersection_areas_m2(fields, footprints, references), field_areas)
+
+        return [
+            CoverageMeasurement(
+                mission_id=mission_id,
+                field_id=field_id,
+                field_area_m2=float(field_area),
+                footprint_area_m2=float(footprint_area),
+                intersection_area_m2=float(intersection),
+            )
+            for mission_id, field_id, field_area, footprint_area, intersection in zip(
+                mission_ids, field_ids, field_areas, footprint_areas, intersections, strict=True
+            )
+        ]
+
+    @staticmethod
+    def _shoelace(xy: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+        if len(offsets) < 2:
+            return np.zeros(0, dtype=np.float64)
+        # Ardışık köşe çarpımları; polygonlar arası "kenar" kümülatif toplam farkında dışarıda kalır.
+        cross = xy[:-1, 0] * xy[1:, 1] - xy[1:, 0] * xy[:-1, 1]
+        cross_cumsum = np.concatenate(([0.0], np.cumsum(cross)))
+        return np.asarray(np.abs(cross_cumsum[offsets[1:] - 1] - cross_cumsum[offsets[:-1]]) / 2.0, dtype=np.float64)
+
+    @staticmethod
+    def _to_geometries(batch: PolygonBatch, xy: np.ndarray) -> np.ndarray:
+        rings = shapely.linearrings(xy, indices=batch.ring_index)
+        geoms = shapely.polygons(rings)
+        invalid = ~shapely.is_valid(geoms)
+        if invalid.any():
+            geoms[invalid] = shapely.make_valid(geoms[invalid])
+        return np.asarray(geoms, dtype=object)
+
+    @staticmethod
+    def _require_same_length(fields: PolygonBatch, footprints: PolygonBatch) -> None:
+        if len(fields) != len(footprints):
+            raise CoverageCalculationError("fields ve footprints aynı sayıda polygon içermelidir.")
@@ -0,0 +1,294 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# PATH: src/infrastructure/geospatial/field_grid_index.py
+# DESC: FieldSpatialIndex portunun in-process düzenli grid implementasyonu (KR-013, KR-016).
+"""
+GridFieldSpatialIndex: tarla geometrileri üzerinde bellek içi düzenli grid indeksi.
+
+Amaç: Pilot araçları ve parsel sorgusunun il listesini tarayıp her polygonu
+  tek tek test etmesi yerine hücre bazlı aday daraltma.
+Sorumluluk: Başlangıçta repository'den doldurma; FieldCreated/FieldUpdated/
+  FieldDeleted ile artımlı güncelleme; bbox/nokta/k-en-yakın sorguları.
+
+Girdi/Çıktı (Contract/DTO/Event):
+  Girdi: Field.geometry (GeoJSON Polygon/MultiPolygon, EPSG:4326).
+  Çıktı: field_id listeleri, FieldDistance.
+
+Güvenlik (RBAC/PII/Audit): Yalnızca geometri ve field_id tutar.
+Hata Modları (idempotency/retry/rate limit):
+  Upsert/remove idempotent; tanınmayan geometri tipleri indekslenmez.
+Observability (log fields/metrics/traces): N/A (çağıran servis loglar).
+Testler: Unit (tam tarama ile eşdeğerlik).
+Bağımlılıklar: Standart kütüphane + domain tipleri.
+Notlar/SSOT: Tek süreç içindir; çok replikada her süreç kendi indeksini event'lerle günceller.
+  Kalıcı/paylaşımlı sorgu için PostgisFieldSpatialIndex (GiST) kullanılır.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import uuid
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any, List, Mapping, Optional
+
+from src.core.domain.entities.field import Field
+from src.core.domain.services.coverage_calculator import CoverageCalculator, Polygon
+from src.core.ports.repositories.field_repository import FieldRepository
+from src.core.ports.repositories.field_spatial_index import FieldDistance, FieldSpatialIndex
+
+# Yerel eşdikdörtgen projeksiyon katsayıları (derece -> metre)
+_METERS_PER_DEG_LAT = 110_540.0
+_METERS_PER_DEG_LON_AT_EQUATOR = 111_320.0
+
+_Cell = tuple[int, int]
+_BBox = tuple[float, float, float, float]  # (min_lon, min_lat, max_lon, max_lat)
+
+
+def rings_from_geojson(geometry: Optional[Mapping[str, Any]]) -> tuple[Polygon, ...]:
+    """GeoJSON Polygon/MultiPolygon geometrisini halka listesine çevirir (delikler dahil)."""
+    if not geometry:
+        return ()
+    coordinates = geometry.get("coordinates") or []
+    if geometry.get("type") == "Polygon":
+        polygons = [coordinates]
+    elif geometry.get("type") == "MultiPolygon":
+        polygons = coordinates
+    else:
+        return ()
+
+    rings: list[Polygon] = []
+    for polygon in polygons:
+        for ring in polygon:
+            points = tuple((float(p[0]), float(p[1])) for p in ring)
+            if points and points[0] != points[-1]:
+                points = (*points, points[0])
+            rings.append(Polygon(coordinates=points))
+    return tuple(rings)
+
+
+@dataclass(frozen=True)
+class _IndexedField:
+    rings: tuple[Polygon, ...]
+    bbox: _BBox
+    cells: tuple[_Cell, ...]
+
+    def contains(self, lon: float, lat: float) -> bool:
+        # Çift-tek kuralı: delikler ve çoklu polygonlar halkaların XOR'u ile ele alınır.
+        inside = False
+        for ring in self.rings:
+            if CoverageCalculator.point_in_polygon((lon, lat), ring):
+                inside = not inside
+        return inside
+
+    def edges(self) -> Iterator[tuple[tuple[float, float], tuple[float, float]]]:
+        for ring in self.rings:
+            coords = ring.coordinates
+            yield from zip(coords, coords[1:], strict=False)
+
+
+class GridFieldSpatialIndex(FieldSpatialIndex):
+    """Düzenli grid tabanlı in-process tarla indeksi (KR-013, KR-016).
+
+    Her tarla, sınır kutusunun kapladığı ``cell_size_deg`` boyutlu hücrelere
+    kaydedilir. Sorgular önce hücrelerden aday toplar, ardından adayları
+    tam geometriyle doğrular. k-en-yakın sorgusu hücre halkalarını dışa
+    doğru genişletir; r. halkanın dışında kalan hiçbir tarla r hücre
+    genişliğinden yakın olamayacağı için k. sonuç bu sınırın içindeyse durur.
+    """
+
+    def __init__(self, cell_size_deg: float = 0.01) -> None:
+        if cell_size_deg <= 0:
+            raise ValueError("cell_size_deg must be positive")
+        self._cell_size = cell_size_deg
+        self._fields: dict[uuid.UUID, _IndexedField] = {}
+        self._cells: dict[_Cell, set[uuid.UUID]] = {}
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    # ------------------------------------------------------------------
+    # Doldurma ve güncelleme
+    # ------------------------------------------------------------------
+    async def load(self, repository: FieldRepository, provinces: Iterable[str]) -> int:
+        """Başlangıçta indeksi il listeleri üzerinden doldurur; indekslenen tarla sayısını döner."""
+        for province in provinces:
+            for field in await repository.list_by_province(province):
+                self.upsert(field.field_id, rings_from_geojson(field.geometry))
+        return len(self._fields)
+
+    def upsert(self, field_id: uuid.UUID, rings: tuple[Polygon, ...]) -> None:
+        self.remove(field_id)
+        if not rings:
+            return
+        lons = [lon for ring in rings for lon, _ in ring.coordinates]
+        lats = [lat for ring in rings for _, lat in ring.coordinates]
+        bbox = (min(lons), min(lats), max(lons), max(lats))
+        cells = tuple(self._cells_in_bbox(bbox))
+        self._fields[field_id] = _IndexedField(rings=rings, bbox=bbox, cells=cells)
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(field_id)
+
+    def remove(self, field_id: uuid.UUID) -> None:
+        entry = self._fields.pop(field_id, None)
+        if entry is None:
+            return
+        for cell in entry.cells:
+            members = self._cells[cell]
+            members.discard(field_id)
+            if not members:
+                del self._cells[cell]
+
+    async def upsert_field(self, field: Field) -> None:
+        self.upsert(field.field_id, rings_from_geojson(field.geometry))
+
+    async def remove_field(self, field_id: uuid.UUID) -> None:
+        self.remove(field_id)
+
+    # ------------------------------------------------------------------
+    # Sorgular
+    # ------------------------------------------------------------------
+    async def find_by_bbox(
+        self,
+        min_lon: float,
+        min_lat: float,
+        max_lon: float,
+        max_lat: float,
+    ) -> List[uuid.UUID]:
+        bbox = (min_lon, min_lat, max_lon, max_lat)
+        return [field_id for field_id in self._bbox_candidates(bbox) if self._intersects_bbox(field_id, bbox)]
+
+    async def find_containing_point(self, lon: float, lat: float) -> List[uuid.UUID]:
+        result: List[uuid.UUID] = []
+        for field_id in self._cells.get(self._cell_of(lon, lat), ()):
+            entry = self._fields[field_id]
+            min_lon, min_lat, max_lon, max_lat = entry.bbox
+            if min_lon <= lon <= max_lon and min_lat <= lat <= max_lat and entry.contains(lon, lat):
+                result.append(field_id)
+        return result
+
+    async def find_nearest(self, lon: float, lat: float, k: int = 1) -> List[FieldDistance]:
+        if k <= 0 or not self._fields:
+            return []
+
+        kx = _METERS_PER_DEG_LON_AT_EQUATOR * math.cos(math.radians(lat))
+        ky = _METERS_PER_DEG_LAT
+        ring_width_m = self._cell_size * min(kx, ky)
+        cx, cy = self._cell_of(lon, lat)
+
+        distances: dict[uuid.UUID, float] = {}
+        radius = 0
+        while len(distances) < len(self._fields):
+            if (2 * radius + 1) ** 2 > len(self._cells):
+                # Halka taraması dolu hücre sayısını aştı; kalanları doğrudan ölç.
+                for field_id in self._fields.keys() - distances.keys():
+                    distances[field_id] = self._distance_m(field_id, lon, lat, kx, ky)
+                break
+            for cell in self._ring_cells(cx, cy, radius):
+                for field_id in self._cells.get(cell, ()):
+                    if field_id not in distances:
+                        distances[field_id] = self._distance_m(field_id, lon, lat, kx, ky)
+            if len(distances) >= k and heapq.nsmallest(k, distances.values())[-1] <= radius * ring_width_m:
+                break
+            radius += 1
+
+        ranked = sorted(distances.items(), key=lambda item: (item[1], str(item[0])))
+        return [FieldDistance(field_id=field_id, distance_m=distance) for field_id, distance in ranked[:k]]
+
+    # ------------------------------------------------------------------
+    # Yardımcılar
+    # ------------------------------------------------------------------
+    def _cell_of(self, lon: float, lat: float) -> _Cell:
+        return (math.floor(lon / self._cell_size), math.floor(lat / self._cell_size))
+
+    def _cells_in_bbox(self, bbox: _BBox) -> Iterator[_Cell]:
+        x0, y0 = self._cell_of(bbox[0], bbox[1])
+        x1, y1 = self._cell_of(bbox[2], bbox[3])
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                yield (x, y)
+
+    def _bbox_candidates(self, bbox: _BBox) -> list[uuid.UUID]:
+        x0, y0 = self._cell_of(bbox[0], bbox[1])
+        x1, y1 = self._cell_of(bbox[2], bbox[3])
+        seen: dict[uuid.UUID, None] = {}
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(self._cells):
+            # Geniş bbox (örn. il geneli): boş hücreleri gezmek yerine dolu hücreleri süz.
+            for (x, y), members in self._cells.items():
+                if x0 <= x <= x1 and y0 <= y <= y1:
+                    seen.update(dict.fromkeys(members))
+        else:
+            for cell in self._cells_in_bbox(bbox):
+                seen.update(dict.fromkeys(self._cells.get(cell, ())))
+        return list(seen)
+
+    @staticmethod
+    def _ring_cells(cx: int, cy: int, radius: int) -> Iterator[_Cell]:
+        if radius == 0:
+            yield (cx, cy)
+            return
+        for x in range(cx - radius, cx + radius + 1):
+            yield (x, cy - radius)
+            yield (x, cy + radius)
+        for y in range(cy - radius + 1, cy + radius):
+            yield (cx - radius, y)
+            yield (cx + radius, y)
+
+    def _intersects_bbox(self, field_id: uuid.UUID, bbox: _BBox) -> bool:
+        entry = self._fields[field_id]
+        min_lon, min_lat, max_lon, max_lat = bbox
+        e_min_lon, e_min_lat, e_max_lon, e_max_lat = entry.bbox
+        if e_max_lon < min_lon or e_min_lon > max_lon or e_max_lat < min_lat or e_min_lat > max_lat:
+            return False
+        if any(
+            min_lon <= lon <= max_lon and min_lat <= lat <= max_lat
+            for ring in entry.rings
+            for lon, lat in ring.coordinates
+        ):
+            return True
+        # Bbox tamamen tarla içinde olabilir
+        if entry.contains(min_lon, min_lat):
+            return True
+        return any(_segment_hits_box(a, b, bbox) for a, b in entry.edges())
+
+    def _distance_m(self, field_id: uuid.UUID, lon: float, lat: float, kx: float, ky: float) -> float:
+        entry = self._fields[field_id]
+        if entry.contains(lon, lat):
+            return 0.0
+        best = math.inf
+        for (ax, ay), (bx, by) in entry.edges():
+            distance = _point_segment_distance((ax - lon) * kx, (ay - lat) * ky, (bx - lon) * kx, (by - lat) * ky)
+            best = min(best, distance)
+        return best
+
+
+def _point_segment_distance(ax: float, ay: float, bx: float, by: float) -> float:
+    """Orijinin (sorgu noktası) [a, b] doğru parçasına uzaklığı."""
+    dx, dy = bx - ax, by - ay
+    length_sq = dx * dx + dy * dy
+    t = 0.0 if length_sq == 0 else max(0.0, min(1.0, -(ax * dx + ay * dy) / length_sq))
+    return math.hypot(ax + t * dx, ay + t * dy)
+
+
+def _segment_hits_box(a: tuple[float, float], b: tuple[float, float], bbox: _BBox) -> bool:
+    """Liang-Barsky: [a, b] doğru parçası bbox ile kesişiyor mu."""
+    t0, t1 = 0.0, 1.0
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    for p, q in (
+        (-dx, a[0] - bbox[0]),
+        (dx, bbox[2] - a[0]),
+        (-dy, a[1] - bbox[1]),
+        (dy, bbox[3] - a[1]),
+    ):
+        if p == 0:
+            if q < 0:
+                return False
+            continue
+        t = q / p
+        if p < 0:
+            t0 = max(t0, t)
+        else:
+            t1 = min(t1, t)
+        if t0 > t1:
+            return False
+    return True
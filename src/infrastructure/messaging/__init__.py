@@ -1,3 +1,5 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: Messaging adapter'ları ve outbox relay dışa aktarımı.
 # PATH: src/infrastructure/messaging/__init__.py
 # DESC: Infrastructure messaging package: event bus ve kuyruk adapter'ları.
 """
@@ -9,6 +11,7 @@ Notlar/SSOT: KR-015, KR-018, KR-033, KR-081 ile tutarlı kalır.
 """
 
 from src.infrastructure.messaging.event_publisher import EventPublisher
+from src.infrastructure.messaging.outbox_relay import OutboxRelay, RelayStats
 from src.infrastructure.messaging.rabbitmq.ai_feedback_publisher import (
     AIFeedbackPublisher,
 )
@@ -32,6 +35,9 @@ __all__: list[str] = [
     # Event bus
     "EventPublisher",
     "RabbitMQEventBus",
+    # Transactional outbox
+    "OutboxRelay",
+    "RelayStats",
     # WebSocket
     "Notification",
     "WebSocketNotificationManager",
@@ -1,3 +1,5 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: Domain event -> exchange/routing key yönlendirmesi ve yayın.
 # PATH: src/infrastructure/messaging/event_publisher.py
 # DESC: Genel domain event publisher adapter.
 """
@@ -39,7 +41,7 @@ import structlog
 
 from src.core.domain.events.base import DomainEvent
 from src.infrastructure.config.settings import Settings
-from src.infrastructure.messaging.rabbitmq.publisher import RabbitMQPublisher
+from src.infrastructure.messaging.rabbitmq.publisher import BatchPublishResult, RabbitMQPublisher
 from src.infrastructure.messaging.rabbitmq_config import (
     DOMAIN_EVENTS_EXCHANGE,
     TRAINING_FEEDBACK_EXCHANGE,
@@ -99,6 +101,22 @@ _EVENT_CATEGORY_MAP: dict[str, tuple[str, str]] = {
 }
 
 
+def resolve_event_routing(event_type: str) -> tuple[str, str]:
+    """Event tipi adından (exchange, routing_key) belirler.
+
+    EventPublisher ve OutboxRelay aynı eşlemeyi kullanır.
+    """
+    if event_type in _EVENT_CATEGORY_MAP:
+        return _EVENT_CATEGORY_MAP[event_type]
+
+    # Bilinmeyen event tipleri -> genel domain events exchange
+    logger.warning(
+        "event_publisher_unknown_event_type",
+        event_type=event_type,
+    )
+    return (DOMAIN_EVENTS_EXCHANGE, f"event.unknown.{event_type.lower()}")
+
+
 class EventPublisher:
     """Genel domain event publisher.
 
@@ -128,16 +146,7 @@ class EventPublisher:
         Returns:
             (exchange_name, routing_key) tuple.
         """
-        event_type = event.event_type
-        if event_type in _EVENT_CATEGORY_MAP:
-            return _EVENT_CATEGORY_MAP[event_type]
-
-        # Bilinmeyen event tipleri -> genel domain events exchange
-        logger.warning(
-            "event_publisher_unknown_event_type",
-            event_type=event_type,
-        )
-        return (DOMAIN_EVENTS_EXCHANGE, f"event.unknown.{event_type.lower()}")
+        return resolve_event_routing(event.event_type)
 
     async def publish(self, event: DomainEvent) -> None:
         """Tek bir domain event'i yayınla.
@@ -168,17 +177,24 @@ class EventPublisher:
             message_id=message_id,
         )
 
-    async def publish_batch(self, events: list[DomainEvent]) -> None:
-        """Birden fazla event'i sıralı yayınla.
+    async def publish_batch(self, events: list[DomainEvent]) -> BatchPublishResult:
+        """Birden fazla event'i exchange bazında pipeline'lı yayınla.
+
+        Her exchange grubu RabbitMQPublisher.publish_batch ile tek seferde
+        gönderilir; grup içi sıra korunur.
 
         Args:
             events: Yayınlanacak event listesi (sıralı).
 
+        Returns:
+            Tüm gruplar için mesaj bazlı sonuçlar (message_id = ``evt-<event_id>``).
+
         Raises:
             ConnectionError: Broker'a bağlantı kurulamadığında.
         """
+        result = BatchPublishResult()
         if not events:
-            return
+            return result
 
         # Exchange'e göre grupla
         grouped: dict[str, list[tuple[str, dict[str, Any], str]]] = {}
@@ -192,15 +208,17 @@ class EventPublisher:
                 grouped[exchange_name] = []
             grouped[exchange_name].append((routing_key, body, message_id))
 
-        # Her exchange grubu için batch publish
+        # Her exchange grubu için pipeline'lı batch publish
         for exchange_name, messages in grouped.items():
-            await self._publisher.publish_batch(exchange_name, messages)
+            result.merge(await self._publisher.publish_batch(exchange_name, messages))
 
         logger.info(
             "event_publisher_batch_published",
             total_count=len(events),
             exchange_count=len(grouped),
+            failed_count=len(result.failed),
         )
+        return result
 
     async def health_check(self) -> bool:
         """Publisher bağlantı sağlığını kontrol eder."""
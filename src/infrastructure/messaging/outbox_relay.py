@@ -0,0 +1,211 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: Transactional outbox relay — event_outbox -> RabbitMQ aktarımı.
+# PATH: src/infrastructure/messaging/outbox_relay.py
+# DESC: event_outbox tablosunu partiler halinde RabbitMQ'ya aktaran arka plan relay'i.
+"""
+OutboxRelay: unit of work içinde yazılan outbox event'lerini broker'a aktarır.
+
+Amaç: Command handler'ların broker'ı beklemeden commit etmesi; event'lerin
+  commit edilmiş veriyle tutarlı olarak en az bir kez yayınlanması.
+
+Sorumluluk: Bekleyen satırları partiler halinde claim etmek (FOR UPDATE SKIP LOCKED),
+  RabbitMQPublisher.publish_batch ile pipeline'lı göndermek, sonuçları işaretlemek
+  ve teslim edilmiş satırları periyodik olarak silmek (compaction).
+
+Girdi/Çıktı (Contract/DTO/Event):
+  Girdi: event_outbox satırları (OutboxRecord).
+  Çıktı: RabbitMQ mesajları (message_id = ``evt-<event_id>``), RelayStats sayaçları.
+
+Hata Modları (idempotency/retry/rate limit):
+  Broker bağlantısı yoksa transaction geri alınır, satırlar bekler ve döngü
+  geri çekilerek tekrar dener. Tekil nack'lenen mesajın attempts sayacı artar;
+  max_attempts'a ulaşan satır claim edilmez (last_error ile incelenir).
+  Teslim en az bir kezdir; consumer message_id ile dedup yapar. Birden fazla
+  relay worker'da partiler arası global sıra garanti edilmez.
+
+Observability (log fields/metrics/traces):
+  claimed, published, failed, compacted, latency_ms.
+
+Testler: Unit (in-memory outbox ile claim/işaretleme/compaction davranışı).
+Bağımlılıklar: RabbitMQPublisher, SqlAlchemyOutboxRepository (outbox_transaction), structlog.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, List, Optional, Protocol, Sequence
+
+import structlog
+
+from src.infrastructure.messaging.event_publisher import resolve_event_routing
+from src.infrastructure.messaging.rabbitmq.publisher import RabbitMQPublisher
+from src.infrastructure.persistence.sqlalchemy.repositories.outbox_repository_impl import OutboxRecord
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_OUTBOX_BATCH_SIZE = 500
+DEFAULT_OUTBOX_POLL_INTERVAL = 1.0  # saniye
+DEFAULT_OUTBOX_MAX_ATTEMPTS = 10
+DEFAULT_OUTBOX_RETENTION = timedelta(hours=1)
+DEFAULT_OUTBOX_COMPACT_INTERVAL = 60.0  # saniye
+DEFAULT_OUTBOX_COMPACT_LIMIT = 5_000
+_MAX_ERROR_BACKOFF = 30.0  # saniye
+
+
+class OutboxRepository(Protocol):
+    """Relay'in tek transaction içinde kullandığı outbox erişimi."""
+
+    async def claim_pending(self, limit: int, max_attempts: int) -> List[OutboxRecord]: ...
+
+    async def mark_published(self, seqs: Sequence[int]) -> None: ...
+
+    async def mark_failed(self, seq: int, error: str) -> None: ...
+
+    async def compact(self, published_before: datetime, limit: int) -> int: ...
+
+
+OutboxTransaction = Callable[[], AbstractAsyncContextManager[OutboxRepository]]
+
+
+@dataclass
+class RelayStats:
+    """Relay sayaçları (süreç ömrü boyunca kümülatif)."""
+
+    batches: int = 0
+    published: int = 0
+    failed: int = 0
+    compacted: int = 0
+    errors: int = 0
+
+
+class OutboxRelay:
+    """event_outbox -> RabbitMQ arka plan relay'i (KR-081).
+
+    Birden fazla replika/worker güvenle çalışabilir; SKIP LOCKED sayesinde
+    her satır aynı anda tek worker tarafından claim edilir.
+
+    Kullanım:
+        relay = OutboxRelay(outbox_transaction(session_factory), publisher)
+        task = asyncio.create_task(relay.run(stop_event))
+    """
+
+    def __init__(
+        self,
+        transaction: OutboxTransaction,
+        publisher: RabbitMQPublisher,
+        *,
+        batch_size: int = DEFAULT_OUTBOX_BATCH_SIZE,
+        poll_interval: float = DEFAULT_OUTBOX_POLL_INTERVAL,
+        max_attempts: int = DEFAULT_OUTBOX_MAX_ATTEMPTS,
+        retention: timedelta = DEFAULT_OUTBOX_RETENTION,
+        compact_interval: float = DEFAULT_OUTBOX_COMPACT_INTERVAL,
+        compact_limit: int = DEFAULT_OUTBOX_COMPACT_LIMIT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self._transaction = transaction
+        self._publisher = publisher
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._max_attempts = max_attempts
+        self._retention = retention
+        self._compact_interval = compact_interval
+        self._compact_limit = compact_limit
+        self._clock = clock
+        self._last_compaction: Optional[float] = None
+        self.stats = RelayStats()
+
+    async def drain_once(self) -> int:
+        """Bir parti claim edip yayınlar; claim edilen satır sayısını döner.
+
+        Raises:
+            ConnectionError: Broker'a bağlanılamazsa (transaction geri alınır).
+        """
+        start_time = time.monotonic()
+        async with self._transaction() as outbox:
+            records = await outbox.claim_pending(self._batch_size, self._max_attempts)
+            if not records:
+                return 0
+
+            grouped: dict[str, list[tuple[str, dict[str, Any], str]]] = {}
+            seq_by_message_id: dict[str, int] = {}
+            for record in records:
+                exchange_name, routing_key = resolve_event_routing(record.event_type)
+                message_id = f"evt-{record.event_id}"
+                grouped.setdefault(exchange_name, []).append((routing_key, record.payload, message_id))
+                seq_by_message_id[message_id] = record.seq
+
+            published: list[int] = []
+            failed = 0
+            for exchange_name, messages in grouped.items():
+                result = await self._publisher.publish_batch(exchange_name, messages)
+                for outcome in result.outcomes:
+                    seq = seq_by_message_id[outcome.message_id]
+                    if outcome.ok:
+                        published.append(seq)
+                    else:
+                        failed += 1
+                        await outbox.mark_failed(seq, outcome.error or "publish_failed")
+            await outbox.mark_published(published)
+
+        self.stats.batches += 1
+        self.stats.published += len(published)
+        self.stats.failed += failed
+        logger.info(
+            "outbox_relay_batch",
+            claimed=len(records),
+            published=len(published),
+            failed=failed,
+            latency_ms=round((time.monotonic() - start_time) * 1000, 2),
+        )
+        return len(records)
+
+    async def compact(self) -> int:
+        """Saklama süresi dolmuş teslim edilmiş satırları siler."""
+        cutoff = datetime.now(timezone.utc) - self._retention
+        async with self._transaction() as outbox:
+            removed = await outbox.compact(cutoff, self._compact_limit)
+        self._last_compaction = self._clock()
+        self.stats.compacted += removed
+        if removed:
+            logger.info("outbox_relay_compacted", compacted=removed)
+        return removed
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """stop set edilene kadar outbox'ı boşaltır.
+
+        Dolu parti sonrası beklemeden devam edilir; boş/kısmi partide
+        poll_interval kadar beklenir. Hata durumunda bekleme üstel artar.
+        """
+        backoff = self._poll_interval
+        while not stop.is_set():
+            try:
+                drained = await self.drain_once()
+                if self._compaction_due():
+                    await self.compact()
+                backoff = self._poll_interval
+            except Exception as exc:
+                self.stats.errors += 1
+                logger.warning("outbox_relay_error", error=str(exc), retry_in_s=backoff)
+                await self._wait(stop, backoff)
+                backoff = min(backoff * 2, _MAX_ERROR_BACKOFF)
+                continue
+            if drained < self._batch_size:
+                await self._wait(stop, self._poll_interval)
+
+    def _compaction_due(self) -> bool:
+        if self._last_compaction is None:
+            return True
+        return self._clock() - self._last_compaction >= self._compact_interval
+
+    @staticmethod
+    async def _wait(stop: asyncio.Event, timeout: float) -> None:
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
@@ -1,19 +1,61 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: RabbitMQ messaging adapters — contract-first event taşıma.
 # PATH: src/infrastructure/messaging/rabbitmq/__init__.py
 # DESC: RabbitMQ messaging package.
 """RabbitMQ messaging adapters."""
 
 from src.infrastructure.messaging.rabbitmq.ai_feedback_publisher import (
     AIFeedbackPublisher,
+    FeedbackItem,
+    FeedbackPublishStats,
+)
+from src.infrastructure.messaging.rabbitmq.consumer import (
+    OrderingKey,
+    RabbitMQConsumer,
+    RetryCounters,
+    order_by_field,
+    order_by_routing_key,
+)
+from src.infrastructure.messaging.rabbitmq.dead_letter import (
+    DeadLetterReplayer,
+    DeadLetterSummary,
+    ReplayResult,
+)
+from src.infrastructure.messaging.rabbitmq.dedup_store import (
+    DedupStats,
+    DedupStore,
+    InMemoryDedupStore,
+    RedisDedupStore,
+)
+from src.infrastructure.messaging.rabbitmq.publisher import (
+    BatchPublishError,
+    BatchPublishResult,
+    PublishOutcome,
+    RabbitMQPublisher,
 )
-from src.infrastructure.messaging.rabbitmq.consumer import RabbitMQConsumer
-from src.infrastructure.messaging.rabbitmq.publisher import RabbitMQPublisher
 from src.infrastructure.messaging.rabbitmq.training_feedback_publisher import (
     TrainingFeedbackPublisher,
 )
 
 __all__: list[str] = [
     "AIFeedbackPublisher",
+    "FeedbackItem",
+    "FeedbackPublishStats",
     "RabbitMQConsumer",
+    "OrderingKey",
+    "RetryCounters",
+    "order_by_field",
+    "order_by_routing_key",
+    "DeadLetterReplayer",
+    "DeadLetterSummary",
+    "ReplayResult",
+    "DedupStats",
+    "DedupStore",
+    "InMemoryDedupStore",
+    "RedisDedupStore",
+    "BatchPublishError",
+    "BatchPublishResult",
+    "PublishOutcome",
     "RabbitMQPublisher",
     "TrainingFeedbackPublisher",
 ]
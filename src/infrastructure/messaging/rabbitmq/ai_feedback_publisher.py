@@ -1,3 +1,5 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-029: Expert feedback -> training pipeline (toplu submit, chunk'lı export manifest).
 # PATH: src/infrastructure/messaging/rabbitmq/ai_feedback_publisher.py
 # DESC: AI feedback publisher adapter.
 """
@@ -19,8 +21,25 @@ Hata Modları (idempotency/retry/rate limit):
   Timeout, transient failure, idempotency; retry (exponential backoff)
   ve circuit breaker (opsiyonel). Mesaj publish idempotent (message_id ile dedup).
 
+  Toplu gönderim: submit_feedback_batch kayıtları batch_max_items'lık gruplar
+  halinde tek mesajda yayınlar (gövde compress_min_bytes üzerindeyse gzip,
+  content_encoding=gzip). batch_window_seconds > 0 ise submit_feedback da
+  pencere içindeki çağrıları birleştirir; her çağrı kendi sonucunu alır.
+  Batch message_id'si feedback ID'lerinden türetilir; aynı batch'in tekrarı dedup edilir.
+
+  Export manifest: export_training_dataset(manifest=...) kayıtları
+  manifest_chunk_records'luk gzip'li JSONL chunk'ları olarak sırayla yayınlar;
+  son chunk x-chunk-last=True ve x-record-count başlıklarını taşır. Kaynak
+  veya chunk yayını yarıda hata verirse boş bir son chunk x-chunk-last=True
+  ve x-chunk-aborted=True ile gönderilir; consumer export'u iptal eder.
+
+  Durum sorgusu: management API tek bir pooled httpx client ile çağrılır;
+  kuyruk derinliği status_cache_ttl_seconds boyunca önbellekte tutulur ve
+  eşzamanlı sorgular tek HTTP isteğinde birleşir.
+
 Observability (log fields/metrics/traces):
   latency, error_code, retries, queue depth, confirmation_id, routing_key.
+  FeedbackPublishStats: batch/item/chunk sayıları, ham ve gönderilen bayt, status cache isabeti.
 
 Testler: Contract test (port), integration test (RabbitMQ stub), e2e (kritik akış).
 Bağımlılıklar: aio-pika (AMQP client), structlog.
@@ -30,10 +49,13 @@ Notlar/SSOT: Port interface core'da; infrastructure yalnızca implementasyon ta
 
 from __future__ import annotations
 
-import json
+import asyncio
+import gzip
+import time
 import uuid
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Optional, Sequence, Union
 
 import structlog
 
@@ -44,6 +66,7 @@ from src.core.ports.external.ai_worker_feedback import (
     TrainingDatasetExport,
 )
 from src.infrastructure.config.settings import Settings
+from src.infrastructure.messaging.rabbitmq.publisher import JSON_ENCODER
 
 logger = structlog.get_logger(__name__)
 
@@ -52,11 +75,81 @@ _FEEDBACK_EXCHANGE = "ai.feedback"
 _FEEDBACK_ROUTING_KEY = "feedback.submit"
 _EXPORT_ROUTING_KEY = "feedback.export"
 _STATUS_ROUTING_KEY = "feedback.status"
+_SUBMIT_QUEUE = "ai.feedback.submit"
+
+# Mesaj tipleri (AMQP type property); tekil feedback tipsiz yayınlanır
+FEEDBACK_BATCH_MESSAGE_TYPE = "feedback.batch"
+EXPORT_MANIFEST_CHUNK_MESSAGE_TYPE = "feedback.export.manifest_chunk"
+
+# Manifest chunk başlıkları
+EXPORT_ID_HEADER = "x-export-id"
+CHUNK_INDEX_HEADER = "x-chunk-index"
+CHUNK_LAST_HEADER = "x-chunk-last"
+RECORD_COUNT_HEADER = "x-record-count"
+CHUNK_ABORTED_HEADER = "x-chunk-aborted"
 
 # Retry sabitleri (kuyruk bağlantısı için)
 _MAX_RECONNECT_ATTEMPTS = 3
 _RECONNECT_DELAY_SECONDS = 2
 
+DEFAULT_BATCH_MAX_ITEMS = 200
+DEFAULT_BATCH_WINDOW_SECONDS = 0.0  # 0: submit_feedback her çağrıda hemen yayınlar
+DEFAULT_COMPRESS_MIN_BYTES = 1024
+DEFAULT_STATUS_CACHE_TTL_SECONDS = 2.0
+DEFAULT_MANIFEST_CHUNK_RECORDS = 500
+
+ManifestSource = Union[Iterable[dict[str, Any]], AsyncIterable[dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class FeedbackItem:
+    """submit_feedback_batch girdisi; alanlar submit_feedback argümanlarıyla aynıdır."""
+
+    feedback_id: uuid.UUID
+    review_id: uuid.UUID
+    mission_id: uuid.UUID
+    model_id: str
+    verdict: str
+    training_grade: str
+    corrected_class: Optional[str] = None
+    notes: Optional[str] = None
+    expert_confidence: Optional[float] = None
+
+    @property
+    def confirmation_id(self) -> str:
+        return f"fb-{self.feedback_id}"
+
+    def to_body(self, submitted_at: str) -> dict[str, Any]:
+        body: dict[str, Any] = {
+            "feedback_id": str(self.feedback_id),
+            "review_id": str(self.review_id),
+            "mission_id": str(self.mission_id),
+            "model_id": self.model_id,
+            "verdict": self.verdict,
+            "training_grade": self.training_grade,
+            "submitted_at": submitted_at,
+        }
+        if self.corrected_class is not None:
+            body["corrected_class"] = self.corrected_class
+        if self.notes is not None:
+            body["notes"] = self.notes
+        if self.expert_confidence is not None:
+            body["expert_confidence"] = self.expert_confidence
+        return body
+
+
+@dataclass
+class FeedbackPublishStats:
+    """Publisher sayaçları (süreç ömrü boyunca birikir)."""
+
+    batches: int = 0
+    batched_items: int = 0
+    manifest_chunks: int = 0
+    bytes_raw: int = 0
+    bytes_sent: int = 0
+    status_requests: int = 0
+    status_cache_hits: int = 0
+
 
 class AIFeedbackPublisher(AIWorkerFeedback):
     """AIWorkerFeedback port implementasyonu (RabbitMQ publisher).
@@ -76,11 +169,45 @@ class AIFeedbackPublisher(AIWorkerFeedback):
       Queue: ai.feedback.export (durable)
     """
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        *,
+        batch_max_items: int = DEFAULT_BATCH_MAX_ITEMS,
+        batch_window_seconds: float = DEFAULT_BATCH_WINDOW_SECONDS,
+        compress_min_bytes: int = DEFAULT_COMPRESS_MIN_BYTES,
+        manifest_chunk_records: int = DEFAULT_MANIFEST_CHUNK_RECORDS,
+        status_cache_ttl_seconds: float = DEFAULT_STATUS_CACHE_TTL_SECONDS,
+        http_client: Any = None,
+    ) -> None:
+        if batch_max_items < 1:
+            raise ValueError("batch_max_items must be >= 1")
+        if manifest_chunk_records < 1:
+            raise ValueError("manifest_chunk_records must be >= 1")
         self._settings = settings
         self._rabbitmq_url = settings.rabbitmq_url
         self._connection: Any = None
         self._channel: Any = None
+        self._batch_max_items = batch_max_items
+        self._batch_window = batch_window_seconds
+        self._compress_min_bytes = compress_min_bytes
+        self._manifest_chunk_records = manifest_chunk_records
+        self._status_ttl = status_cache_ttl_seconds
+        self._stats = FeedbackPublishStats()
+
+        # Birleştirme penceresi: (kayıt, sonucu bekleyen future)
+        self._pending: list[tuple[FeedbackItem, asyncio.Future[FeedbackSubmissionResult]]] = []
+        self._window_task: Optional[asyncio.Task[None]] = None
+
+        # Management API: pooled client ve kuyruk derinliği önbelleği (expires_at, depth)
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+        self._status_cache: Optional[tuple[float, int]] = None
+        self._status_inflight: Optional[asyncio.Future[int]] = None
+
+    @property
+    def stats(self) -> FeedbackPublishStats:
+        return self._stats
 
     async def _ensure_connection(self) -> None:
         """RabbitMQ bağlantısını sağlar (lazy initialization)."""
@@ -106,7 +233,7 @@ class AIFeedbackPublisher(AIWorkerFeedback):
 
             # Feedback submit kuyruğu (durable + DLX)
             submit_queue = await self._channel.declare_queue(
-                "ai.feedback.submit",
+                _SUBMIT_QUEUE,
                 durable=True,
                 arguments={
                     "x-dead-letter-exchange": f"{_FEEDBACK_EXCHANGE}.dlx",
@@ -130,6 +257,30 @@ class AIFeedbackPublisher(AIWorkerFeedback):
             self._channel = None
             raise
 
+    @staticmethod
+    def _build_message(
+        body: bytes,
+        message_id: str,
+        *,
+        content_type: str = "application/json",
+        content_encoding: Optional[str] = None,
+        message_type: Optional[str] = None,
+        headers: Optional[dict[str, Any]] = None,
+    ) -> Any:
+        """Persistent aio-pika mesajı oluşturur."""
+        import aio_pika
+
+        return aio_pika.Message(
+            body=body,
+            content_type=content_type,
+            content_encoding=content_encoding,
+            type=message_type,
+            headers=headers or {},
+            message_id=message_id,
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            timestamp=datetime.utcnow(),
+        )
+
     async def _publish_message(
         self,
         routing_key: str,
@@ -137,26 +288,49 @@ class AIFeedbackPublisher(AIWorkerFeedback):
         message_id: str,
     ) -> None:
         """Mesajı RabbitMQ exchange'ine publish eder."""
-        import aio_pika
+        await self._publish_raw(routing_key, JSON_ENCODER.encode(body).encode("utf-8"), message_id)
 
+    async def _publish_raw(
+        self,
+        routing_key: str,
+        payload: bytes,
+        message_id: str,
+        *,
+        content_type: str = "application/json",
+        message_type: Optional[str] = None,
+        headers: Optional[dict[str, Any]] = None,
+        compress: bool = False,
+    ) -> None:
+        """Hazır gövdeyi publish eder; compress=True ve eşik aşılmışsa gzip uygular."""
         await self._ensure_connection()
 
         exchange = await self._channel.get_exchange(_FEEDBACK_EXCHANGE)
 
-        message = aio_pika.Message(
-            body=json.dumps(body, default=str).encode("utf-8"),
-            content_type="application/json",
-            message_id=message_id,
-            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-            timestamp=datetime.utcnow(),
+        raw_size = len(payload)
+        content_encoding: Optional[str] = None
+        if compress and raw_size >= self._compress_min_bytes:
+            payload = gzip.compress(payload, compresslevel=6, mtime=0)
+            content_encoding = "gzip"
+
+        message = self._build_message(
+            payload,
+            message_id,
+            content_type=content_type,
+            content_encoding=content_encoding,
+            message_type=message_type,
+            headers=headers,
         )
 
         await exchange.publish(message, routing_key=routing_key)
+        self._stats.bytes_raw += raw_size
+        self._stats.bytes_sent += len(payload)
 
         logger.info(
             "rabbitmq_message_published",
             routing_key=routing_key,
             message_id=message_id,
+            content_encoding=content_encoding,
+            size_bytes=len(payload),
         )
 
     # ------------------------------------------------------------------
@@ -175,8 +349,22 @@ class AIFeedbackPublisher(AIWorkerFeedback):
         notes: Optional[str] = None,
         expert_confidence: Optional[float] = None,
     ) -> FeedbackSubmissionResult:
-        """Uzman feedback'ini RabbitMQ kuyruğuna publish et (KR-029)."""
-        confirmation_id = f"fb-{feedback_id}"
+        """Uzman feedback'ini RabbitMQ kuyruğuna publish et (KR-029).
+
+        batch_window_seconds > 0 ise çağrı pencere kapanana (veya batch
+        dolana) kadar bekler ve diğer çağrılarla tek mesajda yayınlanır.
+        """
+        item = FeedbackItem(
+            feedback_id=feedback_id,
+            review_id=review_id,
+            mission_id=mission_id,
+            model_id=model_id,
+            verdict=verdict,
+            training_grade=training_grade,
+            corrected_class=corrected_class,
+            notes=notes,
+            expert_confidence=expert_confidence,
+        )
 
         logger.info(
             "ai_feedback_submit_request",
@@ -188,26 +376,14 @@ class AIFeedbackPublisher(AIWorkerFeedback):
             training_grade=training_grade,
         )
 
-        body: dict[str, Any] = {
-            "feedback_id": str(feedback_id),
-            "review_id": str(review_id),
-            "mission_id": str(mission_id),
-            "model_id": model_id,
-            "verdict": verdict,
-            "training_grade": training_grade,
-            "submitted_at": datetime.utcnow().isoformat() + "Z",
-        }
-        if corrected_class is not None:
-            body["corrected_class"] = corrected_class
-        if notes is not None:
-            body["notes"] = notes
-        if expert_confidence is not None:
-            body["expert_confidence"] = expert_confidence
+        if self._batch_window > 0:
+            return await self._enqueue(item)
 
+        confirmation_id = item.confirmation_id
         try:
             await self._publish_message(
                 routing_key=_FEEDBACK_ROUTING_KEY,
-                body=body,
+                body=item.to_body(_utc_now_iso()),
                 message_id=confirmation_id,
             )
 
@@ -235,6 +411,81 @@ class AIFeedbackPublisher(AIWorkerFeedback):
                 message=f"Feedback gönderilemedi: {type(exc).__name__}",
             )
 
+    async def submit_feedback_batch(
+        self,
+        items: Sequence[FeedbackItem],
+    ) -> list[FeedbackSubmissionResult]:
+        """Feedback kayıtlarını batch_max_items'lık gruplar halinde tek mesajlarla gönder.
+
+        Sonuçlar girdi sırasıyla döner; bir grubun publish hatası yalnızca
+        o grubun kayıtlarını accepted=False yapar.
+        """
+        results: list[FeedbackSubmissionResult] = []
+        submitted_at = _utc_now_iso()
+        for start in range(0, len(items), self._batch_max_items):
+            group = items[start : start + self._batch_max_items]
+            ids = [item.confirmation_id for item in group]
+            batch_id = f"fbb-{uuid.uuid5(uuid.NAMESPACE_URL, ','.join(ids))}"
+            body = {"batch_id": batch_id, "items": [item.to_body(submitted_at) for item in group]}
+            try:
+                await self._publish_raw(
+                    _FEEDBACK_ROUTING_KEY,
+                    JSON_ENCODER.encode(body).encode("utf-8"),
+                    batch_id,
+                    message_type=FEEDBACK_BATCH_MESSAGE_TYPE,
+                    headers={RECORD_COUNT_HEADER: len(group)},
+                    compress=True,
+                )
+            except Exception as exc:
+                logger.error(
+                    "ai_feedback_batch_failed",
+                    batch_id=batch_id,
+                    item_count=len(group),
+                    error=str(exc),
+                )
+                message = f"Feedback gönderilemedi: {type(exc).__name__}"
+                results.extend(FeedbackSubmissionResult(cid, False, message) for cid in ids)
+                continue
+
+            self._stats.batches += 1
+            self._stats.batched_items += len(group)
+            logger.info("ai_feedback_batch_success", batch_id=batch_id, item_count=len(group))
+            results.extend(FeedbackSubmissionResult(cid, True, "Feedback kuyruğa alındı") for cid in ids)
+        return results
+
+    async def _enqueue(self, item: FeedbackItem) -> FeedbackSubmissionResult:
+        future: asyncio.Future[FeedbackSubmissionResult] = asyncio.get_running_loop().create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self._batch_max_items:
+            await self.flush()
+        elif self._window_task is None:
+            self._window_task = asyncio.ensure_future(self._flush_after_window())
+        return await future
+
+    async def _flush_after_window(self) -> None:
+        await asyncio.sleep(self._batch_window)
+        self._window_task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Birleştirme penceresinde bekleyen feedback'leri hemen gönder."""
+        if self._window_task is not None:
+            self._window_task.cancel()
+            self._window_task = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        try:
+            results = await self.submit_feedback_batch([item for item, _ in pending])
+        except BaseException as exc:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(exc)
+            raise
+        for (_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
+
     # ------------------------------------------------------------------
     # Training dataset export
     # ------------------------------------------------------------------
@@ -247,8 +498,14 @@ class AIFeedbackPublisher(AIWorkerFeedback):
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
         format: str = "jsonl",
+        manifest: Optional[ManifestSource] = None,
     ) -> TrainingDatasetExport:
-        """Training dataset export isteğini kuyruğa gönder (KR-029)."""
+        """Training dataset export isteğini kuyruğa gönder (KR-029).
+
+        manifest verilirse kayıtlar istek mesajının ardından export_id ile
+        ilişkili chunk mesajları olarak akıtılır (bellekte en fazla bir chunk
+        tutulur) ve record_count akıtılan kayıt sayısını gösterir.
+        """
         export_id = uuid.uuid4()
         message_id = f"export-{export_id}"
 
@@ -273,6 +530,8 @@ class AIFeedbackPublisher(AIWorkerFeedback):
             body["date_from"] = date_from.isoformat() + "Z"
         if date_to:
             body["date_to"] = date_to.isoformat() + "Z"
+        if manifest is not None:
+            body["manifest"] = "chunked"
 
         await self._publish_message(
             routing_key=_EXPORT_ROUTING_KEY,
@@ -280,20 +539,92 @@ class AIFeedbackPublisher(AIWorkerFeedback):
             message_id=message_id,
         )
 
+        record_count = 0
+        if manifest is not None:
+            record_count = await self._stream_manifest(export_id, manifest)
+
         logger.info(
             "ai_feedback_export_queued",
             export_id=str(export_id),
+            record_count=record_count,
         )
 
         # Export asenkron olarak işlenir; blob_id consumer tarafından atanır
         return TrainingDatasetExport(
             export_id=export_id,
             blob_id=f"exports/feedback/{export_id}.{format}",
-            record_count=0,  # Consumer tarafından güncellenir
+            record_count=record_count,  # manifest yoksa consumer tarafından güncellenir
             exported_at=datetime.utcnow(),
             format=format,
         )
 
+    async def _stream_manifest(self, export_id: uuid.UUID, manifest: ManifestSource) -> int:
+        """Manifest kayıtlarını gzip'li JSONL chunk'ları olarak yayınlar; kayıt sayısını döner.
+
+        Toplam chunk sayısı önceden bilinmez: bir chunk, sonraki dolana kadar
+        bekletilir ve kaynak bitince son chunk x-chunk-last=True ile gider.
+        Boş manifest tek bir boş son chunk üretir. Yarıda kalan akış,
+        consumer'ın x-chunk-last beklerken takılmaması için iptal işaretli
+        boş bir son chunk ile kapatılır ve hata yeniden yükseltilir.
+        """
+        held: Optional[list[bytes]] = None
+        current: list[bytes] = []
+        index = 0
+        total = 0
+
+        async def _emit(lines: list[bytes], last: bool, aborted: bool = False) -> None:
+            nonlocal index
+            headers: dict[str, Any] = {
+                EXPORT_ID_HEADER: str(export_id),
+                CHUNK_INDEX_HEADER: index,
+                CHUNK_LAST_HEADER: last,
+            }
+            if aborted:
+                headers[CHUNK_ABORTED_HEADER] = True
+            elif last:
+                headers[RECORD_COUNT_HEADER] = total
+            await self._publish_raw(
+                _EXPORT_ROUTING_KEY,
+                b"".join(lines),
+                f"export-{export_id}-chunk-{index}",
+                content_type="application/x-ndjson",
+                message_type=EXPORT_MANIFEST_CHUNK_MESSAGE_TYPE,
+                headers=headers,
+                compress=True,
+            )
+            self._stats.manifest_chunks += 1
+            index += 1
+
+        try:
+            async for record in _aiter(manifest):
+                current.append(JSON_ENCODER.encode(record).encode("utf-8") + b"\n")
+                total += 1
+                if len(current) >= self._manifest_chunk_records:
+                    if held is not None:
+                        await _emit(held, last=False)
+                    held, current = current, []
+
+            if held is not None and current:
+                await _emit(held, last=False)
+                held = None
+            await _emit(current if held is None else held, last=True)
+        except Exception as exc:
+            logger.warning(
+                "ai_feedback_export_manifest_aborted",
+                export_id=str(export_id),
+                chunks=index,
+                records=total,
+                error=str(exc),
+            )
+            try:
+                await _emit([], last=True, aborted=True)
+            except Exception as abort_exc:
+                logger.error("ai_feedback_export_abort_publish_failed", export_id=str(export_id), error=str(abort_exc))
+            raise
+
+        logger.info("ai_feedback_export_manifest_streamed", export_id=str(export_id), chunks=index, records=total)
+        return total
+
     # ------------------------------------------------------------------
     # Durum sorgulama
     # ------------------------------------------------------------------
@@ -312,43 +643,27 @@ class AIFeedbackPublisher(AIWorkerFeedback):
         )
 
         try:
-            import httpx
-
-            management_url = f"http://{self._settings.rabbitmq_host}:15672/api/queues/%2F/ai.feedback.submit"
-
-            async with httpx.AsyncClient(
-                auth=(
-                    self._settings.rabbitmq_user,
-                    self._settings.rabbitmq_password.get_secret_value(),
-                ),
-                timeout=httpx.Timeout(5),
-            ) as client:
-                response = await client.get(management_url)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    queue_depth = data.get("messages", 0)
-
-                    logger.info(
-                        "ai_feedback_status_result",
-                        confirmation_id=confirmation_id,
-                        queue_depth=queue_depth,
-                    )
-
-                    # Kuyrukta mesaj varsa QUEUED, yoksa PROCESSING
-                    status = "QUEUED" if queue_depth > 0 else "PROCESSING"
-                    return FeedbackPipelineStatus(
-                        confirmation_id=confirmation_id,
-                        status=status,
-                        detail=f"Kuyruk derinliği: {queue_depth}",
-                    )
-
+            queue_depth = await self._submit_queue_depth()
         except Exception as exc:
             logger.warning(
                 "ai_feedback_status_check_failed",
                 confirmation_id=confirmation_id,
                 error=str(exc),
             )
+        else:
+            logger.info(
+                "ai_feedback_status_result",
+                confirmation_id=confirmation_id,
+                queue_depth=queue_depth,
+            )
+
+            # Kuyrukta mesaj varsa QUEUED, yoksa PROCESSING
+            status = "QUEUED" if queue_depth > 0 else "PROCESSING"
+            return FeedbackPipelineStatus(
+                confirmation_id=confirmation_id,
+                status=status,
+                detail=f"Kuyruk derinliği: {queue_depth}",
+            )
 
         # Durum belirlenemezse PROCESSING döner
         return FeedbackPipelineStatus(
@@ -357,6 +672,54 @@ class AIFeedbackPublisher(AIWorkerFeedback):
             detail="Durum bilgisi alınamadı",
         )
 
+    def _management_client(self) -> Any:
+        """Management API için pooled httpx client (ilk kullanımda oluşturulur)."""
+        if self._http_client is None:
+            import httpx
+
+            self._http_client = httpx.AsyncClient(
+                base_url=f"http://{self._settings.rabbitmq_host}:15672",
+                auth=(
+                    self._settings.rabbitmq_user,
+                    self._settings.rabbitmq_password.get_secret_value(),
+                ),
+                timeout=httpx.Timeout(5),
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=2),
+            )
+        return self._http_client
+
+    async def _submit_queue_depth(self) -> int:
+        """Submit kuyruğunun derinliği; TTL önbellekli, eşzamanlı sorgular tek istekte birleşir."""
+        self._stats.status_requests += 1
+        now = time.monotonic()
+        if self._status_cache is not None and self._status_cache[0] > now:
+            self._stats.status_cache_hits += 1
+            return self._status_cache[1]
+        if self._status_inflight is not None:
+            self._stats.status_cache_hits += 1
+            return await asyncio.shield(self._status_inflight)
+
+        inflight: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+        self._status_inflight = inflight
+        try:
+            response = await self._management_client().get(f"/api/queues/%2F/{_SUBMIT_QUEUE}")
+            if response.status_code != 200:
+                raise ConnectionError(f"management API status {response.status_code}")
+            depth = int(response.json().get("messages", 0))
+        except Exception as exc:
+            inflight.set_exception(exc)
+            inflight.exception()  # bekleyen yoksa "never retrieved" uyarısını bastır
+            raise
+        except BaseException:
+            inflight.cancel()
+            raise
+        finally:
+            self._status_inflight = None
+
+        self._status_cache = (time.monotonic() + self._status_ttl, depth)
+        inflight.set_result(depth)
+        return depth
+
     # ------------------------------------------------------------------
     # Sağlık kontrolü
     # ------------------------------------------------------------------
@@ -373,7 +736,24 @@ class AIFeedbackPublisher(AIWorkerFeedback):
     # Kaynak temizliği
     # ------------------------------------------------------------------
     async def close(self) -> None:
-        """RabbitMQ bağlantısını kapat."""
+        """Bekleyen batch'i gönder, HTTP client'ı ve RabbitMQ bağlantısını kapat."""
+        await self.flush()
+        if self._http_client is not None and self._owns_http_client:
+            await self._http_client.aclose()
+            self._http_client = None
         if self._connection and not self._connection.is_closed:
             await self._connection.close()
             logger.info("rabbitmq_connection_closed")
+
+
+def _utc_now_iso() -> str:
+    return datetime.utcnow().isoformat() + "Z"
+
+
+async def _aiter(source: ManifestSource) -> AsyncIterator[dict[str, Any]]:
+    if hasattr(source, "__aiter__"):
+        async for record in source:
+            yield record
+    else:
+        for record in source:
+            yield record
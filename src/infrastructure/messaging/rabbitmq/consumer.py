@@ -1,3 +1,5 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: Consumer idempotency — message_id yalnızca başarılı işlem sonrası commit edilir; retry/DLQ akışı.
 # PATH: src/infrastructure/messaging/rabbitmq/consumer.py
 # DESC: RabbitMQ consumer adapter.
 """
@@ -18,14 +20,24 @@ Güvenlik (RBAC/PII/Audit):
   PII redaction: mesaj payload'larında PII loglanmaz.
 
 Hata Modları (idempotency/retry/rate limit):
-  Timeout, transient failure, idempotency; retry (exponential backoff)
-  ve DLQ (dead letter queue). message_id ile dedup.
+  Timeout, transient failure, idempotency. Başarısız mesaj x-retry-count
+  artırılarak <queue>.retry.<tier> TTL kuyruğuna yazılıp ack'lenir; bekleme
+  broker'da geçer (consumer uyumaz). MAX_RETRY_ATTEMPTS sonrası ve geçersiz
+  JSON <queue>.dlq kuyruğuna park edilir (replay: ``tarlaanaliz dlq replay``).
+  Yeniden yazım başarısızsa (mandatory publish geri dönerse dahil) mesaj
+  nack(requeue=True) ile geri bırakılır. Retry kademesi tanımlı olmayan
+  (retry_tiers_ms=()) kuyruklarda retry/DLQ kuyrukları declare edilmediği için
+  mesaj nack(requeue=False) ile kuyruğun kendi DLX'ine bırakılır.
+  message_id ile dedup (DedupStore); ID yalnızca handler başarıyla bittikten
+  sonra commit edilir.
 
 Observability (log fields/metrics/traces):
-  latency, error_code, retries, queue_depth, event_type, message_id.
+  latency, error_code, retries, queue_depth, event_type, message_id;
+  dedup hit/miss/commit/eviction sayaçları (dedup_stats); kuyruk başına
+  retried/dead_lettered/kademe sayaçları (retry_stats).
 
 Testler: Contract test (port), integration test (RabbitMQ stub), e2e (kritik akış).
-Bağımlılıklar: aio-pika (AMQP client), structlog, rabbitmq_config.
+Bağımlılıklar: aio-pika (AMQP client), orjson (body decode), structlog, rabbitmq_config.
 Notlar/SSOT: Port interface core'da; infrastructure yalnızca implementasyon taşır.
   v3.2.2'de redundant çiftler kaldırıldı.
 """
@@ -36,16 +48,34 @@ import asyncio
 import json
 import time
 import uuid
+from dataclasses import dataclass, field
+from functools import partial
 from typing import Any, Awaitable, Callable, Optional
 
+import orjson
 import structlog
 
 from src.infrastructure.config.settings import Settings
+from src.infrastructure.messaging.rabbitmq.dead_letter import copy_message
+from src.infrastructure.messaging.rabbitmq.dedup_store import (
+    DedupStats,
+    DedupStore,
+    InMemoryDedupStore,
+)
 from src.infrastructure.messaging.rabbitmq_config import (
     DEFAULT_CONNECT_TIMEOUT,
     DEFAULT_PREFETCH_COUNT,
+    LAST_ERROR_HEADER,
     MAX_RETRY_ATTEMPTS,
+    ORIGINAL_QUEUE_HEADER,
+    RETRY_COUNT_HEADER,
+    ExchangeConfig,
+    dead_letter_queue_name,
     declare_topology,
+    get_default_topology,
+    retry_delay_ms,
+    retry_queue_name,
+    tier_label,
 )
 
 logger = structlog.get_logger(__name__)
@@ -53,6 +83,47 @@ logger = structlog.get_logger(__name__)
 # Handler tipi: mesaj body dict'i alır, None döner
 MessageHandler = Callable[[dict[str, Any]], Awaitable[None]]
 
+# Sıralama anahtarı: aio-pika mesajından anahtar üretir; None -> sıralama kısıtı yok
+OrderingKey = Callable[[Any], Optional[str]]
+
+
+def order_by_routing_key(message: Any) -> Optional[str]:
+    """Aynı routing key'li mesajlar geliş sırasıyla işlenir."""
+    return getattr(message, "routing_key", None) or None
+
+
+def order_by_field(field_name: str) -> OrderingKey:
+    """Body'deki alanı (ör. aggregate ID) sıralama anahtarı olarak kullanır."""
+
+    def _key(message: Any) -> Optional[str]:
+        try:
+            body = orjson.loads(message.body)
+        except json.JSONDecodeError:
+            return None
+        value = body.get(field_name) if isinstance(body, dict) else None
+        return str(value) if value is not None else None
+
+    return _key
+
+
+_LAST_ERROR_MAX_LEN = 512
+
+
+@dataclass
+class RetryCounters:
+    """Kuyruk başına retry/DLQ sayaçları (süreç ömrü boyunca kümülatif)."""
+
+    retried: int = 0
+    dead_lettered: int = 0
+    tiers: dict[str, int] = field(default_factory=dict)  # kademe etiketi (1s/10s/...) -> adet
+    rejected: int = 0  # retry topolojisi olmadığı için DLX'e bırakılan
+
+
+@dataclass(frozen=True)
+class _SubscriptionOptions:
+    max_concurrency: int = 1
+    ordering_key: Optional[OrderingKey] = None
+
 
 class RabbitMQConsumer:
     """Genel amaçlı RabbitMQ consumer.
@@ -63,9 +134,13 @@ class RabbitMQConsumer:
     Özellikler:
       - aio_pika.connect_robust ile otomatik yeniden bağlanma
       - Prefetch (QoS) ile akış kontrolü
-      - message_id bazlı idempotency (dedup cache)
-      - Başarısız mesajlar için retry + DLQ
-      - Graceful shutdown desteği
+      - message_id bazlı idempotency (takılabilir DedupStore; varsayılan in-process FIFO/TTL)
+      - Başarısız mesajlar için TTL kademeli retry kuyrukları (1s/10s/1m/10m)
+        ve retry hakkı tükenince <queue>.dlq park kuyruğu (retry_stats)
+      - Subscription başına sınırlı eşzamanlılık (max_concurrency, semaphore);
+        ordering_key verilirse aynı anahtarlı mesajlar sırayla işlenir
+      - In-flight göstergeleri (in_flight)
+      - Graceful shutdown desteği (işlemdeki mesajlar beklenir)
 
     Kullanım:
         consumer = RabbitMQConsumer(settings)
@@ -82,6 +157,8 @@ class RabbitMQConsumer:
         *,
         prefetch_count: int = DEFAULT_PREFETCH_COUNT,
         max_retry_attempts: int = MAX_RETRY_ATTEMPTS,
+        dedup_store: Optional[DedupStore] = None,
+        topology: Optional[list[ExchangeConfig]] = None,
     ) -> None:
         self._settings = settings
         self._rabbitmq_url = settings.rabbitmq_url
@@ -93,10 +170,25 @@ class RabbitMQConsumer:
 
         # subscription_id -> (queue_name, handler, consumer_tag)
         self._subscriptions: dict[str, tuple[str, MessageHandler, Optional[str]]] = {}
-
-        # Idempotency dedup cache: son N mesaj ID'si
-        self._processed_ids: set[str] = set()
-        self._max_dedup_size = 10_000
+        self._options: dict[str, _SubscriptionOptions] = {}
+
+        # Eşzamanlı mod durumu: subscription başına işlemdeki mesaj sayısı,
+        # arka plan görevleri ve (subscription, anahtar) -> son görev zinciri
+        self._in_flight: dict[str, int] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._key_tails: dict[tuple[str, str], asyncio.Task[None]] = {}
+
+        # Idempotency: replikalar arası paylaşım için RedisDedupStore verilebilir
+        self._dedup_store: DedupStore = dedup_store if dedup_store is not None else InMemoryDedupStore()
+
+        # Retry/DLQ sayaçları: queue_name -> RetryCounters
+        self._retry_counters: dict[str, RetryCounters] = {}
+        # queue_name -> retry kademeleri; yalnızca bu kuyruklar için retry/DLQ kuyrukları declare edilir
+        self._retry_tiers: dict[str, tuple[int, ...]] = {
+            queue.name: queue.retry_tiers_ms
+            for exchange in (topology if topology is not None else get_default_topology())
+            for queue in exchange.queues
+        }
 
         # Consuming state
         self._consuming = False
@@ -117,7 +209,8 @@ class RabbitMQConsumer:
                 self._rabbitmq_url,
                 timeout=DEFAULT_CONNECT_TIMEOUT,
             )
-            self._channel = await self._connection.channel()
+            # mandatory publish yönlendirilemezse sessizce düşmez, publish hata fırlatır
+            self._channel = await self._connection.channel(on_return_raises=True)
             await self._channel.set_qos(prefetch_count=self._prefetch_count)
 
             if not self._topology_declared:
@@ -135,8 +228,20 @@ class RabbitMQConsumer:
             self._channel = None
             raise ConnectionError(f"RabbitMQ bağlantısı kurulamadı: {type(exc).__name__}") from exc
 
-    def _is_duplicate(self, message_id: str) -> bool:
-        """Mesaj daha önce işlendi mi kontrol et (idempotency).
+    @property
+    def in_flight(self) -> dict[str, int]:
+        """Subscription başına şu an işlenmekte olan mesaj sayısı (gauge)."""
+        return dict(self._in_flight)
+
+    @property
+    def dedup_stats(self) -> DedupStats:
+        """Dedup hit/miss/commit/eviction sayaçları."""
+        return self._dedup_store.stats
+
+    async def _is_duplicate(self, message_id: str) -> bool:
+        """Mesaj daha önce başarıyla işlendi mi kontrol et (idempotency).
+
+        Store erişilemezse fail-open: mesaj yeni kabul edilir.
 
         Args:
             message_id: Kontrol edilecek mesaj ID.
@@ -145,18 +250,18 @@ class RabbitMQConsumer:
             True: Duplicate mesaj.
             False: Yeni mesaj.
         """
-        if message_id in self._processed_ids:
-            return True
-
-        # Cache boyut kontrolü
-        if len(self._processed_ids) >= self._max_dedup_size:
-            # En eski %20'sini kaldır (basit eviction)
-            evict_count = self._max_dedup_size // 5
-            for _ in range(evict_count):
-                self._processed_ids.pop()
+        try:
+            return await self._dedup_store.seen(message_id)
+        except Exception as exc:
+            logger.warning("rabbitmq_consumer_dedup_lookup_failed", message_id=message_id, error=str(exc))
+            return False
 
-        self._processed_ids.add(message_id)
-        return False
+    async def _commit_processed(self, message_id: str) -> None:
+        """Başarıyla işlenen mesaj ID'sini dedup store'a yazar."""
+        try:
+            await self._dedup_store.commit(message_id)
+        except Exception as exc:
+            logger.warning("rabbitmq_consumer_dedup_commit_failed", message_id=message_id, error=str(exc))
 
     async def subscribe(
         self,
@@ -164,6 +269,8 @@ class RabbitMQConsumer:
         handler: MessageHandler,
         *,
         group_id: Optional[str] = None,
+        max_concurrency: int = 1,
+        ordering_key: Optional[OrderingKey] = None,
     ) -> str:
         """Belirtilen kuyruğa handler kaydet.
 
@@ -171,19 +278,36 @@ class RabbitMQConsumer:
             queue_name: Dinlenecek kuyruk adı.
             handler: Async handler fonksiyonu (dict alır, None döner).
             group_id: Consumer group ID (opsiyonel; load balancing için).
+            max_concurrency: Aynı anda işlenecek en fazla mesaj (1 = sıralı).
+                Etkin paralellik prefetch_count ile de sınırlıdır.
+            ordering_key: Eşzamanlı modda aynı anahtarlı mesajların geliş
+                sırasıyla işlenmesi için anahtar fonksiyonu
+                (order_by_routing_key, order_by_field("field_id") vb.).
 
         Returns:
             Subscription ID (unsubscribe için kullanılır).
+
+        Raises:
+            ValueError: max_concurrency < 1 ise.
         """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+
         subscription_id = f"sub-{uuid.uuid4().hex[:12]}"
 
         self._subscriptions[subscription_id] = (queue_name, handler, None)
+        self._options[subscription_id] = _SubscriptionOptions(
+            max_concurrency=max_concurrency,
+            ordering_key=ordering_key,
+        )
+        self._in_flight[subscription_id] = 0
 
         logger.info(
             "rabbitmq_consumer_subscribed",
             subscription_id=subscription_id,
             queue_name=queue_name,
             group_id=group_id,
+            max_concurrency=max_concurrency,
         )
 
         return subscription_id
@@ -214,6 +338,8 @@ class RabbitMQConsumer:
                 )
 
         del self._subscriptions[subscription_id]
+        self._options.pop(subscription_id, None)
+        self._in_flight.pop(subscription_id, None)
 
         logger.info(
             "rabbitmq_consumer_unsubscribed",
@@ -254,6 +380,12 @@ class RabbitMQConsumer:
     ) -> Callable[..., Awaitable[None]]:
         """Her subscription için aio-pika callback oluşturur.
 
+        max_concurrency 1 ise mesaj callback içinde işlenir. Aksi halde
+        callback semaphore'dan yer alıp işlemi arka plan görevine devreder;
+        semaphore doluyken callback bekler (broker'a geri basınç). Sıralama
+        anahtarı olan mesajın görevi, aynı anahtarlı bir önceki görev
+        bitmeden handler'a geçmez.
+
         Args:
             subscription_id: Subscription ID (loglama için).
             handler: Asıl iş mantığı handler'ı.
@@ -262,12 +394,14 @@ class RabbitMQConsumer:
             aio-pika IncomingMessage callback fonksiyonu.
         """
 
-        async def _on_message(message: Any) -> None:
+        async def _handle(message: Any) -> None:
             start_time = time.monotonic()
+            # message_id olmayan mesajlar dedup'a girmez (üretilen ID tekrar görülmez)
+            has_message_id = bool(message.message_id)
             message_id = message.message_id or str(uuid.uuid4())
 
             # Idempotency kontrolü
-            if self._is_duplicate(message_id):
+            if has_message_id and await self._is_duplicate(message_id):
                 logger.warning(
                     "rabbitmq_consumer_duplicate_message",
                     message_id=message_id,
@@ -277,7 +411,7 @@ class RabbitMQConsumer:
                 return
 
             try:
-                body = json.loads(message.body.decode("utf-8"))
+                body = orjson.loads(message.body)
 
                 logger.debug(
                     "rabbitmq_consumer_message_received",
@@ -288,6 +422,8 @@ class RabbitMQConsumer:
 
                 await handler(body)
 
+                if has_message_id:
+                    await self._commit_processed(message_id)
                 await message.ack()
 
                 latency_ms = (time.monotonic() - start_time) * 1000
@@ -299,51 +435,212 @@ class RabbitMQConsumer:
                     latency_ms=round(latency_ms, 2),
                 )
 
-            except json.JSONDecodeError as exc:
+            except json.JSONDecodeError as exc:  # orjson.JSONDecodeError alt sınıfıdır
                 logger.error(
                     "rabbitmq_consumer_invalid_json",
                     message_id=message_id,
                     error=str(exc),
                 )
-                # Geçersiz JSON tekrar denenirse de başarısız olur -> reject
-                await message.reject(requeue=False)
+                # Geçersiz JSON tekrar denenirse de başarısız olur -> doğrudan DLQ
+                await self._park(subscription_id, message, exc)
 
             except Exception as exc:
                 latency_ms = (time.monotonic() - start_time) * 1000
-
-                # Retry sayısını kontrol et
-                retry_count = (message.headers or {}).get("x-retry-count", 0)
+                retry_count = int((message.headers or {}).get(RETRY_COUNT_HEADER, 0))
 
                 if retry_count < self._max_retry_attempts:
                     logger.warning(
-                        "rabbitmq_consumer_message_requeued",
+                        "rabbitmq_consumer_message_retry_scheduled",
                         message_id=message_id,
                         subscription_id=subscription_id,
                         error=str(exc),
                         retry_count=retry_count,
+                        delay_ms=retry_delay_ms(retry_count),
                         latency_ms=round(latency_ms, 2),
                     )
-                    # Exponential backoff delay
-                    delay = min(2**retry_count, 30)
-                    await asyncio.sleep(delay)
-                    await message.nack(requeue=True)
+                    await self._schedule_retry(subscription_id, message, exc, retry_count)
                 else:
                     logger.error(
-                        "rabbitmq_consumer_message_rejected",
+                        "rabbitmq_consumer_message_dead_lettered",
                         message_id=message_id,
                         subscription_id=subscription_id,
                         error=str(exc),
                         retry_count=retry_count,
                         latency_ms=round(latency_ms, 2),
                     )
-                    # DLQ'ya gönder (reject + requeue=False -> DLX)
-                    await message.reject(requeue=False)
+                    await self._park(subscription_id, message, exc)
 
-                # Dedup cache'den kaldır (retry'a izin ver)
-                self._processed_ids.discard(message_id)
+        async def _process(message: Any) -> None:
+            # unsubscribe sonrası boşaltılan mesajlar gauge'a yazılmaz
+            tracked = subscription_id in self._in_flight
+            if tracked:
+                self._in_flight[subscription_id] += 1
+            try:
+                await _handle(message)
+            finally:
+                if tracked and subscription_id in self._in_flight:
+                    self._in_flight[subscription_id] -= 1
+
+        options = self._options.get(subscription_id, _SubscriptionOptions())
+        if options.max_concurrency == 1:
+            return _process
+
+        semaphore = asyncio.Semaphore(options.max_concurrency)
+
+        async def _on_message(message: Any) -> None:
+            await semaphore.acquire()
+            key = options.ordering_key(message) if options.ordering_key is not None else None
+            previous = self._key_tails.get((subscription_id, key)) if key is not None else None
+
+            task = asyncio.create_task(self._run_ordered(_process, message, semaphore, previous))
+            self._tasks.add(task)
+            if key is not None:
+                self._key_tails[(subscription_id, key)] = task
+            task.add_done_callback(partial(self._on_task_done, subscription_id, key))
 
         return _on_message
 
+    @staticmethod
+    async def _run_ordered(
+        process: Callable[[Any], Awaitable[None]],
+        message: Any,
+        semaphore: asyncio.Semaphore,
+        previous: Optional[asyncio.Task[None]],
+    ) -> None:
+        try:
+            if previous is not None:
+                # Önceki görev hata ile bitse de sıra korunur
+                await asyncio.wait({previous})
+            await process(message)
+        finally:
+            semaphore.release()
+
+    def _on_task_done(self, subscription_id: str, key: Optional[str], task: asyncio.Task[None]) -> None:
+        self._tasks.discard(task)
+        if key is not None and self._key_tails.get((subscription_id, key)) is task:
+            del self._key_tails[(subscription_id, key)]
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                "rabbitmq_consumer_task_failed",
+                subscription_id=subscription_id,
+                error=str(task.exception()),
+            )
+
+    # ------------------------------------------------------------------
+    # Retry / DLQ
+    # ------------------------------------------------------------------
+    def _queue_of(self, subscription_id: str) -> Optional[str]:
+        subscription = self._subscriptions.get(subscription_id)
+        return subscription[0] if subscription is not None else None
+
+    def _counters(self, queue_name: str) -> RetryCounters:
+        counters = self._retry_counters.get(queue_name)
+        if counters is None:
+            counters = self._retry_counters[queue_name] = RetryCounters()
+        return counters
+
+    async def _schedule_retry(self, subscription_id: str, message: Any, exc: Exception, retry_count: int) -> None:
+        """Mesajı retry_count kademesindeki TTL kuyruğuna yazar ve orijinali ack'ler.
+
+        Bekleme broker'da geçer; consumer slotu ve prefetch penceresi boşalır.
+        """
+        queue_name = self._queue_of(subscription_id)
+        if queue_name is None:
+            await message.nack(requeue=True)
+            return
+        tiers = self._retry_tiers.get(queue_name, ())
+        if not tiers:
+            await self._reject_to_dlx(message, queue_name, exc)
+            return
+        delay_ms = retry_delay_ms(retry_count, tiers)
+        if await self._republish(message, retry_queue_name(queue_name, delay_ms), queue_name, exc, retry_count + 1):
+            counters = self._counters(queue_name)
+            counters.retried += 1
+            tier = tier_label(delay_ms)
+            counters.tiers[tier] = counters.tiers.get(tier, 0) + 1
+
+    async def _park(self, subscription_id: str, message: Any, exc: Exception) -> None:
+        """Mesajı <queue>.dlq kuyruğuna park eder ve orijinali ack'ler."""
+        queue_name = self._queue_of(subscription_id)
+        if queue_name is None:
+            await message.reject(requeue=False)
+            return
+        if not self._retry_tiers.get(queue_name):
+            await self._reject_to_dlx(message, queue_name, exc)
+            return
+        retry_count = int((message.headers or {}).get(RETRY_COUNT_HEADER, 0))
+        if await self._republish(message, dead_letter_queue_name(queue_name), queue_name, exc, retry_count):
+            self._counters(queue_name).dead_lettered += 1
+
+    async def _reject_to_dlx(self, message: Any, queue_name: str, exc: Exception) -> None:
+        """Retry/DLQ kuyrukları olmayan kuyrukta mesajı broker DLX'ine bırakır.
+
+        Var olmayan <queue>.retry.<tier> kuyruğuna yazıp ack'lemek mesajı kaybettirirdi.
+        """
+        logger.warning(
+            "rabbitmq_consumer_retry_topology_missing",
+            message_id=message.message_id,
+            queue=queue_name,
+            error=f"{type(exc).__name__}: {exc}"[:_LAST_ERROR_MAX_LEN],
+        )
+        await message.nack(requeue=False)
+        self._counters(queue_name).rejected += 1
+
+    async def _republish(
+        self,
+        message: Any,
+        target: str,
+        queue_name: str,
+        exc: Exception,
+        retry_count: int,
+    ) -> bool:
+        """Mesajı default exchange üzerinden target kuyruğa yazar, sonra orijinali ack'ler.
+
+        Yazım başarısızsa (kanal yok, broker hatası, target kuyruk yok ->
+        mandatory geri dönüşü) mesaj nack(requeue=True) ile kaynak kuyruğa
+        geri bırakılır; mesaj kaybolmaz.
+
+        Returns:
+            True: Mesaj target kuyruğa yazıldı ve ack'lendi.
+        """
+        if self._channel is None:
+            await message.nack(requeue=True)
+            return False
+
+        headers = dict(message.headers or {})
+        headers[RETRY_COUNT_HEADER] = retry_count
+        headers[ORIGINAL_QUEUE_HEADER] = queue_name
+        headers[LAST_ERROR_HEADER] = f"{type(exc).__name__}: {exc}"[:_LAST_ERROR_MAX_LEN]
+        try:
+            await self._channel.default_exchange.publish(
+                self._build_message(message, headers),
+                routing_key=target,
+                mandatory=True,
+            )
+        except Exception as publish_exc:
+            logger.error(
+                "rabbitmq_consumer_republish_failed",
+                message_id=message.message_id,
+                target_queue=target,
+                error=str(publish_exc),
+            )
+            await message.nack(requeue=True)
+            return False
+
+        await message.ack()
+        return True
+
+    # Retry/DLQ kopyası: gövde ve özellikler korunur, header'lar güncellenir
+    _build_message = staticmethod(copy_message)
+
+    @property
+    def retry_stats(self) -> dict[str, RetryCounters]:
+        """Kuyruk başına retry/DLQ sayaçları (kopya)."""
+        return {
+            queue: RetryCounters(c.retried, c.dead_lettered, dict(c.tiers), c.rejected)
+            for queue, c in self._retry_counters.items()
+        }
+
     async def health_check(self) -> bool:
         """RabbitMQ consumer bağlantı sağlığını kontrol eder.
 
@@ -376,10 +673,13 @@ class RabbitMQConsumer:
                     error=str(exc),
                 )
 
+        # Eşzamanlı modda işlemdeki mesajların ack/nack'i tamamlanır
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
         if self._connection and not self._connection.is_closed:
             await self._connection.close()
             logger.info("rabbitmq_consumer_connection_closed")
 
         self._connection = None
         self._channel = None
-        self._processed_ids.clear()
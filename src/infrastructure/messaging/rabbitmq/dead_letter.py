@@ -0,0 +1,183 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: DLQ park kuyruğu — inceleme ve kaynak kuyruğa yeniden oynatma (replay).
+# PATH: src/infrastructure/messaging/rabbitmq/dead_letter.py
+# DESC: <queue>.dlq mesajlarını inceleyen/kaynak kuyruğa geri yazan yardımcılar.
+"""
+DeadLetterReplayer: retry hakkı tükenip <queue>.dlq kuyruğuna park edilen
+mesajları operatör kararıyla kaynak kuyruğa geri gönderir.
+
+Sorumluluk: DLQ'dan basic.get ile sınırlı sayıda mesaj almak; dry-run'da
+  yalnızca özetleyip geri bırakmak, replay'de x-retry-count sıfırlanmış ve
+  x-replay-count artırılmış kopyayı default exchange ile kaynak kuyruğa yazıp
+  DLQ kopyasını ack'lemek.
+
+Hata Modları (idempotency/retry/rate limit):
+  Kopya yazılmadan DLQ mesajı ack'lenmez; yazım hatasında mesaj DLQ'da kalır.
+  Aynı mesaj iki kez replay edilirse consumer message_id ile dedup yapar.
+  dry-run'da alınan mesajlar işlem sonunda nack(requeue=True) ile bırakılır.
+
+Observability (log fields/metrics/traces):
+  queue_name, replayed, inspected, message_id, last_error.
+
+Bağımlılıklar: aio-pika (lazy import), structlog, rabbitmq_config.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import structlog
+
+from src.infrastructure.messaging.rabbitmq_config import (
+    DEFAULT_CONNECT_TIMEOUT,
+    LAST_ERROR_HEADER,
+    REPLAY_COUNT_HEADER,
+    RETRY_COUNT_HEADER,
+    dead_letter_queue_name,
+)
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_REPLAY_LIMIT = 100
+
+
+def copy_message(message: Any, headers: dict[str, Any]) -> Any:
+    """Gelen mesajın gövdesi ve özellikleriyle yeni kalıcı aio-pika Message oluşturur."""
+    import aio_pika
+
+    return aio_pika.Message(
+        body=message.body,
+        message_id=message.message_id,
+        correlation_id=message.correlation_id,
+        content_type=message.content_type,
+        timestamp=message.timestamp,
+        headers=headers,
+        delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+    )
+
+
+@dataclass(frozen=True)
+class DeadLetterSummary:
+    """DLQ'daki tek mesajın özeti (payload içermez; PII loglanmaz)."""
+
+    message_id: Optional[str]
+    retry_count: int
+    replay_count: int
+    last_error: Optional[str]
+
+
+@dataclass(frozen=True)
+class ReplayResult:
+    """replay/inspect sonucu."""
+
+    queue_name: str
+    dry_run: bool
+    replayed: int = 0
+    messages: list[DeadLetterSummary] = field(default_factory=list)
+
+
+class DeadLetterReplayer:
+    """<queue>.dlq -> <queue> yeniden oynatma.
+
+    Kullanım:
+        replayer = DeadLetterReplayer(channel)
+        result = await replayer.replay("domain.events.mission", limit=50)
+    """
+
+    def __init__(self, channel: Any) -> None:
+        self._channel = channel
+
+    _build_message = staticmethod(copy_message)
+
+    async def replay(
+        self,
+        queue_name: str,
+        *,
+        limit: int = DEFAULT_REPLAY_LIMIT,
+        dry_run: bool = False,
+    ) -> ReplayResult:
+        """DLQ'dan en fazla limit mesajı kaynak kuyruğa geri yazar.
+
+        Args:
+            queue_name: Kaynak kuyruk adı (DLQ adı değil).
+            limit: Tek çağrıda işlenecek en fazla mesaj.
+            dry_run: True ise mesajlar yalnızca özetlenir, DLQ'da kalır.
+
+        Raises:
+            ValueError: limit < 1 ise.
+        """
+        if limit < 1:
+            raise ValueError("limit must be >= 1")
+
+        dlq = await self._channel.get_queue(dead_letter_queue_name(queue_name), ensure=False)
+        summaries: list[DeadLetterSummary] = []
+        held: list[Any] = []
+        replayed = 0
+        try:
+            for _ in range(limit):
+                message = await dlq.get(no_ack=False, fail=False)
+                if message is None:
+                    break
+                headers = dict(message.headers or {})
+                summaries.append(
+                    DeadLetterSummary(
+                        message_id=message.message_id,
+                        retry_count=int(headers.get(RETRY_COUNT_HEADER, 0)),
+                        replay_count=int(headers.get(REPLAY_COUNT_HEADER, 0)),
+                        last_error=headers.get(LAST_ERROR_HEADER),
+                    )
+                )
+                if dry_run:
+                    # Ack'lenmeyen mesaj bu kanalda tekrar teslim edilmez; sonda geri bırakılır
+                    held.append(message)
+                    continue
+
+                headers[RETRY_COUNT_HEADER] = 0
+                headers[REPLAY_COUNT_HEADER] = int(headers.get(REPLAY_COUNT_HEADER, 0)) + 1
+                try:
+                    await self._channel.default_exchange.publish(
+                        self._build_message(message, headers),
+                        routing_key=queue_name,
+                    )
+                except Exception:
+                    await message.nack(requeue=True)
+                    raise
+                await message.ack()
+                replayed += 1
+        finally:
+            for message in held:
+                await message.nack(requeue=True)
+
+        logger.info(
+            "rabbitmq_dead_letter_replay",
+            queue_name=queue_name,
+            dry_run=dry_run,
+            inspected=len(summaries),
+            replayed=replayed,
+        )
+        return ReplayResult(queue_name=queue_name, dry_run=dry_run, replayed=replayed, messages=summaries)
+
+
+async def replay_dead_letters(
+    rabbitmq_url: str,
+    queue_name: str,
+    *,
+    limit: int = DEFAULT_REPLAY_LIMIT,
+    dry_run: bool = False,
+) -> ReplayResult:
+    """Kısa ömürlü bağlantı açıp DeadLetterReplayer.replay çalıştırır (CLI girişi).
+
+    Raises:
+        ConnectionError: Broker'a bağlanılamazsa.
+    """
+    import aio_pika
+
+    try:
+        connection = await aio_pika.connect(rabbitmq_url, timeout=DEFAULT_CONNECT_TIMEOUT)
+    except Exception as exc:
+        raise ConnectionError(f"RabbitMQ bağlantısı kurulamadı: {type(exc).__name__}") from exc
+
+    async with connection:
+        channel = await connection.channel(publisher_confirms=True)
+        return await DeadLetterReplayer(channel).replay(queue_name, limit=limit, dry_run=dry_run)
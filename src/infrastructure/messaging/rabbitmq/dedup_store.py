@@ -0,0 +1,170 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: Consumer dedup durumu (in-process FIFO/TTL veya Redis).
+# PATH: src/infrastructure/messaging/rabbitmq/dedup_store.py
+# DESC: RabbitMQConsumer için message_id idempotency store'ları (in-process FIFO/TTL, Redis).
+"""
+Dedup store: consumer tarafında message_id bazlı idempotency durumu.
+
+Amaç: Redelivery ve çift publish durumlarında aynı mesajın iki kez işlenmesini önlemek.
+Sorumluluk: "Bu mesaj işlendi mi?" sorgusu (seen) ve başarı sonrası kayıt (commit).
+
+Girdi/Çıktı (Contract/DTO/Event):
+  Girdi: message_id (AMQP message_id property).
+  Çıktı: bool (işlendi mi), DedupStats sayaçları.
+
+Güvenlik (RBAC/PII/Audit): Yalnızca message_id tutulur; payload saklanmaz.
+
+Hata Modları (idempotency/retry/rate limit):
+  ID yalnızca handler başarıyla bittikten sonra commit edilir; başarısız mesaj
+  redelivery'de tekrar işlenir. Redis erişilemezse consumer fail-open davranır
+  (mesaj işlenir, uyarı loglanır).
+
+Observability (log fields/metrics/traces):
+  hits, misses, commits, evictions sayaçları (DedupStats).
+
+Testler: Unit (eviction sırası, TTL, commit-after-success).
+Bağımlılıklar: Standart kütüphane; Redis varyantı için redis.asyncio (çalışma anında).
+Notlar/SSOT: InMemoryDedupStore tek süreçlidir ve restart'ta sıfırlanır;
+  replikalar arası paylaşım ve kalıcılık için RedisDedupStore kullanılır.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Protocol
+
+DEFAULT_DEDUP_MAX_SIZE = 10_000
+DEFAULT_DEDUP_TTL_SECONDS = 24 * 60 * 60
+
+
+@dataclass
+class DedupStats:
+    """Dedup store sayaçları."""
+
+    hits: int = 0  # seen() -> True (duplicate)
+    misses: int = 0  # seen() -> False (yeni mesaj)
+    commits: int = 0  # başarıyla işlenip kaydedilen ID
+    evictions: int = 0  # kapasite veya TTL nedeniyle düşürülen ID
+
+
+class DedupStore(Protocol):
+    """Consumer idempotency store portu."""
+
+    stats: DedupStats
+
+    async def seen(self, message_id: str) -> bool: ...
+
+    async def commit(self, message_id: str) -> None: ...
+
+
+class InMemoryDedupStore:
+    """Ekleme sıralı (FIFO) TTL dedup store (tek süreç).
+
+    ID'ler OrderedDict'te commit sırasıyla tutulur; TTL sabit olduğundan baştaki
+    girdi her zaman en erken süresi dolan girdidir. Kapasite aşılınca en eski
+    commit düşürülür, süresi dolan ID'ler baştan temizlenir. seen() sırayı
+    değiştirmez; aksi halde _expire baştaki taze girdide durup arkadaki
+    süresi dolmuş ID'leri bırakırdı.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = DEFAULT_DEDUP_MAX_SIZE,
+        ttl_seconds: float = DEFAULT_DEDUP_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._clock = clock
+        # message_id -> son geçerlilik zamanı
+        self._entries: OrderedDict[str, float] = OrderedDict()
+        self.stats = DedupStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def seen(self, message_id: str) -> bool:
+        now = self._clock()
+        self._expire(now)
+        expires_at = self._entries.get(message_id)
+        if expires_at is None or expires_at <= now:
+            if expires_at is not None:
+                del self._entries[message_id]
+                self.stats.evictions += 1
+            self.stats.misses += 1
+            return False
+        self.stats.hits += 1
+        return True
+
+    async def commit(self, message_id: str) -> None:
+        now = self._clock()
+        self._entries[message_id] = now + self._ttl
+        self._entries.move_to_end(message_id)
+        self.stats.commits += 1
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+        self._expire(now)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _expire(self, now: float) -> None:
+        # Baştaki girdiler en eski commit'lerdir; süresi dolmayan ilk girdide durulur.
+        while self._entries:
+            message_id, expires_at = next(iter(self._entries.items()))
+            if expires_at > now:
+                break
+            del self._entries[message_id]
+            self.stats.evictions += 1
+
+
+class RedisDedupStore:
+    """Redis SET NX + EX ile replikalar arası paylaşılan dedup store.
+
+    Süre dolumu Redis tarafından yapıldığı için ``evictions`` sayacı
+    artmaz; commit sırasında anahtar zaten varsa (başka replika aynı
+    mesajı bitirmiş) bu bir hit olarak sayılır.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        key_prefix: str = "tarlaanaliz:dedup:",
+        ttl_seconds: int = DEFAULT_DEDUP_TTL_SECONDS,
+    ) -> None:
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        self._client = client
+        self._prefix = key_prefix
+        self._ttl = ttl_seconds
+        self.stats = DedupStats()
+
+    @classmethod
+    def from_url(cls, redis_url: str, **kwargs: Any) -> RedisDedupStore:
+        import redis.asyncio as aioredis
+
+        return cls(aioredis.from_url(redis_url), **kwargs)
+
+    async def seen(self, message_id: str) -> bool:
+        exists = bool(await self._client.exists(self._prefix + message_id))
+        if exists:
+            self.stats.hits += 1
+        else:
+            self.stats.misses += 1
+        return exists
+
+    async def commit(self, message_id: str) -> None:
+        created = await self._client.set(self._prefix + message_id, b"1", nx=True, ex=self._ttl)
+        if created:
+            self.stats.commits += 1
+        else:
+            self.stats.hits += 1
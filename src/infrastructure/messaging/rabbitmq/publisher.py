@@ -1,3 +1,5 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: Contract-first event publish (tekil ve pipeline'lı toplu).
 # PATH: src/infrastructure/messaging/rabbitmq/publisher.py
 # DESC: RabbitMQ publisher adapter.
 """
@@ -21,8 +23,11 @@ Hata Modları (idempotency/retry/rate limit):
   Timeout, transient failure, idempotency; retry (exponential backoff)
   ve circuit breaker (opsiyonel). message_id ile dedup.
 
+  publish_batch confirm'leri pencere (confirm_window) kadar eşzamanlı bekler;
+  başarısız mesajlar BatchPublishResult içinde tek tek raporlanır, batch yarıda kesilmez.
+
 Observability (log fields/metrics/traces):
-  latency, error_code, retries, routing_key, message_id.
+  latency, error_code, retries, routing_key, message_id, succeeded/failed (batch).
 
 Testler: Contract test (port), integration test (RabbitMQ stub), e2e (kritik akış).
 Bağımlılıklar: aio-pika (AMQP client), structlog, rabbitmq_config.
@@ -32,8 +37,10 @@ Notlar/SSOT: Port interface core'da; infrastructure yalnızca implementasyon ta
 
 from __future__ import annotations
 
+import asyncio
 import json
 import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Optional
 
@@ -41,6 +48,7 @@ import structlog
 
 from src.infrastructure.config.settings import Settings
 from src.infrastructure.messaging.rabbitmq_config import (
+    DEFAULT_CONFIRM_WINDOW,
     DEFAULT_CONNECT_TIMEOUT,
     DEFAULT_PREFETCH_COUNT,
     declare_topology,
@@ -48,6 +56,59 @@ from src.infrastructure.messaging.rabbitmq_config import (
 
 logger = structlog.get_logger(__name__)
 
+# Tüm publish'ler tek encoder örneğini paylaşır (json.dumps her çağrıda yeni encoder kurar).
+# AIFeedbackPublisher da aynı örneği kullanır.
+JSON_ENCODER = json.JSONEncoder(default=str)
+
+
+@dataclass(frozen=True)
+class PublishOutcome:
+    """Toplu publish'te tek mesajın sonucu."""
+
+    message_id: str
+    routing_key: str
+    ok: bool
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchPublishResult:
+    """publish_batch sonucu; outcomes girdi sırasıyla tutulur."""
+
+    outcomes: list[PublishOutcome] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for outcome in self.outcomes if outcome.ok)
+
+    @property
+    def failed(self) -> list[PublishOutcome]:
+        return [outcome for outcome in self.outcomes if not outcome.ok]
+
+    @property
+    def ok(self) -> bool:
+        return all(outcome.ok for outcome in self.outcomes)
+
+    def merge(self, other: BatchPublishResult) -> None:
+        self.outcomes.extend(other.outcomes)
+
+    def raise_on_failure(self) -> None:
+        """Başarısız mesaj varsa BatchPublishError fırlatır."""
+        if not self.ok:
+            raise BatchPublishError(self)
+
+
+class BatchPublishError(ConnectionError):
+    """Toplu publish'te en az bir mesaj broker tarafından onaylanmadı.
+
+    ConnectionError alt sınıfıdır; EventBus portunun hata sözleşmesi korunur.
+    """
+
+    def __init__(self, result: BatchPublishResult) -> None:
+        failed = result.failed
+        super().__init__(f"{len(failed)}/{len(result.outcomes)} mesaj publish edilemedi: {failed[0].error}")
+        self.result = result
+
 
 class RabbitMQPublisher:
     """Genel amaçlı RabbitMQ publisher.
@@ -68,8 +129,11 @@ class RabbitMQPublisher:
         await publisher.close()
     """
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, *, confirm_window: int = DEFAULT_CONFIRM_WINDOW) -> None:
+        if confirm_window <= 0:
+            raise ValueError("confirm_window must be positive")
         self._settings = settings
+        self._confirm_window = confirm_window
         self._rabbitmq_url = settings.rabbitmq_url
         self._connection: Any = None
         self._channel: Any = None
@@ -132,6 +196,29 @@ class RabbitMQPublisher:
             )
         return self._exchanges[exchange_name]
 
+    @staticmethod
+    def _build_message(
+        body: dict[str, Any],
+        message_id: str,
+        *,
+        timestamp: datetime,
+        headers: Optional[dict[str, Any]] = None,
+        content_type: str = "application/json",
+        correlation_id: Optional[str] = None,
+    ) -> Any:
+        """Persistent aio-pika mesajı oluşturur (gövde paylaşılan encoder ile)."""
+        import aio_pika
+
+        return aio_pika.Message(
+            body=JSON_ENCODER.encode(body).encode("utf-8"),
+            content_type=content_type,
+            message_id=message_id,
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            timestamp=timestamp,
+            headers=headers or {},
+            correlation_id=correlation_id,
+        )
+
     async def publish(
         self,
         exchange_name: str,
@@ -158,21 +245,18 @@ class RabbitMQPublisher:
             ConnectionError: Broker bağlantısı yoksa.
             TimeoutError: Publish timeout'u aşılırsa.
         """
-        import aio_pika
-
         start_time = time.monotonic()
 
         await self._ensure_connection()
 
         exchange = await self._get_exchange(exchange_name)
 
-        message = aio_pika.Message(
-            body=json.dumps(body, default=str).encode("utf-8"),
-            content_type=content_type,
-            message_id=message_id,
-            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+        message = self._build_message(
+            body,
+            message_id,
             timestamp=datetime.now(timezone.utc),
-            headers=headers or {},
+            headers=headers,
+            content_type=content_type,
             correlation_id=correlation_id,
         )
 
@@ -192,31 +276,75 @@ class RabbitMQPublisher:
         self,
         exchange_name: str,
         messages: list[tuple[str, dict[str, Any], str]],
-    ) -> None:
-        """Birden fazla mesajı sıralı olarak publish eder.
+        *,
+        confirm_window: Optional[int] = None,
+    ) -> BatchPublishResult:
+        """Mesajları pipeline'lı publish eder; confirm'ler pencere kadar eşzamanlı beklenir.
+
+        Mesajlar kanala girdi sırasıyla yazılır; her mesajın confirm'i
+        bir öncekini beklemeden izlenir. En fazla ``confirm_window`` mesaj
+        onay bekleyebilir, pencere dolunca ilk boşalan yerine yenisi gönderilir.
+        Tek mesajın hatası (nack, serialize hatası) batch'i kesmez.
 
         Args:
             exchange_name: Hedef exchange adı.
             messages: (routing_key, body, message_id) tuple listesi.
+            confirm_window: Eşzamanlı bekleyen confirm üst sınırı
+                (varsayılan: constructor'daki değer).
+
+        Returns:
+            Girdi sırasıyla mesaj bazlı sonuçları taşıyan BatchPublishResult.
 
         Raises:
-            ConnectionError: Broker bağlantısı yoksa.
+            ConnectionError: Broker bağlantısı kurulamazsa (hiçbir mesaj gönderilmez).
         """
+        window = confirm_window or self._confirm_window
+        result = BatchPublishResult()
+        if not messages:
+            return result
+
         start_time = time.monotonic()
-        published = 0
 
-        for routing_key, body, message_id in messages:
-            await self.publish(exchange_name, routing_key, body, message_id)
-            published += 1
+        await self._ensure_connection()
+        exchange = await self._get_exchange(exchange_name)
 
+        outcomes: list[Optional[PublishOutcome]] = [None] * len(messages)
+        semaphore = asyncio.Semaphore(window)
+        timestamp = datetime.now(timezone.utc)
+
+        async def _send(index: int, routing_key: str, body: dict[str, Any], message_id: str) -> None:
+            try:
+                message = self._build_message(body, message_id, timestamp=timestamp)
+                await exchange.publish(message, routing_key=routing_key)
+            except Exception as exc:
+                outcomes[index] = PublishOutcome(message_id, routing_key, False, f"{type(exc).__name__}: {exc}")
+            else:
+                outcomes[index] = PublishOutcome(message_id, routing_key, True)
+            finally:
+                semaphore.release()
+
+        # Task'lar oluşturulma sırasıyla çalışır; basic.publish çerçeveleri girdi sırasıyla yazılır.
+        tasks: list[asyncio.Task[None]] = []
+        for index, (routing_key, body, message_id) in enumerate(messages):
+            await semaphore.acquire()
+            tasks.append(asyncio.ensure_future(_send(index, routing_key, body, message_id)))
+        await asyncio.gather(*tasks)
+
+        result.outcomes = [outcome for outcome in outcomes if outcome is not None]
         latency_ms = (time.monotonic() - start_time) * 1000
+        failed = result.failed
 
-        logger.info(
+        log = logger.warning if failed else logger.info
+        log(
             "rabbitmq_batch_published",
             exchange=exchange_name,
-            count=published,
+            count=len(messages),
+            succeeded=len(messages) - len(failed),
+            failed=len(failed),
+            confirm_window=window,
             latency_ms=round(latency_ms, 2),
         )
+        return result
 
     async def health_check(self) -> bool:
         """RabbitMQ bağlantı sağlığını kontrol eder.
@@ -1,3 +1,5 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: RabbitMQ topoloji ve bağlantı/publish varsayılanları.
 # PATH: src/infrastructure/messaging/rabbitmq_config.py
 # DESC: RabbitMQ bağlantı ve topoloji konfigürasyonu.
 """
@@ -15,6 +17,8 @@ Güvenlik (RBAC/PII/Audit):
 
 Hata Modları (idempotency/retry/rate limit):
   Exchange ve queue declare işlemleri idempotent'tir.
+  Her kuyruk için TTL'li retry kademeleri (<queue>.retry.1s/10s/1m/10m) ve
+  park kuyruğu (<queue>.dlq) declare edilir; retry sayısı header'da taşınır.
 
 Observability (log fields/metrics/traces):
   Topoloji değişiklikleri structlog ile loglanır.
@@ -42,9 +46,18 @@ DOMAIN_EVENTS_EXCHANGE = "domain.events"
 TRAINING_FEEDBACK_EXCHANGE = "training.feedback"
 NOTIFICATION_EXCHANGE = "notifications"
 
+# WebSocket cluster bus (direct): replika başına exclusive kuyruk; topolojide declare edilmez
+WEBSOCKET_BUS_EXCHANGE = "notifications.ws"
+WEBSOCKET_BUS_BROADCAST_KEY = "broadcast"
+WEBSOCKET_BUS_MESSAGE_TTL_MS = 30_000  # geç kalan canlı bildirim teslim edilmez
+
 # Dead letter exchange suffix
 DLX_SUFFIX = ".dlx"
 
+# Gecikmeli retry ve park kuyruğu (DLQ) ekleri: <queue>.retry.<tier>, <queue>.dlq
+RETRY_QUEUE_INFIX = ".retry."
+DLQ_SUFFIX = ".dlq"
+
 
 # ------------------------------------------------------------------
 # Queue sabitleri
@@ -83,11 +96,23 @@ DEFAULT_MESSAGE_TTL_MS = 86_400_000  # 24 saat
 DEFAULT_PREFETCH_COUNT = 10
 DEFAULT_CONNECT_TIMEOUT = 10  # saniye
 DEFAULT_HEARTBEAT = 60  # saniye
-MAX_RETRY_ATTEMPTS = 3
+DEFAULT_CONFIRM_WINDOW = 256  # publish_batch: aynı anda beklenen publisher confirm sayısı
+MAX_RETRY_ATTEMPTS = 4  # her retry kademesi için bir deneme; sonrası DLQ
 RETRY_BACKOFF_MULTIPLIER = 1
 RETRY_MIN_WAIT = 1  # saniye
 RETRY_MAX_WAIT = 10  # saniye
 
+# TTL tabanlı retry kademeleri (ms): 1s / 10s / 60s / 10m. retry_count n, n. kademeyi
+# kullanır (son kademe tekrar eder). Süre dolunca mesaj default exchange üzerinden
+# yalnızca kaynak kuyruğa geri döner (topic'e yeniden yayılmaz).
+RETRY_TIERS_MS: tuple[int, ...] = (1_000, 10_000, 60_000, 600_000)
+
+# Retry/DLQ mesaj header'ları
+RETRY_COUNT_HEADER = "x-retry-count"
+ORIGINAL_QUEUE_HEADER = "x-original-queue"
+LAST_ERROR_HEADER = "x-last-error"
+REPLAY_COUNT_HEADER = "x-replay-count"
+
 
 @dataclass(frozen=True)
 class QueueConfig:
@@ -102,6 +127,8 @@ class QueueConfig:
     message_ttl_ms: int = DEFAULT_MESSAGE_TTL_MS
     dead_letter_exchange: str = ""
     extra_arguments: dict[str, Any] = field(default_factory=dict)
+    # Consumer retry akışı için TTL kademeleri; boş tuple -> retry/DLQ kuyrukları declare edilmez
+    retry_tiers_ms: tuple[int, ...] = RETRY_TIERS_MS
 
     @property
     def arguments(self) -> dict[str, Any]:
@@ -114,6 +141,54 @@ class QueueConfig:
         args.update(self.extra_arguments)
         return args
 
+    def retry_queues(self) -> list[QueueConfig]:
+        """Kademe başına TTL'li retry kuyrukları; süre dolunca bu kuyruğa geri döner."""
+        return [
+            QueueConfig(
+                name=retry_queue_name(self.name, ttl_ms),
+                routing_key="",
+                message_ttl_ms=ttl_ms,
+                extra_arguments={
+                    # Default exchange ("") + kuyruk adı routing key'i -> doğrudan kaynak kuyruk
+                    "x-dead-letter-exchange": "",
+                    "x-dead-letter-routing-key": self.name,
+                },
+                retry_tiers_ms=(),
+            )
+            for ttl_ms in self.retry_tiers_ms
+        ]
+
+    def dead_letter_queue(self) -> QueueConfig:
+        """Retry hakkı tükenen mesajların park edildiği kuyruk (TTL yok)."""
+        return QueueConfig(
+            name=dead_letter_queue_name(self.name),
+            routing_key="",
+            message_ttl_ms=0,
+            retry_tiers_ms=(),
+        )
+
+
+def tier_label(ttl_ms: int) -> str:
+    """Retry kademesi etiketi: 1000 -> "1s", 60000 -> "1m"."""
+    seconds = ttl_ms // 1000
+    if seconds >= 60 and seconds % 60 == 0:
+        return f"{seconds // 60}m"
+    return f"{seconds}s" if ttl_ms % 1000 == 0 else f"{ttl_ms}ms"
+
+
+def retry_queue_name(queue_name: str, ttl_ms: int) -> str:
+    """Örn. domain.events.mission + 10000 -> domain.events.mission.retry.10s"""
+    return f"{queue_name}{RETRY_QUEUE_INFIX}{tier_label(ttl_ms)}"
+
+
+def dead_letter_queue_name(queue_name: str) -> str:
+    return f"{queue_name}{DLQ_SUFFIX}"
+
+
+def retry_delay_ms(retry_count: int, tiers_ms: tuple[int, ...] = RETRY_TIERS_MS) -> int:
+    """retry_count. tekrar için bekleme süresi (kademe dışı -> son kademe)."""
+    return tiers_ms[min(max(retry_count, 0), len(tiers_ms) - 1)]
+
 
 @dataclass(frozen=True)
 class ExchangeConfig:
@@ -258,6 +333,15 @@ async def declare_topology(channel: Any) -> None:
             )
             await queue.bind(exchange, queue_config.routing_key)
 
+            # Retry kademeleri ve DLQ exchange'e bağlanmaz; default exchange ile adresiyle yazılır.
+            if queue_config.retry_tiers_ms:
+                for side_queue in (*queue_config.retry_queues(), queue_config.dead_letter_queue()):
+                    await channel.declare_queue(
+                        side_queue.name,
+                        durable=True,
+                        arguments=side_queue.arguments,
+                    )
+
         logger.info(
             "rabbitmq_topology_declared",
             exchange=exchange_config.name,
@@ -1,3 +1,5 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: EventBus portunun RabbitMQ implementasyonu; contract-first event dağıtımı.
 # PATH: src/infrastructure/messaging/rabbitmq_event_bus_impl.py
 # DESC: EventBus portunun RabbitMQ implementasyonu.
 """
@@ -32,22 +34,39 @@ Notlar/SSOT: Port interface core'da; infrastructure yalnızca implementasyon ta
 
 from __future__ import annotations
 
-import json
+import asyncio
+import time
 import uuid
+from dataclasses import dataclass
 from typing import Any, Awaitable, Callable, Optional
 
 import structlog
 
 from src.core.domain.events.base import DomainEvent
+from src.core.domain.events.registry import EventRegistry, build_default_registry
 from src.core.ports.messaging.event_bus import EventBus, EventHandler
 from src.infrastructure.config.settings import Settings
 from src.infrastructure.messaging.event_publisher import EventPublisher
-from src.infrastructure.messaging.rabbitmq.consumer import RabbitMQConsumer
+from src.infrastructure.messaging.rabbitmq.consumer import OrderingKey, RabbitMQConsumer
 from src.infrastructure.messaging.rabbitmq_config import DOMAIN_EVENTS_QUEUE
 
 logger = structlog.get_logger(__name__)
 
 
+@dataclass
+class DecodeStats:
+    """Body -> tipli event dönüşüm sayaçları (dispatch başına bir decode)."""
+
+    decoded: int = 0
+    failed: int = 0
+    unknown_type: int = 0
+    total_seconds: float = 0.0
+
+    @property
+    def mean_microseconds(self) -> float:
+        return self.total_seconds / self.decoded * 1e6 if self.decoded else 0.0
+
+
 class RabbitMQEventBus(EventBus):
     """EventBus portunun RabbitMQ implementasyonu.
 
@@ -60,6 +79,12 @@ class RabbitMQEventBus(EventBus):
       - Consumer group desteği (competing consumers)
       - DLQ ile başarısız event yönetimi
       - Graceful connect/disconnect lifecycle
+      - Opsiyonel eşzamanlılık: max_concurrency ile bağımsız mesajlar paralel
+        işlenir (ordering_key ile anahtar bazında sıra korunur);
+        concurrent_handlers ile aynı event'in handler'ları asyncio.gather ile
+        birlikte çalışır
+      - Tipli dispatch: body EventRegistry ile bir kez somut event sınıfına
+        çevrilir; tüm handler'lar aynı immutable nesneyi alır
 
     Kuyruk topolojisi:
       Exchange: domain.events (topic, durable)
@@ -70,10 +95,23 @@ class RabbitMQEventBus(EventBus):
       Queue: domain.events.payment (ödeme event'leri)
     """
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        *,
+        max_concurrency: int = 1,
+        ordering_key: Optional[OrderingKey] = None,
+        concurrent_handlers: bool = False,
+        registry: Optional[EventRegistry] = None,
+    ) -> None:
         self._settings = settings
         self._event_publisher = EventPublisher(settings)
         self._consumer = RabbitMQConsumer(settings)
+        self._max_concurrency = max_concurrency
+        self._ordering_key = ordering_key
+        self._concurrent_handlers = concurrent_handlers
+        self._registry = registry or build_default_registry()
+        self._decode_stats = DecodeStats()
 
         # event_type -> handler listesi (local dispatch)
         self._handlers: dict[str, list[tuple[str, EventHandler]]] = {}
@@ -107,16 +145,18 @@ class RabbitMQEventBus(EventBus):
     async def publish_batch(self, events: list[DomainEvent]) -> None:
         """Birden fazla event'i toplu yayınla.
 
-        Sıralama korunur.
+        Confirm'ler pipeline'lı beklenir; sıralama korunur.
 
         Args:
             events: Yayınlanacak event listesi (sıralı).
 
         Raises:
             TimeoutError: Broker yanıt vermediğinde.
-            ConnectionError: Broker'a bağlantı kurulamadığında.
+            ConnectionError: Broker'a bağlantı kurulamadığında veya en az
+                bir event onaylanmadığında (BatchPublishError).
         """
-        await self._event_publisher.publish_batch(events)
+        result = await self._event_publisher.publish_batch(events)
+        result.raise_on_failure()
 
     # ------------------------------------------------------------------
     # Subscribe
@@ -161,6 +201,8 @@ class RabbitMQEventBus(EventBus):
                 queue_name=DOMAIN_EVENTS_QUEUE,
                 handler=self._make_dispatcher(),
                 group_id=group_id,
+                max_concurrency=self._max_concurrency,
+                ordering_key=self._ordering_key,
             )
 
         self._subscriptions[subscription_id] = (event_type, consumer_sub_id)
@@ -231,6 +273,8 @@ class RabbitMQEventBus(EventBus):
         await self._consumer.subscribe(
             queue_name=DOMAIN_EVENTS_QUEUE,
             handler=self._make_dispatcher(),
+            max_concurrency=self._max_concurrency,
+            ordering_key=self._ordering_key,
         )
 
         # Consumer'ı başlat
@@ -257,6 +301,16 @@ class RabbitMQEventBus(EventBus):
     # ------------------------------------------------------------------
     # Sağlık kontrolü
     # ------------------------------------------------------------------
+    @property
+    def decode_stats(self) -> DecodeStats:
+        """Event decode sayaçları ve toplam süre."""
+        return self._decode_stats
+
+    @property
+    def in_flight(self) -> dict[str, int]:
+        """Consumer subscription başına işlemdeki mesaj sayısı (gauge)."""
+        return self._consumer.in_flight
+
     async def health_check(self) -> bool:
         """Broker'ın erişilebilirliğini kontrol et.
 
@@ -295,26 +349,66 @@ class RabbitMQEventBus(EventBus):
                 )
                 return
 
-            # DomainEvent reconstruct (basit: body dict'i olarak geçir)
-            event = DomainEvent()  # base event
-            # Handler'lara body dict'ini DomainEvent olarak sararak gönder
-            # Not: handler'lar body dict'ini doğrudan kullanabilir
+            # Body bir kez tipli event'e çevrilir; tüm handler'lar aynı immutable nesneyi alır.
+            event = self._decode(event_type, body)
+
+            if self._concurrent_handlers and len(handlers) > 1:
+                # Bağımsız handler'lar birlikte çalışır; hepsi bittikten sonra
+                # ilk hata yükseltilir (mesaj retry/DLQ akışına girer).
+                results = await asyncio.gather(
+                    *(self._invoke(event_type, sub_id, handler, event) for sub_id, handler in handlers),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+                return
 
             for sub_id, handler in handlers:
-                try:
-                    await handler(event)
-                    logger.debug(
-                        "event_bus_handler_invoked",
-                        event_type=event_type,
-                        subscription_id=sub_id,
-                    )
-                except Exception as exc:
-                    logger.error(
-                        "event_bus_handler_error",
-                        event_type=event_type,
-                        subscription_id=sub_id,
-                        error=str(exc),
-                    )
-                    raise
+                await self._invoke(event_type, sub_id, handler, event)
 
         return _dispatch
+
+    def _decode(self, event_type: str, body: dict[str, Any]) -> DomainEvent:
+        """Body'yi registry ile somut event sınıfına çevirir ve süreyi ölçer.
+
+        Raises:
+            ValueError: Alan değerleri çözümlenemezse (mesaj retry/DLQ akışına girer).
+        """
+        stats = self._decode_stats
+        if event_type not in self._registry:
+            stats.unknown_type += 1
+            logger.warning("event_bus_unknown_event_type", event_type=event_type)
+        started = time.perf_counter()
+        try:
+            event = self._registry.decode(body)
+        except (TypeError, ValueError) as exc:
+            stats.failed += 1
+            logger.error("event_bus_decode_failed", event_type=event_type, error=str(exc))
+            raise ValueError(f"{event_type} decode edilemedi: {exc}") from exc
+        stats.total_seconds += time.perf_counter() - started
+        stats.decoded += 1
+        return event
+
+    @staticmethod
+    async def _invoke(
+        event_type: str,
+        sub_id: str,
+        handler: EventHandler,
+        event: DomainEvent,
+    ) -> None:
+        try:
+            await handler(event)
+            logger.debug(
+                "event_bus_handler_invoked",
+                event_type=event_type,
+                subscription_id=sub_id,
+            )
+        except Exception as exc:
+            logger.error(
+                "event_bus_handler_error",
+                event_type=event_type,
+                subscription_id=sub_id,
+                error=str(exc),
+            )
+            raise
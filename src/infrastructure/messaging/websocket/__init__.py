@@ -1,13 +1,49 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: Uzman portalı gerçek zamanlı bildirim adapter'ları.
 # PATH: src/infrastructure/messaging/websocket/__init__.py
 # DESC: WebSocket messaging package.
 """WebSocket messaging adapters."""
 
+from src.infrastructure.messaging.websocket.cluster import (
+    ClusteredNotificationManager,
+    ClusterStats,
+    NotificationBus,
+    RabbitMQNotificationBus,
+    RedisNotificationBus,
+)
+from src.infrastructure.messaging.websocket.history import (
+    HistoryWindow,
+    InMemoryNotificationHistory,
+    NotificationHistory,
+    RedisNotificationHistory,
+)
 from src.infrastructure.messaging.websocket.notification_manager import (
+    FanoutStats,
     Notification,
+    PreparedNotification,
     WebSocketNotificationManager,
 )
+from src.infrastructure.messaging.websocket.presence import (
+    InMemoryPresenceStore,
+    PresenceStore,
+    RedisPresenceStore,
+)
 
 __all__: list[str] = [
+    "ClusteredNotificationManager",
+    "ClusterStats",
+    "NotificationBus",
+    "RabbitMQNotificationBus",
+    "RedisNotificationBus",
+    "HistoryWindow",
+    "InMemoryNotificationHistory",
+    "NotificationHistory",
+    "RedisNotificationHistory",
+    "FanoutStats",
     "Notification",
+    "PreparedNotification",
     "WebSocketNotificationManager",
+    "InMemoryPresenceStore",
+    "PresenceStore",
+    "RedisPresenceStore",
 ]
@@ -0,0 +1,423 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: Replikalar arası WebSocket bildirim fan-out'u (broker bus + presence).
+# PATH: src/infrastructure/messaging/websocket/cluster.py
+# DESC: Cluster modu: bildirim bus'ı (RabbitMQ direct / Redis pub/sub) ve ClusteredNotificationManager.
+"""
+ClusteredNotificationManager: birden fazla API replikasında WebSocket bildirimi.
+
+Amaç: Sticky session olmadan yatay ölçekleme. Her replika yalnızca kendi
+  bağlantılarına teslim eder; replikalar arası taşıma bir bus üzerinden yapılır.
+
+Sorumluluk:
+  - broadcast: zarf bus'a bir kez yayınlanır (broadcast adresi), her replika
+    kendi yerel bağlantılarına dağıtır; kaynak replika yerel teslimi doğrudan yapar.
+  - send_to_user/send_to_users: presence ile kullanıcının bağlı olduğu replikalar
+    bulunur; yalnızca o replikaların adresine yayın yapılır. Kullanıcı yalnızca
+    yereldeyse veya hiç bağlı değilse bus kullanılmaz.
+
+Girdi/Çıktı (Contract/DTO/Event):
+  Zarf (JSON): origin, kind (user|broadcast), user_ids, topic, exclude, notification;
+  paylaşılan geçmişte (Redis Streams) ayrıca payload + seqs: kayıt kaynak
+  replikada bir kez yapılır, alıcı replika aynı seq'lerle teslim eder. Süreç içi
+  geçmişte her replika teslim ettiği bildirimi kendi geçmişine yazar.
+
+Hata Modları (idempotency/retry/rate limit):
+  Bildirimler canlı/geçicidir: bus kalıcı değildir, replika yokken gelen zarf düşer.
+  Presence okunamazsa hedefli gönderim broadcast adresine yapılır (fail-open);
+  her replika kullanıcıyı yerel bağlantılarında arar. Bus publish hatası
+  loglanır ve yerel teslimi etkilemez.
+
+Observability (log fields/metrics/traces):
+  ClusterStats: published, received, local_only, no_presence, presence_errors, publish_errors.
+
+Bağımlılıklar: aio-pika veya redis.asyncio (çalışma anında), structlog.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable, Optional, Protocol
+
+import structlog
+
+from src.infrastructure.messaging.rabbitmq_config import (
+    DEFAULT_CONNECT_TIMEOUT,
+    WEBSOCKET_BUS_BROADCAST_KEY,
+    WEBSOCKET_BUS_EXCHANGE,
+    WEBSOCKET_BUS_MESSAGE_TTL_MS,
+)
+from src.infrastructure.messaging.websocket.notification_manager import (
+    Notification,
+    PreparedNotification,
+    WebSocketNotificationManager,
+)
+from src.infrastructure.messaging.websocket.presence import (
+    DEFAULT_PRESENCE_TTL_SECONDS,
+    PresenceStore,
+)
+
+logger = structlog.get_logger(__name__)
+
+# Bus'tan gelen ham zarfı işleyen callback
+EnvelopeHandler = Callable[[bytes], Awaitable[None]]
+
+
+class NotificationBus(Protocol):
+    """Replikalar arası bildirim taşıma portu.
+
+    replica_id=None ile yayın tüm replikalara (broadcast adresi), aksi halde
+    yalnızca o replikaya gider.
+    """
+
+    async def start(self, replica_id: str, on_message: EnvelopeHandler) -> None: ...
+
+    async def publish(self, envelope: bytes, *, replica_id: Optional[str] = None) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class RabbitMQNotificationBus:
+    """Direct exchange ``notifications.ws``; replika başına exclusive, auto-delete kuyruk.
+
+    Kuyruk ``broadcast`` ve ``replica.<id>`` anahtarlarına bağlanır. Mesajlar
+    kalıcı değildir ve WEBSOCKET_BUS_MESSAGE_TTL_MS sonra düşer.
+    """
+
+    def __init__(self, rabbitmq_url: str, *, exchange_name: str = WEBSOCKET_BUS_EXCHANGE) -> None:
+        self._rabbitmq_url = rabbitmq_url
+        self._exchange_name = exchange_name
+        self._connection: Any = None
+        self._exchange: Any = None
+
+    async def start(self, replica_id: str, on_message: EnvelopeHandler) -> None:
+        import aio_pika
+
+        try:
+            self._connection = await aio_pika.connect_robust(self._rabbitmq_url, timeout=DEFAULT_CONNECT_TIMEOUT)
+        except Exception as exc:
+            raise ConnectionError(f"RabbitMQ bağlantısı kurulamadı: {type(exc).__name__}") from exc
+        channel = await self._connection.channel()
+        self._exchange = await channel.declare_exchange(
+            self._exchange_name,
+            aio_pika.ExchangeType.DIRECT,
+            durable=True,
+        )
+        queue = await channel.declare_queue(
+            f"{self._exchange_name}.{replica_id}",
+            exclusive=True,
+            auto_delete=True,
+            arguments={"x-message-ttl": WEBSOCKET_BUS_MESSAGE_TTL_MS},
+        )
+        await queue.bind(self._exchange, WEBSOCKET_BUS_BROADCAST_KEY)
+        await queue.bind(self._exchange, _replica_key(replica_id))
+
+        async def _on_message(message: Any) -> None:
+            try:
+                await on_message(message.body)
+            except Exception as exc:
+                logger.warning("websocket_bus_handler_failed", error=str(exc))
+
+        await queue.consume(_on_message, no_ack=True)
+
+    async def publish(self, envelope: bytes, *, replica_id: Optional[str] = None) -> None:
+        import aio_pika
+
+        if self._exchange is None:
+            raise ConnectionError("Notification bus is not started")
+        await self._exchange.publish(
+            aio_pika.Message(
+                body=envelope,
+                content_type="application/json",
+                delivery_mode=aio_pika.DeliveryMode.NOT_PERSISTENT,
+            ),
+            routing_key=_replica_key(replica_id) if replica_id else WEBSOCKET_BUS_BROADCAST_KEY,
+        )
+
+    async def close(self) -> None:
+        if self._connection is not None and not self._connection.is_closed:
+            await self._connection.close()
+        self._connection = None
+        self._exchange = None
+
+
+class RedisNotificationBus:
+    """Redis pub/sub: ``<prefix>broadcast`` ve ``<prefix>replica:<id>`` kanalları."""
+
+    def __init__(self, client: Any, *, channel_prefix: str = "tarlaanaliz:ws:") -> None:
+        self._client = client
+        self._prefix = channel_prefix
+        self._pubsub: Any = None
+        self._reader: Optional[asyncio.Task[None]] = None
+
+    @classmethod
+    def from_url(cls, redis_url: str, **kwargs: Any) -> RedisNotificationBus:
+        import redis.asyncio as aioredis
+
+        return cls(aioredis.from_url(redis_url), **kwargs)
+
+    async def start(self, replica_id: str, on_message: EnvelopeHandler) -> None:
+        self._pubsub = self._client.pubsub()
+        await self._pubsub.subscribe(self._channel(None), self._channel(replica_id))
+
+        async def _read() -> None:
+            async for item in self._pubsub.listen():
+                if item.get("type") != "message":
+                    continue
+                try:
+                    await on_message(item["data"])
+                except Exception as exc:
+                    logger.warning("websocket_bus_handler_failed", error=str(exc))
+
+        self._reader = asyncio.create_task(_read())
+
+    async def publish(self, envelope: bytes, *, replica_id: Optional[str] = None) -> None:
+        await self._client.publish(self._channel(replica_id), envelope)
+
+    async def close(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+        if self._pubsub is not None:
+            await self._pubsub.unsubscribe()
+            await self._pubsub.aclose()
+            self._pubsub = None
+
+    def _channel(self, replica_id: Optional[str]) -> str:
+        return f"{self._prefix}replica:{replica_id}" if replica_id else f"{self._prefix}{WEBSOCKET_BUS_BROADCAST_KEY}"
+
+
+def _replica_key(replica_id: str) -> str:
+    return f"replica.{replica_id}"
+
+
+@dataclass
+class ClusterStats:
+    """Cluster bus sayaçları (süreç ömrü boyunca kümülatif)."""
+
+    published: int = 0  # bus'a yazılan zarf
+    received: int = 0  # başka replikadan gelen ve işlenen zarf
+    local_only: int = 0  # hedef kullanıcı(lar) yalnızca bu replikada -> bus atlandı
+    no_presence: int = 0  # hedef kullanıcı hiçbir replikada bağlı değil
+    presence_errors: int = 0
+    publish_errors: int = 0
+
+
+class ClusteredNotificationManager:
+    """WebSocketNotificationManager'ın cluster modu (KR-081).
+
+    Gönderim metotlarının dönüş değeri bu replikada kuyruğa alınan bağlantı
+    sayısıdır; uzak replikaların teslimi bus üzerinden asenkron yapılır.
+
+    Kullanım:
+        manager = ClusteredNotificationManager(
+            WebSocketNotificationManager(),
+            RabbitMQNotificationBus(settings.rabbitmq_url),
+            RedisPresenceStore.from_url(settings.redis_url),
+        )
+        await manager.start()
+        conn_id = await manager.connect(websocket, user_id)
+        await manager.send_to_user(user_id, notification)
+    """
+
+    def __init__(
+        self,
+        local: WebSocketNotificationManager,
+        bus: NotificationBus,
+        presence: PresenceStore,
+        *,
+        replica_id: Optional[str] = None,
+        presence_ttl_seconds: float = DEFAULT_PRESENCE_TTL_SECONDS,
+    ) -> None:
+        self._local = local
+        self._bus = bus
+        self._presence = presence
+        self.replica_id = replica_id or uuid.uuid4().hex[:12]
+        # TTL dolmadan en az iki kez yenilenir
+        self._refresh_interval = presence_ttl_seconds / 3
+        self._refresh_task: Optional[asyncio.Task[None]] = None
+        self.stats = ClusterStats()
+
+    @property
+    def local(self) -> WebSocketNotificationManager:
+        return self._local
+
+    async def start(self) -> None:
+        """Bus aboneliğini ve presence yenileme döngüsünü başlatır."""
+        await self._bus.start(self.replica_id, self._on_envelope)
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+        logger.info("websocket_cluster_started", replica_id=self.replica_id)
+
+    async def close(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        for user_id in self._local.connected_user_ids():
+            await self._safe_presence_remove(user_id)
+        await self._local.close_all()
+        await self._bus.close()
+        logger.info("websocket_cluster_closed", replica_id=self.replica_id)
+
+    # ------------------------------------------------------------------
+    # Bağlantılar
+    # ------------------------------------------------------------------
+    async def connect(
+        self,
+        websocket: Any,
+        user_id: str,
+        *,
+        topics: Iterable[str] = (),
+        resume_from: Optional[int] = None,
+    ) -> str:
+        first = not self._local.is_user_connected(user_id)
+        connection_id = await self._local.connect(websocket, user_id, topics=topics, resume_from=resume_from)
+        if first:
+            try:
+                await self._presence.add(user_id, self.replica_id)
+            except Exception as exc:
+                self.stats.presence_errors += 1
+                logger.warning("websocket_presence_add_failed", user_id=user_id, error=str(exc))
+        return connection_id
+
+    async def disconnect(self, connection_id: str) -> None:
+        user_id = self._local.get_connection_user(connection_id)
+        await self._local.disconnect(connection_id)
+        if user_id is not None and not self._local.is_user_connected(user_id):
+            await self._safe_presence_remove(user_id)
+
+    # ------------------------------------------------------------------
+    # Gönderim
+    # ------------------------------------------------------------------
+    async def send_to_user(self, user_id: str, notification: Notification) -> int:
+        return await self.send_to_users([user_id], notification)
+
+    async def send_to_users(self, user_ids: list[str], notification: Notification) -> int:
+        """Kullanıcılara bildirim gönderir; uzak replikalara tek zarf/replika yayınlanır."""
+        try:
+            presence = await self._presence.replicas(user_ids)
+        except Exception as exc:
+            self.stats.presence_errors += 1
+            logger.warning("websocket_presence_lookup_failed", error=str(exc))
+            # Fail-open: tüm replikalar kullanıcıları yerelde arar
+            prepared = await self._local.prepare(user_ids, notification)
+            sent = self._local.deliver(prepared)
+            await self._publish(self._user_envelope(prepared, list(prepared.user_ids)), None)
+            return sent
+
+        remote: dict[str, list[str]] = {}
+        for user_id in user_ids:
+            for replica_id in presence.get(user_id, ()):
+                if replica_id != self.replica_id:
+                    remote.setdefault(replica_id, []).append(user_id)
+
+        prepared = await self._local.prepare(user_ids, notification)
+        sent = self._local.deliver(prepared)
+        if not remote:
+            if presence:
+                self.stats.local_only += 1
+            else:
+                self.stats.no_presence += 1
+            return sent
+
+        for replica_id, targets in remote.items():
+            await self._publish(self._user_envelope(prepared, targets), replica_id)
+        return sent
+
+    async def broadcast(
+        self,
+        notification: Notification,
+        *,
+        exclude_user_ids: Optional[set[str]] = None,
+        topic: Optional[str] = None,
+    ) -> int:
+        """Tüm replikalardaki bağlantılara (veya topic abonelerine) bildirim gönderir.
+
+        Paylaşılan geçmişte kaynak replikanın yazdığı seq'ler zarfla taşınır;
+        aynı kullanıcının başka replikadaki bağlantıları kaydı tekrar yazmaz.
+        """
+        sent, seqs = await self._local.broadcast_recorded(notification, exclude_user_ids=exclude_user_ids, topic=topic)
+        fields: dict[str, Any] = {
+            "topic": topic,
+            "exclude": sorted(exclude_user_ids) if exclude_user_ids else [],
+        }
+        if self._local.history_shared:
+            fields["seqs"] = seqs
+        await self._publish(self._envelope("broadcast", notification, **fields), None)
+        return sent
+
+    # ------------------------------------------------------------------
+    # Bus
+    # ------------------------------------------------------------------
+    def _envelope(self, kind: str, notification: Notification, **fields: Any) -> bytes:
+        body = {"origin": self.replica_id, "kind": kind, "notification": notification.to_dict(), **fields}
+        return json.dumps(body, default=str).encode("utf-8")
+
+    def _user_envelope(self, prepared: PreparedNotification, user_ids: list[str]) -> bytes:
+        if not self._local.history_shared:
+            return self._envelope("user", prepared.notification, user_ids=user_ids)
+        # Paylaşılan geçmiş kaynakta yazıldı; alıcı aynı seq'lerle yalnızca teslim eder
+        return self._envelope(
+            "user",
+            prepared.notification,
+            user_ids=user_ids,
+            payload=prepared.payload,
+            seqs={user_id: prepared.seqs[user_id] for user_id in user_ids if user_id in prepared.seqs},
+        )
+
+    async def _publish(self, envelope: bytes, replica_id: Optional[str]) -> None:
+        try:
+            await self._bus.publish(envelope, replica_id=replica_id)
+            self.stats.published += 1
+        except Exception as exc:
+            self.stats.publish_errors += 1
+            logger.warning("websocket_bus_publish_failed", target_replica=replica_id, error=str(exc))
+
+    async def _on_envelope(self, raw: bytes) -> None:
+        envelope = json.loads(raw)
+        if envelope.get("origin") == self.replica_id:
+            return  # kaynak replika yerel teslimi zaten yaptı
+        notification = Notification.from_dict(envelope["notification"])
+        self.stats.received += 1
+        if envelope.get("kind") == "broadcast":
+            exclude = set(envelope.get("exclude") or ())
+            seqs = envelope.get("seqs")
+            await self._local.broadcast_recorded(
+                notification,
+                exclude_user_ids=exclude or None,
+                topic=envelope.get("topic"),
+                seqs={user_id: int(seq) for user_id, seq in seqs.items()} if seqs is not None else None,
+            )
+        elif "seqs" in envelope:
+            user_ids = tuple(envelope.get("user_ids") or ())
+            self._local.deliver(
+                PreparedNotification(
+                    notification=notification,
+                    payload=envelope["payload"],
+                    user_ids=user_ids,
+                    seqs={user_id: int(seq) for user_id, seq in envelope["seqs"].items()},
+                )
+            )
+        else:
+            await self._local.send_to_users(list(envelope.get("user_ids") or ()), notification)
+
+    # ------------------------------------------------------------------
+    # Presence
+    # ------------------------------------------------------------------
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._refresh_interval)
+            try:
+                await self._presence.refresh(self._local.connected_user_ids(), self.replica_id)
+            except Exception as exc:
+                self.stats.presence_errors += 1
+                logger.warning("websocket_presence_refresh_failed", error=str(exc))
+
+    async def _safe_presence_remove(self, user_id: str) -> None:
+        try:
+            await self._presence.remove(user_id, self.replica_id)
+        except Exception as exc:
+            self.stats.presence_errors += 1
+            logger.warning("websocket_presence_remove_failed", user_id=user_id, error=str(exc))
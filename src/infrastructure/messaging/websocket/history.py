@@ -0,0 +1,191 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: Kullanıcı başına sıralı bildirim geçmişi ve yeniden bağlanınca resume.
+# PATH: src/infrastructure/messaging/websocket/history.py
+# DESC: Kullanıcı başına ring buffer geçmişi (in-process, Redis Streams) ve seq numaraları.
+"""
+Notification history: kullanıcı başına sınırlı, sıra numaralı bildirim geçmişi.
+
+Amaç: Yeniden bağlanan istemcinin "seq N'den sonrasını" isteyip kaçırdığı
+  bildirimleri WebSocket üzerinden alması; deploy sonrası REST yeniden
+  sorgulama fırtınasının önlenmesi.
+
+Girdi/Çıktı (Contract/DTO/Event):
+  Girdi: append(user_ids, payload) — serileştirilmiş bildirim JSON'u.
+  Çıktı: user_id -> seq (kullanıcı başına monoton artan, 1'den başlar);
+    since(user_id, seq) -> HistoryWindow (seq'ten sonraki kayıtlar + gap).
+
+Hata Modları (idempotency/retry/rate limit):
+  Ring buffer dolunca en eski kayıt düşer. İstenen seq'ten sonraki kayıtların
+  bir kısmı düşmüşse veya store sıfırlanmışsa (in-process restart) gap=True
+  döner; istemci yalnızca bu durumda REST ile tam senkron yapar.
+  InMemoryNotificationHistory süreç içidir (shared=False); replikalar arası
+  resume ve restart sonrası kalıcılık için RedisNotificationHistory kullanılır.
+
+Bağımlılıklar: Standart kütüphane; Redis varyantı için redis.asyncio (çalışma anında).
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Protocol
+
+DEFAULT_HISTORY_PER_USER = 100
+DEFAULT_HISTORY_MAX_USERS = 50_000
+DEFAULT_HISTORY_TTL_SECONDS = 24 * 60 * 60
+
+
+@dataclass(frozen=True)
+class HistoryWindow:
+    """since() sonucu: (seq, payload) kayıtları eski -> yeni sırada."""
+
+    entries: list[tuple[int, str]] = field(default_factory=list)
+    # İstenen aralığın bir kısmı artık mevcut değil (buffer taştı veya store sıfırlandı)
+    gap: bool = False
+
+
+class NotificationHistory(Protocol):
+    """Kullanıcı başına bildirim geçmişi portu."""
+
+    # True: tüm replikalar aynı geçmişi görür (cluster modunda kayıt kaynak replikada yapılır)
+    shared: bool
+
+    async def append(self, user_ids: Iterable[str], payload: str) -> dict[str, int]: ...
+
+    async def since(self, user_id: str, seq: int) -> HistoryWindow: ...
+
+
+class _UserRing:
+    __slots__ = ("entries", "last_seq")
+
+    def __init__(self, size: int) -> None:
+        self.entries: deque[tuple[int, str]] = deque(maxlen=size)
+        self.last_seq = 0
+
+
+class InMemoryNotificationHistory:
+    """Süreç içi ring buffer'lar; kullanıcı sayısı max_users ile sınırlı (LRU)."""
+
+    shared = False
+
+    def __init__(
+        self,
+        *,
+        per_user_size: int = DEFAULT_HISTORY_PER_USER,
+        max_users: int = DEFAULT_HISTORY_MAX_USERS,
+    ) -> None:
+        if per_user_size < 1:
+            raise ValueError("per_user_size must be >= 1")
+        self._per_user_size = per_user_size
+        self._max_users = max_users
+        self._rings: OrderedDict[str, _UserRing] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._rings)
+
+    async def append(self, user_ids: Iterable[str], payload: str) -> dict[str, int]:
+        seqs: dict[str, int] = {}
+        for user_id in user_ids:
+            ring = self._rings.get(user_id)
+            if ring is None:
+                ring = self._rings[user_id] = _UserRing(self._per_user_size)
+                if len(self._rings) > self._max_users:
+                    self._rings.popitem(last=False)
+            else:
+                self._rings.move_to_end(user_id)
+            ring.last_seq += 1
+            ring.entries.append((ring.last_seq, payload))
+            seqs[user_id] = ring.last_seq
+        return seqs
+
+    async def since(self, user_id: str, seq: int) -> HistoryWindow:
+        ring = self._rings.get(user_id)
+        if ring is None:
+            # Hiç kayıt yok: istemci daha ileri bir seq biliyorsa store sıfırlanmıştır
+            return HistoryWindow(gap=seq > 0)
+        entries = [entry for entry in ring.entries if entry[0] > seq]
+        oldest = ring.entries[0][0] if ring.entries else ring.last_seq + 1
+        return HistoryWindow(entries=entries, gap=seq > ring.last_seq or oldest > seq + 1)
+
+
+# seq sayacı artırımı ve stream'e ekleme atomiktir; stream ID'si "<seq>-0" olur
+_APPEND_SCRIPT = """
+local seq = redis.call('INCR', KEYS[2])
+redis.call('XADD', KEYS[1], 'MAXLEN', ARGV[2], seq .. '-0', 'p', ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+return seq
+"""
+
+
+class RedisNotificationHistory:
+    """Redis Streams geçmişi: ``<prefix><user_id>`` stream'i + ``<prefix>seq:<user_id>`` sayacı.
+
+    Stream ID'leri seq'ten türetilir (``<seq>-0``); since() tek XRANGE ile
+    çalışır. Çok kullanıcılı append tek pipeline'da yapılır.
+    """
+
+    shared = True
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        key_prefix: str = "tarlaanaliz:ws:history:",
+        per_user_size: int = DEFAULT_HISTORY_PER_USER,
+        ttl_seconds: int = DEFAULT_HISTORY_TTL_SECONDS,
+    ) -> None:
+        if per_user_size < 1:
+            raise ValueError("per_user_size must be >= 1")
+        self._client = client
+        self._prefix = key_prefix
+        self._per_user_size = per_user_size
+        self._ttl = ttl_seconds
+        self._append = client.register_script(_APPEND_SCRIPT)
+
+    @classmethod
+    def from_url(cls, redis_url: str, **kwargs: Any) -> RedisNotificationHistory:
+        import redis.asyncio as aioredis
+
+        return cls(aioredis.from_url(redis_url), **kwargs)
+
+    async def append(self, user_ids: Iterable[str], payload: str) -> dict[str, int]:
+        users = list(dict.fromkeys(user_ids))
+        if not users:
+            return {}
+        pipe = self._client.pipeline(transaction=False)
+        for user_id in users:
+            await self._append(
+                keys=[self._prefix + user_id, f"{self._prefix}seq:{user_id}"],
+                args=[payload, self._per_user_size, self._ttl],
+                client=pipe,
+            )
+        seqs = await pipe.execute()
+        return {user_id: int(seq) for user_id, seq in zip(users, seqs)}
+
+    async def since(self, user_id: str, seq: int) -> HistoryWindow:
+        key = self._prefix + user_id
+        pipe = self._client.pipeline(transaction=False)
+        pipe.xrange(key, min=f"{seq + 1}-0", max="+")
+        pipe.get(f"{self._prefix}seq:{user_id}")
+        pipe.xrange(key, min="-", max="+", count=1)
+        rows, last_seq, oldest = await pipe.execute()
+
+        entries = [(_stream_seq(entry_id), _field(fields)) for entry_id, fields in rows]
+        last = int(last_seq or 0)
+        first = _stream_seq(oldest[0][0]) if oldest else last + 1
+        return HistoryWindow(entries=entries, gap=seq > last or first > seq + 1)
+
+
+def _stream_seq(entry_id: Any) -> int:
+    raw = entry_id.decode() if isinstance(entry_id, bytes) else entry_id
+    return int(raw.split("-", 1)[0])
+
+
+def _field(fields: dict[Any, Any]) -> str:
+    value = fields.get(b"p", fields.get("p"))
+    if isinstance(value, bytes):
+        return value.decode()
+    if isinstance(value, str):
+        return value
+    raise ValueError("history entry has no payload field")
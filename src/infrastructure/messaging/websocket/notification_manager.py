@@ -1,3 +1,5 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: Uzman portalı gerçek zamanlı bildirim fan-out'u (tek serileştirme, sınırlı kuyruk).
 # PATH: src/infrastructure/messaging/websocket/notification_manager.py
 # DESC: WebSocket bildirim yöneticisi (uzman portalı).
 """
@@ -20,10 +22,18 @@ Güvenlik (RBAC/PII/Audit):
 
 Hata Modları (idempotency/retry/rate limit):
   Bağlantı kopma, timeout; bağlantı yeniden kurma desteği.
-  Rate limiting: istemci başına mesaj hızı sınırlaması.
+  Fan-out: bildirim bir kez serileştirilir ve her bağlantının sınırlı giden
+  kuyruğuna eklenir; bağlantı başına writer görevi kuyruğu boşaltır. Kuyruk
+  doluyken en eski mesaj düşer (drop-oldest). Gönderim send_timeout'u aşan
+  veya hata veren bağlantı kapatılır; yavaş istemci diğerlerini bekletmez.
+  Resume: her bildirim kullanıcı başına seq alır (NotificationHistory);
+  connect(resume_from=N) kaçırılanları canlı mesajlardan önce kuyruğa koyar.
+  Replay outbound_queue_size'ı aşarsa kuyruk sınırı geçerlidir.
 
 Observability (log fields/metrics/traces):
-  active_connections, messages_sent, errors, latency.
+  active_connections, messages_sent, errors, latency;
+  fanout_stats: enqueued, sent, dropped, timeouts, failed;
+  websocket_resumed (from_seq, replayed, gap).
 
 Testler: Contract test (port), integration test (WebSocket stub), e2e (kritik akış).
 Bağımlılıklar: FastAPI WebSocket, structlog, asyncio.
@@ -37,24 +47,52 @@ import asyncio
 import json
 import time
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 import structlog
 
+from src.infrastructure.messaging.websocket.history import (
+    HistoryWindow,
+    InMemoryNotificationHistory,
+    NotificationHistory,
+)
+
 logger = structlog.get_logger(__name__)
 
+DEFAULT_OUTBOUND_QUEUE_SIZE = 256
+DEFAULT_MAX_CONCURRENT_SENDS = 512
+DEFAULT_SEND_TIMEOUT_SECONDS = 5.0
+
+_PING_PAYLOAD = json.dumps({"type": "ping"})
+
+
+def _with_seq(payload: str, seq: int) -> str:
+    """Serileştirilmiş bildirim nesnesine seq alanını ekler (yeniden serileştirmeden)."""
+    return f'{{"seq":{seq},{payload[1:]}'
+
 
 @dataclass
 class WebSocketConnection:
-    """Tek bir WebSocket bağlantısının meta bilgisi."""
+    """Tek bir WebSocket bağlantısının meta bilgisi ve giden kuyruğu."""
 
     connection_id: str
     user_id: str
     websocket: Any  # FastAPI WebSocket instance
     connected_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     last_ping: Optional[datetime] = None
+    # Abone olunan topic'ler (ör. "role:expert", "province:34")
+    topics: set[str] = field(default_factory=set)
+    # Serileştirilmiş mesajlar; maxlen dolunca en eskisi düşer
+    outbound: deque[str] = field(default_factory=lambda: deque(maxlen=DEFAULT_OUTBOUND_QUEUE_SIZE))
+    dropped: int = 0
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+    idle: asyncio.Event = field(default_factory=asyncio.Event)
+    writer: Optional[asyncio.Task[None]] = None
+    # Resume sırasında kuyruğa giren ilk canlı mesajın seq'i (replay bununla kesilir)
+    first_live_seq: Optional[int] = None
 
 
 @dataclass(frozen=True)
@@ -79,6 +117,39 @@ class Notification:
             "created_at": self.created_at.isoformat(),
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Notification:
+        """to_dict() çıktısından bildirimi yeniden oluşturur (cluster bus alıcı tarafı)."""
+        return cls(
+            notification_id=data["notification_id"],
+            notification_type=data["notification_type"],
+            title=data["title"],
+            body=data["body"],
+            data=data.get("data") or {},
+            created_at=datetime.fromisoformat(data["created_at"]),
+        )
+
+
+@dataclass(frozen=True)
+class PreparedNotification:
+    """Bir kez serileştirilmiş ve geçmişe yazılmış bildirim (teslime hazır)."""
+
+    notification: Notification
+    payload: str
+    user_ids: tuple[str, ...]
+    seqs: dict[str, int] = field(default_factory=dict)  # user_id -> geçmiş seq'i
+
+
+@dataclass
+class FanoutStats:
+    """Fan-out sayaçları (süreç ömrü boyunca kümülatif)."""
+
+    enqueued: int = 0
+    sent: int = 0
+    dropped: int = 0
+    timeouts: int = 0
+    failed: int = 0
+
 
 class WebSocketNotificationManager:
     """WebSocket bildirim yöneticisi.
@@ -89,16 +160,27 @@ class WebSocketNotificationManager:
 
     Özellikler:
       - Kullanıcı bazlı bağlantı yönetimi
-      - Broadcast (tüm kullanıcılara) ve unicast (tek kullanıcıya) bildirim
+      - Broadcast (tüm kullanıcılara veya bir topic'e) ve unicast (tek kullanıcıya) bildirim
+      - Topic/rol abonelikleri: broadcast(topic=...) yalnızca ilgili bağlantıları dolaşır
+      - Tek serileştirme + bağlantı başına sınırlı kuyruk (drop-oldest)
+      - Eşzamanlı gönderim üst sınırı (max_concurrent_sends) ve send_timeout
       - Periyodik ping/pong ile bağlantı sağlığı kontrolü
       - Otomatik dead connection temizleme
-      - Bildirim geçmişi (bellek içi, son N bildirim)
+      - Kullanıcı başına seq numaralı geçmiş (NotificationHistory) ve
+        connect(resume_from=N) ile kaçırılan bildirimlerin yeniden oynatılması
+      - Genel bildirim geçmişi (bellek içi, son N bildirim)
 
     Kullanım:
         manager = WebSocketNotificationManager()
-        await manager.connect(websocket, user_id)
+        conn_id = await manager.connect(websocket, user_id, topics={"role:expert", "province:34"})
         await manager.send_to_user(user_id, notification)
-        await manager.disconnect(connection_id)
+        await manager.broadcast(alert, topic="province:34")
+        await manager.disconnect(conn_id)
+
+    Resume: istemcinin aldığı her bildirimde ``seq`` alanı bulunur. Yeniden
+    bağlanırken son seq gönderilir; önce ``{"type": "resume", "gap": ...}``
+    kontrol mesajı, ardından kaçırılan bildirimler sırayla gelir. gap=True ise
+    geçmiş yetmemiştir ve istemci REST ile tam senkron yapar.
     """
 
     def __init__(
@@ -106,16 +188,36 @@ class WebSocketNotificationManager:
         *,
         max_history_size: int = 100,
         ping_interval_seconds: int = 30,
+        outbound_queue_size: int = DEFAULT_OUTBOUND_QUEUE_SIZE,
+        max_concurrent_sends: int = DEFAULT_MAX_CONCURRENT_SENDS,
+        send_timeout_seconds: float = DEFAULT_SEND_TIMEOUT_SECONDS,
+        history: Optional[NotificationHistory] = None,
     ) -> None:
+        if outbound_queue_size < 1:
+            raise ValueError("outbound_queue_size must be >= 1")
+        if max_concurrent_sends < 1:
+            raise ValueError("max_concurrent_sends must be >= 1")
+
         # connection_id -> WebSocketConnection
         self._connections: dict[str, WebSocketConnection] = {}
 
         # user_id -> set[connection_id]
         self._user_connections: dict[str, set[str]] = {}
 
-        # Bildirim geçmişi (son N)
-        self._notification_history: list[Notification] = []
-        self._max_history_size = max_history_size
+        # topic -> set[connection_id]
+        self._topic_connections: dict[str, set[str]] = {}
+
+        # Genel bildirim geçmişi (son N) ve kullanıcı başına resume geçmişi
+        self._notification_history: deque[Notification] = deque(maxlen=max_history_size)
+        self._history: NotificationHistory = (
+            history if history is not None else InMemoryNotificationHistory(per_user_size=max_history_size)
+        )
+
+        # Fan-out ayarları: writer görevleri ortak semaphore ile sınırlanır
+        self._outbound_queue_size = outbound_queue_size
+        self._send_slots = asyncio.Semaphore(max_concurrent_sends)
+        self._send_timeout = send_timeout_seconds
+        self._stats = FanoutStats()
 
         # Ping/pong ayarları
         self._ping_interval = ping_interval_seconds
@@ -131,16 +233,31 @@ class WebSocketNotificationManager:
         """Aktif kullanıcı sayısı (en az bir bağlantısı olan)."""
         return len(self._user_connections)
 
+    @property
+    def history_shared(self) -> bool:
+        """Kullanıcı geçmişi replikalar arası paylaşılıyor mu (ör. Redis Streams)."""
+        return self._history.shared
+
+    @property
+    def fanout_stats(self) -> FanoutStats:
+        """enqueued/sent/dropped/timeouts/failed sayaçları."""
+        return self._stats
+
     async def connect(
         self,
         websocket: Any,
         user_id: str,
+        *,
+        topics: Iterable[str] = (),
+        resume_from: Optional[int] = None,
     ) -> str:
         """Yeni WebSocket bağlantısı kaydet.
 
         Args:
             websocket: FastAPI WebSocket instance.
             user_id: Bağlanan kullanıcı ID'si.
+            topics: Başlangıç topic abonelikleri (ör. "role:expert", "province:34").
+            resume_from: İstemcinin aldığı son seq; verilirse sonrası yeniden oynatılır.
 
         Returns:
             connection_id: Benzersiz bağlantı ID'si.
@@ -151,14 +268,25 @@ class WebSocketNotificationManager:
             connection_id=connection_id,
             user_id=user_id,
             websocket=websocket,
+            outbound=deque(maxlen=self._outbound_queue_size),
         )
+        connection.idle.set()
 
+        # Önce kayıt: replay beklenirken gelen canlı mesajlar kuyrukta birikir
         self._connections[connection_id] = connection
 
         if user_id not in self._user_connections:
             self._user_connections[user_id] = set()
         self._user_connections[user_id].add(connection_id)
 
+        self.subscribe(connection_id, *topics)
+
+        if resume_from is not None:
+            await self._replay(connection, resume_from)
+        # Writer replay kuyruğun başına eklendikten sonra başlar (sıra korunur)
+        if connection_id in self._connections:
+            connection.writer = asyncio.create_task(self._write_loop(connection))
+
         logger.info(
             "websocket_connected",
             connection_id=connection_id,
@@ -186,6 +314,14 @@ class WebSocketNotificationManager:
             if not self._user_connections[user_id]:
                 del self._user_connections[user_id]
 
+        self._remove_from_topics(connection_id, connection.topics)
+
+        # Writer kendi hatasıyla disconnect çağırıyorsa kendini iptal etmez
+        if connection.writer is not None and connection.writer is not asyncio.current_task():
+            connection.writer.cancel()
+        connection.outbound.clear()
+        connection.idle.set()
+
         logger.info(
             "websocket_disconnected",
             connection_id=connection_id,
@@ -193,6 +329,148 @@ class WebSocketNotificationManager:
             active_connections=self.active_connection_count,
         )
 
+    def subscribe(self, connection_id: str, *topics: str) -> None:
+        """Bağlantıyı topic'lere abone eder (bilinmeyen bağlantı yok sayılır)."""
+        connection = self._connections.get(connection_id)
+        if connection is None:
+            return
+        for topic in topics:
+            connection.topics.add(topic)
+            self._topic_connections.setdefault(topic, set()).add(connection_id)
+
+    def unsubscribe(self, connection_id: str, *topics: str) -> None:
+        """Bağlantının topic aboneliklerini kaldırır."""
+        connection = self._connections.get(connection_id)
+        if connection is None:
+            return
+        connection.topics.difference_update(topics)
+        self._remove_from_topics(connection_id, topics)
+
+    def _remove_from_topics(self, connection_id: str, topics: Iterable[str]) -> None:
+        for topic in topics:
+            members = self._topic_connections.get(topic)
+            if members is None:
+                continue
+            members.discard(connection_id)
+            if not members:
+                del self._topic_connections[topic]
+
+    def topic_connection_count(self, topic: str) -> int:
+        """Topic'e abone bağlantı sayısı."""
+        return len(self._topic_connections.get(topic, ()))
+
+    # ------------------------------------------------------------------
+    # Fan-out
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _serialize(notification: Notification) -> str:
+        return json.dumps(notification.to_dict(), default=str)
+
+    def _enqueue(self, connection: WebSocketConnection, payload: str) -> None:
+        """Serileştirilmiş mesajı bağlantı kuyruğuna ekler (dolu ise en eskisi düşer)."""
+        if len(connection.outbound) == connection.outbound.maxlen:
+            connection.dropped += 1
+            self._stats.dropped += 1
+        connection.outbound.append(payload)
+        connection.idle.clear()
+        connection.wakeup.set()
+        self._stats.enqueued += 1
+
+    def _enqueue_many(self, connection_ids: Iterable[str], payload: str, seq: Optional[int] = None) -> int:
+        queued = 0
+        for conn_id in connection_ids:
+            connection = self._connections.get(conn_id)
+            if connection is None:
+                continue
+            if seq is not None and connection.first_live_seq is None:
+                connection.first_live_seq = seq
+            self._enqueue(connection, payload)
+            queued += 1
+        return queued
+
+    async def _record(self, user_ids: Iterable[str], payload: str) -> dict[str, int]:
+        """Kullanıcı geçmişlerine yazar; store hatasında seq'siz teslim edilir."""
+        try:
+            return await self._history.append(user_ids, payload)
+        except Exception as exc:
+            logger.warning("websocket_history_append_failed", error=str(exc))
+            return {}
+
+    async def _replay(self, connection: WebSocketConnection, resume_from: int) -> None:
+        """resume_from sonrası kayıtları kontrol mesajıyla birlikte kuyruğun başına ekler."""
+        try:
+            window = await self._history.since(connection.user_id, resume_from)
+        except Exception as exc:
+            logger.warning("websocket_history_read_failed", user_id=connection.user_id, error=str(exc))
+            window = HistoryWindow(gap=True)
+
+        first_live = connection.first_live_seq
+        replay = [_with_seq(payload, seq) for seq, payload in window.entries if first_live is None or seq < first_live]
+        control = json.dumps({"type": "resume", "from_seq": resume_from, "replayed": len(replay), "gap": window.gap})
+        connection.outbound.extendleft(reversed([control, *replay]))
+        connection.idle.clear()
+        self._stats.enqueued += len(replay) + 1
+
+        logger.info(
+            "websocket_resumed",
+            connection_id=connection.connection_id,
+            user_id=connection.user_id,
+            from_seq=resume_from,
+            replayed=len(replay),
+            gap=window.gap,
+        )
+
+    async def _write_loop(self, connection: WebSocketConnection) -> None:
+        """Bağlantının giden kuyruğunu sırayla gönderir (bağlantı başına tek görev).
+
+        Gönderim hatası veya send_timeout aşımında bağlantı kapatılır.
+        """
+        outbound = connection.outbound
+        try:
+            while True:
+                while not outbound:
+                    connection.idle.set()
+                    connection.wakeup.clear()
+                    await connection.wakeup.wait()
+                payload = outbound.popleft()
+                async with self._send_slots:
+                    await asyncio.wait_for(connection.websocket.send_text(payload), timeout=self._send_timeout)
+                self._stats.sent += 1
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            self._stats.timeouts += 1
+            logger.warning(
+                "websocket_send_timeout",
+                connection_id=connection.connection_id,
+                user_id=connection.user_id,
+                timeout_seconds=self._send_timeout,
+            )
+        except Exception as exc:
+            self._stats.failed += 1
+            logger.warning(
+                "websocket_send_failed",
+                connection_id=connection.connection_id,
+                user_id=connection.user_id,
+                error=str(exc),
+            )
+        await self.disconnect(connection.connection_id)
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """Tüm giden kuyruklar boşalana kadar bekler.
+
+        Returns:
+            True: Kuyruklar boşaldı. False: timeout doldu.
+        """
+        waiters = [conn.idle.wait() for conn in self._connections.values() if not conn.idle.is_set()]
+        if not waiters:
+            return True
+        try:
+            await asyncio.wait_for(asyncio.gather(*waiters), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
     async def send_to_user(
         self,
         user_id: str,
@@ -200,96 +478,128 @@ class WebSocketNotificationManager:
     ) -> int:
         """Belirli bir kullanıcının tüm bağlantılarına bildirim gönder.
 
+        Kullanıcı bağlı değilse de geçmişine yazılır (yeniden bağlanınca replay).
+
         Args:
             user_id: Hedef kullanıcı ID'si.
             notification: Gönderilecek bildirim.
 
         Returns:
-            Başarıyla gönderilen bağlantı sayısı.
+            Bildirimin kuyruğa alındığı bağlantı sayısı (teslim writer görevlerinde yapılır).
         """
-        connection_ids = self._user_connections.get(user_id, set())
-        if not connection_ids:
-            logger.debug(
-                "websocket_user_not_connected",
-                user_id=user_id,
-                notification_type=notification.notification_type,
-            )
-            return 0
-
-        sent_count = 0
-        failed_connections: list[str] = []
-        payload = json.dumps(notification.to_dict(), default=str)
-
-        for conn_id in list(connection_ids):
-            connection = self._connections.get(conn_id)
-            if connection is None:
-                continue
-
-            try:
-                await connection.websocket.send_text(payload)
-                sent_count += 1
-            except Exception as exc:
-                logger.warning(
-                    "websocket_send_failed",
-                    connection_id=conn_id,
-                    user_id=user_id,
-                    error=str(exc),
-                )
-                failed_connections.append(conn_id)
-
-        # Başarısız bağlantıları temizle
-        for conn_id in failed_connections:
-            await self.disconnect(conn_id)
-
-        # Geçmişe ekle
-        self._add_to_history(notification)
+        sent_count = await self.send_to_users([user_id], notification)
 
         logger.info(
             "websocket_notification_sent",
             user_id=user_id,
             notification_type=notification.notification_type,
             sent_count=sent_count,
-            failed_count=len(failed_connections),
         )
 
         return sent_count
 
+    async def prepare(self, user_ids: Iterable[str], notification: Notification) -> PreparedNotification:
+        """Bildirimi bir kez serileştirir ve hedef kullanıcıların geçmişine yazar."""
+        users = tuple(dict.fromkeys(user_ids))
+        payload = self._serialize(notification)
+        seqs = await self._record(users, payload)
+        self._add_to_history(notification)
+        return PreparedNotification(notification=notification, payload=payload, user_ids=users, seqs=seqs)
+
+    def deliver(self, prepared: PreparedNotification, user_ids: Optional[Iterable[str]] = None) -> int:
+        """Hazırlanmış bildirimi (verilirse yalnızca user_ids'e) yerel bağlantılara kuyruğa alır.
+
+        Returns:
+            Bildirimin kuyruğa alındığı bağlantı sayısı.
+        """
+        total_sent = 0
+        for user_id in prepared.user_ids if user_ids is None else user_ids:
+            connection_ids = self._user_connections.get(user_id)
+            if not connection_ids:
+                continue
+            seq = prepared.seqs.get(user_id)
+            payload = _with_seq(prepared.payload, seq) if seq is not None else prepared.payload
+            total_sent += self._enqueue_many(connection_ids, payload, seq)
+        return total_sent
+
     async def broadcast(
         self,
         notification: Notification,
         *,
         exclude_user_ids: Optional[set[str]] = None,
+        topic: Optional[str] = None,
     ) -> int:
-        """Tüm bağlı kullanıcılara bildirim gönder.
+        """Tüm bağlı kullanıcılara (veya topic abonelerine) bildirim gönder.
+
+        Bildirim bir kez serileştirilir; gönderim bağlantı writer'larında
+        eşzamanlı yapılır, bu çağrı yavaş istemcileri beklemez. Geçmişe
+        yalnızca o an bağlı alıcıların kaydı yazılır.
 
         Args:
             notification: Gönderilecek bildirim.
             exclude_user_ids: Hariç tutulacak kullanıcı ID'leri.
+            topic: Verilirse yalnızca bu topic'e abone bağlantılar (ör. "province:34").
+
+        Returns:
+            Bildirimin kuyruğa alındığı bağlantı sayısı.
+        """
+        total_sent, _ = await self.broadcast_recorded(notification, exclude_user_ids=exclude_user_ids, topic=topic)
+        return total_sent
+
+    async def broadcast_recorded(
+        self,
+        notification: Notification,
+        *,
+        exclude_user_ids: Optional[set[str]] = None,
+        topic: Optional[str] = None,
+        seqs: Optional[dict[str, int]] = None,
+    ) -> tuple[int, dict[str, int]]:
+        """broadcast() gibi; ayrıca kullanıcı başına geçmiş seq'lerini döndürür.
+
+        seqs verilen kullanıcılar geçmişe tekrar yazılmaz, bu seq'lerle
+        teslim edilir (paylaşılan geçmişe başka replikada yazılmış yayın).
 
         Returns:
-            Toplam gönderilen bağlantı sayısı.
+            (kuyruğa alınan bağlantı sayısı, user_id -> seq).
         """
         start_time = time.monotonic()
-        total_sent = 0
         exclude = exclude_user_ids or set()
+        payload = self._serialize(notification)
+
+        if topic is not None:
+            targets: Iterable[str] = self._topic_connections.get(topic, ())
+        else:
+            targets = self._connections.keys()
+        # Seq kullanıcı başınadır: alıcı bağlantılar kullanıcıya göre gruplanır
+        by_user: dict[str, list[str]] = {}
+        for conn_id in targets:
+            user_id = self._connections[conn_id].user_id
+            if user_id not in exclude:
+                by_user.setdefault(user_id, []).append(conn_id)
+
+        known = seqs or {}
+        recorded = {user_id: known[user_id] for user_id in by_user if user_id in known}
+        recorded.update(await self._record([user_id for user_id in by_user if user_id not in known], payload))
+        total_sent = 0
+        for user_id, connection_ids in by_user.items():
+            seq = recorded.get(user_id)
+            user_payload = _with_seq(payload, seq) if seq is not None else payload
+            total_sent += self._enqueue_many(connection_ids, user_payload, seq)
 
-        for user_id in list(self._user_connections.keys()):
-            if user_id in exclude:
-                continue
-            sent = await self.send_to_user(user_id, notification)
-            total_sent += sent
+        self._add_to_history(notification)
 
         latency_ms = (time.monotonic() - start_time) * 1000
 
         logger.info(
             "websocket_broadcast_completed",
             notification_type=notification.notification_type,
+            topic=topic,
             total_sent=total_sent,
             user_count=self.active_user_count,
             latency_ms=round(latency_ms, 2),
         )
 
-        return total_sent
+        return total_sent, recorded
 
     async def send_to_users(
         self,
@@ -303,13 +613,9 @@ class WebSocketNotificationManager:
             notification: Gönderilecek bildirim.
 
         Returns:
-            Toplam gönderilen bağlantı sayısı.
+            Bildirimin kuyruğa alındığı toplam bağlantı sayısı.
         """
-        total_sent = 0
-        for user_id in user_ids:
-            sent = await self.send_to_user(user_id, notification)
-            total_sent += sent
-        return total_sent
+        return self.deliver(await self.prepare(user_ids, notification))
 
     def is_user_connected(self, user_id: str) -> bool:
         """Kullanıcının aktif bağlantısı var mı?
@@ -328,13 +634,18 @@ class WebSocketNotificationManager:
         """Kullanıcının aktif bağlantı sayısını döner."""
         return len(self._user_connections.get(user_id, set()))
 
+    def connected_user_ids(self) -> list[str]:
+        """En az bir aktif bağlantısı olan kullanıcı ID'leri."""
+        return list(self._user_connections)
+
+    def get_connection_user(self, connection_id: str) -> Optional[str]:
+        """Bağlantının kullanıcı ID'si (bilinmeyen bağlantı -> None)."""
+        connection = self._connections.get(connection_id)
+        return connection.user_id if connection is not None else None
+
     def _add_to_history(self, notification: Notification) -> None:
         """Bildirimi geçmişe ekle (boyut sınırlaması ile)."""
-        self._notification_history.append(notification)
-        if len(self._notification_history) > self._max_history_size:
-            # En eski kayıtları kaldır
-            overflow = len(self._notification_history) - self._max_history_size
-            self._notification_history = self._notification_history[overflow:]
+        self._notification_history.append(notification)  # deque(maxlen) en eskiyi düşürür
 
     def get_recent_notifications(
         self,
@@ -348,7 +659,7 @@ class WebSocketNotificationManager:
         Returns:
             Bildirim dict listesi.
         """
-        recent = self._notification_history[-limit:]
+        recent = list(self._notification_history)[-limit:]
         recent.reverse()
         return [n.to_dict() for n in recent]
 
@@ -379,28 +690,23 @@ class WebSocketNotificationManager:
             logger.info("websocket_ping_loop_stopped")
 
     async def _ping_all_connections(self) -> None:
-        """Tüm bağlantılara ping gönder, dead olanları temizle."""
-        dead_connections: list[str] = []
-
-        for conn_id, connection in list(self._connections.items()):
-            try:
-                await connection.websocket.send_json({"type": "ping"})
-                connection.last_ping = datetime.now(timezone.utc)
-            except Exception:
-                dead_connections.append(conn_id)
+        """Tüm bağlantılara ping kuyruğa alır.
 
-        for conn_id in dead_connections:
-            await self.disconnect(conn_id)
+        Ping, bildirimlerle aynı writer üzerinden gider (aynı sokete eşzamanlı
+        yazım olmaz); gönderilemeyen bağlantıyı writer kapatır.
+        """
+        now = datetime.now(timezone.utc)
+        for connection in list(self._connections.values()):
+            self._enqueue(connection, _PING_PAYLOAD)
+            connection.last_ping = now
 
-        if dead_connections:
-            logger.info(
-                "websocket_dead_connections_cleaned",
-                count=len(dead_connections),
-            )
+    async def close_all(self, *, drain_timeout: float = 1.0) -> None:
+        """Tüm bağlantıları kapat (graceful shutdown).
 
-    async def close_all(self) -> None:
-        """Tüm bağlantıları kapat (graceful shutdown)."""
+        Kuyruktaki mesajlar için en fazla drain_timeout saniye beklenir.
+        """
         await self.stop_ping_loop()
+        await self.flush(timeout=drain_timeout)
 
         for conn_id in list(self._connections.keys()):
             try:
@@ -0,0 +1,143 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: WebSocket presence — kullanıcının hangi API replikalarında bağlı olduğu.
+# PATH: src/infrastructure/messaging/websocket/presence.py
+# DESC: Cluster modu için user_id -> replica_id presence store'ları (in-process, Redis).
+"""
+Presence store: kullanıcı başına bağlı olduğu replika kümesi.
+
+Amaç: Hedefli bildirimlerin (send_to_user/send_to_users) yalnızca kullanıcının
+  bağlı olduğu replikalara yayınlanması; bağlı olmayan kullanıcı için bus'a
+  hiç mesaj gönderilmemesi.
+
+Girdi/Çıktı (Contract/DTO/Event):
+  Girdi: (user_id, replica_id) kayıt/silme, periyodik refresh.
+  Çıktı: user_id -> set[replica_id].
+
+Hata Modları (idempotency/retry/rate limit):
+  Her kayıt TTL taşır; replika çökerse kayıtları refresh edilmediği için
+  ttl sonunda düşer. Süresi dolmamış eski kayıt yalnızca boşa bir publish'e
+  yol açar (hedef replikanın kuyruğu/aboneliği yoktur, mesaj düşer).
+
+Bağımlılıklar: Standart kütüphane; Redis varyantı için redis.asyncio (çalışma anında).
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Iterable, Protocol
+
+DEFAULT_PRESENCE_TTL_SECONDS = 60
+
+
+class PresenceStore(Protocol):
+    """Cluster presence portu."""
+
+    async def add(self, user_id: str, replica_id: str) -> None: ...
+
+    async def remove(self, user_id: str, replica_id: str) -> None: ...
+
+    async def refresh(self, user_ids: Iterable[str], replica_id: str) -> None: ...
+
+    async def replicas(self, user_ids: Iterable[str]) -> dict[str, set[str]]: ...
+
+
+class InMemoryPresenceStore:
+    """Süreç içi presence (tek düğüm ve testler; aynı süreçteki yöneticiler paylaşabilir)."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = DEFAULT_PRESENCE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._clock = clock
+        # user_id -> replica_id -> son geçerlilik zamanı
+        self._entries: dict[str, dict[str, float]] = {}
+
+    async def add(self, user_id: str, replica_id: str) -> None:
+        self._entries.setdefault(user_id, {})[replica_id] = self._clock() + self._ttl
+
+    async def remove(self, user_id: str, replica_id: str) -> None:
+        replicas = self._entries.get(user_id)
+        if replicas is None:
+            return
+        replicas.pop(replica_id, None)
+        if not replicas:
+            del self._entries[user_id]
+
+    async def refresh(self, user_ids: Iterable[str], replica_id: str) -> None:
+        for user_id in user_ids:
+            await self.add(user_id, replica_id)
+
+    async def replicas(self, user_ids: Iterable[str]) -> dict[str, set[str]]:
+        now = self._clock()
+        result: dict[str, set[str]] = {}
+        for user_id in user_ids:
+            live = {rid for rid, expires_at in self._entries.get(user_id, {}).items() if expires_at > now}
+            if live:
+                result[user_id] = live
+        return result
+
+
+class RedisPresenceStore:
+    """Redis sorted set presence: anahtar ``<prefix><user_id>``, üye replica_id, skor son geçerlilik.
+
+    Üye başına süre dolumu skor ile yapılır (ZRANGEBYSCORE now +inf); anahtarın
+    kendisi de ttl ile expire olur, böylece terk edilmiş kullanıcılar birikmez.
+    Çoklu kullanıcı sorgusu tek pipeline ile yapılır.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        key_prefix: str = "tarlaanaliz:ws:presence:",
+        ttl_seconds: int = DEFAULT_PRESENCE_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        self._client = client
+        self._prefix = key_prefix
+        self._ttl = ttl_seconds
+        self._clock = clock
+
+    @classmethod
+    def from_url(cls, redis_url: str, **kwargs: Any) -> RedisPresenceStore:
+        import redis.asyncio as aioredis
+
+        return cls(aioredis.from_url(redis_url), **kwargs)
+
+    async def add(self, user_id: str, replica_id: str) -> None:
+        await self.refresh((user_id,), replica_id)
+
+    async def remove(self, user_id: str, replica_id: str) -> None:
+        await self._client.zrem(self._prefix + user_id, replica_id)
+
+    async def refresh(self, user_ids: Iterable[str], replica_id: str) -> None:
+        expires_at = self._clock() + self._ttl
+        pipe = self._client.pipeline(transaction=False)
+        queued = False
+        for user_id in user_ids:
+            key = self._prefix + user_id
+            pipe.zadd(key, {replica_id: expires_at})
+            pipe.expire(key, self._ttl)
+            queued = True
+        if queued:
+            await pipe.execute()
+
+    async def replicas(self, user_ids: Iterable[str]) -> dict[str, set[str]]:
+        users = list(user_ids)
+        if not users:
+            return {}
+        now = self._clock()
+        pipe = self._client.pipeline(transaction=False)
+        for user_id in users:
+            pipe.zrangebyscore(self._prefix + user_id, now, "+inf")
+        rows = await pipe.execute()
+        result: dict[str, set[str]] = {}
+        for user_id, members in zip(users, rows):
+            if members:
+                result[user_id] = {m.decode() if isinstance(m, bytes) else m for m in members}
+        return result
@@ -1,3 +1,182 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-041: Replikalar arası paylaşılan rate-limit (Redis GCRA).
 # PATH: src/infrastructure/persistence/redis/rate_limiter.py
 # DESC: Redis rate limiter adapter.
-# TODO: Implement this file.
+"""
+Redis rate limiter: RateLimitMiddleware için dağıtık RateLimitStore.
+
+Amaç: Limitin replika sayısından bağımsız uygulanması; N replika ile istemcinin
+  N kat limit alması önlenir.
+
+Sorumluluk: GCRA (Generic Cell Rate Algorithm) kontrolü tek Lua script'i ile
+  atomik yapılır; anahtar başına yalnızca TAT (theoretical arrival time)
+  saklanır -> bellek istek sayısından bağımsız O(1).
+
+Girdi/Çıktı (Contract/DTO/Event):
+  Girdi: allow(key, now, per_minute, burst) — RateLimitStore sözleşmesi.
+  Çıktı: (allowed, retry_after_seconds).
+
+  Limit = per_minute + burst istek / 60 sn: boş anahtar limitin tamamını anında
+  kullanabilir, sonrasında her 60/limit saniyede bir yeni istek açılır.
+  Zaman Redis TIME ile alınır; replika saatleri arasındaki kayma etkisizdir.
+
+Hata Modları (idempotency/retry/rate limit):
+  Redis erişilemezse varsayılan fail_open=True: istek geçer, errors sayacı artar.
+  Lokal ön-tahsis (max_prefetch > 1): sıcak anahtar için tek round trip'te
+  birden fazla token alınır ve lease_seconds boyunca süreç içinde harcanır.
+  Parti boyu 1'den başlar, lease dolmadan tükendikçe ikiye katlanır. Lease
+  süresi dolan kullanılmamış token'lar kaybolur (limit aşılmaz, en fazla
+  max_prefetch kadar erken tükenir).
+
+Observability (log fields/metrics/traces):
+  RateLimitStats: checks, local_hits, round_trips, denied, errors.
+
+Testler: Unit (GCRA kapasitesi, retry_after, ön-tahsis, fail-open).
+Bağımlılıklar: Standart kütüphane; redis.asyncio (from_url ile çalışma anında).
+"""
+
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+DEFAULT_RATE_LIMIT_WINDOW_SECONDS = 60
+DEFAULT_LEASE_SECONDS = 1.0
+DEFAULT_MAX_LOCAL_KEYS = 10_000
+DEFAULT_MAX_CONNECTIONS = 50
+
+# KEYS[1]: TAT anahtarı (ms)
+# ARGV: emission interval (ms), tolerans (ms), istenen token sayısı
+# Dönüş: {verilen token, yeniden deneme için bekleme (ms)}
+_GCRA_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local interval = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local quantity = tonumber(ARGV[3])
+local tat = tonumber(redis.call('GET', KEYS[1]) or '0')
+if tat < now then tat = now end
+local granted = math.floor((now + tolerance + interval - tat) / interval)
+if granted > quantity then granted = quantity end
+if granted < 1 then
+  return {0, tat - tolerance - now}
+end
+tat = tat + granted * interval
+redis.call('SET', KEYS[1], tat, 'PX', tat - now)
+return {granted, 0}
+"""
+
+
+@dataclass
+class RateLimitStats:
+    """RedisRateLimitStore sayaçları."""
+
+    checks: int = 0
+    local_hits: int = 0  # ön-tahsis edilmiş token ile round trip'siz karar
+    round_trips: int = 0
+    denied: int = 0
+    errors: int = 0  # Redis hatası (fail_open ise istek geçirildi)
+
+
+class _Lease:
+    __slots__ = ("tokens", "expires_at", "batch")
+
+    def __init__(self, tokens: int, expires_at: float, batch: int) -> None:
+        self.tokens = tokens
+        self.expires_at = expires_at
+        self.batch = batch
+
+
+class RedisRateLimitStore:
+    """GCRA tabanlı, replikalar arası paylaşılan rate-limit store'u.
+
+    ``allow`` coroutine'dir; RateLimitMiddleware awaitable sonuçları bekler.
+    ``now`` yalnızca lokal lease süresi için kullanılır (time.monotonic).
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        key_prefix: str = "tarlaanaliz:ratelimit:",
+        window_seconds: int = DEFAULT_RATE_LIMIT_WINDOW_SECONDS,
+        max_prefetch: int = 1,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        max_local_keys: int = DEFAULT_MAX_LOCAL_KEYS,
+        fail_open: bool = True,
+    ) -> None:
+        if max_prefetch < 1:
+            raise ValueError("max_prefetch must be >= 1")
+        self._client = client
+        self._prefix = key_prefix
+        self._window_ms = window_seconds * 1000
+        self._max_prefetch = max_prefetch
+        self._lease_seconds = lease_seconds
+        self._max_local_keys = max_local_keys
+        self._fail_open = fail_open
+        self._gcra = client.register_script(_GCRA_SCRIPT)
+        self._leases: OrderedDict[str, _Lease] = OrderedDict()
+        self.stats = RateLimitStats()
+
+    @classmethod
+    def from_url(
+        cls,
+        redis_url: str,
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        **kwargs: Any,
+    ) -> RedisRateLimitStore:
+        """Sınırlı bağlantı havuzlu client ile store oluşturur."""
+        import redis.asyncio as aioredis
+
+        pool = aioredis.BlockingConnectionPool.from_url(redis_url, max_connections=max_connections, timeout=1)
+        return cls(aioredis.Redis(connection_pool=pool), **kwargs)
+
+    async def allow(self, key: str, now: float, per_minute: int, burst: int) -> tuple[bool, int]:
+        self.stats.checks += 1
+        limit = max(1, per_minute + burst)
+
+        lease = self._leases.get(key)
+        if lease is not None and lease.tokens > 0 and lease.expires_at > now:
+            lease.tokens -= 1
+            self._leases.move_to_end(key)
+            self.stats.local_hits += 1
+            return True, 0
+
+        quantity = 1
+        if lease is not None and lease.expires_at > now:
+            # Önceki parti lease bitmeden tükendi: anahtar sıcak, parti büyür
+            quantity = min(lease.batch * 2, self._max_prefetch, limit)
+
+        interval = max(1, self._window_ms // limit)
+        try:
+            granted, wait_ms = await self._gcra(
+                keys=[self._prefix + key],
+                args=[interval, interval * (limit - 1), quantity],
+            )
+        except Exception:
+            self.stats.errors += 1
+            if self._fail_open:
+                return True, 0
+            raise
+        self.stats.round_trips += 1
+
+        if int(granted) < 1:
+            self._leases.pop(key, None)
+            self.stats.denied += 1
+            return False, max(1, math.ceil(int(wait_ms) / 1000))
+
+        if self._max_prefetch > 1:
+            self._store_lease(key, _Lease(int(granted) - 1, now + self._lease_seconds, quantity))
+        return True, 0
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    def _store_lease(self, key: str, lease: _Lease) -> None:
+        self._leases[key] = lease
+        self._leases.move_to_end(key)
+        while len(self._leases) > self._max_local_keys:
+            self._leases.popitem(last=False)
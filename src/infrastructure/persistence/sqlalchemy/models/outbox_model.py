@@ -0,0 +1,50 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: Transactional outbox — domain event'leri iş verisiyle aynı transaction'da yazılır.
+# PATH: src/infrastructure/persistence/sqlalchemy/models/outbox_model.py
+# DESC: event_outbox ORM modeli; relay tarafından RabbitMQ'ya aktarılacak event kayıtları.
+"""
+OutboxMessageModel — SQLAlchemy ORM modeli.
+
+Alembic migration kr081_outbox (event_outbox tablosu) ile uyumludur.
+``seq`` yazım sırasını verir; relay bekleyen kayıtları seq sırasıyla çeker.
+``published_at`` dolu kayıtlar teslim edilmiştir ve compaction ile silinir.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import BigInteger, DateTime, Identity, Index, Integer, String, UniqueConstraint, func, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.persistence.sqlalchemy.base import Base
+
+
+class OutboxMessageModel(Base):
+    """event_outbox tablosu ORM modeli (KR-081)."""
+
+    __tablename__ = "event_outbox"
+    __table_args__ = (
+        UniqueConstraint("event_id", name="uq_event_outbox_event_id"),
+        Index("ix_event_outbox_pending", "seq", postgresql_where=text("published_at IS NULL")),
+        Index("ix_event_outbox_published_at", "published_at", postgresql_where=text("published_at IS NOT NULL")),
+    )
+
+    seq: Mapped[int] = mapped_column(BigInteger, Identity(always=True), primary_key=True)
+    event_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    # Yayınlanacak mesaj gövdesinin tamamı (event_id, event_type, occurred_at, correlation_id + alanlar)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    correlation_id: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    published_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    last_error: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
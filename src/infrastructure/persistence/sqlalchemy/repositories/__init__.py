@@ -10,11 +10,23 @@ TODO stubs are not exported until they contain actual implementations.
 from src.infrastructure.persistence.sqlalchemy.repositories.dataset_repository_impl import (
     DatasetRepositoryImpl,
 )
+from src.infrastructure.persistence.sqlalchemy.repositories.field_spatial_index_impl import (
+    PostgisFieldSpatialIndex,
+)
+from src.infrastructure.persistence.sqlalchemy.repositories.outbox_repository_impl import (
+    OutboxRecord,
+    SqlAlchemyOutboxRepository,
+    outbox_transaction,
+)
 from src.infrastructure.persistence.sqlalchemy.repositories.subscription_repository_impl import (
     SqlAlchemySubscriptionRepository,
 )
 
 __all__: list[str] = [
     "DatasetRepositoryImpl",
+    "PostgisFieldSpatialIndex",
+    "OutboxRecord",
+    "SqlAlchemyOutboxRepository",
+    "outbox_transaction",
     "SqlAlchemySubscriptionRepository",
 ]
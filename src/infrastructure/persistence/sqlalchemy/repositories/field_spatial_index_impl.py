@@ -0,0 +1,120 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# PATH: src/infrastructure/persistence/sqlalchemy/repositories/field_spatial_index_impl.py
+# DESC: FieldSpatialIndex portunun PostGIS (GiST) implementasyonu.
+# SSOT: KR-013 (tarla yönetimi), KR-016 (eşleştirme)
+"""
+PostgisFieldSpatialIndex — FieldSpatialIndex portunu PostGIS üzerinden implemente eder.
+
+Sorumluluk: fields.boundary (geometry POLYGON, EPSG:4326) kolonundaki GiST indeksini
+  (idx_fields_boundary; alembic 002'de GeoAlchemy2 Geometry kolonunun spatial_index
+  varsayılanıyla oluşur) kullanarak bbox/nokta/k-en-yakın sorgularını veritabanında
+  çalıştırmak.
+
+Sorgu planı:
+  - bbox: ``boundary && envelope`` GiST ile daraltır, ST_Intersects doğrular.
+  - nokta: ST_Covers (sınır dahil) GiST ile daraltılır.
+  - k-en-yakın: ``boundary <-> point`` KNN operatörü GiST üzerinden sıralar;
+    mesafe geography tipinde metre olarak döner.
+
+Veri tabloda tutulduğu için upsert_field/remove_field no-op'tur; kayıt
+FieldRepository.save ile yazılır.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.domain.entities.field import Field
+from src.core.ports.repositories.field_spatial_index import FieldDistance, FieldSpatialIndex
+
+# GeoAlchemy2'nin alembic 002'de oluşturduğu indeksle aynı ad: ensure_index() ikinci bir indeks açmaz,
+# yalnızca migration'sız kurulmuş (ör. test) veritabanlarında eksikse ekler.
+FIELDS_BOUNDARY_GIST_INDEX_DDL = "CREATE INDEX IF NOT EXISTS idx_fields_boundary ON fields USING GIST (boundary)"
+
+_BBOX_SQL = text(
+    """
+    SELECT field_id FROM fields
+    WHERE boundary && ST_MakeEnvelope(:min_lon, :min_lat, :max_lon, :max_lat, 4326)
+      AND ST_Intersects(boundary, ST_MakeEnvelope(:min_lon, :min_lat, :max_lon, :max_lat, 4326))
+    """
+)
+
+_POINT_SQL = text(
+    """
+    SELECT field_id FROM fields
+    WHERE ST_Covers(boundary, ST_SetSRID(ST_MakePoint(:lon, :lat), 4326))
+    """
+)
+
+# KNN aday sıralaması GiST üzerinden (derece), nihai sıra geography mesafesi (metre) ile.
+_NEAREST_SQL = text(
+    """
+    SELECT field_id, distance_m FROM (
+        SELECT field_id,
+               ST_Distance(boundary::geography, ST_SetSRID(ST_MakePoint(:lon, :lat), 4326)::geography) AS distance_m
+        FROM fields
+        WHERE boundary IS NOT NULL
+        ORDER BY boundary <-> ST_SetSRID(ST_MakePoint(:lon, :lat), 4326)
+        LIMIT :candidates
+    ) AS nearest
+    ORDER BY distance_m, field_id
+    LIMIT :k
+    """
+)
+
+
+class PostgisFieldSpatialIndex(FieldSpatialIndex):
+    """FieldSpatialIndex portunun PostGIS implementasyonu (KR-013, KR-016).
+
+    ``candidate_factor``: KNN operatörü düzlemsel (derece) sıraladığı için
+    geography mesafesiyle yeniden sıralanacak aday sayısı çarpanı.
+    """
+
+    def __init__(self, session: AsyncSession, candidate_factor: int = 4) -> None:
+        self._session = session
+        self._candidate_factor = max(1, candidate_factor)
+
+    async def ensure_index(self) -> None:
+        await self._session.execute(text(FIELDS_BOUNDARY_GIST_INDEX_DDL))
+
+    # ------------------------------------------------------------------
+    # Güncelleme (tablo kaynaklı; indeks DB tarafından tutulur)
+    # ------------------------------------------------------------------
+    async def upsert_field(self, field: Field) -> None:
+        return None
+
+    async def remove_field(self, field_id: uuid.UUID) -> None:
+        return None
+
+    # ------------------------------------------------------------------
+    # Sorgular
+    # ------------------------------------------------------------------
+    async def find_by_bbox(
+        self,
+        min_lon: float,
+        min_lat: float,
+        max_lon: float,
+        max_lat: float,
+    ) -> List[uuid.UUID]:
+        result = await self._session.execute(
+            _BBOX_SQL,
+            {"min_lon": min_lon, "min_lat": min_lat, "max_lon": max_lon, "max_lat": max_lat},
+        )
+        return [row.field_id for row in result]
+
+    async def find_containing_point(self, lon: float, lat: float) -> List[uuid.UUID]:
+        result = await self._session.execute(_POINT_SQL, {"lon": lon, "lat": lat})
+        return [row.field_id for row in result]
+
+    async def find_nearest(self, lon: float, lat: float, k: int = 1) -> List[FieldDistance]:
+        if k <= 0:
+            return []
+        result = await self._session.execute(
+            _NEAREST_SQL,
+            {"lon": lon, "lat": lat, "k": k, "candidates": k * self._candidate_factor},
+        )
+        return [FieldDistance(field_id=row.field_id, distance_m=float(row.distance_m)) for row in result]
@@ -0,0 +1,112 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: Transactional outbox — relay tarafı okuma/işaretleme/compaction sorguları.
+# PATH: src/infrastructure/persistence/sqlalchemy/repositories/outbox_repository_impl.py
+# DESC: event_outbox tablosu için relay sorguları (FOR UPDATE SKIP LOCKED).
+"""
+SqlAlchemyOutboxRepository — OutboxRelay'in event_outbox erişimi.
+
+Sorgu planı:
+  - claim_pending: ``published_at IS NULL`` kısmi indeksi üzerinden seq sırasıyla
+    ``FOR UPDATE SKIP LOCKED``; birden fazla relay worker aynı satırı almaz.
+  - mark_published / mark_failed: claim edilen satırlar aynı transaction'da güncellenir.
+  - compact: teslim edilmiş ve saklama süresi dolmuş satırlar sınırlı partilerle silinir.
+
+Satır kilitleri transaction boyunca tutulur; outbox_transaction() claim + publish +
+işaretleme adımlarını tek transaction'da çalıştırır.
+"""
+
+from __future__ import annotations
+
+import uuid
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, List, Sequence, cast
+
+from sqlalchemy import CursorResult, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.persistence.sqlalchemy.models.outbox_model import OutboxMessageModel
+
+
+@dataclass(frozen=True)
+class OutboxRecord:
+    """Relay'e teslim edilen bekleyen outbox satırı."""
+
+    seq: int
+    event_id: uuid.UUID
+    event_type: str
+    payload: dict[str, Any]
+    attempts: int
+
+
+class SqlAlchemyOutboxRepository:
+    """event_outbox relay sorguları (KR-081)."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def claim_pending(self, limit: int, max_attempts: int) -> List[OutboxRecord]:
+        stmt = (
+            select(OutboxMessageModel)
+            .where(OutboxMessageModel.published_at.is_(None), OutboxMessageModel.attempts < max_attempts)
+            .order_by(OutboxMessageModel.seq)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self._session.execute(stmt)
+        return [
+            OutboxRecord(
+                seq=model.seq,
+                event_id=model.event_id,
+                event_type=model.event_type,
+                payload=model.payload,
+                attempts=model.attempts,
+            )
+            for model in result.scalars()
+        ]
+
+    async def mark_published(self, seqs: Sequence[int]) -> None:
+        if not seqs:
+            return
+        await self._session.execute(
+            update(OutboxMessageModel)
+            .where(OutboxMessageModel.seq.in_(seqs))
+            .values(published_at=func.now(), last_error=None)
+        )
+
+    async def mark_failed(self, seq: int, error: str) -> None:
+        await self._session.execute(
+            update(OutboxMessageModel)
+            .where(OutboxMessageModel.seq == seq)
+            .values(attempts=OutboxMessageModel.attempts + 1, last_error=error[:500])
+        )
+
+    async def compact(self, published_before: datetime, limit: int) -> int:
+        doomed = (
+            select(OutboxMessageModel.seq)
+            .where(OutboxMessageModel.published_at.is_not(None), OutboxMessageModel.published_at < published_before)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        # DML sonucu CursorResult'tır; rowcount silinen satır sayısını verir.
+        result = cast(
+            CursorResult[Any],
+            await self._session.execute(delete(OutboxMessageModel).where(OutboxMessageModel.seq.in_(doomed))),
+        )
+        return int(result.rowcount or 0)
+
+
+def outbox_transaction(
+    session_factory: Callable[[], AsyncSession],
+) -> Callable[[], AbstractAsyncContextManager[SqlAlchemyOutboxRepository]]:
+    """OutboxRelay için transaction fabrikası: her çağrı yeni session + BEGIN açar."""
+
+    @asynccontextmanager
+    async def _transaction() -> AsyncIterator[SqlAlchemyOutboxRepository]:
+        async with session_factory() as session:
+            async with session.begin():
+                yield SqlAlchemyOutboxRepository(session)
+
+    return _transaction
@@ -1,3 +1,133 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: Transactional outbox — event'ler iş verisiyle aynı commit'te kalıcılaşır.
 # PATH: src/infrastructure/persistence/sqlalchemy/unit_of_work.py
 # DESC: Transaction sınırları ve atomicity (Unit of Work).
-# TODO: Implement this file.
+"""
+SqlAlchemyUnitOfWork — tek AsyncSession üzerinde transaction sınırı.
+
+Sorumluluk: Repository yazımları ile domain event'lerinin aynı transaction'da
+  commit edilmesi. Event'ler broker'a doğrudan gönderilmez; event_outbox
+  tablosuna eklenir ve OutboxRelay tarafından asenkron aktarılır. Böylece
+  istek gecikmesi RabbitMQ'ya bağlı değildir ve commit/publish tutarsızlığı oluşmaz.
+
+Girdi/Çıktı (Contract/DTO/Event):
+  Girdi: append(event_type, payload, correlation_id) veya collect(DomainEvent).
+  Çıktı: event_outbox satırları (commit ile birlikte görünür olur).
+
+Hata Modları (idempotency/retry/rate limit):
+  commit çağrılmadan çıkılırsa veya blok hata ile biterse rollback yapılır;
+  outbox satırları da geri alınır. event_id consumer tarafında dedup anahtarıdır.
+
+Kullanım:
+    async with SqlAlchemyUnitOfWork(session_factory) as uow:
+        repo = SqlAlchemyMissionRepository(uow.session)
+        ...
+        uow.append("MissionAssigned", {"mission_id": ...}, correlation_id=cid)
+        await uow.commit()
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from types import TracebackType
+from typing import Any, Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.domain.events.base import DomainEvent
+from src.infrastructure.persistence.sqlalchemy.models.outbox_model import OutboxMessageModel
+
+
+class SqlAlchemyUnitOfWork:
+    """AsyncSession transaction sınırı + outbox event kuyruğu (KR-081).
+
+    ``append`` senkron çalışır (session.add); application katmanındaki
+    senkron command handler'lar EventOutboxPort olarak doğrudan kullanabilir.
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession]) -> None:
+        self._session_factory = session_factory
+        self._session: Optional[AsyncSession] = None
+        self._committed = False
+        self.pending_events = 0
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            raise RuntimeError("UnitOfWork is not active; use 'async with'")
+        return self._session
+
+    async def __aenter__(self) -> SqlAlchemyUnitOfWork:
+        self._session = self._session_factory()
+        self._committed = False
+        self.pending_events = 0
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        try:
+            if exc_type is not None or not self._committed:
+                await self.rollback()
+        finally:
+            await self.session.close()
+            self._session = None
+
+    # ------------------------------------------------------------------
+    # Outbox
+    # ------------------------------------------------------------------
+    def append(
+        self,
+        event_type: str,
+        payload: dict[str, Any],
+        *,
+        correlation_id: Optional[str] = None,
+        event_id: Optional[uuid.UUID] = None,
+    ) -> uuid.UUID:
+        """Event'i outbox'a ekler; commit ile birlikte kalıcılaşır.
+
+        Yayınlanacak gövde payload alanları + zarf alanlarıdır
+        (event_id, event_type, occurred_at, correlation_id).
+
+        Returns:
+            Event ID (consumer dedup anahtarı ``evt-<event_id>``).
+        """
+        event_id = event_id or uuid.uuid4()
+        body = dict(payload)
+        body.setdefault("occurred_at", datetime.now(timezone.utc).isoformat())
+        body.update({"event_id": str(event_id), "event_type": event_type, "correlation_id": correlation_id})
+        self.session.add(
+            OutboxMessageModel(
+                event_id=event_id,
+                event_type=event_type,
+                payload=body,
+                correlation_id=correlation_id,
+            )
+        )
+        self.pending_events += 1
+        return event_id
+
+    def collect(self, event: DomainEvent, *, correlation_id: Optional[str] = None) -> uuid.UUID:
+        """Domain event'ini outbox'a ekler (gövde: event.to_dict())."""
+        return self.append(
+            event.event_type,
+            event.to_dict(),
+            correlation_id=correlation_id,
+            event_id=event.event_id,
+        )
+
+    # ------------------------------------------------------------------
+    # Transaction
+    # ------------------------------------------------------------------
+    async def commit(self) -> None:
+        await self.session.commit()
+        self._committed = True
+        self.pending_events = 0
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
+        self.pending_events = 0
@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, cast
 
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
 
 
 @dataclass(frozen=True)
@@ -24,10 +24,15 @@ class JWTSettings:
 
 
 class JWTHandler:
-    """Small wrapper for token issue/verify."""
+    """Small wrapper for token issue/verify.
+
+    The signing key object is constructed once here; issue/verify reuse it
+    instead of rebuilding it from the secret on every call.
+    """
 
     def __init__(self, settings: JWTSettings) -> None:
         self._settings = settings
+        self._key = jwk.construct(settings.secret_key, settings.algorithm)
 
     def issue_access_token(self, subject: str, claims: dict[str, Any] | None = None) -> str:
         now = datetime.now(timezone.utc)
@@ -40,13 +45,13 @@ class JWTHandler:
         }
         if claims:
             payload.update(claims)
-        return cast(str, jwt.encode(payload, self._settings.secret_key, algorithm=self._settings.algorithm))
+        return cast(str, jwt.encode(payload, self._key, algorithm=self._settings.algorithm))
 
     def verify_token(self, token: str) -> dict[str, Any]:
         try:
             payload = jwt.decode(
                 token,
-                self._settings.secret_key,
+                self._key,
                 algorithms=[self._settings.algorithm],
                 audience=self._settings.audience,
                 issuer=self._settings.issuer,
@@ -7,22 +7,22 @@ from __future__ import annotations
 import uuid
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from typing import Any, Callable
+from typing import Any
 
 from fastapi import FastAPI, Request
-from starlette.responses import Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+from src.presentation.api.middleware._shared import send_with_corr_id
 from src.presentation.api.middleware.anomaly_detection_middleware import AnomalyDetectionMiddleware
 from src.presentation.api.middleware.cors_middleware import add_cors_middleware
-from src.presentation.api.middleware.grid_anonymizer import GridAnonymizerMiddleware
 from src.presentation.api.middleware.jwt_middleware import JwtMiddleware
 from src.presentation.api.middleware.mtls_verifier import MTLSVerifierMiddleware
-from src.presentation.api.middleware.pii_filter import PIIFilterMiddleware
 from src.presentation.api.middleware.rbac_middleware import RBACMiddleware
 from src.presentation.api.middleware.rate_limit_middleware import RateLimitMiddleware
+from src.presentation.api.middleware.response_rewriter import ResponseRewriteMiddleware
 from src.presentation.api.settings import settings
 from src.presentation.api.v1.endpoints import (
     admin_audit_router,
@@ -108,12 +108,53 @@ async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
     logger.info("lifespan_shutdown")
 
 
-async def _corr_id_middleware(request: Request, call_next: Callable[..., Any]) -> Response:
-    corr_id = request.headers.get("X-Correlation-Id") or str(uuid.uuid4())
-    request.state.corr_id = corr_id
-    response: Response = await call_next(request)
-    response.headers["X-Correlation-Id"] = corr_id
-    return response
+class _CorrelationIdMiddleware:
+    """Assign request.state.corr_id and echo it on the response (pure ASGI)."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request = Request(scope)
+        corr_id = request.headers.get("X-Correlation-Id") or str(uuid.uuid4())
+        request.state.corr_id = corr_id
+        await self.app(scope, receive, send_with_corr_id(send, corr_id))
+
+
+def _rate_limit_store() -> Any:
+    """Redis-backed shared store when API_RATE_LIMIT_REDIS_URL is set; otherwise the middleware default."""
+    if not settings.rate_limit.redis_url:
+        return None
+    from src.infrastructure.persistence.redis.rate_limiter import RedisRateLimitStore
+
+    return RedisRateLimitStore.from_url(
+        settings.rate_limit.redis_url,
+        max_prefetch=max(1, settings.rate_limit.local_prefetch),
+    )
+
+
+def _install_middleware(app: FastAPI) -> None:
+    """Install the request pipeline; every layer is pure ASGI (no BaseHTTPMiddleware)."""
+    # Middleware stack (LIFO order — last added executes first):
+    # 1. Correlation ID
+    # 2. CORS
+    # 3. mTLS Verifier (KR-071 — before auth for ingest endpoints)
+    # 4. JWT Authentication
+    # 5. RBAC (KR-063 — merkezi rol tabanli erisim kontrolu)
+    # 6. Rate Limiting
+    # 7. Anomaly Detection
+    # 8. Response rewrite (KR-066 PII filter + KR-083 grid anonymizer, single pass)
+    app.add_middleware(_CorrelationIdMiddleware)
+    add_cors_middleware(app)
+    app.add_middleware(MTLSVerifierMiddleware)
+    app.add_middleware(JwtMiddleware)
+    app.add_middleware(RBACMiddleware)
+    app.add_middleware(RateLimitMiddleware, store=_rate_limit_store())
+    app.add_middleware(AnomalyDetectionMiddleware)
+    app.add_middleware(ResponseRewriteMiddleware)
 
 
 def _register_exception_handlers(app: FastAPI) -> None:
@@ -151,25 +192,7 @@ def create_app() -> FastAPI:
         lifespan=_lifespan,
     )
 
-    # Middleware stack (LIFO order — last added executes first):
-    # 1. Correlation ID (http middleware — outermost)
-    # 2. CORS
-    # 3. mTLS Verifier (KR-071 — before auth for ingest endpoints)
-    # 4. JWT Authentication
-    # 5. RBAC (KR-063 — merkezi rol tabanli erisim kontrolu)
-    # 6. Rate Limiting
-    # 7. Anomaly Detection
-    # 8. PII Filter (KR-066 — after auth, before response)
-    # 9. Grid Anonymizer (KR-083 — after auth, before response)
-    app.middleware("http")(_corr_id_middleware)
-    add_cors_middleware(app)
-    app.add_middleware(MTLSVerifierMiddleware)
-    app.add_middleware(JwtMiddleware)
-    app.add_middleware(RBACMiddleware)
-    app.add_middleware(RateLimitMiddleware)
-    app.add_middleware(AnomalyDetectionMiddleware)
-    app.add_middleware(PIIFilterMiddleware)
-    app.add_middleware(GridAnonymizerMiddleware)
+    _install_middleware(app)
 
     @app.get("/health", tags=["health"])
     async def health() -> dict[str, str]:
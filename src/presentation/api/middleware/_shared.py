@@ -1,6 +1,6 @@
 # BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
 # KR-081: Ortak middleware primitifleri; corr_id, IP maskeleme, metrik hook.
-"""Shared middleware primitives for context and safe observability."""
+"""Shared middleware primitives for context, safe observability and pure-ASGI response plumbing."""
 
 from __future__ import annotations
 
@@ -9,9 +9,12 @@ import logging
 import time
 import uuid
 from collections import Counter
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 LOGGER = logging.getLogger("api.middleware")
 
@@ -74,3 +77,62 @@ def get_client_ip(request: Request) -> str:
 
 def is_bypassed_path(path: str, bypass_routes: list[str]) -> bool:
     return any(path == route or path.startswith(f"{route.rstrip('/')}/") for route in bypass_routes)
+
+
+def send_with_corr_id(send: Send, corr_id: str) -> Send:
+    """Wrap ``send`` so the response start message carries X-Correlation-Id."""
+
+    async def _send(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            MutableHeaders(scope=message)["X-Correlation-Id"] = corr_id
+        await send(message)
+
+    return _send
+
+
+def is_json_response(message: Message) -> bool:
+    return "application/json" in Headers(raw=message.get("headers", [])).get("content-type", "")
+
+
+async def rewrite_json_response(
+    app: ASGIApp,
+    scope: Scope,
+    receive: Receive,
+    send: Send,
+    select_transform: Callable[[], Callable[[bytes], bytes | None] | None],
+) -> None:
+    """Run ``app``, buffer a JSON response body and pass it through a transform.
+
+    ``select_transform`` is called when the response starts (inner layers may
+    have populated request.state by then); None forwards the response as is.
+    The transform returns the new body or None to keep the original bytes.
+    Non-JSON responses are forwarded message by message without buffering.
+    """
+    start: Message | None = None
+    transform: Callable[[bytes], bytes | None] | None = None
+    chunks: list[bytes] = []
+
+    async def _send(message: Message) -> None:
+        nonlocal start, transform
+        if message["type"] == "http.response.start":
+            if is_json_response(message):
+                transform = select_transform()
+            if transform is None:
+                await send(message)
+            else:
+                start = message
+        elif message["type"] == "http.response.body" and start is not None and transform is not None:
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            body = b"".join(chunks)
+            rewritten = transform(body)
+            if rewritten is not None:
+                body = rewritten
+                MutableHeaders(scope=start)["content-length"] = str(len(body))
+            await send(start)
+            await send({"type": "http.response.body", "body": body, "more_body": False})
+        else:
+            await send(message)
+
+    await app(scope, receive, _send)
@@ -8,11 +8,10 @@ import logging
 import time
 from collections import defaultdict, deque
 from dataclasses import dataclass
-from typing import Any
 
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.presentation.api.middleware._shared import (
     METRICS_HOOK,
@@ -20,6 +19,7 @@ from src.presentation.api.middleware._shared import (
     get_client_ip,
     is_bypassed_path,
     mask_ip,
+    send_with_corr_id,
 )
 from src.presentation.api.settings import settings
 
@@ -36,11 +36,15 @@ class AnomalyDetectedEvent:
     masked_ip: str
 
 
-class AnomalyDetectionMiddleware(BaseHTTPMiddleware):
-    """Detect unusual request patterns and emit internal observability events."""
+class AnomalyDetectionMiddleware:
+    """Detect unusual request patterns and emit internal observability events.
 
-    def __init__(self, app: Any) -> None:
-        super().__init__(app)
+    Pure ASGI: status-based rules run when the response start message passes
+    through, so the body is never re-wrapped.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
         self._request_history: dict[str, deque[float]] = defaultdict(deque)
         self._error_history: dict[str, deque[float]] = defaultdict(deque)
         self._known_user_agents: set[str] = {
@@ -51,13 +55,17 @@ class AnomalyDetectionMiddleware(BaseHTTPMiddleware):
             "postmanruntime",
         }
 
-    async def dispatch(self, request: Request, call_next: Any) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
         corr_id, start_time = ensure_request_context(request)
 
         if not settings.anomaly.enabled or is_bypassed_path(request.url.path, settings.anomaly.allowlist_routes):
-            response: Response = await call_next(request)
-            response.headers["X-Correlation-Id"] = corr_id
-            return response
+            await self.app(scope, receive, send_with_corr_id(send, corr_id))
+            return
 
         now = time.monotonic()
         client_ip = get_client_ip(request)
@@ -65,11 +73,27 @@ class AnomalyDetectionMiddleware(BaseHTTPMiddleware):
         history = self._request_history[ip_key]
         repeat_count = self._record_and_count(history, now, settings.anomaly.rapid_repeat_window_seconds)
 
-        response = await call_next(request)
-
+        async def _send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                self._observe(request, corr_id, start_time, now, ip_key, repeat_count, message["status"])
+                MutableHeaders(scope=message)["X-Correlation-Id"] = corr_id
+            await send(message)
+
+        await self.app(scope, receive, _send)
+
+    def _observe(
+        self,
+        request: Request,
+        corr_id: str,
+        start_time: float,
+        now: float,
+        ip_key: str,
+        repeat_count: int,
+        status_code: int,
+    ) -> None:
         latency_ms = (time.monotonic() - start_time) * 1000
         METRICS_HOOK.observe_ms("http_latency_ms", latency_ms)
-        METRICS_HOOK.increment(f"http_status_total:{response.status_code}")
+        METRICS_HOOK.increment(f"http_status_total:{status_code}")
 
         reasons: list[str] = []
         score = 0.0
@@ -88,7 +112,7 @@ class AnomalyDetectionMiddleware(BaseHTTPMiddleware):
             reasons.append("uncommon_user_agent")
             score += 0.2
 
-        if response.status_code >= 400:
+        if status_code >= 400:
             err_history = self._error_history[ip_key]
             error_count = self._record_and_count(err_history, now, settings.anomaly.rapid_repeat_window_seconds)
             if error_count >= 4:
@@ -99,7 +123,7 @@ class AnomalyDetectionMiddleware(BaseHTTPMiddleware):
             event = AnomalyDetectedEvent(
                 corr_id=corr_id,
                 path=request.url.path,
-                status_code=response.status_code,
+                status_code=status_code,
                 anomaly_score=round(score, 3),
                 reasons=reasons,
                 masked_ip=ip_key,
@@ -119,9 +143,6 @@ class AnomalyDetectionMiddleware(BaseHTTPMiddleware):
                 },
             )
 
-        response.headers["X-Correlation-Id"] = corr_id
-        return response
-
     @staticmethod
     def _record_and_count(history: deque[float], now: float, window_seconds: int) -> int:
         window_start = now - float(window_seconds)
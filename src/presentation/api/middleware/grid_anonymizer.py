@@ -17,15 +17,17 @@ import hashlib
 import json
 import logging
 import math
-from typing import Any, Callable, cast
+from functools import partial
+from typing import Any, Callable
 
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from src.presentation.api.middleware._shared import (
     METRICS_HOOK,
     ensure_request_context,
+    rewrite_json_response,
+    send_with_corr_id,
 )
 
 LOGGER = logging.getLogger("api.middleware.grid_anonymizer")
@@ -119,7 +121,7 @@ def _anonymize_dict(data: dict[str, Any]) -> dict[str, Any]:
     return result
 
 
-class GridAnonymizerMiddleware(BaseHTTPMiddleware):
+class GridAnonymizerMiddleware:
     """KR-083 grid anonimizasyon middleware'i.
 
     IL_OPERATOR rolune sahip kullanicilar icin:
@@ -129,66 +131,51 @@ class GridAnonymizerMiddleware(BaseHTTPMiddleware):
     - Aggregate KPI verileri korunur
     """
 
-    async def dispatch(self, request: Request, call_next: Callable[..., Any]) -> Response:
-        corr_id, _ = ensure_request_context(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        response = cast(Response, await call_next(request))
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Yalnizca JSON response'lari filtrele
-        content_type = response.headers.get("content-type", "")
-        if "application/json" not in content_type:
-            response.headers["X-Correlation-Id"] = corr_id
-            return response
+        request = Request(scope)
+        corr_id, _ = ensure_request_context(request)
 
-        # Kullanici rolunu kontrol et
-        user = getattr(request.state, "user", None)
-        user_roles: set[str] = set()
-        if user is not None:
-            user_roles = set(getattr(user, "roles", []))
+        def _select() -> Callable[[bytes], bytes | None] | None:
+            # Kullanici rolunu kontrol et
+            user = getattr(request.state, "user", None)
+            user_roles: set[str] = set()
+            if user is not None:
+                user_roles = set(getattr(user, "roles", []))
 
-        # Anonimizasyon gerekli mi?
-        if not (user_roles & _ANONYMIZE_ROLES):
-            response.headers["X-Correlation-Id"] = corr_id
-            return response
+            # Anonimizasyon gerekli mi?
+            if not (user_roles & _ANONYMIZE_ROLES):
+                return None
+            return partial(self._transform, corr_id, request.url.path)
 
-        # Response body'yi oku ve anonimize et
-        try:
-            body = b""
-            async for chunk in response.body_iterator:  # type: ignore[attr-defined]
-                if isinstance(chunk, bytes):
-                    body += chunk
-                else:
-                    body += chunk.encode("utf-8")
+        # Yalnizca JSON response'lar tamponlanip yeniden yazilir
+        await rewrite_json_response(self.app, scope, receive, send_with_corr_id(send, corr_id), _select)
 
+    @staticmethod
+    def _transform(corr_id: str, path: str, body: bytes) -> bytes | None:
+        try:
             data = json.loads(body)
-
-            if isinstance(data, dict):
-                data = _anonymize_dict(data)
-            elif isinstance(data, list):
-                data = [_anonymize_dict(item) if isinstance(item, dict) else item for item in data]
-
-            anon_body = json.dumps(data, ensure_ascii=False).encode("utf-8")
-
-            METRICS_HOOK.increment("grid_anonymizer.applied")
-            LOGGER.info(
-                "grid_anonymizer.applied",
-                extra={
-                    "corr_id": corr_id,
-                    "path": request.url.path,
-                },
-            )
-
-            headers = dict(response.headers)
-            headers["content-length"] = str(len(anon_body))
-            headers["X-Correlation-Id"] = corr_id
-
-            return Response(
-                content=anon_body,
-                status_code=response.status_code,
-                headers=headers,
-                media_type="application/json",
-            )
-
         except (json.JSONDecodeError, UnicodeDecodeError):
-            response.headers["X-Correlation-Id"] = corr_id
-            return response
+            # JSON parse edilemezse orijinal body dondurulur
+            return None
+
+        if isinstance(data, dict):
+            data = _anonymize_dict(data)
+        elif isinstance(data, list):
+            data = [_anonymize_dict(item) if isinstance(item, dict) else item for item in data]
+
+        METRICS_HOOK.increment("grid_anonymizer.applied")
+        LOGGER.info(
+            "grid_anonymizer.applied",
+            extra={
+                "corr_id": corr_id,
+                "path": path,
+            },
+        )
+        return json.dumps(data, ensure_ascii=False).encode("utf-8")
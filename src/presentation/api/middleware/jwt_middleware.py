@@ -1,6 +1,15 @@
 # BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
 # KR-081: contract-first claim gate for authenticated identity.
-"""JWT authentication middleware for phone+PIN verified identities."""
+"""JWT authentication middleware for phone+PIN verified identities.
+
+Verified claims are kept in a bounded LRU keyed by the token's SHA-256 digest,
+so a client reusing one token (mobile pilots keep theirs for an hour) pays
+for base64/JSON decoding and signature verification only once. An entry is
+served until the token's ``exp`` (or ``max_ttl_seconds`` for tokens without
+one), is dropped on revocation (``VERIFIED_TOKEN_CACHE.revoke`` /
+``revoke_subject``) and the whole cache is flushed when the signing secret
+or algorithm changes.
+"""
 
 from __future__ import annotations
 
@@ -9,15 +18,23 @@ import hashlib
 import hmac
 import json
 import logging
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Callable
 
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from src.presentation.api.middleware._shared import METRICS_HOOK, ensure_request_context, is_bypassed_path
+from src.presentation.api.middleware._shared import (
+    METRICS_HOOK,
+    ensure_request_context,
+    is_bypassed_path,
+    send_with_corr_id,
+)
 from src.presentation.api.settings import settings
 
 LOGGER = logging.getLogger("api.middleware.jwt")
@@ -34,42 +51,167 @@ class JwtValidationError(Exception):
     """Raised when JWT validation fails."""
 
 
-class JwtMiddleware(BaseHTTPMiddleware):
-    """Validate bearer token and attach identity context to request.state."""
+@lru_cache(maxsize=4)
+def _hs256_key(secret: str) -> hmac.HMAC:
+    """HMAC key schedule computed once per secret; verification works on copies."""
+    return hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of verified claims keyed by token digest.
+
+    Cached claims are shared between requests and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = 10_000, max_ttl_seconds: float = 300.0) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self._max_entries = max_entries
+        self._max_ttl_seconds = max_ttl_seconds
+        # digest -> (claims, expires_at, subject)
+        self._entries: OrderedDict[bytes, tuple[dict[str, Any], float, str]] = OrderedDict()
+        self._by_subject: dict[str, set[bytes]] = {}
+        self._key_binding: object = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def bind_key(self, binding: object) -> None:
+        """Flush every entry when the verification key material changes."""
+        if binding != self._key_binding:
+            with self._lock:
+                self._entries.clear()
+                self._by_subject.clear()
+                self._key_binding = binding
+
+    def get(self, digest: bytes, now: float) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None and now < entry[1]:
+                self._entries.move_to_end(digest)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                self._evict(digest)
+            self.misses += 1
+            return None
+
+    def put(self, digest: bytes, claims: dict[str, Any], now: float) -> None:
+        expires_at = now + self._max_ttl_seconds
+        exp = claims.get("exp")
+        if exp is not None:
+            expires_at = min(expires_at, float(int(exp)))
+        if expires_at <= now:
+            return
+        subject = str(claims.get("sub") or claims.get("subject") or "")
+        with self._lock:
+            self._evict(digest)
+            self._entries[digest] = (claims, expires_at, subject)
+            self._by_subject.setdefault(subject, set()).add(digest)
+            while len(self._entries) > self._max_entries:
+                self._evict(next(iter(self._entries)))
+
+    def revoke(self, token: str) -> bool:
+        """Drop one token (e.g. logout); returns whether it was cached."""
+        with self._lock:
+            return self._evict(self.digest(token))
+
+    def revoke_subject(self, subject: str) -> int:
+        """Drop every cached token of a subject (PIN change, account suspension)."""
+        with self._lock:
+            digests = list(self._by_subject.get(subject, ()))
+            for digest in digests:
+                self._evict(digest)
+            return len(digests)
 
-    def __init__(self, app: Any, token_decoder: Callable[[str], dict[str, Any]] | None = None) -> None:
-        super().__init__(app)
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_subject.clear()
+
+    def _evict(self, digest: bytes) -> bool:
+        entry = self._entries.pop(digest, None)
+        if entry is None:
+            return False
+        digests = self._by_subject.get(entry[2])
+        if digests is not None:
+            digests.discard(digest)
+            if not digests:
+                del self._by_subject[entry[2]]
+        return True
+
+
+# Process-wide cache; revocation consumers call VERIFIED_TOKEN_CACHE.revoke*/clear.
+VERIFIED_TOKEN_CACHE = VerifiedTokenCache()
+
+
+class JwtMiddleware:
+    """Validate bearer token and attach identity context to request.state (pure ASGI)."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        token_decoder: Callable[[str], dict[str, Any]] | None = None,
+        token_cache: VerifiedTokenCache | None = None,
+    ) -> None:
+        self.app = app
+        self._token_cache = token_cache if token_cache is not None else VERIFIED_TOKEN_CACHE
         self._token_decoder = token_decoder or self._decode_token
 
-    async def dispatch(self, request: Request, call_next: Callable[..., Any]) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
         corr_id, _ = ensure_request_context(request)
 
         if not settings.jwt.enabled or is_bypassed_path(request.url.path, settings.jwt.bypass_routes):
-            response: Response = await call_next(request)
-            response.headers["X-Correlation-Id"] = corr_id
-            return response
+            await self.app(scope, receive, send_with_corr_id(send, corr_id))
+            return
 
+        error = self._authenticate(request)
+        if error is not None:
+            await self._error_response(corr_id, *error)(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send_with_corr_id(send, corr_id))
+
+    def _authenticate(self, request: Request) -> tuple[int, str] | None:
+        """Attach identity to request.state; return (status, detail) on rejection."""
         header = request.headers.get("Authorization", "")
         if not header.startswith("Bearer "):
             METRICS_HOOK.increment("auth_unauthorized_total")
-            return self._error_response(corr_id, 401, "Unauthorized")
+            return 401, "Unauthorized"
 
         token = header[len("Bearer ") :].strip()
         try:
             claims = self._token_decoder(token)
         except JwtValidationError:
             METRICS_HOOK.increment("auth_unauthorized_total")
-            return self._error_response(corr_id, 401, "Unauthorized")
+            return 401, "Unauthorized"
 
         if not claims.get("phone_verified", False):
             # KR-081: contract-first claim gate for authenticated identity context.
             METRICS_HOOK.increment("auth_forbidden_total")
-            return self._error_response(corr_id, 403, "Forbidden")
+            return 403, "Forbidden"
 
         subject = str(claims.get("sub") or claims.get("subject") or "")
         if not subject:
             METRICS_HOOK.increment("auth_unauthorized_total")
-            return self._error_response(corr_id, 401, "Unauthorized")
+            return 401, "Unauthorized"
 
         request.state.user = AuthenticatedUser(
             subject=subject,
@@ -78,10 +220,7 @@ class JwtMiddleware(BaseHTTPMiddleware):
         )
         request.state.permissions = list(claims.get("permissions", []))
         request.state.roles = list(claims.get("roles", []))
-
-        response = await call_next(request)
-        response.headers["X-Correlation-Id"] = corr_id
-        return response
+        return None
 
     @staticmethod
     def _error_response(corr_id: str, status_code: int, detail: str) -> JSONResponse:
@@ -90,6 +229,23 @@ class JwtMiddleware(BaseHTTPMiddleware):
         return response
 
     def _decode_token(self, token: str) -> dict[str, Any]:
+        started = time.perf_counter()
+        algorithm = settings.jwt.algorithm
+        signing_key = _hs256_key(settings.jwt.secret)
+        self._token_cache.bind_key((algorithm, signing_key))
+
+        digest = self._token_cache.digest(token)
+        claims = self._token_cache.get(digest, time.time())
+        if claims is not None:
+            METRICS_HOOK.increment("jwt_cache_hit_total")
+        else:
+            METRICS_HOOK.increment("jwt_cache_miss_total")
+            claims = self._verify_token(token, algorithm, signing_key)
+            self._token_cache.put(digest, claims, time.time())
+        METRICS_HOOK.observe_ms("jwt_verify_ms", (time.perf_counter() - started) * 1000)
+        return claims
+
+    def _verify_token(self, token: str, expected_algorithm: str, signing_key: hmac.HMAC) -> dict[str, Any]:
         parts = token.split(".")
         if len(parts) != 3:
             raise JwtValidationError("Malformed token")
@@ -99,7 +255,6 @@ class JwtMiddleware(BaseHTTPMiddleware):
         payload = self._json_b64url_decode(payload_raw)
 
         algorithm = str(header.get("alg", ""))
-        expected_algorithm = settings.jwt.algorithm
         if algorithm != expected_algorithm:
             raise JwtValidationError("Algorithm mismatch")
 
@@ -107,11 +262,9 @@ class JwtMiddleware(BaseHTTPMiddleware):
             raise JwtValidationError("Unsupported algorithm")
 
         signed_content = f"{header_raw}.{payload_raw}".encode("utf-8")
-        expected_signature = hmac.new(
-            settings.jwt.secret.encode("utf-8"),
-            signed_content,
-            hashlib.sha256,
-        ).digest()
+        mac = signing_key.copy()
+        mac.update(signed_content)
+        expected_signature = mac.digest()
         received_signature = self._b64url_decode(signature_raw)
         if not hmac.compare_digest(expected_signature, received_signature):
             LOGGER.info("JWT signature validation failed", extra={"event": "jwt_invalid_signature"})
@@ -17,17 +17,17 @@ from __future__ import annotations
 
 import hashlib
 import logging
-from typing import Any, Callable, cast
 
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from src.presentation.api.middleware._shared import (
     METRICS_HOOK,
     ensure_request_context,
     get_client_ip,
     mask_ip,
+    send_with_corr_id,
 )
 
 LOGGER = logging.getLogger("api.middleware.mtls_verifier")
@@ -67,7 +67,7 @@ class MTLSVerificationError(Exception):
     """mTLS dogrulama hatasi."""
 
 
-class MTLSVerifierMiddleware(BaseHTTPMiddleware):
+class MTLSVerifierMiddleware:
     """KR-071 mTLS cihaz kimlik dogrulama middleware'i.
 
     Ingest endpoint'lerinde:
@@ -77,75 +77,77 @@ class MTLSVerifierMiddleware(BaseHTTPMiddleware):
     - Kayitsiz/iptal edilmis sertifikalari reddeder
 
     Diger endpoint'ler icin bypass eder (mTLS zorunlu degil).
+
+    Saf ASGI: BaseHTTPMiddleware'in istek basina task/stream maliyeti yoktur;
+    response mesajlari dogrudan iletilir.
     """
 
     def __init__(
         self,
-        app: Any,
+        app: ASGIApp,
         registered_fingerprints: frozenset[str] | None = None,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         # Kayitli cihaz sertifika parmak izleri (SHA-256)
         # Production'da bu bilgi config/secret store'dan yuklenir
         self._registered_fingerprints = registered_fingerprints or frozenset()
 
-    async def dispatch(self, request: Request, call_next: Callable[..., Any]) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
         corr_id, _ = ensure_request_context(request)
         path = request.url.path
 
-        # Bypass: health/docs/auth
-        if any(path.startswith(bp) for bp in _BYPASS_PATHS):
-            response = cast(Response, await call_next(request))
-            response.headers["X-Correlation-Id"] = corr_id
-            return response
-
-        # mTLS zorunlu mu?
-        requires_mtls = any(path.startswith(p) for p in _MTLS_REQUIRED_PATHS)
-
-        if not requires_mtls:
-            response = cast(Response, await call_next(request))
-            response.headers["X-Correlation-Id"] = corr_id
-            return response
+        # Bypass: health/docs/auth; mTLS zorunlu olmayan endpoint'ler
+        if any(path.startswith(bp) for bp in _BYPASS_PATHS) or not any(
+            path.startswith(p) for p in _MTLS_REQUIRED_PATHS
+        ):
+            await self.app(scope, receive, send_with_corr_id(send, corr_id))
+            return
 
         # mTLS dogrulama
         client_cert = self._extract_client_cert(request)
         verify_status = request.headers.get(_VERIFY_HEADER, "").upper()
 
+        denial: JSONResponse | None = None
         if not client_cert:
-            return self._deny(
+            denial = self._deny(
                 request,
                 corr_id,
                 reason="missing_client_cert",
                 message="mTLS client sertifikasi gereklidir (KR-071)",
             )
-
-        if verify_status and verify_status != "SUCCESS":
-            return self._deny(
+        elif verify_status and verify_status != "SUCCESS":
+            denial = self._deny(
                 request,
                 corr_id,
                 reason="cert_verify_failed",
                 message=f"Sertifika dogrulama basarisiz: {verify_status}",
             )
-
-        # Sertifika parmak izi kontrolu (eger kayitli fingerprint'ler varsa)
-        if self._registered_fingerprints:
+        elif self._registered_fingerprints:
+            # Sertifika parmak izi kontrolu (eger kayitli fingerprint'ler varsa)
             fingerprint = self._compute_fingerprint(client_cert)
             if fingerprint not in self._registered_fingerprints:
-                return self._deny(
+                denial = self._deny(
                     request,
                     corr_id,
                     reason="unregistered_cert",
                     message="Kayitsiz cihaz sertifikasi",
                 )
 
+        if denial is not None:
+            await denial(scope, receive, send)
+            return
+
         # mTLS basarili
         METRICS_HOOK.increment("mtls_verifier.success")
         request.state.mtls_verified = True
         request.state.client_cert_dn = request.headers.get(_DN_HEADER, "")
 
-        response = cast(Response, await call_next(request))
-        response.headers["X-Correlation-Id"] = corr_id
-        return response
+        await self.app(scope, receive, send_with_corr_id(send, corr_id))
 
     @staticmethod
     def _extract_client_cert(request: Request) -> str | None:
@@ -15,15 +15,17 @@ from __future__ import annotations
 import json
 import logging
 import re
-from typing import Any, Callable, cast
+from functools import partial
+from typing import Any, Callable
 
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import Response, StreamingResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from src.presentation.api.middleware._shared import (
     METRICS_HOOK,
     ensure_request_context,
+    rewrite_json_response,
+    send_with_corr_id,
 )
 
 LOGGER = logging.getLogger("api.middleware.pii_filter")
@@ -91,75 +93,59 @@ def _redact_dict(data: dict[str, Any]) -> dict[str, Any]:
     return redacted
 
 
-class PIIFilterMiddleware(BaseHTTPMiddleware):
+class PIIFilterMiddleware:
     """KVKK PII filtreleme middleware'i.
 
     JSON response body'lerdeki PII alanlarini kullanici rolune gore
     maskeler. CENTRAL_ADMIN rolu haric tum roller icin PII maskelenir.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable[..., Any]) -> Response:
-        corr_id, _ = ensure_request_context(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        response = cast(Response, await call_next(request))
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Yalnizca JSON response'lari filtrele
-        content_type = response.headers.get("content-type", "")
-        if "application/json" not in content_type:
-            response.headers["X-Correlation-Id"] = corr_id
-            return response
+        request = Request(scope)
+        corr_id, _ = ensure_request_context(request)
 
-        # Kullanici rolunu kontrol et
-        user = getattr(request.state, "user", None)
-        user_roles: set[str] = set()
-        if user is not None:
-            user_roles = set(getattr(user, "roles", []))
+        def _select() -> Callable[[bytes], bytes | None] | None:
+            # Kullanici rolunu kontrol et
+            user = getattr(request.state, "user", None)
+            user_roles: set[str] = set()
+            if user is not None:
+                user_roles = set(getattr(user, "roles", []))
 
-        # PII gormeye yetkili roller bypass
-        if user_roles & _PII_ALLOWED_ROLES:
-            response.headers["X-Correlation-Id"] = corr_id
-            return response
+            # PII gormeye yetkili roller bypass
+            if user_roles & _PII_ALLOWED_ROLES:
+                return None
+            return partial(self._transform, corr_id, request.url.path, len(user_roles))
 
-        # Response body'yi oku ve PII maskele
-        try:
-            body = b""
-            async for chunk in response.body_iterator:  # type: ignore[attr-defined]
-                if isinstance(chunk, bytes):
-                    body += chunk
-                else:
-                    body += chunk.encode("utf-8")
+        # Yalnizca JSON response'lar tamponlanip yeniden yazilir
+        await rewrite_json_response(self.app, scope, receive, send_with_corr_id(send, corr_id), _select)
 
+    @staticmethod
+    def _transform(corr_id: str, path: str, role_count: int, body: bytes) -> bytes | None:
+        try:
             data = json.loads(body)
-
-            if isinstance(data, dict):
-                data = _redact_dict(data)
-            elif isinstance(data, list):
-                data = [_redact_dict(item) if isinstance(item, dict) else item for item in data]
-
-            redacted_body = json.dumps(data, ensure_ascii=False).encode("utf-8")
-
-            METRICS_HOOK.increment("pii_filter.redacted")
-            LOGGER.info(
-                "pii_filter.applied",
-                extra={
-                    "corr_id": corr_id,
-                    "path": request.url.path,
-                    "role_count": len(user_roles),
-                },
-            )
-
-            headers = dict(response.headers)
-            headers["content-length"] = str(len(redacted_body))
-            headers["X-Correlation-Id"] = corr_id
-
-            return Response(
-                content=redacted_body,
-                status_code=response.status_code,
-                headers=headers,
-                media_type="application/json",
-            )
-
         except (json.JSONDecodeError, UnicodeDecodeError):
-            # JSON parse edilemezse orijinal response'u dondur
-            response.headers["X-Correlation-Id"] = corr_id
-            return response
+            # JSON parse edilemezse orijinal body dondurulur
+            return None
+
+        if isinstance(data, dict):
+            data = _redact_dict(data)
+        elif isinstance(data, list):
+            data = [_redact_dict(item) if isinstance(item, dict) else item for item in data]
+
+        METRICS_HOOK.increment("pii_filter.redacted")
+        LOGGER.info(
+            "pii_filter.applied",
+            extra={
+                "corr_id": corr_id,
+                "path": path,
+                "role_count": role_count,
+            },
+        )
+        return json.dumps(data, ensure_ascii=False).encode("utf-8")
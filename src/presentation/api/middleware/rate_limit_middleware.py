@@ -4,16 +4,17 @@
 
 from __future__ import annotations
 
+import inspect
 import math
 import threading
 import time
 from collections import deque
-from dataclasses import dataclass
-from typing import Any, Protocol
+from dataclasses import dataclass, field
+from typing import Awaitable, Protocol
 
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from src.presentation.api.middleware._shared import (
     METRICS_HOOK,
@@ -21,22 +22,29 @@ from src.presentation.api.middleware._shared import (
     get_client_ip,
     is_bypassed_path,
     mask_ip,
+    send_with_corr_id,
 )
 from src.presentation.api.settings import settings
 
 
 class RateLimitStore(Protocol):
-    """Adapter interface for distributed rate-limit implementations."""
+    """Adapter interface for distributed rate-limit implementations.
 
-    def allow(self, key: str, now: float, per_minute: int, burst: int) -> tuple[bool, int]:
+    ``allow`` may be synchronous (process-local stores) or return an awaitable
+    (network-backed stores such as RedisRateLimitStore).
+    """
+
+    def allow(
+        self, key: str, now: float, per_minute: int, burst: int
+    ) -> tuple[bool, int] | Awaitable[tuple[bool, int]]:
         """Return if request is allowed and retry_after seconds."""
 
 
 @dataclass(slots=True)
 class InMemorySlidingWindowStore:
-    """Process-local sliding window store."""
+    """Process-local sliding window log (one timestamp per request; InMemoryGCRAStore is the compact default)."""
 
-    lock: threading.Lock = threading.Lock()
+    lock: threading.Lock = field(default_factory=threading.Lock)
     buckets: dict[str, deque[float]] | None = None
 
     def __post_init__(self) -> None:
@@ -60,38 +68,114 @@ class InMemorySlidingWindowStore:
             return True, 0
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Apply process-local rate limiting based on IP and authenticated user."""
+class _Stripe:
+    __slots__ = ("lock", "cells", "next_sweep_at")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # key -> theoretical arrival time (monotonic seconds)
+        self.cells: dict[str, float] = {}
+        self.next_sweep_at = 0.0
+
+
+class InMemoryGCRAStore:
+    """Process-local GCRA store with O(1) memory per key.
+
+    Capacity matches InMemorySlidingWindowStore: ``per_minute + burst`` requests
+    may be spent at once, after which one request is released every
+    ``60 / (per_minute + burst)`` seconds. Each key holds a single float
+    (theoretical arrival time); a key whose TAT is in the past is equivalent
+    to an absent key, so idle keys are dropped without changing decisions.
+
+    Keys are spread over ``stripes`` independently locked dicts. Each stripe
+    is swept of idle keys at most once per ``sweep_interval`` seconds by the
+    request that lands on it, so no background thread is needed.
+    """
+
+    def __init__(self, *, stripes: int = 64, sweep_interval: float = 30.0, window_seconds: float = 60.0) -> None:
+        if stripes < 1:
+            raise ValueError("stripes must be >= 1")
+        self._stripes = tuple(_Stripe() for _ in range(stripes))
+        self._sweep_interval = sweep_interval
+        self._window = window_seconds
+
+    def __len__(self) -> int:
+        return sum(len(stripe.cells) for stripe in self._stripes)
+
+    def allow(self, key: str, now: float, per_minute: int, burst: int) -> tuple[bool, int]:
+        limit = max(1, per_minute + burst)
+        interval = self._window / limit
+        tolerance = self._window - interval
+        stripe = self._stripes[hash(key) % len(self._stripes)]
+        with stripe.lock:
+            if now >= stripe.next_sweep_at:
+                self._sweep_stripe(stripe, now)
+            tat = stripe.cells.get(key, now)
+            if tat < now:
+                tat = now
+            if tat - now > tolerance + 1e-9:  # float drift of repeated interval additions
+                return False, max(1, math.ceil(tat - tolerance - now))
+            stripe.cells[key] = tat + interval
+            return True, 0
+
+    def sweep(self, now: float) -> int:
+        """Drop every idle key; return how many were removed."""
+        removed = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                removed += self._sweep_stripe(stripe, now)
+        return removed
+
+    def _sweep_stripe(self, stripe: _Stripe, now: float) -> int:
+        stripe.next_sweep_at = now + self._sweep_interval
+        idle = [key for key, tat in stripe.cells.items() if tat <= now]
+        for key in idle:
+            del stripe.cells[key]
+        return len(idle)
 
-    def __init__(self, app: Any, store: RateLimitStore | None = None) -> None:
-        super().__init__(app)
-        self._store = store or InMemorySlidingWindowStore()
 
-    async def dispatch(self, request: Request, call_next: Any) -> Response:
+class RateLimitMiddleware:
+    """Apply rate limiting based on IP and authenticated user (process-local unless a shared store is given).
+
+    Pure ASGI: allowed requests are forwarded with only the correlation header
+    added to the response start message.
+    """
+
+    def __init__(self, app: ASGIApp, store: RateLimitStore | None = None) -> None:
+        self.app = app
+        self._store = store or InMemoryGCRAStore()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
         corr_id, _ = ensure_request_context(request)
         if not settings.rate_limit.enabled or is_bypassed_path(request.url.path, settings.rate_limit.bypass_routes):
-            response: Response = await call_next(request)
-            response.headers["X-Correlation-Id"] = corr_id
-            return response
+            await self.app(scope, receive, send_with_corr_id(send, corr_id))
+            return
 
         client_ip = get_client_ip(request)
         user_id = getattr(getattr(request.state, "user", None), "user_id", None) or "anonymous"
         key = f"{mask_ip(client_ip)}:{user_id}"
 
-        allowed, retry_after = self._store.allow(
+        decision = self._store.allow(
             key=key,
             now=time.monotonic(),
             per_minute=settings.rate_limit.per_minute_limit,
             burst=settings.rate_limit.burst,
         )
+        if inspect.isawaitable(decision):
+            decision = await decision
+        allowed, retry_after = decision
 
         if not allowed:
             METRICS_HOOK.increment("rate_limit_block_total")
             response = JSONResponse(status_code=429, content={"detail": "Too Many Requests"})
             response.headers["Retry-After"] = str(retry_after)
             response.headers["X-Correlation-Id"] = corr_id
-            return response
+            await response(scope, receive, send)
+            return
 
-        response = await call_next(request)
-        response.headers["X-Correlation-Id"] = corr_id
-        return response
+        await self.app(scope, receive, send_with_corr_id(send, corr_id))
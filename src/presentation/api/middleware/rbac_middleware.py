@@ -11,14 +11,10 @@ Bypass routes (auth, health, docs) are skipped.
 
 from __future__ import annotations
 
-from collections.abc import Callable, Awaitable
-
-from typing import Any
-
 import structlog
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 logger = structlog.get_logger(__name__)
 
@@ -140,30 +136,43 @@ _BYPASS_PREFIXES = (
 )
 
 
-class RBACMiddleware(BaseHTTPMiddleware):
+class RBACMiddleware:
     """Central role-based access control (KR-063).
 
     Runs after JWT middleware.
     Compares request.state.roles list against _ROUTE_ROLES.
     Returns 403 Forbidden if no match.
+    Pure ASGI: allowed requests reach the app without response re-wrapping.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            denial = self._check(Request(scope))
+            if denial is not None:
+                await denial(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def _check(request: Request) -> JSONResponse | None:
         path = request.url.path
 
         # Bypass check
         for prefix in _BYPASS_PREFIXES:
             if path.startswith(prefix):
-                return await call_next(request)
+                return None
 
         # OPTIONS preflight bypass
         if request.method == "OPTIONS":
-            return await call_next(request)
+            return None
 
         # JWT bypass (no user) -> pass to next middleware
         user = getattr(request.state, "user", None)
         if user is None:
-            return await call_next(request)
+            return None
 
         # User roles
         user_roles = set(getattr(request.state, "roles", []))
@@ -189,4 +198,4 @@ class RBACMiddleware(BaseHTTPMiddleware):
                     )
                 break  # Match found, access granted
 
-        return await call_next(request)
+        return None
@@ -0,0 +1,376 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-066: KVKK PII maskeleme; KR-083: il operatoru grid anonimizasyonu (tek gecis).
+"""Response rewriter: PII filtresi ve grid anonimizasyonunun tek gecisli birlesimi.
+
+PIIFilterMiddleware ve GridAnonymizerMiddleware her JSON response'u ayri ayri
+tamponlayip parse ediyordu. Bu asama ayni kurallari tek parse ve tek
+traversal ile uygular:
+
+  - strip: grid kurali (_STRIP_FIELDS) — alan kaldirilir
+  - mask: PII kurali (PII_FIELDS) — deger maskelenir
+  - snap: koordinatlar grid hucresine yuvarlanir
+  - pseudonymize: FieldID -> FieldRef
+
+Kurallar rol kombinasyonuna gore derlenir (en fazla dort kural seti) ve
+anahtar -> aksiyon cozumlemesi kural seti basina onbelleklenir. Eski iki
+middleware'in sirasi korunur: PII maskesi once, grid sonra uygulanir; ayni
+alan iki kurala da girerse strip kazanir.
+
+Atlama yollari:
+  - Rol yeniden yazma gerektirmiyorsa (ornegin CENTRAL_ADMIN) body'ye dokunulmaz.
+  - Tamponlanan body'de kurallardaki hicbir anahtar adi gecmiyorsa parse edilmez.
+
+Buyuk diziler: ust seviyesi JSON dizisi olan ve stream_threshold_bytes'tan
+buyuk (veya uzunlugu bilinmeyen) response'lar eleman eleman parse edilip
+yeniden yazilarak stream edilir; bellekte bir eleman ve okuma tamponu tutulur.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import logging
+import re
+from collections.abc import Iterable
+from typing import Any
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.presentation.api.middleware._shared import (
+    METRICS_HOOK,
+    ensure_request_context,
+    is_json_response,
+)
+from src.presentation.api.middleware.grid_anonymizer import (
+    _ANONYMIZE_ROLES,
+    _COORD_FIELDS,
+    _FIELD_ID_FIELDS,
+    _STRIP_FIELDS,
+    _pseudonymize_field_id,
+    _snap_to_grid,
+)
+from src.presentation.api.middleware.pii_filter import (
+    _PII_ALLOWED_ROLES,
+    PII_FIELDS,
+    _mask_value,
+)
+
+LOGGER = logging.getLogger("api.middleware.response_rewriter")
+
+DEFAULT_STREAM_THRESHOLD_BYTES = 256 * 1024
+
+# Anahtar aksiyonlari
+_KEEP = 0
+_STRIP = 1
+_MASK = 2
+_SNAP = 3
+_PSEUDONYMIZE = 4
+
+# Kural seti basina onbelleklenen anahtar sayisi ust siniri (dinamik anahtarli map'ler icin)
+_MAX_CACHED_KEYS = 4096
+
+
+class RewriteRules:
+    """Bir rol kombinasyonu icin derlenmis anahtar -> aksiyon kurallari."""
+
+    __slots__ = ("mask_pii", "anonymize", "_by_lower_key", "_key_cache", "_prescan")
+
+    def __init__(self, *, mask_pii: bool, anonymize: bool) -> None:
+        self.mask_pii = mask_pii
+        self.anonymize = anonymize
+        by_lower_key: dict[str, int] = {}
+        if mask_pii:
+            by_lower_key.update(dict.fromkeys(PII_FIELDS, _MASK))
+        if anonymize:
+            by_lower_key.update(dict.fromkeys(_COORD_FIELDS, _SNAP))
+            by_lower_key.update(dict.fromkeys(_FIELD_ID_FIELDS, _PSEUDONYMIZE))
+            by_lower_key.update(dict.fromkeys(_STRIP_FIELDS, _STRIP))
+        self._by_lower_key = by_lower_key
+        self._key_cache: dict[str, int] = {}
+        names = b"|".join(re.escape(name.encode("utf-8")) for name in sorted(by_lower_key))
+        self._prescan = re.compile(b'"(?:' + names + b')"', re.IGNORECASE)
+
+    def action(self, key: str) -> int:
+        action = self._key_cache.get(key)
+        if action is None:
+            action = self._by_lower_key.get(key.lower(), _KEEP)
+            if len(self._key_cache) < _MAX_CACHED_KEYS:
+                self._key_cache[key] = action
+        return action
+
+    def may_match(self, body: bytes) -> bool:
+        """Body kurallardaki bir anahtari icerebilir mi (escape'li metinde her zaman True)."""
+        return b"\\u" in body or self._prescan.search(body) is not None
+
+    def rewrite(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return self._rewrite_dict(value)
+        if isinstance(value, list):
+            return [self._rewrite_dict(item) if isinstance(item, dict) else item for item in value]
+        return value
+
+    def _rewrite_dict(self, data: dict[str, Any]) -> dict[str, Any]:
+        result: dict[str, Any] = {}
+        for key, value in data.items():
+            action = self.action(key)
+            if action == _STRIP:
+                continue
+            if action == _MASK:
+                result[key] = _mask_value(value) if isinstance(value, str) else "***"
+            elif action == _SNAP and isinstance(value, (int, float)):
+                result[key] = round(_snap_to_grid(float(value)), 6)
+            elif action == _PSEUDONYMIZE and isinstance(value, str):
+                result[key] = _pseudonymize_field_id(value)
+            elif isinstance(value, dict):
+                result[key] = self._rewrite_dict(value)
+            elif isinstance(value, list):
+                result[key] = [self._rewrite_dict(item) if isinstance(item, dict) else item for item in value]
+            else:
+                result[key] = value
+        return result
+
+
+_RULES: dict[tuple[bool, bool], RewriteRules] = {}
+
+
+def compile_rules(roles: Iterable[str]) -> RewriteRules | None:
+    """Rollere gore kural setini dondurur; yeniden yazma gerekmiyorsa None."""
+    role_set = set(roles)
+    mask_pii = not (role_set & _PII_ALLOWED_ROLES)
+    anonymize = bool(role_set & _ANONYMIZE_ROLES)
+    if not (mask_pii or anonymize):
+        return None
+    rules = _RULES.get((mask_pii, anonymize))
+    if rules is None:
+        rules = _RULES[(mask_pii, anonymize)] = RewriteRules(mask_pii=mask_pii, anonymize=anonymize)
+    return rules
+
+
+class ArrayStreamRewriter:
+    """Ust seviye JSON dizisini eleman eleman parse edip yeniden yazan artimli donusturucu.
+
+    feed() her chunk icin hazir cikti parcalarini dondurur. Gecersiz JSON
+    gorulurse kalan girdi oldugu gibi gecirilir (tamponlu yoldaki gibi).
+    """
+
+    _WHITESPACE = " \t\n\r"
+
+    def __init__(self, rules: RewriteRules) -> None:
+        self._rules = rules
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._state = "start"  # start -> value|sep -> done | raw
+        self._emitted = 0
+
+    @property
+    def passthrough(self) -> bool:
+        return self._state == "raw"
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        if self._state == "raw":
+            return [chunk]
+        try:
+            self._buffer += self._text.decode(chunk)
+        except UnicodeDecodeError:
+            return self._fail() + [chunk]
+        return self._drain(final=False)
+
+    def close(self) -> list[bytes]:
+        if self._state == "raw":
+            return []
+        self._buffer += self._text.decode(b"", final=True)
+        out = self._drain(final=True)
+        if self._state != "done":
+            out.extend(self._fail())
+        return out
+
+    def _drain(self, *, final: bool) -> list[bytes]:
+        out: list[bytes] = []
+        buffer = self._buffer
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in self._WHITESPACE:
+                pos += 1
+            if pos >= len(buffer):
+                break
+            char = buffer[pos]
+            if self._state == "start":
+                if char != "[":
+                    self._buffer = buffer[pos:]
+                    return out + self._fail()
+                out.append(b"[")
+                self._state = "value"
+                pos += 1
+            elif self._state == "value":
+                if char == "]" and self._emitted == 0:
+                    out.append(b"]")
+                    self._state = "done"
+                    pos += 1
+                    continue
+                try:
+                    value, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        self._buffer = buffer[pos:]
+                        return out + self._fail()
+                    break
+                if end == len(buffer) and not final and isinstance(value, (int, float)):
+                    break  # sayi chunk sinirinda bolunmus olabilir
+                encoded = json.dumps(self._rules.rewrite(value), ensure_ascii=False).encode("utf-8")
+                out.append(b"," + encoded if self._emitted else encoded)
+                self._emitted += 1
+                self._state = "sep"
+                pos = end
+            elif self._state == "sep":
+                if char == ",":
+                    self._state = "value"
+                    pos += 1
+                elif char == "]":
+                    out.append(b"]")
+                    self._state = "done"
+                    pos += 1
+                else:
+                    self._buffer = buffer[pos:]
+                    return out + self._fail()
+            else:  # done: dizi sonrasi yalnizca bosluk kabul edilir
+                self._buffer = buffer[pos:]
+                return out + self._fail()
+        self._buffer = buffer[pos:]
+        return out
+
+    def _fail(self) -> list[bytes]:
+        self._state = "raw"
+        rest, self._buffer = self._buffer, ""
+        METRICS_HOOK.increment("response_rewriter.stream_passthrough")
+        return [rest.encode("utf-8")] if rest else []
+
+
+def _record_applied(rules: RewriteRules) -> None:
+    if rules.mask_pii:
+        METRICS_HOOK.increment("pii_filter.redacted")
+    if rules.anonymize:
+        METRICS_HOOK.increment("grid_anonymizer.applied")
+
+
+class ResponseRewriteMiddleware:
+    """PIIFilterMiddleware + GridAnonymizerMiddleware davranisini tek asamada uygular (saf ASGI)."""
+
+    def __init__(self, app: ASGIApp, stream_threshold_bytes: int = DEFAULT_STREAM_THRESHOLD_BYTES) -> None:
+        self.app = app
+        self._stream_threshold = stream_threshold_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        corr_id, _ = ensure_request_context(request)
+        await self.app(scope, receive, _RewritingSend(request, corr_id, send, self._stream_threshold))
+
+
+class _RewritingSend:
+    """Tek response'un start/body mesajlarini yakalayip yeniden yazan send sarmalayicisi.
+
+    Kurallar response baslarken derlenir (request.state.user ic katmanlarda
+    set edilmis olabilir). Ust seviyesi dizi olan buyuk/uzunlugu bilinmeyen
+    body'ler ArrayStreamRewriter ile stream edilir; digerleri tamponlanir.
+    """
+
+    def __init__(self, request: Request, corr_id: str, send: Send, stream_threshold: int) -> None:
+        self._request = request
+        self._corr_id = corr_id
+        self._send = send
+        self._stream_threshold = stream_threshold
+        self._rules: RewriteRules | None = None
+        self._start: Message | None = None
+        self._chunks: list[bytes] = []
+        self._streamer: ArrayStreamRewriter | None = None
+        self._head_seen = False
+        self._passthrough = False
+
+    async def __call__(self, message: Message) -> None:
+        if self._passthrough:
+            await self._send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            MutableHeaders(scope=message)["X-Correlation-Id"] = self._corr_id
+            user = getattr(self._request.state, "user", None)
+            self._rules = compile_rules(getattr(user, "roles", []) if user is not None else [])
+            # Yalnizca JSON response'lari yeniden yaz
+            if self._rules is None or not is_json_response(message):
+                self._passthrough = True
+                await self._send(message)
+            else:
+                self._start = message
+            return
+
+        if message["type"] != "http.response.body" or self._start is None:
+            await self._send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+        if self._streamer is not None:
+            await self._stream(body, more_body)
+            return
+
+        self._chunks.append(body)
+        if not self._head_seen:
+            # Ilk anlamli chunk'a kadar bekle: dizi mi, nesne mi?
+            head = b"".join(self._chunks)
+            if more_body and not head.strip():
+                return
+            self._head_seen = True
+            headers = MutableHeaders(scope=self._start)
+            declared_length = int(headers.get("content-length", "0") or 0)
+            if head.lstrip()[:1] == b"[" and (declared_length == 0 or declared_length > self._stream_threshold):
+                await self._begin_stream(headers, head, more_body)
+                return
+        if not more_body:
+            await self._finish(b"".join(self._chunks))
+
+    async def _begin_stream(self, headers: MutableHeaders, head: bytes, more_body: bool) -> None:
+        assert self._rules is not None and self._start is not None
+        if "content-length" in headers:
+            del headers["content-length"]
+        _record_applied(self._rules)
+        LOGGER.info("response_rewriter.streamed", extra={"corr_id": self._corr_id, "path": self._request.url.path})
+        self._streamer = ArrayStreamRewriter(self._rules)
+        self._chunks = []
+        await self._send(self._start)
+        await self._stream(head, more_body)
+
+    async def _stream(self, chunk: bytes, more_body: bool) -> None:
+        assert self._streamer is not None
+        pieces = self._streamer.feed(chunk)
+        if not more_body:
+            pieces.extend(self._streamer.close())
+        if pieces or not more_body:
+            await self._send({"type": "http.response.body", "body": b"".join(pieces), "more_body": more_body})
+
+    async def _finish(self, body: bytes) -> None:
+        assert self._rules is not None and self._start is not None
+        if not self._rules.may_match(body):
+            METRICS_HOOK.increment("response_rewriter.skipped")
+        else:
+            try:
+                rewritten = json.dumps(self._rules.rewrite(json.loads(body)), ensure_ascii=False).encode("utf-8")
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                # JSON parse edilemezse orijinal body dondurulur
+                pass
+            else:
+                _record_applied(self._rules)
+                LOGGER.info(
+                    "response_rewriter.applied",
+                    extra={"corr_id": self._corr_id, "path": self._request.url.path},
+                )
+                body = rewritten
+                MutableHeaders(scope=self._start)["content-length"] = str(len(body))
+
+        await self._send(self._start)
+        await self._send({"type": "http.response.body", "body": body, "more_body": False})
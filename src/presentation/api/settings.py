@@ -95,6 +95,9 @@ class RateLimitSettings:
     enabled: bool = field(default_factory=lambda: _env_bool("API_RATE_LIMIT_ENABLED", True))
     per_minute_limit: int = field(default_factory=lambda: _env_int("API_RATE_LIMIT_PER_MINUTE", 61))
     burst: int = field(default_factory=lambda: _env_int("API_RATE_LIMIT_BURST", 20))
+    # Empty: process-local store. Set to share limits across API replicas via Redis.
+    redis_url: str = field(default_factory=lambda: os.getenv("API_RATE_LIMIT_REDIS_URL", ""))
+    local_prefetch: int = field(default_factory=lambda: _env_int("API_RATE_LIMIT_LOCAL_PREFETCH", 1))
     bypass_routes: list[str] = field(
         default_factory=lambda: _env_list("API_RATE_LIMIT_BYPASS_ROUTES", ["/health", "/docs", "/openapi.json"])
     )
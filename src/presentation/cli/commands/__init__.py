@@ -1,7 +1,9 @@
 # BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-015: CLI komut kaydı (weekly-planner, dlq ve yönetim komutları).
 """CLI command modules."""
 
 __all__ = [
+    "dead_letter",
     "expert_management",
     "migrate",
     "run_weekly_planner",
@@ -0,0 +1,87 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: DLQ park kuyruğu inceleme/replay CLI komutu.
+"""Dead letter queue (DLQ) commands."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+
+EXIT_SUCCESS = 0
+EXIT_ERROR = 1
+EXIT_VALIDATION = 2
+
+
+def _rabbitmq_url_from_env() -> str | None:
+    return os.getenv("RABBITMQ_URL")
+
+
+def _load_replayer() -> object:
+    try:
+        from src.infrastructure.messaging.rabbitmq import dead_letter
+    except (ImportError, ModuleNotFoundError, SyntaxError) as exc:
+        raise RuntimeError("TODO: dead letter replay adapter is not available") from exc
+    return dead_letter
+
+
+def register(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -> argparse.ArgumentParser:
+    parser = subparsers.add_parser("dlq", help="Dead letter queue commands")
+    dlq_sub = parser.add_subparsers(dest="dlq_command", required=True)
+
+    inspect = dlq_sub.add_parser("inspect", help="List parked messages without removing them")
+    inspect.add_argument("queue", help="Source queue name (e.g. domain.events.mission)")
+    inspect.add_argument("--limit", type=int, default=20)
+
+    replay = dlq_sub.add_parser("replay", help="Move parked messages back to the source queue")
+    replay.add_argument("queue", help="Source queue name (e.g. domain.events.mission)")
+    replay.add_argument("--limit", type=int, default=100)
+    replay.add_argument("--dry-run", action="store_true")
+
+    parser.set_defaults(handler=handle)
+    return parser
+
+
+def handle(args: argparse.Namespace) -> int:
+    if args.limit < 1:
+        print("Validation error: --limit must be >= 1", file=sys.stderr)
+        return EXIT_VALIDATION
+
+    rabbitmq_url = _rabbitmq_url_from_env()
+    if not rabbitmq_url:
+        print("Validation error: RABBITMQ_URL is required.", file=sys.stderr)
+        return EXIT_VALIDATION
+
+    try:
+        dead_letter = _load_replayer()
+    except RuntimeError as exc:
+        print(str(exc), file=sys.stderr)
+        return EXIT_ERROR
+
+    dry_run = args.dlq_command == "inspect" or bool(getattr(args, "dry_run", False))
+    try:
+        result = asyncio.run(
+            dead_letter.replay_dead_letters(  # type: ignore[attr-defined]
+                rabbitmq_url,
+                args.queue,
+                limit=args.limit,
+                dry_run=dry_run,
+            )
+        )
+    except Exception as exc:
+        print(f"DLQ command failed: {type(exc).__name__}", file=sys.stderr)
+        return EXIT_ERROR
+
+    for summary in result.messages:
+        print(
+            f"{summary.message_id or '-'}\tretries={summary.retry_count}\t"
+            f"replays={summary.replay_count}\t{summary.last_error or ''}"
+        )
+    action = "would replay" if dry_run else "replayed"
+    count = len(result.messages) if dry_run else result.replayed
+    print(f"{action} {count} message(s) from {args.queue}")
+    return EXIT_SUCCESS
+
+
+__all__ = ["register", "handle"]
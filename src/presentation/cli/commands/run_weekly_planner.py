@@ -1,4 +1,5 @@
 # BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-015: Weekly planner CLI entry point.
 """Weekly planner runner command."""
 
 from __future__ import annotations
@@ -37,6 +38,12 @@ def register(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) ->
     parser.add_argument("--corr-id")
     parser.add_argument("--max-work-days", type=int, default=6)
     parser.add_argument("--daily-capacity", type=int, default=2500)
+    parser.add_argument(
+        "--shard-workers",
+        type=int,
+        default=None,
+        help="Plan provinces in parallel shards with this many worker processes",
+    )
     parser.set_defaults(handler=handle)
     return parser
 
@@ -49,6 +56,8 @@ def _validate(args: argparse.Namespace) -> str | None:
         return "--max-work-days must be in range 1..6"
     if args.daily_capacity < 2500 or args.daily_capacity > 3000:
         return "--daily-capacity must be in range 2500..3000"
+    if args.shard_workers is not None and args.shard_workers < 1:
+        return "--shard-workers must be >= 1"
     return None
 
 
@@ -71,14 +80,18 @@ def handle(args: argparse.Namespace) -> int:
         print("Error: weekly_planner_service.run is missing.", file=sys.stderr)
         return EXIT_ERROR
 
+    options: dict[str, object] = {
+        "week": args.week,
+        "dry_run": args.dry_run,
+        "corr_id": corr_id,
+        "max_work_days": args.max_work_days,
+        "daily_capacity_donum": args.daily_capacity,
+    }
+    if args.shard_workers is not None:
+        options["shard_workers"] = args.shard_workers
+
     try:
-        result = runner(
-            week=args.week,
-            dry_run=args.dry_run,
-            corr_id=corr_id,
-            max_work_days=args.max_work_days,
-            daily_capacity_donum=args.daily_capacity,
-        )
+        result = runner(**options)
     except ValueError as exc:
         print(f"Validation error: {exc}", file=sys.stderr)
         return EXIT_VALIDATION
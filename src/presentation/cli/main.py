@@ -1,4 +1,5 @@
 # BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-015: CLI komut kaydı (weekly-planner, dlq ve yönetim komutları).
 """Platform CLI entrypoint."""
 
 from __future__ import annotations
@@ -6,13 +7,21 @@ from __future__ import annotations
 import argparse
 import sys
 
-from src.presentation.cli.commands import expert_management, migrate, run_weekly_planner, seed, subscription_management
+from src.presentation.cli.commands import (
+    dead_letter,
+    expert_management,
+    migrate,
+    run_weekly_planner,
+    seed,
+    subscription_management,
+)
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="tarlaanaliz")
     subparsers = parser.add_subparsers(dest="command")
 
+    dead_letter.register(subparsers)
     expert_management.register(subparsers)
     migrate.register(subparsers)
     run_weekly_planner.register(subparsers)
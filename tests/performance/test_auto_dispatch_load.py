@@ -0,0 +1,65 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-015: AutoDispatcher yük dengeli atama yük testi (50k mission).
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): record_property ile runtime_s
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+
+from src.core.domain.services.auto_dispatcher import AutoDispatcher
+from src.core.domain.value_objects.crop_ops_profile import CropOpsProfile
+from src.core.domain.value_objects.crop_type import CropType
+
+pytestmark = pytest.mark.performance
+
+
+@dataclass
+class _Mission:
+    id: str
+    territory_id: str
+    scheduled_date: str
+    area_donum: int
+
+
+@dataclass
+class _Pilot:
+    id: str
+    territory_id: str
+    reliability_score: float
+
+
+def test_dispatch_balanced_50k_missions(record_property: Callable[[str, Any], None]) -> None:
+    rng = random.Random(1)
+    territories = [f"T{i}" for i in range(81)]
+    pilots = [_Pilot(f"p-{i}", rng.choice(territories), rng.random()) for i in range(500)]
+    missions = [
+        _Mission(f"m-{i}", rng.choice(territories), f"2026-05-{rng.randint(4, 10):02d}", rng.randint(20, 150))
+        for i in range(50_000)
+    ]
+
+    profile = CropOpsProfile.create_default(CropType(code="PAMUK"))
+
+    started = time.perf_counter()
+    decisions = AutoDispatcher().dispatch_balanced(missions, pilots, profile)
+    elapsed = time.perf_counter() - started
+
+    record_property("runtime_s", round(elapsed, 4))
+    record_property("dispatched", len(decisions))
+    assert decisions
+    assert elapsed < 1.0
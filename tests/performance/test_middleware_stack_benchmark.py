@@ -0,0 +1,161 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: API middleware zinciri — saf ASGI katmanlarının ucuz endpoint'lerdeki ek yükü.
+"""
+Amaç: Tam middleware zinciri (corr-id, mTLS, JWT, RBAC, rate limit, anomaly, response rewrite) için req/s, p50/p99.
+Sorumluluk: /health ve görev listesi için üç yapılandırma: middleware'siz uygulama (bare), saf ASGI zincir
+  (asgi) ve aynı zincire katman sayısı kadar geçişsiz BaseHTTPMiddleware eklenmiş hali (asgi_plus_basehttp).
+  Üçüncüsü dönüşüm öncesi zincirin kendisi değildir; yalnızca katman başına call_next sarmalama maliyetini
+  gösterir ve raporlanır, doğrulanmaz (eski BaseHTTPMiddleware implementasyonları ağaçta yoktur).
+Girdi/Çıktı (Contract/DTO/Event): ASGI scope -> HTTP durum kodu (istekler sunucusuz, doğrudan uygulamaya verilir)
+Güvenlik (RBAC/PII/Audit): Geçerli HS256 token (PILOT, phone_verified); görev listesi PII maskesinden geçer.
+Hata Modları (idempotency/retry/rate limit): Rate limit benchmark süresince yükseltilir; tüm yanıtlar 200 olmalı.
+Observability (log fields/metrics/traces): record_property ile req_per_s, p50_ms ve p99_ms
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Ağ ve sunucu maliyeti yoktur; mutlak değerler değil yapılandırmalar arası fark anlamlıdır.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import os
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message
+
+from src.presentation.api.main import _install_middleware
+from src.presentation.api.settings import settings
+
+pytestmark = pytest.mark.performance
+
+_RUN_PERF = os.getenv("RUN_PERF") == "1"
+_REQUESTS = 20_000 if _RUN_PERF else 1_500
+_WARMUP = 200
+_BASEHTTP_LAYERS = 8  # corr-id + yedi middleware katmanı kadar geçişsiz sarmalayıcı
+
+_MISSIONS = [
+    {
+        "mission_id": f"MSN-{n:05d}",
+        "status": "ASSIGNED",
+        "crop_type": "PAMUK",
+        "area_donum": 42.5,
+        "farmer": {"full_name": "Ali Yilmaz", "phone": "05321234567"},
+    }
+    for n in range(20)
+]
+
+
+def _token() -> str:
+    def _enc(data: dict[str, Any]) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data, separators=(",", ":")).encode()).decode().rstrip("=")
+
+    claims = {"sub": "pilot-1", "user_id": "u-1", "phone_verified": True, "roles": ["PILOT"]}
+    signed = f"{_enc({'alg': 'HS256', 'typ': 'JWT'})}.{_enc(claims)}"
+    sig = hmac.new(settings.jwt.secret.encode(), signed.encode(), hashlib.sha256).digest()
+    return f"{signed}.{base64.urlsafe_b64encode(sig).decode().rstrip('=')}"
+
+
+class _PassThrough(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Any) -> Any:
+        return await call_next(request)
+
+
+def _app(stack: str) -> ASGIApp:
+    app = FastAPI()
+    if stack != "bare":
+        _install_middleware(app)
+    if stack == "asgi_plus_basehttp":
+        for _ in range(_BASEHTTP_LAYERS):
+            app.add_middleware(_PassThrough)
+
+    @app.get("/health")
+    async def health() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/api/v1/missions")
+    async def missions() -> list[dict[str, Any]]:
+        return _MISSIONS
+
+    return app
+
+
+async def _drive(app: ASGIApp, path: str, headers: list[tuple[bytes, bytes]], count: int) -> list[float]:
+    scope_base = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": headers,
+        "client": ("203.0.113.7", 50000),
+        "server": ("testserver", 80),
+    }
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    statuses: list[int] = []
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    latencies: list[float] = []
+    for _ in range(count):
+        started = time.perf_counter()
+        await app(dict(scope_base), receive, send)
+        latencies.append(time.perf_counter() - started)
+    assert set(statuses) == {200}, set(statuses)
+    return latencies
+
+
+def _measure(stack: str, path: str) -> tuple[float, float, float]:
+    headers = [(b"authorization", f"Bearer {_token()}".encode()), (b"user-agent", b"python-httpx/0.27")]
+    app = _app(stack)
+
+    async def _run() -> list[float]:
+        await _drive(app, path, headers, _WARMUP)
+        return await _drive(app, path, headers, _REQUESTS)
+
+    latencies = asyncio.run(_run())
+    cuts = statistics.quantiles(latencies, n=100)
+    return len(latencies) / sum(latencies), cuts[49] * 1000, cuts[98] * 1000
+
+
+@pytest.mark.parametrize("path", ["/health", "/api/v1/missions"])
+def test_pure_asgi_stack_overhead(
+    path: str,
+    monkeypatch: pytest.MonkeyPatch,
+    record_property: Callable[[str, Any], None],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    monkeypatch.setattr(settings.rate_limit, "per_minute_limit", 10**9)
+    monkeypatch.setattr(settings.cors, "enabled", False)
+
+    results = {stack: _measure(stack, path) for stack in ("bare", "asgi", "asgi_plus_basehttp")}
+
+    for stack, (rps, p50, p99) in results.items():
+        record_property(f"{stack}_req_per_s", round(rps, 1))
+        record_property(f"{stack}_p50_ms", round(p50, 4))
+        record_property(f"{stack}_p99_ms", round(p99, 4))
+        with capsys.disabled():
+            sys.stdout.write(
+                f"\n[middleware-bench] path={path} stack={stack} requests={_REQUESTS} "
+                f"req_per_s={rps:.0f} p50_ms={p50:.3f} p99_ms={p99:.3f}"
+            )
@@ -0,0 +1,107 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-015: Greedy ve optimal planlama motorlarının planlama oranı / süre karşılaştırması.
+"""
+Amaç: Planlama motorları için benchmark; planlanan oran ve çalışma süresini raporlar.
+Sorumluluk: 1k talep her koşuda, 10k/100k talep RUN_PERF=1 ile çalışır.
+Girdi/Çıktı (Contract/DTO/Event): MissionDemand, PilotSlot -> ScheduleResult
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): record_property ile scheduled_ratio ve runtime_s
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import time
+import uuid
+from collections.abc import Callable
+from datetime import date, timedelta
+from typing import Any
+
+import pytest
+
+from src.core.domain.services.optimal_planning_engine import OptimalPlanningEngine
+from src.core.domain.services.planning_engine import MissionDemand, PilotSlot, PlanningEngine, ScheduleResult
+
+pytestmark = pytest.mark.performance
+
+_RUN_PERF = os.getenv("RUN_PERF") == "1"
+
+
+def _workload(demand_count: int, seed: int = 7) -> tuple[list[MissionDemand], list[PilotSlot]]:
+    rng = random.Random(seed)
+    start = date(2026, 4, 6)
+    provinces = [f"{code:02d}" for code in range(1, 21)]
+    pilots = [(uuid.UUID(int=rng.getrandbits(128)), rng.choice(provinces)) for _ in range(max(20, demand_count // 25))]
+    slots = [
+        PilotSlot(
+            pilot_id=pilot_id,
+            date=start + timedelta(days=day),
+            province_code=province,
+            remaining_capacity=rng.randint(0, 5),
+            daily_capacity=5,
+        )
+        for pilot_id, province in pilots
+        for day in range(7)
+    ]
+    demands: list[MissionDemand] = []
+    for _ in range(demand_count):
+        earliest = start + timedelta(days=rng.randint(0, 6))
+        demands.append(
+            MissionDemand(
+                demand_id=uuid.UUID(int=rng.getrandbits(128)),
+                field_id=uuid.UUID(int=rng.getrandbits(128)),
+                province_code=rng.choice(provinces),
+                crop_type="WHEAT",
+                area_m2=50_000,
+                priority=rng.randint(0, 4),
+                earliest_date=earliest,
+                latest_date=earliest + timedelta(days=rng.choice([0, 0, 1, 3, 6])),
+                estimated_duration_minutes=45,
+            )
+        )
+    return demands, slots
+
+
+_ENGINES: dict[str, Callable[[list[MissionDemand], list[PilotSlot]], ScheduleResult]] = {
+    "greedy": PlanningEngine().optimize_schedule_indexed,
+    "optimal": OptimalPlanningEngine(time_budget_seconds=120.0).optimize_schedule,
+}
+
+
+@pytest.mark.parametrize(
+    "demand_count",
+    [
+        1_000,
+        pytest.param(10_000, marks=pytest.mark.skipif(not _RUN_PERF, reason="Set RUN_PERF=1 for 10k benchmark.")),
+        pytest.param(100_000, marks=pytest.mark.skipif(not _RUN_PERF, reason="Set RUN_PERF=1 for 100k benchmark.")),
+    ],
+)
+def test_planning_engines_scheduled_ratio_and_runtime(
+    demand_count: int,
+    record_property: Callable[[str, Any], None],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    demands, slots = _workload(demand_count)
+    ratios: dict[str, float] = {}
+
+    for name, optimize in _ENGINES.items():
+        started = time.perf_counter()
+        result = optimize(demands, slots)
+        elapsed = time.perf_counter() - started
+
+        ratios[name] = len(result.scheduled) / demand_count
+        record_property(f"{name}_scheduled_ratio", round(ratios[name], 4))
+        record_property(f"{name}_runtime_s", round(elapsed, 4))
+        with capsys.disabled():
+            sys.stdout.write(
+                f"\n[planning-bench] engine={name} demands={demand_count} "
+                f"scheduled_ratio={ratios[name]:.4f} runtime_s={elapsed:.3f}"
+            )
+
+    assert ratios["optimal"] >= ratios["greedy"]
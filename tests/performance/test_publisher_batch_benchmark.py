@@ -0,0 +1,119 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: RabbitMQPublisher toplu publish — sıralı confirm ile pipeline'lı confirm karşılaştırması.
+"""
+Amaç: publish_batch benchmark'ı; confirm penceresi 1 (eski sıralı davranış) ile varsayılan pencereyi karşılaştırır.
+Sorumluluk: 1k event karşılaştırması ve 10k pipeline'lı batch her koşuda, 10k sıralı karşılaştırma RUN_PERF=1 ile.
+Girdi/Çıktı (Contract/DTO/Event): MissionAssigned -> BatchPublishResult
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): record_property ile runtime_s ve msgs_per_s
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Broker round trip'i sabit confirm gecikmesiyle simüle edilir; mutlak değerler değil oran anlamlıdır.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Optional
+
+import pytest
+
+from src.core.domain.events.mission_events import MissionAssigned
+from src.infrastructure.messaging.event_publisher import EventPublisher
+from src.infrastructure.messaging.rabbitmq.publisher import BatchPublishResult, RabbitMQPublisher
+
+pytestmark = pytest.mark.performance
+
+_RUN_PERF = os.getenv("RUN_PERF") == "1"
+_CONFIRM_RTT_S = 0.001
+
+
+class _Exchange:
+    async def publish(self, message: Any, routing_key: str) -> None:
+        await asyncio.sleep(_CONFIRM_RTT_S)
+
+
+class _Publisher(RabbitMQPublisher):
+    async def _ensure_connection(self) -> None:
+        return None
+
+    async def _get_exchange(self, exchange_name: str) -> Any:
+        return _Exchange()
+
+    @staticmethod
+    def _build_message(
+        body: dict[str, Any],
+        message_id: str,
+        *,
+        timestamp: datetime,
+        headers: Optional[dict[str, Any]] = None,
+        content_type: str = "application/json",
+        correlation_id: Optional[str] = None,
+    ) -> Any:
+        return SimpleNamespace(message_id=message_id)
+
+
+def _run(event_count: int, confirm_window: int) -> tuple[BatchPublishResult, float]:
+    events = [MissionAssigned(assignment_source="SYSTEM_SEED") for _ in range(event_count)]
+    event_publisher = EventPublisher(SimpleNamespace(rabbitmq_url="amqp://bench"))  # type: ignore[arg-type]
+    event_publisher._publisher = _Publisher(
+        SimpleNamespace(rabbitmq_url="amqp://bench"),  # type: ignore[arg-type]
+        confirm_window=confirm_window,
+    )
+    started = time.perf_counter()
+    result = asyncio.run(event_publisher.publish_batch(events))
+    return result, time.perf_counter() - started
+
+
+def _report(
+    label: str,
+    event_count: int,
+    elapsed: float,
+    record_property: Callable[[str, Any], None],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    record_property(f"{label}_runtime_s", round(elapsed, 4))
+    record_property(f"{label}_msgs_per_s", round(event_count / elapsed, 1))
+    with capsys.disabled():
+        sys.stdout.write(
+            f"\n[publish-bench] mode={label} events={event_count} "
+            f"runtime_s={elapsed:.3f} msgs_per_s={event_count / elapsed:.0f}"
+        )
+
+
+@pytest.mark.parametrize(
+    "event_count",
+    [
+        1_000,
+        pytest.param(10_000, marks=pytest.mark.skipif(not _RUN_PERF, reason="Set RUN_PERF=1 for 10k serial baseline.")),
+    ],
+)
+def test_pipelined_batch_outpaces_serial_confirms(
+    event_count: int,
+    record_property: Callable[[str, Any], None],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    serial, serial_s = _run(event_count, confirm_window=1)
+    pipelined, pipelined_s = _run(event_count, confirm_window=256)
+
+    _report("serial", event_count, serial_s, record_property, capsys)
+    _report("pipelined", event_count, pipelined_s, record_property, capsys)
+    assert serial.ok and pipelined.ok
+    assert pipelined_s * 5 < serial_s
+
+
+def test_pipelined_batch_10k_events(
+    record_property: Callable[[str, Any], None],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    result, elapsed = _run(10_000, confirm_window=256)
+
+    _report("pipelined", 10_000, elapsed, record_property, capsys)
+    assert result.succeeded == 10_000
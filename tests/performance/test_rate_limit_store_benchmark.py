@@ -0,0 +1,116 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-041: Süreç içi rate-limit store'ları — deque log ile GCRA bellek/süre karşılaştırması.
+"""
+Amaç: InMemorySlidingWindowStore (istek başına timestamp) ile InMemoryGCRAStore (anahtar başına tek float) karşılaştırması.
+Sorumluluk: 100k farklı anahtar (scanner trafiği) GCRA ile her koşuda; 100k deque karşılaştırması RUN_PERF=1 ile.
+Girdi/Çıktı (Contract/DTO/Event): allow(key, now, per_minute, burst) -> (allowed, retry_after)
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): record_property ile runtime_s, checks_per_s ve retained_kib
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Bellek tracemalloc ile ölçülür; mutlak değerler değil oran anlamlıdır.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from src.presentation.api.middleware.rate_limit_middleware import (
+    InMemoryGCRAStore,
+    InMemorySlidingWindowStore,
+    RateLimitStore,
+)
+
+pytestmark = pytest.mark.performance
+
+_RUN_PERF = os.getenv("RUN_PERF") == "1"
+_REQUESTS_PER_KEY = 3
+
+
+def _drive(store: RateLimitStore, keys: list[str]) -> None:
+    for round_ in range(_REQUESTS_PER_KEY):
+        now = 1_000.0 + round_ * 0.01
+        for key in keys:
+            store.allow(key, now, per_minute=60, burst=20)
+
+
+def _run(store_factory: Callable[[], RateLimitStore], key_count: int) -> tuple[float, int]:
+    """Her anahtara birkaç istek gönderir; (süre, tutulan bayt) döner.
+
+    tracemalloc küçük nesne ayırmalarını orantısız yavaşlattığı için süre
+    ve bellek ayrı store örnekleriyle ölçülür.
+    """
+    keys = [f"203.0.113.x:scanner-{n}" for n in range(key_count)]
+    started = time.perf_counter()
+    _drive(store_factory(), keys)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    store = store_factory()
+    _drive(store, keys)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, retained
+
+
+def _report(
+    label: str,
+    key_count: int,
+    elapsed: float,
+    retained: int,
+    record_property: Callable[[str, Any], None],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    checks = key_count * _REQUESTS_PER_KEY
+    record_property(f"{label}_runtime_s", round(elapsed, 4))
+    record_property(f"{label}_checks_per_s", round(checks / elapsed, 1))
+    record_property(f"{label}_retained_kib", retained // 1024)
+    with capsys.disabled():
+        sys.stdout.write(
+            f"\n[rate-limit-bench] store={label} keys={key_count} runtime_s={elapsed:.3f} "
+            f"checks_per_s={checks / elapsed:.0f} retained_kib={retained // 1024}"
+        )
+
+
+def test_gcra_store_100k_keys_is_compact_and_swept(
+    record_property: Callable[[str, Any], None],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    elapsed, retained = _run(InMemoryGCRAStore, 100_000)
+    store = InMemoryGCRAStore()
+    _drive(store, [f"k{n}" for n in range(100_000)])
+
+    _report("gcra", 100_000, elapsed, retained, record_property, capsys)
+    assert retained < 100_000 * 200  # anahtar başına float + dict girdisi
+    assert len(store) == 100_000
+    assert store.sweep(now=1_060.0) == 100_000
+
+
+@pytest.mark.parametrize(
+    "key_count",
+    [
+        10_000,
+        pytest.param(
+            100_000, marks=pytest.mark.skipif(not _RUN_PERF, reason="Set RUN_PERF=1 for 100k deque baseline.")
+        ),
+    ],
+)
+def test_gcra_store_retains_less_than_deque_log(
+    key_count: int,
+    record_property: Callable[[str, Any], None],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    deque_s, deque_bytes = _run(InMemorySlidingWindowStore, key_count)
+    gcra_s, gcra_bytes = _run(InMemoryGCRAStore, key_count)
+
+    _report("deque", key_count, deque_s, deque_bytes, record_property, capsys)
+    _report("gcra", key_count, gcra_s, gcra_bytes, record_property, capsys)
+    assert gcra_bytes * 3 < deque_bytes
@@ -0,0 +1,116 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-050: Dogrulanmis JWT onbellegi; exp, iptal ve anahtar degisimi ile gecersizlesme.
+"""Verified-token cache tests for JwtMiddleware."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import json
+import time
+from typing import Any
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.presentation.api.middleware._shared import METRICS_HOOK
+from src.presentation.api.middleware.jwt_middleware import JwtMiddleware, VerifiedTokenCache
+from src.presentation.api.settings import settings
+
+
+def _token(payload: dict[str, Any], secret: str | None = None) -> str:
+    def _enc(data: dict[str, Any]) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data, separators=(",", ":")).encode()).decode().rstrip("=")
+
+    signed = f"{_enc({'alg': 'HS256', 'typ': 'JWT'})}.{_enc(payload)}"
+    sig = hmac.new((secret or settings.jwt.secret).encode(), signed.encode(), hashlib.sha256).digest()
+    return f"{signed}.{base64.urlsafe_b64encode(sig).decode().rstrip('=')}"
+
+
+def _client(cache: VerifiedTokenCache) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(JwtMiddleware, token_cache=cache)
+
+    @app.get("/private")
+    def private(request: Request) -> dict[str, str]:
+        return {"subject": request.state.user.subject}
+
+    return TestClient(app)
+
+
+def _claims(sub: str = "pilot-1", ttl: int = 3600) -> dict[str, Any]:
+    return {"sub": sub, "phone_verified": True, "exp": int(time.time()) + ttl}
+
+
+def test_repeated_token_is_verified_once() -> None:
+    cache = VerifiedTokenCache()
+    client = _client(cache)
+    headers = {"Authorization": f"Bearer {_token(_claims())}"}
+    hits_before = METRICS_HOOK.counters["jwt_cache_hit_total"]
+
+    responses = [client.get("/private", headers=headers) for _ in range(5)]
+
+    assert [r.status_code for r in responses] == [200] * 5
+    assert (cache.hits, cache.misses, len(cache)) == (4, 1, 1)
+    assert cache.hit_ratio == 0.8
+    assert METRICS_HOOK.counters["jwt_cache_hit_total"] - hits_before == 4
+    assert METRICS_HOOK.timings_ms["jwt_verify_ms"]
+
+
+def test_invalid_tokens_are_not_cached() -> None:
+    cache = VerifiedTokenCache()
+    client = _client(cache)
+    forged = _token(_claims(), secret="not-the-secret")
+
+    assert client.get("/private", headers={"Authorization": f"Bearer {forged}"}).status_code == 401
+    assert len(cache) == 0
+
+
+def test_entry_expires_with_token_exp() -> None:
+    cache = VerifiedTokenCache(max_ttl_seconds=600)
+    claims = {"sub": "pilot-1", "exp": 1_000}
+
+    cache.put(b"d", claims, now=990.0)
+
+    assert cache.get(b"d", now=999.5) is claims
+    assert cache.get(b"d", now=1_000.0) is None
+    assert len(cache) == 0
+
+
+def test_revocation_drops_tokens() -> None:
+    cache = VerifiedTokenCache()
+    tokens = [_token(_claims("pilot-1", ttl=n + 60)) for n in range(3)]
+    for token in tokens:
+        cache.put(cache.digest(token), _claims("pilot-1"), now=time.time())
+    other = _token(_claims("pilot-2"))
+    cache.put(cache.digest(other), _claims("pilot-2"), now=time.time())
+
+    assert cache.revoke(tokens[0])
+    assert cache.revoke_subject("pilot-1") == 2
+    assert len(cache) == 1
+    assert cache.get(cache.digest(other), now=time.time()) is not None
+
+
+def test_cache_is_bounded_lru() -> None:
+    cache = VerifiedTokenCache(max_entries=2)
+    for key in (b"a", b"b"):
+        cache.put(key, {"sub": "s"}, now=0.0)
+    cache.get(b"a", now=1.0)
+
+    cache.put(b"c", {"sub": "s"}, now=1.0)
+
+    assert cache.get(b"b", now=1.0) is None
+    assert cache.get(b"a", now=1.0) is not None
+
+
+def test_secret_rotation_flushes_cache(monkeypatch: Any) -> None:
+    cache = VerifiedTokenCache()
+    client = _client(cache)
+    token = _token(_claims())
+    assert client.get("/private", headers={"Authorization": f"Bearer {token}"}).status_code == 200
+
+    monkeypatch.setattr(settings.jwt, "secret", "rotated-secret")
+
+    assert client.get("/private", headers={"Authorization": f"Bearer {token}"}).status_code == 401
+    assert len(cache) == 0
@@ -1,17 +1,22 @@
 # BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-041: RateLimitMiddleware davranış testleri.
 
 from __future__ import annotations
 
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from src.presentation.api.middleware.rate_limit_middleware import RateLimitMiddleware
+from src.presentation.api.middleware.rate_limit_middleware import (
+    InMemoryGCRAStore,
+    InMemorySlidingWindowStore,
+    RateLimitMiddleware,
+)
 from src.presentation.api.settings import settings
 
 
-def _app() -> FastAPI:
+def _app(store: object | None = None) -> FastAPI:
     app = FastAPI()
-    app.add_middleware(RateLimitMiddleware)
+    app.add_middleware(RateLimitMiddleware, store=store)
 
     @app.get("/limited")
     def limited() -> dict[str, str]:
@@ -66,3 +71,40 @@ def test_rate_limit_disabled(monkeypatch) -> None:
         assert response.status_code == 200
     finally:
         monkeypatch.setattr(settings.rate_limit, "enabled", True)
+
+
+def test_rate_limit_awaits_async_store() -> None:
+    class _AsyncStore:
+        async def allow(self, key: str, now: float, per_minute: int, burst: int) -> tuple[bool, int]:
+            return False, 7
+
+    client = TestClient(_app(_AsyncStore()))
+    blocked = client.get("/limited")
+
+    assert blocked.status_code == 429
+    assert blocked.headers["Retry-After"] == "7"
+
+
+def test_gcra_store_matches_window_capacity_and_retry_after() -> None:
+    store = InMemoryGCRAStore()
+
+    decisions = [store.allow("k", 100.0, per_minute=80, burst=1) for _ in range(82)]
+
+    assert [allowed for allowed, _ in decisions] == [True] * 81 + [False]
+    assert decisions[-1][1] == 1
+    assert store.allow("k", 100.0 + 60 / 81, per_minute=80, burst=1) == (True, 0)
+
+
+def test_gcra_store_sweeps_idle_keys() -> None:
+    store = InMemoryGCRAStore(stripes=4, sweep_interval=10.0)
+    for n in range(100):
+        store.allow(f"ip-{n}", 0.0, per_minute=60, burst=0)
+
+    assert len(store) == 100
+    assert store.sweep(now=0.5) == 0
+    assert store.sweep(now=1.0) == 100
+    assert len(store) == 0
+
+
+def test_sliding_window_store_instances_do_not_share_lock() -> None:
+    assert InMemorySlidingWindowStore().lock is not InMemorySlidingWindowStore().lock
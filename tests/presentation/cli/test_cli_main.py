@@ -1,4 +1,5 @@
 # BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-015: CLI smoke tests.
 
 from __future__ import annotations
 
@@ -20,3 +21,25 @@ def test_weekly_planner_dry_run_graceful_when_service_missing(capsys) -> None:
     captured = capsys.readouterr()
     assert exit_code == 1
     assert "weekly_planner_service" in captured.err
+
+
+def test_weekly_planner_rejects_invalid_shard_workers(capsys) -> None:
+    exit_code = main(["weekly-planner", "--dry-run", "--week", "2026-10", "--shard-workers", "0"])
+    captured = capsys.readouterr()
+    assert exit_code == 2
+    assert "--shard-workers" in captured.err
+
+
+def test_dlq_replay_requires_rabbitmq_url(capsys, monkeypatch) -> None:
+    monkeypatch.delenv("RABBITMQ_URL", raising=False)
+    exit_code = main(["dlq", "replay", "domain.events.mission", "--dry-run"])
+    captured = capsys.readouterr()
+    assert exit_code == 2
+    assert "RABBITMQ_URL" in captured.err
+
+
+def test_dlq_replay_rejects_invalid_limit(capsys) -> None:
+    exit_code = main(["dlq", "replay", "domain.events.mission", "--limit", "0"])
+    captured = capsys.readouterr()
+    assert exit_code == 2
+    assert "--limit" in captured.err
@@ -0,0 +1,153 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-066/KR-083: Tek gecisli response rewriter; PII filtresi + grid anonimizasyonu ile esdegerlik.
+"""Response rewriter security tests.
+
+Birlesik asama, eski iki middleware'in ardisik uygulanmasiyla (once PII
+maskesi, sonra grid) ayni ciktiyi uretmeli; buyuk diziler stream edilirken
+chunk sinirlari sonucu degistirmemeli.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.presentation.api.middleware.grid_anonymizer import _anonymize_dict
+from src.presentation.api.middleware.pii_filter import _redact_dict
+from src.presentation.api.middleware.response_rewriter import (
+    ArrayStreamRewriter,
+    ResponseRewriteMiddleware,
+    compile_rules,
+)
+
+
+@dataclass
+class FakeUser:
+    roles: list[str]
+
+
+_PAYLOAD: dict[str, Any] = {
+    "district": "Harran",
+    "field_id": "FLD-12345-ABCDE",
+    "latitude": 36.86543,
+    "Longitude": 39.02178,
+    "farmer_name": "Ali Yilmaz",
+    "phone": "05321234567",
+    "email": {"primary": "a@b.c"},
+    "owner": {"full_name": "Ayse Demir", "iban": "TR330006100519786457841326", "lat": 37.5},
+    "fields": [{"tarla_id": "T-1", "enlem": 36.1, "adres": "Koy"}, 7, [{"phone": "0555"}]],
+}
+
+
+def test_single_pass_matches_sequential_pii_then_grid() -> None:
+    for roles in (["IL_OPERATOR"], ["PILOT"], ["CENTRAL_ADMIN", "IL_OPERATOR"]):
+        rules = compile_rules(roles)
+        assert rules is not None
+        expected = _PAYLOAD
+        if rules.mask_pii:
+            expected = _redact_dict(expected)
+        if rules.anonymize:
+            expected = _anonymize_dict(expected)
+        assert rules.rewrite(_PAYLOAD) == expected, roles
+
+
+def test_roles_without_rewrite_skip_entirely() -> None:
+    assert compile_rules(["CENTRAL_ADMIN"]) is None
+    assert compile_rules(["PILOT"]) is compile_rules(["FARMER"])
+
+
+def test_prescan_skips_bodies_without_rule_keys() -> None:
+    rules = compile_rules(["IL_OPERATOR"])
+    assert rules is not None
+
+    assert not rules.may_match(b'{"mission_id": "m1", "status": "DONE"}')
+    assert rules.may_match(b'{"Farmer_Phone": "0555"}')
+    assert rules.may_match(b'{"\\u0070hone": "0555"}')
+
+
+def test_stream_rewriter_is_independent_of_chunk_boundaries() -> None:
+    rules = compile_rules(["IL_OPERATOR"])
+    assert rules is not None
+    items = [{"field_id": f"F-{n}", "lat": 36.0 + n / 100, "phone": "05321234567", "n": n} for n in range(50)]
+    items.extend([12345, "ş", None, [1, 2]])
+    body = json.dumps(items, ensure_ascii=False).encode("utf-8")
+    expected = rules.rewrite(items)
+
+    for size in (1, 3, 7, 64, len(body)):
+        rewriter = ArrayStreamRewriter(rules)
+        out = b"".join(piece for i in range(0, len(body), size) for piece in rewriter.feed(body[i : i + size]))
+        out += b"".join(rewriter.close())
+        assert json.loads(out) == expected, size
+        assert not rewriter.passthrough
+
+
+def test_stream_rewriter_passes_invalid_json_through() -> None:
+    rules = compile_rules(["PILOT"])
+    assert rules is not None
+    rewriter = ArrayStreamRewriter(rules)
+
+    out = b"".join([*rewriter.feed(b'[{"phone": "05321234567"}, {oops'), *rewriter.close()])
+
+    assert rewriter.passthrough
+    assert out.startswith(b'[{"phone": "05')
+    assert out.endswith(b"{oops")
+
+
+def _app(roles: list[str], threshold: int = 256 * 1024) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ResponseRewriteMiddleware, stream_threshold_bytes=threshold)
+
+    @app.middleware("http")
+    async def inject_user(request: Request, call_next: Any) -> Any:
+        request.state.user = FakeUser(roles=roles)
+        return await call_next(request)
+
+    @app.get("/api/v1/kpi/field-density")
+    def field_density() -> dict[str, Any]:
+        return _PAYLOAD
+
+    @app.get("/api/v1/fields")
+    def fields() -> StreamingResponse:
+        def _rows() -> Any:
+            yield b"["
+            for n in range(100):
+                yield (b"," if n else b"") + json.dumps({"field_id": f"F-{n}", "farmer_phone": "0555"}).encode()
+            yield b"]"
+
+        return StreamingResponse(_rows(), media_type="application/json")
+
+    @app.get("/api/v1/missions/m1")
+    def mission() -> StreamingResponse:
+        chunks = [b"  ", b'{"mission_id": "m1", ', b'"phone": "05321234567"}']
+        return StreamingResponse(iter(chunks), media_type="application/json")
+
+    return app
+
+
+def test_middleware_applies_both_rule_sets_for_il_operator() -> None:
+    resp = TestClient(_app(["IL_OPERATOR"])).get("/api/v1/kpi/field-density")
+
+    assert resp.status_code == 200
+    assert resp.json() == _anonymize_dict(_redact_dict(_PAYLOAD))
+    assert resp.headers["content-length"] == str(len(resp.content))
+
+
+def test_middleware_streams_large_arrays() -> None:
+    resp = TestClient(_app(["IL_OPERATOR"], threshold=0)).get("/api/v1/fields")
+    data = resp.json()
+
+    assert len(data) == 100
+    assert all(row["field_id"].startswith("FR-") and "farmer_phone" not in row for row in data)
+
+
+def test_middleware_buffers_chunked_objects() -> None:
+    resp = TestClient(_app(["PILOT"])).get("/api/v1/missions/m1")
+
+    assert resp.json() == _redact_dict({"mission_id": "m1", "phone": "05321234567"})
+    assert resp.headers["content-length"] == str(len(resp.content))
+    assert "x-correlation-id" in resp.headers
@@ -0,0 +1,102 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: ApprovePayment command handler outbox testleri.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+
+from src.application.commands import approve_payment
+from src.core.domain.events.base import DomainEvent
+from src.core.domain.events.payment_events import PaymentApproved
+from src.core.domain.events.registry import build_default_registry
+
+
+@dataclass
+class _PaymentService:
+    approved: list[str] = field(default_factory=list)
+
+    def get_payment_intent(self, *, payment_intent_id: str) -> dict[str, Any] | None:
+        return {"payment_intent_id": payment_intent_id, "status": "pending"}
+
+    def approve_payment(self, *, payment_intent_id: str, **_: str) -> dict[str, Any]:
+        self.approved.append(payment_intent_id)
+        return {"payment_intent_id": payment_intent_id, "status": "paid"}
+
+
+class _Validator:
+    def validate(self, *, schema_key: str, payload: dict[str, Any]) -> None:
+        pass
+
+
+class _Audit:
+    def log(self, **_: Any) -> None:
+        pass
+
+
+class _Outbox:
+    def __init__(self) -> None:
+        self.events: list[tuple[dict[str, Any], str | None]] = []
+
+    def collect(self, event: DomainEvent, *, correlation_id: str | None = None) -> None:
+        # JSONB sütununa yazılıp okunmuş gibi
+        self.events.append((json.loads(json.dumps(event.to_dict())), correlation_id))
+
+
+@dataclass
+class _Deps:
+    payment_service: _PaymentService
+    outbox: _Outbox
+    contract_validator: _Validator = field(default_factory=_Validator)
+    audit_log: _Audit = field(default_factory=_Audit)
+    idempotency: None = None
+
+
+def _ctx(actor_id: str) -> approve_payment.RequestContext:
+    return approve_payment.RequestContext(actor_id=actor_id, roles=("finance",), correlation_id="corr-ap")
+
+
+def _cmd(payment_intent_id: str) -> approve_payment.ApprovePaymentCommand:
+    return approve_payment.ApprovePaymentCommand(
+        payment_intent_id=payment_intent_id, payment_ref="ref-1", receipt_ref="rcpt-1"
+    )
+
+
+def test_payment_approved_outbox_body_round_trips_through_registry() -> None:
+    intent_id, actor_id = uuid.uuid4(), uuid.uuid4()
+    deps = _Deps(_PaymentService(), _Outbox())
+
+    approve_payment.handle(_cmd(str(intent_id)), ctx=_ctx(str(actor_id)), deps=deps)
+
+    [(body, correlation_id)] = deps.outbox.events
+    decoded = build_default_registry().decode(body)
+    assert isinstance(decoded, PaymentApproved)
+    assert (decoded.payment_intent_id, decoded.approved_by) == (intent_id, actor_id)
+    assert correlation_id == "corr-ap"
+
+
+def test_non_uuid_ids_are_rejected_before_approval() -> None:
+    deps = _Deps(_PaymentService(), _Outbox())
+
+    with pytest.raises(ValueError, match="invalid_payment_intent_id"):
+        approve_payment.handle(_cmd("pi-1"), ctx=_ctx(str(uuid.uuid4())), deps=deps)
+    with pytest.raises(ValueError, match="invalid_actor_id"):
+        approve_payment.handle(_cmd(str(uuid.uuid4())), ctx=_ctx("admin-1"), deps=deps)
+
+    assert deps.payment_service.approved == []
+    assert deps.outbox.events == []
@@ -14,12 +14,19 @@ Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import uuid
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
 
 import importlib
 
+from src.core.domain.entities.mission import AssignmentSource
+from src.core.domain.events.base import DomainEvent
+from src.core.domain.events.registry import build_default_registry
+
 
 @dataclass
 class _MissionService:
@@ -70,6 +77,16 @@ class _Deps:
     contract_validator: _ContractValidator
     audit_log: _Audit
     idempotency: _Idempotency | None
+    outbox: _Outbox | None = None
+    availability_cache: _AvailabilityCache | None = None
+
+
+@dataclass
+class _AvailabilityCache:
+    invalidated: list[str | None] = field(default_factory=list)
+
+    def invalidate(self, pilot_id: str | None = None) -> None:
+        self.invalidated.append(pilot_id)
 
 
 def _load_assign_module():
@@ -117,3 +134,93 @@ def test_assign_mission_runs_capacity_and_audit() -> None:
     assert deps.planning_capacity.calls == 1
     assert deps.mission_service.calls == 1
     assert deps.audit_log.calls == 1
+
+
+class _Outbox:
+    """SqlAlchemyUnitOfWork.collect gibi gövdeyi event.to_dict() ile yazar."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, dict[str, Any], str | None]] = []
+
+    def collect(self, event: DomainEvent, *, correlation_id: str | None = None) -> None:
+        self.events.append((event.event_type, event.to_dict(), correlation_id))
+
+
+_FIELD_ID = uuid.UUID("00000000-0000-0000-0000-0000000000f3")
+
+
+@dataclass
+class _FieldMissionService(_MissionService):
+    def assign_mission(self, *, mission_id: str, pilot_id: str, correlation_id: str) -> dict[str, str]:
+        assigned = super().assign_mission(mission_id=mission_id, pilot_id=pilot_id, correlation_id=correlation_id)
+        return {**assigned, "field_id": str(_FIELD_ID), "assignment_source": "PULL"}
+
+
+def test_assign_mission_outbox_payload_round_trips_full_event() -> None:
+    assign_mission = _load_assign_module()
+    outbox = _Outbox()
+    deps = _Deps(_FieldMissionService(), _PlanningCapacity(), _ContractValidator(), _Audit(), None, outbox=outbox)
+    mission_id, pilot_id = uuid.uuid4(), uuid.uuid4()
+    cmd = assign_mission.AssignMissionCommand(mission_id=str(mission_id), pilot_id=str(pilot_id))
+
+    assign_mission.handle(cmd, ctx=_ctx(assign_mission, "dispatcher"), deps=deps)
+
+    [(event_type, payload, correlation_id)] = outbox.events
+    assert (event_type, correlation_id) == ("MissionAssigned", "corr-1")
+    decoded = build_default_registry().decode(payload)
+    assert (decoded.mission_id, decoded.pilot_id, decoded.field_id) == (mission_id, pilot_id, _FIELD_ID)
+    assert decoded.assignment_source == "PULL"
+    assert str(decoded.event_id) == payload["event_id"]
+
+
+def test_assign_mission_rejects_non_uuid_ids_before_assigning() -> None:
+    assign_mission = _load_assign_module()
+    outbox, cache = _Outbox(), _AvailabilityCache()
+    service = _FieldMissionService()
+    deps = _Deps(service, _PlanningCapacity(), _ContractValidator(), _Audit(), None, outbox, cache)
+    cmd = assign_mission.AssignMissionCommand(mission_id="m5", pilot_id=str(uuid.uuid4()))
+
+    with pytest.raises(ValueError, match="invalid_mission_id"):
+        assign_mission.handle(cmd, ctx=_ctx(assign_mission, "dispatcher"), deps=deps)
+
+    assert (service.calls, outbox.events, cache.invalidated) == (0, [], [])
+
+
+def test_assign_mission_without_field_id_fails_before_outbox_and_cache() -> None:
+    assign_mission = _load_assign_module()
+    outbox, cache = _Outbox(), _AvailabilityCache()
+    deps = _Deps(_MissionService(), _PlanningCapacity(), _ContractValidator(), _Audit(), None, outbox, cache)
+    cmd = assign_mission.AssignMissionCommand(mission_id=str(uuid.uuid4()), pilot_id=str(uuid.uuid4()))
+
+    with pytest.raises(ValueError, match="mission_field_id_missing"):
+        assign_mission.handle(cmd, ctx=_ctx(assign_mission, "dispatcher"), deps=deps)
+
+    assert (outbox.events, cache.invalidated) == ([], [])
+
+
+def test_assign_mission_reads_field_id_from_mission_entity() -> None:
+    assign_mission = _load_assign_module()
+    outbox = _Outbox()
+
+    class _EntityMissionService(_MissionService):
+        def assign_mission(self, *, mission_id: str, pilot_id: str, correlation_id: str) -> Any:
+            return SimpleNamespace(field_id=_FIELD_ID, assignment_source=AssignmentSource.PULL, status="assigned")
+
+    deps = _Deps(_EntityMissionService(), _PlanningCapacity(), _ContractValidator(), _Audit(), None, outbox=outbox)
+    cmd = assign_mission.AssignMissionCommand(mission_id=str(uuid.uuid4()), pilot_id=str(uuid.uuid4()))
+
+    assign_mission.handle(cmd, ctx=_ctx(assign_mission, "dispatcher"), deps=deps)
+
+    [(_, payload, _)] = outbox.events
+    assert (payload["field_id"], payload["assignment_source"]) == (str(_FIELD_ID), "PULL")
+
+
+def test_assign_mission_invalidates_pilot_availability() -> None:
+    assign_mission = _load_assign_module()
+    cache = _AvailabilityCache()
+    deps = _Deps(_MissionService(), _PlanningCapacity(), _ContractValidator(), _Audit(), None, availability_cache=cache)
+    cmd = assign_mission.AssignMissionCommand(mission_id="m4", pilot_id="p4")
+
+    assign_mission.handle(cmd, ctx=_ctx(assign_mission, "dispatcher"), deps=deps)
+
+    assert cache.invalidated == ["p4"]
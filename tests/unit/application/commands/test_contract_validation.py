@@ -148,6 +148,8 @@ class _AssignMissionDeps:
     contract_validator: Any
     audit_log: Any
     idempotency: Any = None
+    outbox: Any = None
+    availability_cache: Any = None
 
 
 @dataclass
@@ -156,6 +158,7 @@ class _ApprovePaymentDeps:
     contract_validator: Any
     audit_log: Any
     idempotency: Any = None
+    outbox: Any = None
 
 
 @dataclass
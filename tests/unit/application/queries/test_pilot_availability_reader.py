@@ -0,0 +1,63 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-015: Pilot müsaitlik okuyucusu; pilot başına okuma ve komutlardan gelen geçersizleme.
+"""PilotCapacityAvailabilityReader tests."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from dataclasses import dataclass, field
+from datetime import date
+
+from src.application.queries.get_pilot_available_slots import PilotCapacityAvailabilityReader
+from src.core.domain.services.capacity_manager import PilotAssignment, PilotCapacity
+
+_PILOT = uuid.uuid4()
+_MONDAY = date(2026, 1, 5)
+
+
+@dataclass
+class _Source:
+    capacity: int = 2
+    assignments: list[PilotAssignment] = field(default_factory=list)
+    reads: list[uuid.UUID] = field(default_factory=list)
+
+    async def get_pilot_capacity(self, *, pilot_id: uuid.UUID) -> PilotCapacity | None:
+        self.reads.append(pilot_id)
+        if pilot_id != _PILOT:
+            return None
+        return PilotCapacity(
+            pilot_id=pilot_id,
+            work_days=frozenset({0, 1}),
+            daily_capacity=self.capacity,
+            province_code="42",
+        )
+
+    async def list_assignments(self, *, pilot_id: uuid.UUID, start_date: date, end_date: date) -> list[PilotAssignment]:
+        return [a for a in self.assignments if a.pilot_id == pilot_id]
+
+
+def _slots(reader: PilotCapacityAvailabilityReader, pilot_id: uuid.UUID = _PILOT) -> list[tuple[date, int]]:
+    slots = asyncio.run(reader.list_available_slots(pilot_id=str(pilot_id), start_date=_MONDAY, end_date=_MONDAY))
+    return [(slot.date, slot.remaining_capacity) for slot in slots]
+
+
+def test_reader_queries_only_requested_pilot() -> None:
+    source = _Source()
+    reader = PilotCapacityAvailabilityReader(source)
+
+    assert _slots(reader) == [(_MONDAY, 2)]
+    assert _slots(reader, uuid.uuid4()) == []
+    assert len(source.reads) == 2
+
+
+def test_invalidate_drops_cached_pilot_slots() -> None:
+    source = _Source()
+    reader = PilotCapacityAvailabilityReader(source)
+    assert _slots(reader) == [(_MONDAY, 2)]
+
+    source.assignments.append(PilotAssignment(pilot_id=_PILOT, mission_id=uuid.uuid4(), scheduled_date=_MONDAY))
+    assert _slots(reader) == [(_MONDAY, 2)]  # TTL içinde önbellekten
+
+    reader.invalidate(str(_PILOT))
+    assert _slots(reader) == [(_MONDAY, 1)]
@@ -0,0 +1,129 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-015: Province-sharded weekly planning must match the single-process plan.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import uuid
+from datetime import date, timedelta
+
+import pytest
+
+from src.application.jobs.weekly_planning_job import ShardedWeeklyPlanningJob
+from src.application.services.province_shard_planner import ProvinceShardPlanner, ShardedScheduleResult
+from src.core.domain.services.planning_engine import MissionDemand, PilotSlot, PlanningEngine
+
+
+def _workload() -> tuple[list[MissionDemand], list[PilotSlot]]:
+    rng = random.Random(5)
+    start = date(2026, 4, 6)
+    provinces = ["06", "34", "42"]
+    pilots = [(uuid.UUID(int=rng.getrandbits(128)), rng.choice(provinces)) for _ in range(9)]
+    slots = [
+        PilotSlot(
+            pilot_id=pid,
+            date=start + timedelta(days=day),
+            province_code=province,
+            remaining_capacity=rng.randint(0, 3),
+            daily_capacity=3,
+        )
+        for pid, province in pilots
+        for day in range(7)
+    ]
+    demands = [
+        MissionDemand(
+            demand_id=uuid.UUID(int=rng.getrandbits(128)),
+            field_id=uuid.UUID(int=rng.getrandbits(128)),
+            province_code=rng.choice([*provinces, "01"]),
+            crop_type="WHEAT",
+            area_m2=1000,
+            priority=rng.randint(0, 3),
+            earliest_date=start + timedelta(days=rng.randint(0, 6)),
+            latest_date=start + timedelta(days=6),
+            estimated_duration_minutes=30,
+        )
+        for _ in range(120)
+    ]
+    return demands, slots
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_sharded_plan_matches_single_process_plan(max_workers: int) -> None:
+    demands, slots = _workload()
+
+    sharded = ProvinceShardPlanner(max_workers=max_workers, engine="greedy").plan(demands, slots)
+
+    assert sharded.result == PlanningEngine().optimize_schedule(demands, slots)
+    assert [s.province_code for s in sharded.shards] == ["01", "06", "34", "42"]
+    assert sum(s.demand_count for s in sharded.shards) == len(demands)
+    assert sum(s.scheduled_count for s in sharded.shards) == len(sharded.result.scheduled)
+
+
+def test_shard_planner_validates_options() -> None:
+    with pytest.raises(ValueError, match="max_workers"):
+        ProvinceShardPlanner(max_workers=0)
+    with pytest.raises(ValueError, match="engine"):
+        ProvinceShardPlanner(engine="simplex")
+
+
+class _Planner:
+    def __init__(self, outcome: ShardedScheduleResult) -> None:
+        self.outcome = outcome
+        self.max_workers: int | None = None
+
+    async def plan_week_sharded(
+        self,
+        *,
+        week_start: date,
+        correlation_id: str,
+        max_workers: int,
+    ) -> ShardedScheduleResult:
+        self.max_workers = max_workers
+        return self.outcome
+
+
+class _AuditWriter:
+    def __init__(self) -> None:
+        self.shards: list[tuple[str, int, int]] = []
+        self.jobs: list[tuple[str, int]] = []
+
+    async def append_job_log(self, *, correlation_id: str, outcome: str, affected_count: int) -> None:
+        self.jobs.append((outcome, affected_count))
+
+    async def append_shard_log(
+        self,
+        *,
+        correlation_id: str,
+        province_code: str,
+        demand_count: int,
+        scheduled_count: int,
+        unscheduled_count: int,
+        elapsed_ms: float,
+    ) -> None:
+        self.shards.append((province_code, demand_count, scheduled_count))
+
+
+def test_sharded_weekly_planning_job_logs_each_shard() -> None:
+    demands, slots = _workload()
+    outcome = ProvinceShardPlanner().plan(demands, slots)
+    planner, writer = _Planner(outcome), _AuditWriter()
+    job = ShardedWeeklyPlanningJob(planner=planner, audit_writer=writer, max_workers=4)
+
+    planned = asyncio.run(job.run(week_start=date(2026, 4, 6), correlation_id="corr-1"))
+
+    assert planned == len(outcome.result.scheduled)
+    assert planner.max_workers == 4
+    assert [s[0] for s in writer.shards] == [s.province_code for s in outcome.shards]
+    assert writer.jobs == [("SUCCESS", planned)]
@@ -0,0 +1,125 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-015: ReplanQueueWorker artımlı replan farkı tüketim testleri.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date
+
+from src.application.workers.replan_queue_worker import ReplanQueueWorker, ReplanTask
+from src.core.domain.services.planning_engine import ScheduledSlot, ScheduleDiff
+
+
+class _Queue:
+    def __init__(self, task: ReplanTask) -> None:
+        self.task: ReplanTask | None = task
+        self.acked: list[str] = []
+        self.nacked: list[str] = []
+
+    def pop(self, queue_name: str) -> ReplanTask | None:
+        task, self.task = self.task, None
+        return task
+
+    def ack(self, queue_name: str, task_id: str) -> None:
+        self.acked.append(task_id)
+
+    def nack(self, queue_name: str, task_id: str, *, requeue: bool) -> None:
+        self.nacked.append(task_id)
+
+
+class _Replanner:
+    def __init__(self, diff: ScheduleDiff | None) -> None:
+        self.diff = diff
+
+    def replan(self, *, mission_id: str, reason: str, correlation_id: str) -> ScheduleDiff | None:
+        return self.diff
+
+
+class _Sink:
+    def __init__(self) -> None:
+        self.applied: list[tuple[ScheduleDiff, str]] = []
+
+    def apply(self, *, diff: ScheduleDiff, correlation_id: str) -> None:
+        self.applied.append((diff, correlation_id))
+
+
+def _task() -> ReplanTask:
+    return ReplanTask(task_id="t-1", mission_id="m-1", reason="WEATHER_BLOCK", correlation_id="c-1")
+
+
+def test_replan_worker_forwards_non_empty_diff_to_sink() -> None:
+    slot = ScheduledSlot(
+        demand_id=uuid.uuid4(),
+        field_id=uuid.uuid4(),
+        pilot_id=uuid.uuid4(),
+        scheduled_date=date(2026, 1, 2),
+        estimated_duration_minutes=30,
+    )
+    diff = ScheduleDiff(added=(slot,), moved=(), dropped=())
+    queue, sink = _Queue(_task()), _Sink()
+
+    assert ReplanQueueWorker(queue=queue, replanner=_Replanner(diff), diff_sink=sink).run_once() is True
+
+    assert sink.applied == [(diff, "c-1")]
+    assert queue.acked == ["t-1"]
+
+
+def test_replan_worker_skips_sink_for_empty_or_missing_diff() -> None:
+    for diff in (None, ScheduleDiff(added=(), moved=(), dropped=())):
+        queue, sink = _Queue(_task()), _Sink()
+
+        ReplanQueueWorker(queue=queue, replanner=_Replanner(diff), diff_sink=sink).run_once()
+
+        assert sink.applied == []
+        assert queue.acked == ["t-1"]
+
+
+def test_replan_worker_acks_replan_and_retries_only_diff_delivery() -> None:
+    class _FlakySink(_Sink):
+        def __init__(self) -> None:
+            super().__init__()
+            self.failures = 1
+
+        def apply(self, *, diff: ScheduleDiff, correlation_id: str) -> None:
+            if self.failures:
+                self.failures -= 1
+                raise ConnectionError("broker down")
+            super().apply(diff=diff, correlation_id=correlation_id)
+
+    class _CountingReplanner(_Replanner):
+        calls = 0
+
+        def replan(self, *, mission_id: str, reason: str, correlation_id: str) -> ScheduleDiff | None:
+            self.calls += 1
+            return self.diff
+
+    slot = ScheduledSlot(
+        demand_id=uuid.uuid4(),
+        field_id=uuid.uuid4(),
+        pilot_id=uuid.uuid4(),
+        scheduled_date=date(2026, 1, 2),
+        estimated_duration_minutes=30,
+    )
+    diff = ScheduleDiff(added=(slot,), moved=(), dropped=())
+    queue, sink, replanner = _Queue(_task()), _FlakySink(), _CountingReplanner(diff)
+    worker = ReplanQueueWorker(queue=queue, replanner=replanner, diff_sink=sink)
+
+    assert worker.run_once() is True
+    assert (queue.acked, queue.nacked, sink.applied) == (["t-1"], [], [])
+    assert worker.pending_diff_count == 1
+
+    assert worker.run_once() is False  # kuyruk boş; bekleyen fark yine de teslim edilir
+    assert sink.applied == [(diff, "c-1")]
+    assert worker.pending_diff_count == 0
+    assert replanner.calls == 1
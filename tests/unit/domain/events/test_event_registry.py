@@ -0,0 +1,120 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: EventRegistry — to_dict() gövdesinden tipli event yeniden oluşturma testleri.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from datetime import date
+
+import pytest
+
+import src.core.domain.events as events
+from src.core.domain.events import (
+    AnalysisRequested,
+    DomainEvent,
+    EventRegistry,
+    MissionAssigned,
+    MissionScheduled,
+    build_default_registry,
+)
+
+_EVENT_NAMES = [
+    name for name in events.__all__ if name not in {"DomainEvent", "EventRegistry", "build_default_registry"}
+]
+
+
+@pytest.mark.parametrize("name", _EVENT_NAMES)
+def test_every_exported_event_round_trips_through_json(name: str) -> None:
+    registry = build_default_registry()
+    original = getattr(events, name)()
+
+    decoded = registry.decode(json.loads(json.dumps(original.to_dict())))
+
+    assert type(decoded) is type(original)
+    assert decoded == original
+
+
+def test_default_registry_covers_all_exported_events() -> None:
+    registry = build_default_registry()
+
+    assert len(registry) == len(_EVENT_NAMES)
+    assert all(name in registry for name in _EVENT_NAMES)
+
+
+def test_field_types_are_restored() -> None:
+    event = AnalysisRequested(crop_type="WHEAT", available_bands=("red", "nir"))
+
+    decoded = build_default_registry().decode(json.loads(json.dumps(event.to_dict())))
+
+    assert isinstance(decoded, AnalysisRequested)
+    assert isinstance(decoded.mission_id, uuid.UUID)
+    assert decoded.available_bands == ("red", "nir")
+    assert decoded.occurred_at == event.occurred_at
+
+
+def test_plain_defaults_fill_missing_fields_and_extra_keys_are_ignored() -> None:
+    event = MissionAssigned(assignment_source="PULL")
+    body = {**event.to_dict(), "correlation_id": "c-1"}
+    del body["assignment_source"]
+
+    decoded = build_default_registry().decode(body)
+
+    assert isinstance(decoded, MissionAssigned)
+    assert decoded.event_id == event.event_id
+    assert decoded.assignment_source == ""
+
+
+def test_missing_id_field_raises_instead_of_generating_one() -> None:
+    body = MissionAssigned(assignment_source="PULL").to_dict()
+    del body["field_id"]
+
+    with pytest.raises(ValueError, match="field_id"):
+        build_default_registry().decode(body)
+
+
+def test_unknown_event_type_decodes_to_base_envelope() -> None:
+    envelope = DomainEvent().to_dict()
+
+    decoded = build_default_registry().decode({**envelope, "event_type": "SomethingNew"})
+
+    assert type(decoded) is DomainEvent
+    assert str(decoded.event_id) == envelope["event_id"]
+
+
+def test_invalid_field_value_raises_value_error() -> None:
+    body = {**MissionAssigned().to_dict(), "mission_id": "not-a-uuid"}
+
+    with pytest.raises(ValueError):
+        build_default_registry().decode(body)
+
+
+def test_optional_date_fields_accept_null_and_iso_strings() -> None:
+    registry = build_default_registry()
+    body = MissionScheduled().to_dict()
+
+    unscheduled = registry.decode({**body, "scheduled_date": None})
+    scheduled = registry.decode({**body, "scheduled_date": "2026-05-01"})
+
+    assert isinstance(scheduled, MissionScheduled)
+    assert unscheduled.scheduled_date is None  # type: ignore[attr-defined]
+    assert scheduled.scheduled_date == date(2026, 5, 1)
+
+
+def test_registering_a_different_class_under_same_name_is_rejected() -> None:
+    registry = EventRegistry([MissionAssigned])
+    duplicate = type("MissionAssigned", (DomainEvent,), {})
+
+    with pytest.raises(ValueError):
+        registry.register(duplicate)
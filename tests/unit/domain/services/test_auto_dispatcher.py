@@ -0,0 +1,80 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-015: AutoDispatcher yük dengeli ve kapasite kontrollü atama testleri.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+
+from src.core.domain.services.auto_dispatcher import AutoDispatcher
+from src.core.domain.value_objects.crop_ops_profile import CropOpsProfile
+from src.core.domain.value_objects.crop_type import CropType
+
+
+@dataclass
+class _Mission:
+    id: str
+    territory_id: str
+    scheduled_date: str
+    area_donum: int
+
+
+@dataclass
+class _Pilot:
+    id: str
+    territory_id: str
+    reliability_score: float
+
+
+def _profile() -> CropOpsProfile:
+    return CropOpsProfile.create_default(CropType(code="PAMUK"))
+
+
+def test_dispatch_balanced_spreads_missions_across_pilots() -> None:
+    pilots = [_Pilot("p-1", "T1", 0.99), _Pilot("p-2", "T1", 0.80), _Pilot("p-3", "T1", 0.70)]
+    missions = [_Mission(f"m-{i}", "T1", "2026-05-04", 100) for i in range(9)]
+
+    decisions = AutoDispatcher().dispatch_balanced(missions, pilots, _profile())
+
+    assert Counter(d.pilot_id for d in decisions) == {"p-1": 3, "p-2": 3, "p-3": 3}
+    assert decisions[0].pilot_id == "p-1"
+
+
+def test_dispatch_balanced_respects_daily_seed_quota() -> None:
+    profile = _profile()
+    pilots = [_Pilot("p-1", "T1", 0.9)]
+    missions = [
+        _Mission("m-1", "T1", "2026-05-04", 1000),
+        _Mission("m-2", "T1", "2026-05-04", 1000),
+        _Mission("m-3", "T1", "2026-05-05", 1000),
+    ]
+
+    decisions = AutoDispatcher().dispatch_balanced(
+        missions,
+        pilots,
+        profile,
+        existing_load_donum={("p-1", "2026-05-05"): profile.system_seed_quota - 500},
+    )
+
+    assert [d.mission_id for d in decisions] == ["m-1"]
+
+
+def test_dispatch_balanced_skips_territory_without_pilots() -> None:
+    decisions = AutoDispatcher().dispatch_balanced(
+        [_Mission("m-1", "T9", "2026-05-04", 10)],
+        [_Pilot("p-1", "T1", 0.9)],
+        _profile(),
+    )
+
+    assert decisions == []
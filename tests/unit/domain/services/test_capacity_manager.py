@@ -1,4 +1,5 @@
 # BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-015: CapacityManager müsaitlik, kullanım ve filo kapasite raporu testleri.
 """
 Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
 Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
@@ -14,7 +15,7 @@ Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez
 from __future__ import annotations
 
 import uuid
-from datetime import date
+from datetime import date, timedelta
 
 import pytest
 
@@ -63,3 +64,62 @@ def test_capacity_manager_rejects_invalid_date_range() -> None:
 
     with pytest.raises(CapacityError, match="start_date"):
         manager.find_available_slots(pilot, date(2026, 1, 2), date(2026, 1, 1), [])
+
+
+def test_capacity_manager_fleet_capacity_matches_per_pilot_queries() -> None:
+    import random
+
+    rng = random.Random(3)
+    manager = CapacityManager()
+    start, end = date(2026, 3, 2), date(2026, 3, 29)
+    pilots = [
+        PilotCapacity(
+            pilot_id=uuid.uuid4(),
+            work_days=frozenset(rng.sample(range(7), rng.randint(0, 7))),
+            daily_capacity=rng.randint(1, 4),
+            province_code="42",
+        )
+        for _ in range(8)
+    ]
+    assignments = [
+        PilotAssignment(
+            pilot_id=rng.choice(pilots).pilot_id,
+            mission_id=uuid.uuid4(),
+            scheduled_date=date(2026, 3, 1) + timedelta(days=rng.randint(0, 30)),
+        )
+        for _ in range(300)
+    ]
+
+    report = manager.fleet_capacity(pilots, start, end, assignments)
+
+    for pilot in pilots:
+        expected_slots = []
+        used = capacity = 0
+        day = start
+        while day <= end:
+            check = manager.check_availability(pilot, day, assignments)
+            assert report.remaining_capacity(pilot.pilot_id, day) == check.remaining
+            if check.is_available:
+                expected_slots.append((day, check.remaining))
+            if day.weekday() in pilot.work_days:
+                capacity += pilot.daily_capacity
+                used += min(check.current_load, pilot.daily_capacity)
+            day += timedelta(days=1)
+
+        slots = manager.find_available_slots(pilot, start, end, assignments)
+        assert [(s.date, s.remaining_capacity) for s in slots] == expected_slots
+        assert report.utilization[pilot.pilot_id] == (used / capacity if capacity else 0.0)
+        assert manager.calculate_utilization(pilot, start, end, assignments) == report.utilization[pilot.pilot_id]
+
+
+def test_capacity_manager_zero_capacity_keeps_legacy_semantics() -> None:
+    manager = CapacityManager()
+    pilot = PilotCapacity(pilot_id=uuid.uuid4(), work_days=frozenset({0}), daily_capacity=0, province_code="42")
+    start, end = date(2026, 1, 5), date(2026, 1, 11)
+
+    report = manager.fleet_capacity([pilot], start, end, [])
+
+    assert report.available_slots(pilot.pilot_id) == []
+    assert manager.calculate_utilization(pilot, start, end, []) == 0.0
+    with pytest.raises(CapacityError, match="daily_capacity"):
+        manager.find_available_slots(pilot, start, end, [])
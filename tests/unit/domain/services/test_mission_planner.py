@@ -0,0 +1,112 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-015: MissionPlanner toplu ve akış (streaming) planlama testleri.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import uuid
+from collections.abc import AsyncIterator
+from datetime import date, timedelta
+
+import pytest
+
+from src.core.domain.services.mission_planner import (
+    MissionPlanner,
+    MissionPlanningError,
+    MissionPriority,
+    MissionRequest,
+    PlannedMission,
+)
+
+_PRIORITIES = [MissionPriority.CRITICAL, MissionPriority.HIGH, MissionPriority.NORMAL, MissionPriority.LOW]
+
+
+async def _stream(requests: list[MissionRequest]) -> AsyncIterator[MissionRequest]:
+    for request in requests:
+        yield request
+
+
+def _collect(
+    planner: MissionPlanner,
+    requests: list[MissionRequest],
+    available: list[date],
+    existing: dict[uuid.UUID, set[date]] | None = None,
+) -> tuple[list[PlannedMission], list[str]]:
+    warnings: list[str] = []
+
+    async def _run() -> list[PlannedMission]:
+        return [
+            mission
+            async for mission in planner.plan_missions_stream(
+                _stream(requests),
+                available,
+                existing,
+                on_unplanned=lambda _request, warning: warnings.append(warning),
+            )
+        ]
+
+    return asyncio.run(_run()), warnings
+
+
+def test_mission_planner_stream_matches_batch_plan() -> None:
+    rng = random.Random(9)
+    planner = MissionPlanner()
+    start = date(2026, 5, 4)
+    fields = [uuid.uuid4() for _ in range(15)]
+    available = [start + timedelta(days=d) for d in range(20) if rng.random() < 0.7]
+    existing = {fields[0]: {available[0], available[1]}, fields[1]: {start - timedelta(days=3)}}
+    requests = []
+    for _ in range(200):
+        earliest = start + timedelta(days=rng.randint(-2, 18))
+        requests.append(
+            MissionRequest(
+                field_id=rng.choice(fields),
+                subscription_id=None,
+                crop_type="WHEAT",
+                province_code="42",
+                area_m2=rng.uniform(1_000, 500_000),
+                priority=rng.choice(_PRIORITIES),
+                earliest_date=earliest if rng.random() < 0.9 else None,
+                latest_date=earliest + timedelta(days=rng.randint(0, 5)) if rng.random() < 0.9 else None,
+            )
+        )
+    grouped = sorted(requests, key=lambda r: _PRIORITIES.index(r.priority))
+
+    batch = planner.plan_missions(requests, available, existing)
+    streamed, warnings = _collect(planner, grouped, available, existing)
+
+    def _key(m: PlannedMission) -> tuple[uuid.UUID, date, MissionPriority, int]:
+        return (m.field_id, m.planned_date, m.priority, m.estimated_duration_minutes)
+
+    assert [_key(m) for m in streamed] == [_key(m) for m in batch.planned_missions]
+    assert warnings == list(batch.warnings)
+
+
+def test_mission_planner_stream_rejects_out_of_order_priorities() -> None:
+    planner = MissionPlanner()
+    day = date(2026, 5, 4)
+
+    def _request(priority: MissionPriority) -> MissionRequest:
+        return MissionRequest(
+            field_id=uuid.uuid4(),
+            subscription_id=None,
+            crop_type="WHEAT",
+            province_code="42",
+            area_m2=10_000,
+            priority=priority,
+        )
+
+    with pytest.raises(MissionPlanningError, match="öncelik sırasına"):
+        _collect(planner, [_request(MissionPriority.LOW), _request(MissionPriority.CRITICAL)], [day])
@@ -0,0 +1,106 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-015: OptimalPlanningEngine global atama davranış testleri.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.domain.services import optimal_planning_engine
+from src.core.domain.services.optimal_planning_engine import OptimalPlanningEngine
+from src.core.domain.services.planning_engine import MissionDemand, PilotSlot, PlanningEngine, PlanningEngineError
+
+
+def _demand(priority: int, earliest: date, latest: date) -> MissionDemand:
+    return MissionDemand(
+        demand_id=uuid.uuid4(),
+        field_id=uuid.uuid4(),
+        province_code="42",
+        crop_type="WHEAT",
+        area_m2=1000,
+        priority=priority,
+        earliest_date=earliest,
+        latest_date=latest,
+        estimated_duration_minutes=30,
+    )
+
+
+def _slot(pilot_id: uuid.UUID, day: date, capacity: int = 1) -> PilotSlot:
+    return PilotSlot(
+        pilot_id=pilot_id,
+        date=day,
+        province_code="42",
+        remaining_capacity=capacity,
+        daily_capacity=capacity,
+    )
+
+
+def test_optimal_engine_places_tight_window_demand_greedy_drops() -> None:
+    flexible = _demand(0, date(2026, 1, 1), date(2026, 1, 2))
+    tight = _demand(1, date(2026, 1, 1), date(2026, 1, 1))
+    slots = [_slot(uuid.uuid4(), date(2026, 1, 1)), _slot(uuid.uuid4(), date(2026, 1, 2))]
+
+    greedy = PlanningEngine().optimize_schedule([flexible, tight], slots)
+    optimal = OptimalPlanningEngine().optimize_schedule([flexible, tight], slots)
+
+    assert greedy.unscheduled == (tight.demand_id,)
+    assert optimal.unscheduled == ()
+    placed = {s.demand_id: s.scheduled_date for s in optimal.scheduled}
+    assert placed == {flexible.demand_id: date(2026, 1, 2), tight.demand_id: date(2026, 1, 1)}
+
+
+def test_optimal_engine_prefers_priority_under_contention() -> None:
+    low = _demand(3, date(2026, 1, 1), date(2026, 1, 1))
+    high = _demand(0, date(2026, 1, 1), date(2026, 1, 1))
+    slots = [_slot(uuid.uuid4(), date(2026, 1, 1))]
+
+    result = OptimalPlanningEngine().optimize_schedule([low, high], slots)
+
+    assert [s.demand_id for s in result.scheduled] == [high.demand_id]
+    assert result.unscheduled == (low.demand_id,)
+
+
+def test_optimal_engine_respects_pilot_capacity_and_balances_load() -> None:
+    pilot_a, pilot_b = uuid.uuid4(), uuid.uuid4()
+    demands = [_demand(0, date(2026, 1, 1), date(2026, 1, 1)) for _ in range(4)]
+    slots = [_slot(pilot_a, date(2026, 1, 1), capacity=2), _slot(pilot_b, date(2026, 1, 1), capacity=2)]
+
+    result = OptimalPlanningEngine().optimize_schedule(demands, slots)
+
+    assert len(result.scheduled) == 4
+    assert result.pilot_utilization == {pilot_a: 1.0, pilot_b: 1.0}
+
+
+def test_optimal_engine_falls_back_to_greedy_when_time_budget_is_exceeded(monkeypatch: pytest.MonkeyPatch) -> None:
+    flexible = _demand(0, date(2026, 1, 1), date(2026, 1, 2))
+    tight = _demand(1, date(2026, 1, 1), date(2026, 1, 1))
+    slots = [_slot(uuid.uuid4(), date(2026, 1, 1)), _slot(uuid.uuid4(), date(2026, 1, 2))]
+    # İlk okuma deadline'ı kurar; sonraki okuma bütçenin çoktan aşıldığını görür
+    clock = iter([0.0, 10.0])
+    monkeypatch.setattr(optimal_planning_engine, "time", SimpleNamespace(monotonic=lambda: next(clock)))
+
+    result = OptimalPlanningEngine(time_budget_seconds=0.5).optimize_schedule([flexible, tight], slots)
+
+    greedy = PlanningEngine().optimize_schedule_indexed([flexible, tight], slots)
+    assert result.unscheduled == greedy.unscheduled == (tight.demand_id,)
+    assert [s.demand_id for s in result.scheduled] == [s.demand_id for s in greedy.scheduled]
+    assert result.warnings[-1] == "Optimal planlama 0.5 sn zaman bütçesini aştı; greedy sonuç kullanıldı."
+
+
+def test_optimal_engine_validates_time_budget() -> None:
+    with pytest.raises(PlanningEngineError, match="time_budget_seconds"):
+        OptimalPlanningEngine(time_budget_seconds=0)
@@ -0,0 +1,134 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-015: PlanWindowSegmenter polygon segmentleme testleri.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from src.core.domain.services.coverage_calculator import CoverageCalculationError, Polygon
+from src.core.domain.services.plan_window_segmenter import PlanWindowSegmenter
+
+_LAT = 39.0
+_DLAT_PER_M = 1 / 110_540.0
+_DLON_PER_M = 1 / (111_320.0 * math.cos(math.radians(_LAT)))
+
+
+def _field(points_m: list[tuple[float, float]]) -> Polygon:
+    coords = tuple((32.0 + x * _DLON_PER_M, _LAT + y * _DLAT_PER_M) for x, y in points_m)
+    return Polygon(coordinates=(*coords, coords[0]))
+
+
+def _rectangle(width_m: float, height_m: float) -> Polygon:
+    return _field([(0, 0), (width_m, 0), (width_m, height_m), (0, height_m)])
+
+
+def _centroid_x(segment_polygon: Polygon) -> float:
+    ring = segment_polygon.coordinates[:-1]
+    return sum(lon for lon, _ in ring) / len(ring)
+
+
+def _shares_edge(a: Polygon, b: Polygon, tol: float = 1e-9) -> bool:
+    # Bitişik segmentler kesim çizgisi üzerinde en az iki ortak köşe paylaşır.
+    shared = sum(1 for p in a.coordinates[:-1] if any(math.dist(p, q) < tol for q in b.coordinates[:-1]))
+    return shared >= 2
+
+
+def test_small_field_stays_single_segment() -> None:
+    segments = PlanWindowSegmenter().segment_polygon(_rectangle(2000, 2000), ["p1", "p2"])
+
+    assert len(segments) == 1
+    assert segments[0].area_m2 == pytest.approx(4_000_000, rel=1e-3)
+    assert segments[0].assigned_pilot_id == "p1"
+
+
+@pytest.mark.parametrize("layout", ["strips", "grid"])
+def test_large_field_split_into_equal_area_segments(layout: str) -> None:
+    # 4 km x 3 km = 12.000 dönüm -> 2.500 dönümlük 5 segment
+    segments = PlanWindowSegmenter().segment_polygon(_rectangle(4000, 3000), layout=layout)
+
+    assert [s.segment_no for s in segments] == [1, 2, 3, 4, 5]
+    assert sum(s.area_m2 for s in segments) == pytest.approx(12_000_000, rel=1e-3)
+    for segment in segments:
+        assert segment.area_m2 == pytest.approx(2_400_000, rel=1e-3)
+
+
+def test_strips_are_ordered_and_contiguous_along_long_axis() -> None:
+    segments = PlanWindowSegmenter().segment_polygon(_rectangle(4000, 3000), layout="strips")
+
+    centroids = [_centroid_x(s.geometry) for s in segments]
+    assert centroids == sorted(centroids)
+    for left, right in zip(segments, segments[1:], strict=False):
+        assert _shares_edge(left.geometry, right.geometry)
+
+
+def test_grid_cells_follow_serpentine_order() -> None:
+    segments = PlanWindowSegmenter(threshold_donum=1000, segment_size_donum=1000).segment_polygon(
+        _rectangle(3000, 3000), layout="grid"
+    )
+
+    assert len(segments) == 9
+    for prev, nxt in zip(segments, segments[1:], strict=False):
+        assert _shares_edge(prev.geometry, nxt.geometry)
+
+
+def test_concave_field_area_is_preserved() -> None:
+    # L biçimli 3 km x 3 km parsel (5.000.000 m2)
+    field = _field([(0, 0), (3000, 0), (3000, 1000), (1000, 1000), (1000, 3000), (0, 3000)])
+
+    segments = PlanWindowSegmenter(threshold_donum=1000, segment_size_donum=1500).segment_polygon(field)
+
+    assert len(segments) == 4
+    assert sum(s.area_m2 for s in segments) == pytest.approx(5_000_000, rel=1e-3)
+    for segment in segments:
+        assert segment.area_m2 == pytest.approx(1_250_000, rel=1e-3)
+
+
+def _bbox_area_m2(segment_polygon: Polygon) -> float:
+    ring = segment_polygon.coordinates[:-1]
+    lons, lats = [lon for lon, _ in ring], [lat for _, lat in ring]
+    return (max(lons) - min(lons)) / _DLON_PER_M * (max(lats) - min(lats)) / _DLAT_PER_M
+
+
+@pytest.mark.parametrize(("layout", "arm_segments"), [("strips", 4), ("grid", 2)])
+def test_u_shaped_field_splits_disconnected_strips_into_separate_segments(layout: str, arm_segments: int) -> None:
+    # 3 km x 4 km U: 1 km taban + 1 km genişliğinde iki kol (9.000.000 m2)
+    field = _field([(0, 0), (3000, 0), (3000, 4000), (2000, 4000), (2000, 1000), (1000, 1000), (1000, 4000), (0, 4000)])
+
+    segments = PlanWindowSegmenter(threshold_donum=1000, segment_size_donum=2250).segment_polygon(field, layout=layout)
+
+    assert sum(s.area_m2 for s in segments) == pytest.approx(9_000_000, rel=1e-3)
+    assert all(s.area_m2 <= 2_250_000 * (1 + 1e-3) for s in segments)
+    # Kol bölgesindeki şeritler iki kopuk dikdörtgene ayrılır; köprü kenarlı tek halka kalmaz
+    arms = [s for s in segments if min(lat for _, lat in s.geometry.coordinates) > _LAT + 1000 * _DLAT_PER_M]
+    assert len(arms) == arm_segments
+    for arm in arms:
+        assert _bbox_area_m2(arm.geometry) == pytest.approx(arm.area_m2, rel=1e-3)
+        assert _bbox_area_m2(arm.geometry) <= 1000 * 4000 * (1 + 1e-3)
+
+
+def test_pilots_receive_contiguous_blocks() -> None:
+    segments = PlanWindowSegmenter(segment_size_donum=1000).segment_polygon(
+        _rectangle(4000, 3000), pilot_ids=["p1", "p2", "p3"]
+    )
+
+    pilots = [s.assigned_pilot_id for s in segments]
+    assert pilots == ["p1"] * 4 + ["p2"] * 4 + ["p3"] * 4
+    assert segments[0].to_mission_segment().assigned_pilot_id == "p1"
+
+
+def test_unknown_layout_rejected() -> None:
+    with pytest.raises(CoverageCalculationError):
+        PlanWindowSegmenter().segment_polygon(_rectangle(100, 100), layout="hex")
@@ -1,4 +1,5 @@
 # BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-015: PlanningEngine greedy ve indeksli planlama davranış testleri.
 """
 Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
 Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
@@ -18,7 +19,13 @@ from datetime import date
 
 import pytest
 
-from src.core.domain.services.planning_engine import MissionDemand, PilotSlot, PlanningEngine, PlanningEngineError
+from src.core.domain.services.planning_engine import (
+    MissionDemand,
+    PilotSlot,
+    PlanningEngine,
+    PlanningEngineError,
+    ScheduleDelta,
+)
 
 
 def test_planning_engine_schedules_by_priority_and_capacity() -> None:
@@ -65,3 +72,148 @@ def test_planning_engine_schedules_by_priority_and_capacity() -> None:
 def test_planning_engine_generate_date_range_validates_order() -> None:
     with pytest.raises(PlanningEngineError, match="start"):
         PlanningEngine.generate_date_range(date(2026, 1, 2), date(2026, 1, 1))
+
+
+def _random_workload(seed: int) -> tuple[list[MissionDemand], list[PilotSlot]]:
+    import random
+    from datetime import timedelta
+
+    rng = random.Random(seed)
+    start = date(2026, 3, 2)
+    provinces = ["06", "35", "42"]
+    pilots = [(uuid.UUID(int=rng.getrandbits(128)), rng.choice(provinces)) for _ in range(12)]
+    slots = [
+        PilotSlot(
+            pilot_id=pid,
+            date=start + timedelta(days=day),
+            province_code=province,
+            remaining_capacity=rng.randint(0, 3),
+            daily_capacity=3,
+        )
+        for pid, province in pilots
+        for day in range(7)
+        if rng.random() < 0.8
+    ]
+    demands = []
+    for _ in range(150):
+        earliest = start + timedelta(days=rng.randint(-1, 6))
+        demands.append(
+            MissionDemand(
+                demand_id=uuid.UUID(int=rng.getrandbits(128)),
+                field_id=uuid.UUID(int=rng.getrandbits(128)),
+                province_code=rng.choice(provinces),
+                crop_type="WHEAT",
+                area_m2=1000,
+                priority=rng.randint(0, 4),
+                earliest_date=earliest,
+                latest_date=earliest + timedelta(days=rng.randint(0, 3)),
+                estimated_duration_minutes=30,
+            )
+        )
+    return demands, slots
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_planning_engine_indexed_matches_greedy(seed: int) -> None:
+    engine = PlanningEngine()
+    demands, slots = _random_workload(seed)
+
+    assert engine.optimize_schedule_indexed(demands, slots) == engine.optimize_schedule(demands, slots)
+
+
+def _simple_demand(earliest: date, latest: date, priority: int = 0) -> MissionDemand:
+    return MissionDemand(
+        demand_id=uuid.uuid4(),
+        field_id=uuid.uuid4(),
+        province_code="42",
+        crop_type="WHEAT",
+        area_m2=1000,
+        priority=priority,
+        earliest_date=earliest,
+        latest_date=latest,
+        estimated_duration_minutes=30,
+    )
+
+
+def test_planning_engine_replan_moves_only_missions_on_blocked_slot() -> None:
+    engine = PlanningEngine()
+    pilot_a, pilot_b = uuid.uuid4(), uuid.uuid4()
+    slots = [
+        PilotSlot(pilot_id=pilot_a, date=date(2026, 1, 1), province_code="42", remaining_capacity=1, daily_capacity=1),
+        PilotSlot(pilot_id=pilot_b, date=date(2026, 1, 1), province_code="42", remaining_capacity=1, daily_capacity=1),
+        PilotSlot(pilot_id=pilot_a, date=date(2026, 1, 2), province_code="42", remaining_capacity=1, daily_capacity=1),
+    ]
+    flexible = _simple_demand(date(2026, 1, 1), date(2026, 1, 2))
+    fixed = _simple_demand(date(2026, 1, 1), date(2026, 1, 1), priority=1)
+    previous = engine.optimize_schedule([flexible, fixed], slots)
+
+    result = engine.replan_incremental(
+        previous,
+        [flexible, fixed],
+        slots,
+        ScheduleDelta(removed_slots=((pilot_a, date(2026, 1, 1)),)),
+    )
+
+    assert result.diff.added == () and result.diff.dropped == ()
+    assert [(old.demand_id, new.pilot_id, new.scheduled_date) for old, new in result.diff.moved] == [
+        (flexible.demand_id, pilot_a, date(2026, 1, 2))
+    ]
+    assert len(result.schedule.scheduled) == 2
+    assert result.affected_cells == frozenset({("42", date(2026, 1, 1))})
+
+
+def test_planning_engine_replan_reports_added_and_dropped() -> None:
+    engine = PlanningEngine()
+    pilot_id = uuid.uuid4()
+    slots = [
+        PilotSlot(pilot_id=pilot_id, date=date(2026, 1, 1), province_code="42", remaining_capacity=2, daily_capacity=2)
+    ]
+    high = _simple_demand(date(2026, 1, 1), date(2026, 1, 1), priority=0)
+    low = _simple_demand(date(2026, 1, 1), date(2026, 1, 1), priority=2)
+    previous = engine.optimize_schedule([high, low], slots)
+    urgent = _simple_demand(date(2026, 1, 1), date(2026, 1, 1), priority=0)
+
+    shrunk = engine.replan_incremental(
+        previous,
+        [high, low],
+        slots,
+        ScheduleDelta(
+            capacity_changes=(
+                PilotSlot(
+                    pilot_id=pilot_id,
+                    date=date(2026, 1, 1),
+                    province_code="42",
+                    remaining_capacity=1,
+                    daily_capacity=2,
+                ),
+            ),
+        ),
+    )
+    assert [s.demand_id for s in shrunk.diff.dropped] == [low.demand_id]
+    assert shrunk.schedule.unscheduled == (low.demand_id,)
+
+    grown = engine.replan_incremental(previous, [high, low], slots, ScheduleDelta(added_demands=(urgent,)))
+    assert grown.diff.added == ()
+    assert [s.demand_id for s in grown.diff.dropped] == []
+    assert grown.schedule.unscheduled == (urgent.demand_id,)
+
+
+def test_planning_engine_replan_empty_delta_keeps_plan() -> None:
+    engine = PlanningEngine()
+    demands, slots = _random_workload(11)
+    previous = engine.optimize_schedule(demands, slots)
+
+    result = engine.replan_incremental(previous, demands, slots, ScheduleDelta())
+
+    assert result.diff.is_empty
+    assert set(result.schedule.scheduled) == set(previous.scheduled)
+    assert set(result.schedule.unscheduled) == set(previous.unscheduled)
+
+
+def test_planning_engine_replan_rejects_duplicate_demand() -> None:
+    engine = PlanningEngine()
+    demand = _simple_demand(date(2026, 1, 1), date(2026, 1, 1))
+    previous = engine.optimize_schedule([demand], [])
+
+    with pytest.raises(PlanningEngineError, match="zaten"):
+        engine.replan_incremental(previous, [demand], [], ScheduleDelta(added_demands=(demand,)))
@@ -0,0 +1,121 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-016: BatchPolygonEngine toplu alan/kesişim/nokta-içerme testleri.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: numpy, shapely.
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import uuid
+
+import numpy as np
+import pytest
+
+from src.core.domain.services.coverage_calculator import (
+    CoverageCalculationError,
+    CoverageCalculator,
+    Polygon,
+)
+from src.infrastructure.geospatial.batch_polygon_engine import BatchPolygonEngine, PolygonBatch
+
+_LAT = 39.0
+_DLAT_PER_M = 1 / 110_540.0
+_DLON_PER_M = 1 / (111_320.0 * math.cos(math.radians(_LAT)))
+
+
+def _rectangle_m(x0: float, y0: float, x1: float, y1: float) -> Polygon:
+    corners = [(x0, y0), (x1, y0), (x1, y1), (x0, y1), (x0, y0)]
+    return Polygon(coordinates=tuple((32.0 + x * _DLON_PER_M, _LAT + y * _DLAT_PER_M) for x, y in corners))
+
+
+def _random_star(rng: random.Random) -> Polygon:
+    # Merkez etrafında açı sıralı köşeler -> basit (kendini kesmeyen) polygon
+    cx, cy = rng.uniform(26, 44), rng.uniform(36, 42)
+    count = rng.randint(3, 12)
+    angles = sorted(rng.uniform(0, 2 * math.pi) for _ in range(count))
+    ring = [(cx + rng.uniform(0.001, 0.01) * math.cos(a), cy + rng.uniform(0.001, 0.01) * math.sin(a)) for a in angles]
+    return Polygon(coordinates=(*ring, ring[0]))
+
+
+def test_areas_match_scalar_shoelace() -> None:
+    rng = random.Random(7)
+    polygons = [_random_star(rng) for _ in range(200)]
+
+    areas = BatchPolygonEngine().areas(PolygonBatch.from_polygons(polygons))
+
+    expected = [CoverageCalculator.shoelace_area(p) for p in polygons]
+    assert areas == pytest.approx(expected, rel=1e-9, abs=1e-15)
+
+
+def test_projected_area_in_square_metres() -> None:
+    batch = PolygonBatch.from_polygons([_rectangle_m(0, 0, 1000, 500), _rectangle_m(0, 0, 200, 200)])
+
+    areas = BatchPolygonEngine().projected_areas_m2(batch)
+
+    assert areas == pytest.approx([500_000, 40_000], rel=1e-3)
+
+
+def test_contains_points_matches_ray_casting() -> None:
+    rng = random.Random(11)
+    polygons = [_random_star(rng) for _ in range(50)]
+    batch = PolygonBatch.from_polygons(polygons)
+    index = np.array([rng.randrange(len(polygons)) for _ in range(2000)])
+    points = np.array(
+        [
+            (
+                polygons[i].coordinates[0][0] + rng.uniform(-0.012, 0.012),
+                polygons[i].coordinates[0][1] + rng.uniform(-0.012, 0.012),
+            )
+            for i in index
+        ]
+    )
+
+    inside = BatchPolygonEngine().contains_points(batch, index, points)
+
+    expected = [
+        CoverageCalculator.point_in_polygon((float(x), float(y)), polygons[i])
+        for (x, y), i in zip(points, index, strict=True)
+    ]
+    assert inside.tolist() == expected
+
+
+def test_measure_coverage_feeds_batch_evaluation() -> None:
+    fields = [_rectangle_m(0, 0, 1000, 1000), _rectangle_m(0, 0, 1000, 1000), _rectangle_m(0, 0, 400, 400)]
+    footprints = [
+        _rectangle_m(-50, -50, 1050, 1050),  # tam kapsam
+        _rectangle_m(0, 0, 500, 1000),  # yarı kapsam
+        _rectangle_m(1000, 1000, 1200, 1200),  # kesişim yok
+    ]
+    mission_ids = [uuid.uuid4() for _ in fields]
+    field_ids = [uuid.uuid4() for _ in fields]
+
+    measurements = BatchPolygonEngine().measure_coverage(
+        mission_ids,
+        field_ids,
+        PolygonBatch.from_polygons(fields),
+        PolygonBatch.from_polygons(footprints),
+    )
+    results = CoverageCalculator().evaluate_coverage_batch(measurements)
+
+    assert [r.mission_id for r in results] == mission_ids
+    assert [r.coverage_ratio for r in results] == pytest.approx([1.0, 0.5, 0.0], abs=1e-3)
+    assert [r.is_sufficient for r in results] == [True, False, False]
+    assert results[0].intersection_area_m2 <= results[0].field_area_m2
+
+
+def test_length_mismatch_rejected() -> None:
+    engine = BatchPolygonEngine()
+    fields = PolygonBatch.from_polygons([_rectangle_m(0, 0, 10, 10)])
+
+    with pytest.raises(CoverageCalculationError):
+        engine.intersection_areas_m2(fields, PolygonBatch.from_polygons([]))
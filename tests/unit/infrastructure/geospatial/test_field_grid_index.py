@@ -0,0 +1,168 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-016: GridFieldSpatialIndex sorgu ve event senkronizasyon testleri.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from src.application.event_handlers.field_spatial_index_handler import FieldSpatialIndexHandler
+from src.core.domain.entities.field import Field, FieldStatus
+from src.core.domain.events.field_events import FieldCreated, FieldDeleted, FieldUpdated
+from src.core.domain.services.coverage_calculator import CoverageCalculator
+from src.infrastructure.geospatial.field_grid_index import GridFieldSpatialIndex, rings_from_geojson
+
+
+def _square(lon: float, lat: float, size: float) -> dict[str, Any]:
+    ring = [[lon, lat], [lon + size, lat], [lon + size, lat + size], [lon, lat + size], [lon, lat]]
+    return {"type": "Polygon", "coordinates": [ring]}
+
+
+def _field(geometry: dict[str, Any] | None, province: str = "Konya") -> Field:
+    now = datetime.now(timezone.utc)
+    return Field(
+        field_id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        province=province,
+        district="Merkez",
+        village="Köy",
+        ada="1",
+        parsel=str(random.randint(1, 10_000)),
+        area_m2=Decimal("1000"),
+        status=FieldStatus.ACTIVE,
+        created_at=now,
+        updated_at=now,
+        geometry=geometry,
+    )
+
+
+def _random_fields(seed: int, count: int) -> dict[uuid.UUID, dict[str, Any]]:
+    rng = random.Random(seed)
+    return {
+        uuid.uuid4(): _square(32.0 + rng.uniform(0, 0.5), 37.0 + rng.uniform(0, 0.5), rng.uniform(0.001, 0.03))
+        for _ in range(count)
+    }
+
+
+def _index(fields: dict[uuid.UUID, dict[str, Any]]) -> GridFieldSpatialIndex:
+    index = GridFieldSpatialIndex(cell_size_deg=0.02)
+    for field_id, geometry in fields.items():
+        index.upsert(field_id, rings_from_geojson(geometry))
+    return index
+
+
+def _brute_nearest(fields: dict[uuid.UUID, dict[str, Any]], lon: float, lat: float) -> list[tuple[float, uuid.UUID]]:
+    kx = 111_320.0 * math.cos(math.radians(lat))
+    ky = 110_540.0
+    ranked = []
+    for field_id, geometry in fields.items():
+        (x0, y0), _, (x1, y1) = geometry["coordinates"][0][:3]
+        dx = max(x0 - lon, 0.0, lon - x1) * kx
+        dy = max(y0 - lat, 0.0, lat - y1) * ky
+        ranked.append((math.hypot(dx, dy), field_id))
+    return sorted(ranked, key=lambda item: (item[0], str(item[1])))
+
+
+def test_point_and_bbox_queries_match_full_scan() -> None:
+    fields = _random_fields(seed=3, count=400)
+    index = _index(fields)
+    rng = random.Random(5)
+
+    for _ in range(200):
+        lon, lat = 32.0 + rng.uniform(0, 0.55), 37.0 + rng.uniform(0, 0.55)
+        expected = {
+            fid
+            for fid, geometry in fields.items()
+            if CoverageCalculator.point_in_polygon((lon, lat), rings_from_geojson(geometry)[0])
+        }
+        assert set(asyncio.run(index.find_containing_point(lon, lat))) == expected
+
+        size = rng.uniform(0.001, 0.2)
+        bbox = (lon, lat, lon + size, lat + size)
+        expected_bbox = {
+            fid
+            for fid, geometry in fields.items()
+            if not (
+                geometry["coordinates"][0][2][0] < bbox[0]
+                or geometry["coordinates"][0][0][0] > bbox[2]
+                or geometry["coordinates"][0][2][1] < bbox[1]
+                or geometry["coordinates"][0][0][1] > bbox[3]
+            )
+        }
+        assert set(asyncio.run(index.find_by_bbox(*bbox))) == expected_bbox
+
+
+def test_nearest_matches_full_scan() -> None:
+    fields = _random_fields(seed=8, count=300)
+    index = _index(fields)
+    rng = random.Random(9)
+
+    for _ in range(100):
+        lon, lat = 31.8 + rng.uniform(0, 1.0), 36.8 + rng.uniform(0, 1.0)
+        result = asyncio.run(index.find_nearest(lon, lat, k=5))
+        expected = _brute_nearest(fields, lon, lat)[:5]
+        assert [r.distance_m for r in result] == pytest.approx([d for d, _ in expected], rel=1e-6, abs=1e-6)
+
+
+def test_polygon_with_hole_excludes_inner_point() -> None:
+    outer = [[32.0, 37.0], [32.1, 37.0], [32.1, 37.1], [32.0, 37.1], [32.0, 37.0]]
+    hole = [[32.04, 37.04], [32.06, 37.04], [32.06, 37.06], [32.04, 37.06], [32.04, 37.04]]
+    field_id = uuid.uuid4()
+    index = GridFieldSpatialIndex()
+    index.upsert(field_id, rings_from_geojson({"type": "Polygon", "coordinates": [outer, hole]}))
+
+    assert asyncio.run(index.find_containing_point(32.05, 37.05)) == []
+    assert asyncio.run(index.find_containing_point(32.01, 37.01)) == [field_id]
+    assert asyncio.run(index.find_by_bbox(32.045, 37.045, 32.055, 37.055)) == []
+
+
+class _FakeFieldRepository:
+    def __init__(self, fields: list[Field]) -> None:
+        self.fields = {f.field_id: f for f in fields}
+
+    async def find_by_id(self, field_id: uuid.UUID) -> Field | None:
+        return self.fields.get(field_id)
+
+    async def list_by_province(self, province: str) -> list[Field]:
+        return [f for f in self.fields.values() if f.province == province]
+
+
+def test_index_loads_from_repository_and_follows_field_events() -> None:
+    konya = _field(_square(32.0, 37.0, 0.01))
+    ankara = _field(_square(33.0, 39.0, 0.01), province="Ankara")
+    no_geometry = _field(None)
+    repository = _FakeFieldRepository([konya, ankara, no_geometry])
+    index = GridFieldSpatialIndex()
+    handler = FieldSpatialIndexHandler(field_reader=repository, spatial_index=index)
+
+    assert asyncio.run(index.load(repository, ["Konya"])) == 1
+
+    asyncio.run(handler.handle(FieldCreated(field_id=ankara.field_id)))
+    assert asyncio.run(index.find_containing_point(33.005, 39.005)) == [ankara.field_id]
+
+    ankara.geometry = _square(34.0, 39.0, 0.01)
+    asyncio.run(handler.handle(FieldUpdated(field_id=ankara.field_id)))
+    assert asyncio.run(index.find_containing_point(33.005, 39.005)) == []
+    assert asyncio.run(index.find_containing_point(34.005, 39.005)) == [ankara.field_id]
+
+    asyncio.run(handler.handle(FieldDeleted(field_id=konya.field_id)))
+    assert asyncio.run(index.find_containing_point(32.005, 37.005)) == []
+    assert len(index) == 1
@@ -0,0 +1,245 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-029: AIFeedbackPublisher toplu submit, chunk'lı export manifest ve önbellekli status testleri.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import uuid
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Optional
+
+import pytest
+
+from src.infrastructure.messaging.rabbitmq.ai_feedback_publisher import (
+    CHUNK_ABORTED_HEADER,
+    CHUNK_INDEX_HEADER,
+    CHUNK_LAST_HEADER,
+    RECORD_COUNT_HEADER,
+    AIFeedbackPublisher,
+    FeedbackItem,
+)
+
+_SETTINGS = SimpleNamespace(rabbitmq_url="amqp://test", rabbitmq_host="rabbit")
+
+
+class _Exchange:
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.published: list[tuple[str, Any]] = []
+
+    async def publish(self, message: Any, routing_key: str) -> None:
+        if self.fail:
+            raise ConnectionError("broker down")
+        self.published.append((routing_key, message))
+
+
+class _Publisher(AIFeedbackPublisher):
+    def __init__(self, exchange: _Exchange, **kwargs: Any) -> None:
+        super().__init__(_SETTINGS, **kwargs)  # type: ignore[arg-type]
+        self._exchange = exchange
+
+    async def _ensure_connection(self) -> None:
+        async def _get_exchange(name: str) -> _Exchange:
+            return self._exchange
+
+        self._channel = SimpleNamespace(get_exchange=_get_exchange)
+
+    @staticmethod
+    def _build_message(
+        body: bytes,
+        message_id: str,
+        *,
+        content_type: str = "application/json",
+        content_encoding: Optional[str] = None,
+        message_type: Optional[str] = None,
+        headers: Optional[dict[str, Any]] = None,
+    ) -> Any:
+        return SimpleNamespace(
+            body=body,
+            message_id=message_id,
+            content_type=content_type,
+            content_encoding=content_encoding,
+            type=message_type,
+            headers=headers or {},
+        )
+
+
+def _decode(message: Any) -> bytes:
+    return gzip.decompress(message.body) if message.content_encoding == "gzip" else message.body
+
+
+def _item(n: int) -> FeedbackItem:
+    return FeedbackItem(
+        feedback_id=uuid.UUID(int=n),
+        review_id=uuid.UUID(int=1000 + n),
+        mission_id=uuid.UUID(int=2000),
+        model_id="model-v3",
+        verdict="confirmed",
+        training_grade="A",
+        notes="x" * 40,
+    )
+
+
+def _submit_kwargs(item: FeedbackItem) -> dict[str, Any]:
+    return {field: getattr(item, field) for field in item.__dataclass_fields__}
+
+
+def test_batch_groups_items_into_compressed_messages() -> None:
+    exchange = _Exchange()
+    publisher = _Publisher(exchange, batch_max_items=50, compress_min_bytes=256)
+
+    results = asyncio.run(publisher.submit_feedback_batch([_item(n) for n in range(120)]))
+
+    assert [r.confirmation_id for r in results] == [f"fb-{uuid.UUID(int=n)}" for n in range(120)]
+    assert all(r.accepted for r in results)
+    assert len(exchange.published) == 3
+    bodies = [json.loads(_decode(message)) for _, message in exchange.published]
+    assert [len(body["items"]) for body in bodies] == [50, 50, 20]
+    assert {message.content_encoding for _, message in exchange.published} == {"gzip"}
+    assert exchange.published[0][1].headers[RECORD_COUNT_HEADER] == 50
+    assert publisher.stats.bytes_sent < publisher.stats.bytes_raw
+
+
+def test_batch_id_is_stable_for_same_items() -> None:
+    exchange = _Exchange()
+    publisher = _Publisher(exchange)
+    items = [_item(n) for n in range(3)]
+
+    async def scenario() -> None:
+        await publisher.submit_feedback_batch(items)
+        await publisher.submit_feedback_batch(items)
+
+    asyncio.run(scenario())
+
+    first, second = (message.message_id for _, message in exchange.published)
+    assert first == second
+
+
+def test_batch_failure_rejects_only_that_group() -> None:
+    publisher = _Publisher(_Exchange(fail=True), batch_max_items=2)
+
+    results = asyncio.run(publisher.submit_feedback_batch([_item(n) for n in range(3)]))
+
+    assert [r.accepted for r in results] == [False, False, False]
+    assert results[0].message == "Feedback gönderilemedi: ConnectionError"
+
+
+def test_submit_feedback_coalesces_within_window() -> None:
+    exchange = _Exchange()
+    publisher = _Publisher(exchange, batch_window_seconds=0.01, batch_max_items=4)
+
+    async def scenario() -> list[Any]:
+        return await asyncio.gather(*(publisher.submit_feedback(**_submit_kwargs(_item(n))) for n in range(6)))
+
+    results = asyncio.run(scenario())
+
+    # Batch 4'te doldu ve hemen gitti; kalan 2 pencere kapanınca tek mesaj oldu
+    assert [len(json.loads(_decode(message))["items"]) for _, message in exchange.published] == [4, 2]
+    assert [r.confirmation_id for r in results] == [f"fb-{uuid.UUID(int=n)}" for n in range(6)]
+    assert all(r.accepted for r in results)
+
+
+def test_export_manifest_is_streamed_in_chunks() -> None:
+    exchange = _Exchange()
+    publisher = _Publisher(exchange, manifest_chunk_records=3)
+
+    async def _records() -> AsyncIterator[dict[str, Any]]:
+        for n in range(7):
+            yield {"feedback_id": n}
+
+    export = asyncio.run(publisher.export_training_dataset(model_id="model-v3", manifest=_records()))
+
+    request, *chunks = (message for _, message in exchange.published)
+    assert json.loads(request.body)["manifest"] == "chunked"
+    assert [m.headers[CHUNK_INDEX_HEADER] for m in chunks] == [0, 1, 2]
+    assert [m.headers[CHUNK_LAST_HEADER] for m in chunks] == [False, False, True]
+    assert chunks[-1].headers[RECORD_COUNT_HEADER] == 7
+    lines = [json.loads(line) for m in chunks for line in _decode(m).splitlines()]
+    assert [line["feedback_id"] for line in lines] == list(range(7))
+    assert export.record_count == 7
+
+
+def test_empty_manifest_emits_single_last_chunk() -> None:
+    exchange = _Exchange()
+    publisher = _Publisher(exchange)
+
+    asyncio.run(publisher.export_training_dataset(manifest=[]))
+
+    chunk = exchange.published[-1][1]
+    assert (chunk.headers[CHUNK_LAST_HEADER], chunk.headers[RECORD_COUNT_HEADER], chunk.body) == (True, 0, b"")
+
+
+def test_manifest_source_failure_closes_stream_with_aborted_chunk() -> None:
+    exchange = _Exchange()
+    publisher = _Publisher(exchange, manifest_chunk_records=2)
+
+    async def _records() -> AsyncIterator[dict[str, Any]]:
+        for n in range(5):
+            yield {"feedback_id": n}
+        raise RuntimeError("cursor lost")
+
+    with pytest.raises(RuntimeError, match="cursor lost"):
+        asyncio.run(publisher.export_training_dataset(manifest=_records()))
+
+    _, *chunks = (message for _, message in exchange.published)
+    assert [m.headers[CHUNK_LAST_HEADER] for m in chunks] == [False, True]
+    assert chunks[-1].headers[CHUNK_ABORTED_HEADER] is True
+    assert RECORD_COUNT_HEADER not in chunks[-1].headers
+    assert CHUNK_ABORTED_HEADER not in chunks[0].headers
+
+
+def test_chunk_publish_failure_closes_stream_with_aborted_chunk() -> None:
+    class _FlakyExchange(_Exchange):
+        async def publish(self, message: Any, routing_key: str) -> None:
+            if message.headers.get(CHUNK_INDEX_HEADER) == 1 and CHUNK_ABORTED_HEADER not in message.headers:
+                raise ConnectionError("broker down")
+            await super().publish(message, routing_key)
+
+    exchange = _FlakyExchange()
+    publisher = _Publisher(exchange, manifest_chunk_records=2)
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(publisher.export_training_dataset(manifest=[{"feedback_id": n} for n in range(7)]))
+
+    _, *chunks = (message for _, message in exchange.published)
+    assert [m.headers[CHUNK_INDEX_HEADER] for m in chunks] == [0, 1]
+    assert (chunks[-1].headers[CHUNK_LAST_HEADER], chunks[-1].headers[CHUNK_ABORTED_HEADER]) == (True, True)
+
+
+class _ManagementClient:
+    def __init__(self, depth: int) -> None:
+        self.depth = depth
+        self.calls = 0
+
+    async def get(self, url: str) -> Any:
+        self.calls += 1
+        await asyncio.sleep(0)
+        return SimpleNamespace(status_code=200, json=lambda: {"messages": self.depth})
+
+
+def test_status_lookups_share_cached_queue_depth() -> None:
+    client = _ManagementClient(depth=5)
+    publisher = _Publisher(_Exchange(), http_client=client, status_cache_ttl_seconds=60)
+
+    async def scenario() -> list[Any]:
+        concurrent = await asyncio.gather(*(publisher.get_feedback_status(f"fb-{n}") for n in range(5)))
+        return [*concurrent, await publisher.get_feedback_status("fb-late")]
+
+    statuses = asyncio.run(scenario())
+
+    assert client.calls == 1
+    assert {s.status for s in statuses} == {"QUEUED"}
+    assert publisher.stats.status_cache_hits == 5
@@ -0,0 +1,122 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: RabbitMQConsumer eşzamanlı handler yürütme ve EventBus fan-out testleri.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from src.core.domain.events.base import DomainEvent
+from src.core.domain.events.field_events import FieldCreated
+from src.infrastructure.messaging.rabbitmq.consumer import RabbitMQConsumer, order_by_field
+from src.infrastructure.messaging.rabbitmq_event_bus_impl import RabbitMQEventBus
+
+_SETTINGS = SimpleNamespace(rabbitmq_url="amqp://test")
+
+
+class _Message:
+    def __init__(self, message_id: str, body: dict[str, Any], routing_key: str = "event.field.created") -> None:
+        self.message_id = message_id
+        self.routing_key = routing_key
+        self.body = json.dumps(body).encode("utf-8")
+        self.headers: dict[str, Any] = {}
+        self.acked = asyncio.Event()
+
+    async def ack(self) -> None:
+        self.acked.set()
+
+    async def nack(self, requeue: bool) -> None:
+        self.acked.set()
+
+    async def reject(self, requeue: bool) -> None:
+        self.acked.set()
+
+
+def test_concurrent_mode_is_bounded_by_max_concurrency() -> None:
+    async def scenario() -> tuple[int, int, dict[str, int]]:
+        consumer = RabbitMQConsumer(_SETTINGS)
+        active = peak = 0
+        gauge_samples: list[int] = []
+
+        async def slow_handler(body: dict[str, Any]) -> None:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            gauge_samples.append(consumer.in_flight[sub_id])
+            await asyncio.sleep(0.02)
+            active -= 1
+
+        sub_id = await consumer.subscribe("q", slow_handler, max_concurrency=4)
+        callback = consumer._make_callback(sub_id, slow_handler)
+        messages = [_Message(f"m{i}", {"event_type": "FieldCreated"}) for i in range(12)]
+        for message in messages:
+            await callback(message)
+        await consumer.close()
+        assert all(m.acked.is_set() for m in messages)
+        return peak, max(gauge_samples), consumer.in_flight
+
+    peak, max_gauge, gauges_after = asyncio.run(scenario())
+    assert peak == 4
+    assert max_gauge == 4
+    assert gauges_after == {}
+
+
+def test_same_ordering_key_is_processed_in_arrival_order() -> None:
+    async def scenario() -> list[tuple[str, int]]:
+        consumer = RabbitMQConsumer(_SETTINGS)
+        processed: list[tuple[str, int]] = []
+
+        async def handler(body: dict[str, Any]) -> None:
+            # İlk mesajlar daha uzun sürer; sıra korunmazsa sonrakiler öne geçer
+            await asyncio.sleep(0.03 / (body["seq"] + 1))
+            processed.append((body["field_id"], body["seq"]))
+
+        sub_id = await consumer.subscribe("q", handler, max_concurrency=8, ordering_key=order_by_field("field_id"))
+        callback = consumer._make_callback(sub_id, handler)
+        for seq in range(4):
+            for field_id in ("a", "b"):
+                await callback(_Message(f"{field_id}{seq}", {"field_id": field_id, "seq": seq}))
+        await consumer.close()
+        return processed
+
+    processed = asyncio.run(scenario())
+    for field_id in ("a", "b"):
+        assert [seq for fid, seq in processed if fid == field_id] == [0, 1, 2, 3]
+
+
+def test_event_bus_fans_out_handlers_concurrently() -> None:
+    async def scenario() -> tuple[float, list[str]]:
+        bus = RabbitMQEventBus(_SETTINGS, concurrent_handlers=True)
+        calls: list[str] = []
+
+        def make_handler(name: str) -> Any:
+            async def _handler(event: DomainEvent) -> None:
+                await asyncio.sleep(0.05)
+                calls.append(name)
+
+            return _handler
+
+        for name in ("sms", "projection", "audit"):
+            await bus.subscribe("FieldCreated", make_handler(name))
+
+        started = time.perf_counter()
+        await bus._make_dispatcher()(json.loads(json.dumps(FieldCreated().to_dict())))
+        return time.perf_counter() - started, calls
+
+    elapsed, calls = asyncio.run(scenario())
+    assert sorted(calls) == ["audit", "projection", "sms"]
+    assert elapsed < 0.12
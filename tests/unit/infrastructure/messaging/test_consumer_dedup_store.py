@@ -0,0 +1,156 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: RabbitMQConsumer dedup store (FIFO/TTL, Redis, commit-after-success) testleri.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Any
+
+from src.infrastructure.messaging.rabbitmq.consumer import RabbitMQConsumer
+from src.infrastructure.messaging.rabbitmq.dedup_store import InMemoryDedupStore, RedisDedupStore
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_in_memory_store_evicts_oldest_first() -> None:
+    store = InMemoryDedupStore(max_size=3)
+
+    async def scenario() -> list[bool]:
+        for message_id in ("m1", "m2", "m3"):
+            await store.commit(message_id)
+        assert await store.seen("m1")  # hit sırayı değiştirmez
+        await store.commit("m4")  # en eski commit (m1) düşer
+        return [await store.seen(m) for m in ("m1", "m2", "m3", "m4")]
+
+    assert asyncio.run(scenario()) == [False, True, True, True]
+    assert store.stats.evictions == 1
+    assert store.stats.commits == 4
+
+
+def test_in_memory_store_expires_after_ttl() -> None:
+    clock = _Clock()
+    store = InMemoryDedupStore(ttl_seconds=10, clock=clock)
+
+    async def scenario() -> tuple[bool, bool]:
+        await store.commit("m1")
+        clock.now = 9.0
+        before = await store.seen("m1")
+        clock.now = 10.5
+        return before, await store.seen("m1")
+
+    assert asyncio.run(scenario()) == (True, False)
+    assert len(store) == 0
+    assert (store.stats.hits, store.stats.misses, store.stats.evictions) == (1, 1, 1)
+
+
+def test_in_memory_store_hit_does_not_block_expiry_of_later_entries() -> None:
+    clock = _Clock()
+    store = InMemoryDedupStore(ttl_seconds=10, clock=clock)
+
+    async def scenario() -> bool:
+        await store.commit("m1")
+        clock.now = 1.0
+        await store.commit("m2")
+        clock.now = 5.0
+        assert await store.seen("m1")
+        clock.now = 10.5  # m1 süresi doldu, m2 hâlâ geçerli
+        return await store.seen("m2")
+
+    assert asyncio.run(scenario()) is True
+    assert len(store) == 1
+    clock.now = 11.5
+    asyncio.run(store.seen("m3"))
+    assert len(store) == 0
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.data: dict[str, tuple[bytes, int]] = {}
+
+    async def exists(self, key: str) -> int:
+        return int(key in self.data)
+
+    async def set(self, key: str, value: bytes, *, nx: bool, ex: int) -> bool:
+        if nx and key in self.data:
+            return False
+        self.data[key] = (value, ex)
+        return True
+
+
+def test_redis_store_uses_set_nx_with_expiry() -> None:
+    client = _FakeRedis()
+    store = RedisDedupStore(client, key_prefix="dedup:", ttl_seconds=60)
+
+    async def scenario() -> tuple[bool, bool]:
+        first = await store.seen("m1")
+        await store.commit("m1")
+        await store.commit("m1")  # başka replika aynı ID'yi commit etmiş gibi
+        return first, await store.seen("m1")
+
+    assert asyncio.run(scenario()) == (False, True)
+    assert client.data == {"dedup:m1": (b"1", 60)}
+    assert (store.stats.commits, store.stats.hits, store.stats.misses) == (1, 2, 1)
+
+
+class _Message:
+    def __init__(self, message_id: str, retry_count: int = 0) -> None:
+        self.message_id = message_id
+        self.body = json.dumps({"event_type": "FieldCreated"}).encode("utf-8")
+        self.headers = {"x-retry-count": retry_count}
+        self.outcome: list[str] = []
+
+    async def ack(self) -> None:
+        self.outcome.append("ack")
+
+    async def nack(self, requeue: bool) -> None:
+        self.outcome.append("nack")
+
+    async def reject(self, requeue: bool) -> None:
+        self.outcome.append("reject")
+
+
+def test_failed_message_is_not_marked_processed() -> None:
+    calls: list[dict[str, Any]] = []
+
+    async def flaky_handler(body: dict[str, Any]) -> None:
+        calls.append(body)
+        if len(calls) == 1:
+            raise RuntimeError("transient")
+
+    consumer = RabbitMQConsumer(SimpleNamespace(rabbitmq_url="amqp://test"))
+    callback = consumer._make_callback("sub-1", flaky_handler)
+
+    first, redelivered, duplicate = _Message("m1"), _Message("m1"), _Message("m1")
+
+    async def scenario() -> None:
+        await callback(first)
+        await callback(redelivered)
+        await callback(duplicate)
+
+    asyncio.run(scenario())
+
+    assert first.outcome == ["nack"]  # kanal yok -> retry kuyruğuna yazılamaz, geri bırakılır
+    assert redelivered.outcome == ["ack"]
+    assert duplicate.outcome == ["ack"]
+    assert len(calls) == 2
+    stats = consumer.dedup_stats
+    assert (stats.hits, stats.misses, stats.commits) == (1, 2, 1)
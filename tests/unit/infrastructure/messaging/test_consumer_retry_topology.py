@@ -0,0 +1,208 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: TTL kademeli retry kuyrukları, DLQ park ve replay testleri.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Any, Optional
+
+from src.infrastructure.messaging.rabbitmq.consumer import RabbitMQConsumer
+from src.infrastructure.messaging.rabbitmq.dead_letter import DeadLetterReplayer
+from src.infrastructure.messaging.rabbitmq_config import (
+    MAX_RETRY_ATTEMPTS,
+    RETRY_TIERS_MS,
+    ExchangeConfig,
+    QueueConfig,
+    retry_delay_ms,
+)
+
+QUEUE = "domain.events.mission"
+
+
+def test_queue_config_declares_tiered_retry_queues_and_dlq() -> None:
+    config = QueueConfig(name=QUEUE, routing_key="event.mission.#")
+
+    retry_queues = config.retry_queues()
+
+    assert [q.name for q in retry_queues] == [f"{QUEUE}.retry.{label}" for label in ("1s", "10s", "1m", "10m")]
+    assert retry_queues[1].arguments == {
+        "x-message-ttl": 10_000,
+        "x-dead-letter-exchange": "",
+        "x-dead-letter-routing-key": QUEUE,
+    }
+    assert config.dead_letter_queue().name == f"{QUEUE}.dlq"
+    assert config.dead_letter_queue().arguments == {}
+    assert [retry_delay_ms(n) for n in range(6)] == [*RETRY_TIERS_MS, RETRY_TIERS_MS[-1], RETRY_TIERS_MS[-1]]
+
+
+class _Exchange:
+    def __init__(self, fail: bool = False) -> None:
+        self.published: list[tuple[str, dict[str, Any]]] = []
+        self.fail = fail
+        self.mandatory: list[bool] = []
+
+    async def publish(self, message: tuple[bytes, dict[str, Any]], routing_key: str, mandatory: bool = False) -> None:
+        if self.fail:
+            raise ConnectionError("channel closed")
+        self.published.append((routing_key, message[1]))
+        self.mandatory.append(mandatory)
+
+
+class _Message:
+    def __init__(self, retry_count: int = 0, body: Optional[bytes] = None) -> None:
+        self.message_id = "m1"
+        self.body = body if body is not None else json.dumps({"event_type": "MissionAssigned"}).encode("utf-8")
+        self.headers: dict[str, Any] = {"x-retry-count": retry_count} if retry_count else {}
+        self.outcome: list[str] = []
+
+    async def ack(self) -> None:
+        self.outcome.append("ack")
+
+    async def nack(self, requeue: bool) -> None:
+        self.outcome.append(f"nack:{requeue}")
+
+    async def reject(self, requeue: bool) -> None:
+        self.outcome.append("reject")
+
+
+async def _failing_handler(body: dict[str, Any]) -> None:
+    raise RuntimeError("downstream unavailable")
+
+
+def _consumer(exchange: _Exchange, topology: Optional[list[ExchangeConfig]] = None) -> tuple[RabbitMQConsumer, Any]:
+    consumer = RabbitMQConsumer(SimpleNamespace(rabbitmq_url="amqp://test"), topology=topology)
+    consumer._channel = SimpleNamespace(default_exchange=exchange)
+    consumer._build_message = lambda message, headers: (message.body, headers)  # type: ignore[method-assign]
+    sub_id = asyncio.run(consumer.subscribe(QUEUE, _failing_handler))
+    return consumer, consumer._make_callback(sub_id, _failing_handler)
+
+
+def test_failed_message_walks_retry_tiers_then_parks_in_dlq() -> None:
+    exchange = _Exchange()
+    consumer, callback = _consumer(exchange)
+    messages = [_Message(retry_count=n) for n in range(MAX_RETRY_ATTEMPTS + 1)]
+
+    async def scenario() -> None:
+        for message in messages:
+            await callback(message)
+
+    asyncio.run(scenario())
+
+    assert [routing_key for routing_key, _ in exchange.published] == [
+        f"{QUEUE}.retry.1s",
+        f"{QUEUE}.retry.10s",
+        f"{QUEUE}.retry.1m",
+        f"{QUEUE}.retry.10m",
+        f"{QUEUE}.dlq",
+    ]
+    assert [headers["x-retry-count"] for _, headers in exchange.published] == [1, 2, 3, 4, 4]
+    assert exchange.published[0][1]["x-original-queue"] == QUEUE
+    assert exchange.published[0][1]["x-last-error"] == "RuntimeError: downstream unavailable"
+    assert all(exchange.mandatory)
+    assert all(message.outcome == ["ack"] for message in messages)
+
+    stats = consumer.retry_stats[QUEUE]
+    assert (stats.retried, stats.dead_lettered) == (4, 1)
+    assert stats.tiers == {"1s": 1, "10s": 1, "1m": 1, "10m": 1}
+
+
+def test_invalid_json_is_parked_without_retry() -> None:
+    exchange = _Exchange()
+    consumer, callback = _consumer(exchange)
+    message = _Message(body=b"{not json")
+
+    asyncio.run(callback(message))
+
+    assert [routing_key for routing_key, _ in exchange.published] == [f"{QUEUE}.dlq"]
+    assert message.outcome == ["ack"]
+    assert consumer.retry_stats[QUEUE].retried == 0
+
+
+def test_queue_without_retry_tiers_falls_back_to_broker_dlx() -> None:
+    exchange = _Exchange()
+    topology = [
+        ExchangeConfig(name="domain.events", queues=[QueueConfig(name=QUEUE, routing_key="#", retry_tiers_ms=())])
+    ]
+    consumer, callback = _consumer(exchange, topology)
+    failed, malformed = _Message(), _Message(body=b"{not json")
+
+    async def scenario() -> None:
+        await callback(failed)
+        await callback(malformed)
+
+    asyncio.run(scenario())
+
+    assert exchange.published == []  # <queue>.retry.* / <queue>.dlq declare edilmedi
+    assert failed.outcome == malformed.outcome == ["nack:False"]
+    assert consumer.retry_stats[QUEUE].rejected == 2
+
+
+def test_republish_failure_releases_message_to_source_queue() -> None:
+    consumer, callback = _consumer(_Exchange(fail=True))
+    message = _Message()
+
+    asyncio.run(callback(message))
+
+    assert message.outcome == ["nack:True"]
+    assert consumer.retry_stats == {}
+
+
+class _DeadLetterQueue:
+    def __init__(self, messages: list[_Message]) -> None:
+        self.messages = list(messages)
+
+    async def get(self, no_ack: bool, fail: bool) -> Optional[_Message]:
+        return self.messages.pop(0) if self.messages else None
+
+
+class _Replayer(DeadLetterReplayer):
+    @staticmethod
+    def _build_message(message: Any, headers: dict[str, Any]) -> tuple[bytes, dict[str, Any]]:
+        return message.body, headers
+
+
+def _replay_channel(exchange: _Exchange, dlq: _DeadLetterQueue) -> Any:
+    async def get_queue(name: str, ensure: bool = True) -> _DeadLetterQueue:
+        assert name == f"{QUEUE}.dlq"
+        return dlq
+
+    return SimpleNamespace(default_exchange=exchange, get_queue=get_queue)
+
+
+def test_replay_resets_retry_count_and_routes_to_source_queue() -> None:
+    exchange = _Exchange()
+    parked = [_Message(retry_count=4), _Message(retry_count=4), _Message(retry_count=4)]
+    replayer = _Replayer(_replay_channel(exchange, _DeadLetterQueue(parked)))
+
+    result = asyncio.run(replayer.replay(QUEUE, limit=2))
+
+    assert result.replayed == 2
+    assert [routing_key for routing_key, _ in exchange.published] == [QUEUE, QUEUE]
+    assert exchange.published[0][1]["x-retry-count"] == 0
+    assert exchange.published[0][1]["x-replay-count"] == 1
+    assert [m.outcome for m in parked] == [["ack"], ["ack"], []]
+
+
+def test_replay_dry_run_leaves_messages_parked() -> None:
+    exchange = _Exchange()
+    parked = [_Message(retry_count=4)]
+    replayer = _Replayer(_replay_channel(exchange, _DeadLetterQueue(parked)))
+
+    result = asyncio.run(replayer.replay(QUEUE, dry_run=True))
+
+    assert exchange.published == []
+    assert [(s.message_id, s.retry_count) for s in result.messages] == [("m1", 4)]
+    assert parked[0].outcome == ["nack:True"]
@@ -0,0 +1,103 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: RabbitMQEventBus tipli event dispatch testleri.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.domain.events.base import DomainEvent
+from src.core.domain.events.mission_events import MissionAssigned
+from src.infrastructure.messaging.rabbitmq_event_bus_impl import RabbitMQEventBus
+
+_SETTINGS = SimpleNamespace(rabbitmq_url="amqp://test")
+
+
+def _bus(**kwargs: object) -> RabbitMQEventBus:
+    return RabbitMQEventBus(_SETTINGS, **kwargs)  # type: ignore[arg-type]
+
+
+def test_handlers_receive_the_same_typed_event_instance() -> None:
+    bus = _bus(concurrent_handlers=True)
+    received: list[DomainEvent] = []
+
+    async def handler(event: DomainEvent) -> None:
+        received.append(event)
+
+    published = MissionAssigned(assignment_source="SYSTEM_SEED")
+
+    async def scenario() -> None:
+        await bus.subscribe("MissionAssigned", handler)
+        await bus.subscribe("MissionAssigned", handler)
+        await bus._make_dispatcher()(json.loads(json.dumps(published.to_dict())))
+
+    asyncio.run(scenario())
+
+    assert len(received) == 2
+    assert received[0] is received[1]
+    assert received[0] == published
+    assert bus.decode_stats.decoded == 1 and bus.decode_stats.failed == 0
+
+
+def test_unknown_event_type_is_dispatched_as_base_event() -> None:
+    bus = _bus()
+    received: list[DomainEvent] = []
+
+    async def handler(event: DomainEvent) -> None:
+        received.append(event)
+
+    async def scenario() -> None:
+        await bus.subscribe("LegacyEvent", handler)
+        await bus._make_dispatcher()(
+            {
+                "event_type": "LegacyEvent",
+                "event_id": "7d4a0a8e-3a8f-4f7a-9d3e-2f7c1a2b3c4d",
+                "occurred_at": "2026-10-18T08:00:00+00:00",
+            }
+        )
+
+    asyncio.run(scenario())
+
+    assert type(received[0]) is DomainEvent
+    assert str(received[0].event_id) == "7d4a0a8e-3a8f-4f7a-9d3e-2f7c1a2b3c4d"
+    assert bus.decode_stats.unknown_type == 1
+
+
+def test_malformed_body_raises_before_any_handler_runs() -> None:
+    bus = _bus()
+    calls: list[DomainEvent] = []
+
+    async def handler(event: DomainEvent) -> None:
+        calls.append(event)
+
+    async def scenario() -> None:
+        await bus.subscribe("MissionAssigned", handler)
+        await bus._make_dispatcher()({"event_type": "MissionAssigned", "mission_id": "bad"})
+
+    with pytest.raises(ValueError):
+        asyncio.run(scenario())
+
+    assert calls == []
+    assert bus.decode_stats.failed == 1
+
+
+def test_body_without_handlers_is_not_decoded() -> None:
+    bus = _bus()
+
+    asyncio.run(bus._make_dispatcher()({"event_type": "MissionAssigned"}))
+
+    assert bus.decode_stats.decoded == 0
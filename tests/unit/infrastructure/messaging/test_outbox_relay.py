@@ -0,0 +1,263 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: Transactional outbox — unit of work yazımı ve OutboxRelay aktarım testleri.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Sequence
+
+import pytest
+
+from src.core.domain.events.mission_events import MissionAssigned
+from src.infrastructure.messaging.outbox_relay import OutboxRelay
+from src.infrastructure.messaging.rabbitmq.publisher import BatchPublishResult, PublishOutcome
+from src.infrastructure.persistence.sqlalchemy.repositories.outbox_repository_impl import OutboxRecord
+from src.infrastructure.persistence.sqlalchemy.unit_of_work import SqlAlchemyUnitOfWork
+
+
+class _Row:
+    def __init__(self, seq: int, event_type: str) -> None:
+        self.seq = seq
+        self.event_id = uuid.uuid4()
+        self.event_type = event_type
+        self.payload = {"event_id": str(self.event_id), "event_type": event_type}
+        self.published_at: datetime | None = None
+        self.attempts = 0
+        self.last_error: str | None = None
+
+
+class _OutboxTable:
+    """event_outbox tablosunun bellek içi karşılığı; SKIP LOCKED satır kilitleri simüle edilir."""
+
+    def __init__(self, event_types: Sequence[str]) -> None:
+        self.rows = [_Row(seq, event_type) for seq, event_type in enumerate(event_types, start=1)]
+        self.locked: set[int] = set()
+
+    def transaction(self) -> Any:
+        @asynccontextmanager
+        async def _tx() -> AsyncIterator[_OutboxTx]:
+            tx = _OutboxTx(self)
+            try:
+                yield tx
+                tx.commit()
+            finally:
+                self.locked -= tx.claimed
+
+        return _tx
+
+
+class _OutboxTx:
+    def __init__(self, table: _OutboxTable) -> None:
+        self.table = table
+        self.claimed: set[int] = set()
+        self.staged: list[Any] = []
+
+    async def claim_pending(self, limit: int, max_attempts: int) -> list[OutboxRecord]:
+        rows = [
+            row
+            for row in self.table.rows
+            if row.published_at is None and row.attempts < max_attempts and row.seq not in self.table.locked
+        ][:limit]
+        for row in rows:
+            self.table.locked.add(row.seq)
+            self.claimed.add(row.seq)
+        return [OutboxRecord(r.seq, r.event_id, r.event_type, r.payload, r.attempts) for r in rows]
+
+    async def mark_published(self, seqs: Sequence[int]) -> None:
+        self.staged.append(("published", list(seqs)))
+
+    async def mark_failed(self, seq: int, error: str) -> None:
+        self.staged.append(("failed", seq, error))
+
+    async def compact(self, published_before: datetime, limit: int) -> int:
+        doomed = [r for r in self.table.rows if r.published_at is not None and r.published_at < published_before]
+        self.staged.append(("delete", [r.seq for r in doomed[:limit]]))
+        return len(doomed[:limit])
+
+    def commit(self) -> None:
+        by_seq = {row.seq: row for row in self.table.rows}
+        for op in self.staged:
+            if op[0] == "published":
+                for seq in op[1]:
+                    by_seq[seq].published_at = datetime.now(timezone.utc)
+            elif op[0] == "failed":
+                by_seq[op[1]].attempts += 1
+                by_seq[op[1]].last_error = op[2]
+            else:
+                self.table.rows = [row for row in self.table.rows if row.seq not in op[1]]
+
+
+class _Publisher:
+    def __init__(self, nack_event_types: frozenset[str] = frozenset(), delay: float = 0.0) -> None:
+        self.nack_event_types = nack_event_types
+        self.delay = delay
+        self.sent: list[tuple[str, str, str]] = []
+        self.down = False
+
+    async def publish_batch(
+        self, exchange_name: str, messages: list[tuple[str, dict[str, Any], str]]
+    ) -> BatchPublishResult:
+        if self.down:
+            raise ConnectionError("broker down")
+        await asyncio.sleep(self.delay)
+        outcomes = []
+        for routing_key, body, message_id in messages:
+            self.sent.append((exchange_name, routing_key, message_id))
+            ok = body["event_type"] not in self.nack_event_types
+            outcomes.append(PublishOutcome(message_id, routing_key, ok, None if ok else "nacked"))
+        return BatchPublishResult(outcomes)
+
+
+def test_relay_publishes_pending_rows_in_order_and_marks_them() -> None:
+    table = _OutboxTable(["MissionAssigned", "PaymentApproved", "MissionAssigned"])
+    publisher = _Publisher()
+    relay = OutboxRelay(table.transaction(), publisher, batch_size=10)  # type: ignore[arg-type]
+
+    claimed = asyncio.run(relay.drain_once())
+
+    assert claimed == 3
+    assert [message_id for _, _, message_id in publisher.sent] == [f"evt-{row.event_id}" for row in table.rows]
+    assert {routing_key for _, routing_key, _ in publisher.sent} == {"event.mission.assigned", "event.payment.approved"}
+    assert all(row.published_at is not None for row in table.rows)
+    assert asyncio.run(relay.drain_once()) == 0
+
+
+def test_nacked_row_stays_pending_until_max_attempts() -> None:
+    table = _OutboxTable(["MissionAssigned", "PaymentApproved"])
+    relay = OutboxRelay(
+        table.transaction(),
+        _Publisher(nack_event_types=frozenset({"PaymentApproved"})),  # type: ignore[arg-type]
+        max_attempts=2,
+    )
+
+    assert asyncio.run(relay.drain_once()) == 2
+    assert asyncio.run(relay.drain_once()) == 1
+    assert asyncio.run(relay.drain_once()) == 0
+
+    failed = table.rows[1]
+    assert failed.published_at is None and failed.attempts == 2 and failed.last_error == "nacked"
+    assert relay.stats.published == 1 and relay.stats.failed == 2
+
+
+def test_broker_outage_rolls_back_and_keeps_rows_pending() -> None:
+    table = _OutboxTable(["MissionAssigned"])
+    publisher = _Publisher()
+    publisher.down = True
+    relay = OutboxRelay(table.transaction(), publisher)  # type: ignore[arg-type]
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(relay.drain_once())
+
+    assert table.rows[0].published_at is None and table.rows[0].attempts == 0
+    assert table.locked == set()
+
+
+def test_concurrent_relays_never_publish_the_same_row() -> None:
+    table = _OutboxTable(["MissionAssigned"] * 12)
+    publisher = _Publisher(delay=0.01)
+
+    async def scenario() -> None:
+        relays = [OutboxRelay(table.transaction(), publisher, batch_size=3) for _ in range(3)]  # type: ignore[arg-type]
+        await asyncio.gather(*(relay.drain_once() for relay in relays))
+        await asyncio.gather(*(relay.drain_once() for relay in relays))
+
+    asyncio.run(scenario())
+
+    sent_ids = [message_id for _, _, message_id in publisher.sent]
+    assert len(sent_ids) == len(set(sent_ids)) == 12
+
+
+def test_compaction_removes_only_published_rows_past_retention() -> None:
+    table = _OutboxTable(["MissionAssigned", "MissionAssigned", "MissionAssigned"])
+    old = datetime.now(timezone.utc) - timedelta(hours=2)
+    table.rows[0].published_at = old
+    table.rows[1].published_at = datetime.now(timezone.utc)
+    relay = OutboxRelay(table.transaction(), _Publisher(), retention=timedelta(hours=1))  # type: ignore[arg-type]
+
+    assert asyncio.run(relay.compact()) == 1
+    assert [row.seq for row in table.rows] == [2, 3]
+
+
+def test_run_loop_drains_and_stops() -> None:
+    table = _OutboxTable(["MissionAssigned"] * 5)
+    publisher = _Publisher()
+
+    async def scenario() -> None:
+        stop = asyncio.Event()
+        relay = OutboxRelay(table.transaction(), publisher, batch_size=2, poll_interval=0.01)  # type: ignore[arg-type]
+        task = asyncio.create_task(relay.run(stop))
+        await asyncio.sleep(0.05)
+        stop.set()
+        await asyncio.wait_for(task, timeout=1)
+
+    asyncio.run(scenario())
+
+    assert len(publisher.sent) == 5
+
+
+class _Session:
+    def __init__(self) -> None:
+        self.added: list[Any] = []
+        self.commits = self.rollbacks = self.closes = 0
+
+    def add(self, model: Any) -> None:
+        self.added.append(model)
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+
+    async def close(self) -> None:
+        self.closes += 1
+
+
+def test_unit_of_work_appends_outbox_rows_and_commits_once() -> None:
+    session = _Session()
+
+    async def scenario() -> uuid.UUID:
+        async with SqlAlchemyUnitOfWork(lambda: session) as uow:  # type: ignore[arg-type,return-value]
+            event = MissionAssigned(assignment_source="PULL")
+            uow.append("PaymentApproved", {"payment_intent_id": "pi-1"}, correlation_id="corr-1")
+            event_id = uow.collect(event, correlation_id="corr-2")
+            assert event_id == event.event_id
+            await uow.commit()
+        return event_id
+
+    event_id = asyncio.run(scenario())
+
+    first, second = session.added
+    assert first.event_type == "PaymentApproved"
+    assert first.payload["payment_intent_id"] == "pi-1"
+    assert first.payload["event_id"] == str(first.event_id) and first.payload["correlation_id"] == "corr-1"
+    assert second.event_id == event_id and second.payload["assignment_source"] == "PULL"
+    assert (session.commits, session.rollbacks, session.closes) == (1, 0, 1)
+
+
+def test_unit_of_work_rolls_back_outbox_rows_on_error() -> None:
+    session = _Session()
+
+    async def scenario() -> None:
+        async with SqlAlchemyUnitOfWork(lambda: session) as uow:  # type: ignore[arg-type,return-value]
+            uow.append("MissionAssigned", {"mission_id": "m1"})
+            raise RuntimeError("db write failed")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(scenario())
+
+    assert (session.commits, session.rollbacks, session.closes) == (0, 1, 1)
@@ -0,0 +1,142 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: RabbitMQPublisher pipeline'lı publish_batch ve EventPublisher toplu yayın testleri.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Optional
+
+import pytest
+
+from src.core.domain.events.mission_events import MissionAssigned
+from src.infrastructure.messaging.event_publisher import EventPublisher
+from src.infrastructure.messaging.rabbitmq.publisher import BatchPublishError, RabbitMQPublisher
+
+_SETTINGS = SimpleNamespace(rabbitmq_url="amqp://test")
+
+
+class _Exchange:
+    """Confirm gecikmesini simüle eden exchange; nack listesindeki ID'ler hata verir."""
+
+    def __init__(self, confirm_delay: float = 0.005, nack_ids: frozenset[str] = frozenset()) -> None:
+        self.confirm_delay = confirm_delay
+        self.nack_ids = nack_ids
+        self.written: list[str] = []
+        self.pending = 0
+        self.peak_pending = 0
+
+    async def publish(self, message: Any, routing_key: str) -> None:
+        self.written.append(message.message_id)
+        self.pending += 1
+        self.peak_pending = max(self.peak_pending, self.pending)
+        try:
+            await asyncio.sleep(self.confirm_delay)
+            if message.message_id in self.nack_ids:
+                raise RuntimeError("nacked")
+        finally:
+            self.pending -= 1
+
+
+class _Publisher(RabbitMQPublisher):
+    def __init__(self, exchange: _Exchange, **kwargs: Any) -> None:
+        super().__init__(_SETTINGS, **kwargs)  # type: ignore[arg-type]
+        self._exchange = exchange
+
+    async def _ensure_connection(self) -> None:
+        return None
+
+    async def _get_exchange(self, exchange_name: str) -> Any:
+        return self._exchange
+
+    @staticmethod
+    def _build_message(
+        body: dict[str, Any],
+        message_id: str,
+        *,
+        timestamp: datetime,
+        headers: Optional[dict[str, Any]] = None,
+        content_type: str = "application/json",
+        correlation_id: Optional[str] = None,
+    ) -> Any:
+        return SimpleNamespace(message_id=message_id, body=json.dumps(body, default=str).encode("utf-8"))
+
+
+def _messages(count: int) -> list[tuple[str, dict[str, Any], str]]:
+    return [("event.mission.assigned", {"n": i}, f"m{i}") for i in range(count)]
+
+
+def test_publish_batch_pipelines_confirms_within_window() -> None:
+    exchange = _Exchange()
+    publisher = _Publisher(exchange, confirm_window=8)
+
+    result = asyncio.run(publisher.publish_batch("domain.events", _messages(40)))
+
+    assert result.ok and result.succeeded == 40
+    assert exchange.peak_pending == 8
+    assert exchange.written == [f"m{i}" for i in range(40)]
+    assert [o.message_id for o in result.outcomes] == [f"m{i}" for i in range(40)]
+
+
+def test_publish_batch_reports_per_message_failures_without_aborting() -> None:
+    exchange = _Exchange(nack_ids=frozenset({"m3", "m7"}))
+    publisher = _Publisher(exchange, confirm_window=4)
+
+    result = asyncio.run(publisher.publish_batch("domain.events", _messages(10)))
+
+    assert result.succeeded == 8
+    assert [o.message_id for o in result.failed] == ["m3", "m7"]
+    assert all("nacked" in (o.error or "") for o in result.failed)
+    with pytest.raises(BatchPublishError) as exc_info:
+        result.raise_on_failure()
+    assert isinstance(exc_info.value, ConnectionError)
+    assert exc_info.value.result is result
+
+
+def test_publish_batch_per_call_window_overrides_default() -> None:
+    exchange = _Exchange(confirm_delay=0.001)
+    publisher = _Publisher(exchange, confirm_window=64)
+
+    asyncio.run(publisher.publish_batch("domain.events", _messages(10), confirm_window=1))
+
+    assert exchange.peak_pending == 1
+
+
+def test_publish_batch_empty_input_skips_connection() -> None:
+    publisher = RabbitMQPublisher(_SETTINGS)  # type: ignore[arg-type]
+
+    result = asyncio.run(publisher.publish_batch("domain.events", []))
+
+    assert result.ok and result.outcomes == []
+
+
+def test_confirm_window_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        RabbitMQPublisher(_SETTINGS, confirm_window=0)  # type: ignore[arg-type]
+
+
+def test_event_publisher_batch_returns_outcomes_keyed_by_event_id() -> None:
+    events = [MissionAssigned(assignment_source="SYSTEM_SEED") for _ in range(5)]
+    failing = f"evt-{events[2].event_id}"
+    exchange = _Exchange(confirm_delay=0.001, nack_ids=frozenset({failing}))
+    event_publisher = EventPublisher(_SETTINGS)  # type: ignore[arg-type]
+    event_publisher._publisher = _Publisher(exchange)
+
+    result = asyncio.run(event_publisher.publish_batch(events))
+
+    assert [o.message_id for o in result.outcomes] == [f"evt-{e.event_id}" for e in events]
+    assert [o.message_id for o in result.failed] == [failing]
+    assert {o.routing_key for o in result.outcomes} == {"event.mission.assigned"}
@@ -0,0 +1,280 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: ClusteredNotificationManager (replikalar arası bus + presence) testleri.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Optional
+
+from src.infrastructure.messaging.websocket.cluster import ClusteredNotificationManager
+from src.infrastructure.messaging.websocket.history import HistoryWindow, InMemoryNotificationHistory
+from src.infrastructure.messaging.websocket.notification_manager import (
+    Notification,
+    WebSocketNotificationManager,
+)
+from src.infrastructure.messaging.websocket.presence import InMemoryPresenceStore, RedisPresenceStore
+
+
+class _Hub:
+    """Süreç içi bus: replica_id -> handler; yayınlar kaydedilir."""
+
+    def __init__(self) -> None:
+        self.handlers: dict[str, Callable[[bytes], Awaitable[None]]] = {}
+        self.published: list[Optional[str]] = []
+
+    def bus(self) -> _HubBus:
+        return _HubBus(self)
+
+
+class _HubBus:
+    def __init__(self, hub: _Hub) -> None:
+        self.hub = hub
+
+    async def start(self, replica_id: str, on_message: Callable[[bytes], Awaitable[None]]) -> None:
+        self.hub.handlers[replica_id] = on_message
+
+    async def publish(self, envelope: bytes, *, replica_id: Optional[str] = None) -> None:
+        self.hub.published.append(replica_id)
+        targets = [replica_id] if replica_id else list(self.hub.handlers)
+        for target in targets:
+            await self.hub.handlers[target](envelope)
+
+    async def close(self) -> None:
+        return None
+
+
+class _Socket:
+    def __init__(self) -> None:
+        self.received: list[str] = []
+
+    async def send_text(self, payload: str) -> None:
+        self.received.append(payload)
+
+    async def close(self) -> None:
+        return None
+
+
+def _notification() -> Notification:
+    return Notification(notification_id="n1", notification_type="review_assigned", title="t", body="b")
+
+
+def _cluster(hub: _Hub, presence: Any, replica_ids: list[str]) -> list[ClusteredNotificationManager]:
+    return [
+        ClusteredNotificationManager(WebSocketNotificationManager(), hub.bus(), presence, replica_id=rid)
+        for rid in replica_ids
+    ]
+
+
+def test_targeted_send_only_reaches_replica_holding_the_user() -> None:
+    hub, presence = _Hub(), InMemoryPresenceStore()
+    a, b, c = _cluster(hub, presence, ["a", "b", "c"])
+    socket = _Socket()
+
+    async def scenario() -> None:
+        for replica in (a, b, c):
+            await replica.start()
+        await b.connect(socket, "expert-1")
+        await a.send_to_user("expert-1", _notification())
+        await b.local.flush(timeout=1)
+        for replica in (a, b, c):
+            await replica.close()
+
+    asyncio.run(scenario())
+
+    assert len(socket.received) == 1
+    assert hub.published == ["b"]
+    assert (b.stats.received, c.stats.received) == (1, 0)
+
+
+def test_local_or_absent_user_skips_the_bus() -> None:
+    hub, presence = _Hub(), InMemoryPresenceStore()
+    a, b = _cluster(hub, presence, ["a", "b"])
+    socket = _Socket()
+
+    async def scenario() -> int:
+        for replica in (a, b):
+            await replica.start()
+        await a.connect(socket, "expert-1")
+        sent = await a.send_to_user("expert-1", _notification())
+        await a.send_to_user("offline", _notification())
+        await a.local.flush(timeout=1)
+        return sent
+
+    assert asyncio.run(scenario()) == 1
+    assert hub.published == []
+    assert (a.stats.local_only, a.stats.no_presence) == (1, 1)
+    assert len(socket.received) == 1
+
+
+def test_broadcast_is_published_once_and_not_echoed_to_origin() -> None:
+    hub, presence = _Hub(), InMemoryPresenceStore()
+    a, b = _cluster(hub, presence, ["a", "b"])
+    on_a, on_b, excluded = _Socket(), _Socket(), _Socket()
+
+    async def scenario() -> None:
+        for replica in (a, b):
+            await replica.start()
+        await a.connect(on_a, "u1", topics={"province:42"})
+        await b.connect(on_b, "u2", topics={"province:42"})
+        await b.connect(excluded, "u3", topics={"province:42"})
+        await a.broadcast(_notification(), topic="province:42", exclude_user_ids={"u3"})
+        await a.local.flush(timeout=1)
+        await b.local.flush(timeout=1)
+
+    asyncio.run(scenario())
+
+    assert hub.published == [None]
+    assert (len(on_a.received), len(on_b.received), len(excluded.received)) == (1, 1, 0)
+
+
+def test_presence_is_removed_after_last_connection_closes() -> None:
+    presence = InMemoryPresenceStore()
+    (a,) = _cluster(_Hub(), presence, ["a"])
+
+    async def scenario() -> list[dict[str, set[str]]]:
+        first = await a.connect(_Socket(), "u1")
+        second = await a.connect(_Socket(), "u1")
+        snapshots = [await presence.replicas(["u1"])]
+        await a.disconnect(first)
+        snapshots.append(await presence.replicas(["u1"]))
+        await a.disconnect(second)
+        snapshots.append(await presence.replicas(["u1"]))
+        return snapshots
+
+    assert asyncio.run(scenario()) == [{"u1": {"a"}}, {"u1": {"a"}}, {}]
+
+
+def test_presence_failure_falls_back_to_broadcast_address() -> None:
+    class _BrokenPresence(InMemoryPresenceStore):
+        async def replicas(self, user_ids: Any) -> dict[str, set[str]]:
+            raise ConnectionError("redis down")
+
+    hub = _Hub()
+    a, b = _cluster(hub, _BrokenPresence(), ["a", "b"])
+    socket = _Socket()
+
+    async def scenario() -> None:
+        for replica in (a, b):
+            await replica.start()
+        await b.connect(socket, "expert-1")
+        await a.send_to_user("expert-1", _notification())
+        await b.local.flush(timeout=1)
+
+    asyncio.run(scenario())
+
+    assert hub.published == [None]
+    assert len(socket.received) == 1
+    assert a.stats.presence_errors == 1
+
+
+class _FakeRedisPipeline:
+    def __init__(self, zsets: dict[str, dict[str, float]]) -> None:
+        self.zsets = zsets
+        self.ops: list[Callable[[], Any]] = []
+
+    def zadd(self, key: str, mapping: dict[str, float]) -> None:
+        self.ops.append(lambda: self.zsets.setdefault(key, {}).update(mapping))
+
+    def expire(self, key: str, ttl: int) -> None:
+        self.ops.append(lambda: True)
+
+    def zrangebyscore(self, key: str, low: float, high: str) -> None:
+        self.ops.append(lambda: [m.encode() for m, score in self.zsets.get(key, {}).items() if score >= low])
+
+    async def execute(self) -> list[Any]:
+        return [op() for op in self.ops]
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.zsets: dict[str, dict[str, float]] = {}
+
+    def pipeline(self, transaction: bool) -> _FakeRedisPipeline:
+        return _FakeRedisPipeline(self.zsets)
+
+    async def zrem(self, key: str, member: str) -> None:
+        self.zsets.get(key, {}).pop(member, None)
+
+
+def test_redis_presence_expires_members_by_score() -> None:
+    now = [1_000.0]
+    store = RedisPresenceStore(_FakeRedis(), key_prefix="p:", ttl_seconds=60, clock=lambda: now[0])
+
+    async def scenario() -> list[dict[str, set[str]]]:
+        await store.add("u1", "a")
+        now[0] += 30
+        await store.refresh(["u1"], "b")
+        snapshots = [await store.replicas(["u1", "u2"])]
+        now[0] += 45  # a'nın kaydı doldu, b hâlâ geçerli
+        snapshots.append(await store.replicas(["u1"]))
+        return snapshots
+
+    assert asyncio.run(scenario()) == [{"u1": {"a", "b"}}, {"u1": {"b"}}]
+
+
+def test_shared_history_is_recorded_once_at_origin() -> None:
+    class _SharedHistory(InMemoryNotificationHistory):
+        shared = True
+
+    hub, presence, history = _Hub(), InMemoryPresenceStore(), _SharedHistory()
+    a, b = (
+        ClusteredNotificationManager(WebSocketNotificationManager(history=history), hub.bus(), presence, replica_id=rid)
+        for rid in ("a", "b")
+    )
+    socket = _Socket()
+
+    async def scenario() -> HistoryWindow:
+        for replica in (a, b):
+            await replica.start()
+        await b.connect(socket, "expert-1")
+        await a.send_to_user("expert-1", _notification())
+        await a.send_to_user("expert-1", _notification())
+        await b.local.flush(timeout=1)
+        return await history.since("expert-1", 0)
+
+    window = asyncio.run(scenario())
+
+    assert [seq for seq, _ in window.entries] == [1, 2]
+    assert [json.loads(p)["seq"] for p in socket.received] == [1, 2]
+
+
+def test_shared_history_broadcast_is_not_recorded_again_by_receivers() -> None:
+    class _SharedHistory(InMemoryNotificationHistory):
+        shared = True
+
+    hub, presence, history = _Hub(), InMemoryPresenceStore(), _SharedHistory()
+    a, b = (
+        ClusteredNotificationManager(WebSocketNotificationManager(history=history), hub.bus(), presence, replica_id=rid)
+        for rid in ("a", "b")
+    )
+    tab_a, tab_b, remote_only = _Socket(), _Socket(), _Socket()
+
+    async def scenario() -> list[HistoryWindow]:
+        for replica in (a, b):
+            await replica.start()
+        await a.connect(tab_a, "u1")
+        await b.connect(tab_b, "u1")
+        await b.connect(remote_only, "u2")
+        await a.broadcast(_notification())
+        await a.local.flush(timeout=1)
+        await b.local.flush(timeout=1)
+        return [await history.since(user_id, 0) for user_id in ("u1", "u2")]
+
+    u1_window, u2_window = asyncio.run(scenario())
+
+    assert [seq for seq, _ in u1_window.entries] == [1]
+    assert [seq for seq, _ in u2_window.entries] == [1]
+    assert [json.loads(p)["seq"] for p in (*tab_a.received, *tab_b.received)] == [1, 1]
+    assert [json.loads(p)["seq"] for p in remote_only.received] == [1]
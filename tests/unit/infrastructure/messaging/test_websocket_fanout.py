@@ -0,0 +1,147 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: WebSocketNotificationManager fan-out (tek serileştirme, topic, drop-oldest, timeout) testleri.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+from src.infrastructure.messaging.websocket import notification_manager as manager_module
+from src.infrastructure.messaging.websocket.notification_manager import (
+    Notification,
+    WebSocketNotificationManager,
+)
+
+
+class _Socket:
+    def __init__(self, gate: asyncio.Event | None = None) -> None:
+        self.gate = gate
+        self.received: list[str] = []
+        self.closed = False
+
+    async def send_text(self, payload: str) -> None:
+        if self.gate is not None:
+            await self.gate.wait()
+        self.received.append(payload)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _alert(n: int = 0) -> Notification:
+    return Notification(
+        notification_id=f"n{n}",
+        notification_type="weather_alert",
+        title="Dolu uyarısı",
+        body="Konya için dolu bekleniyor",
+    )
+
+
+def test_broadcast_serializes_once_and_only_walks_topic_subscribers(monkeypatch: Any) -> None:
+    calls: list[Any] = []
+    real_dumps = json.dumps
+
+    def counting_dumps(obj: Any, **kwargs: Any) -> str:
+        calls.append(obj)
+        return real_dumps(obj, **kwargs)
+
+    monkeypatch.setattr(manager_module.json, "dumps", counting_dumps)
+    manager = WebSocketNotificationManager()
+    konya = [_Socket() for _ in range(3)]
+    ankara = _Socket()
+
+    async def scenario() -> int:
+        for i, socket in enumerate(konya):
+            await manager.connect(socket, f"u{i}", topics={"province:42"})
+        await manager.connect(ankara, "u9", topics={"province:06"})
+        sent = await manager.broadcast(_alert(), topic="province:42", exclude_user_ids={"u2"})
+        await manager.flush(timeout=1)
+        await manager.close_all()
+        return sent
+
+    assert asyncio.run(scenario()) == 2
+    assert len(calls) == 1
+    assert [len(s.received) for s in konya] == [1, 1, 0]
+    assert ankara.received == []
+    assert manager.topic_connection_count("province:42") == 0  # close_all abonelikleri temizler
+
+
+def test_slow_client_does_not_delay_others_and_is_dropped_on_timeout() -> None:
+    manager = WebSocketNotificationManager(send_timeout_seconds=0.05)
+    stuck = _Socket(gate=asyncio.Event())  # hiç açılmayan kapı
+    fast = [_Socket() for _ in range(5)]
+
+    async def scenario() -> None:
+        await manager.connect(stuck, "slow")
+        for i, socket in enumerate(fast):
+            await manager.connect(socket, f"u{i}")
+        await manager.broadcast(_alert())
+        await manager.flush(timeout=1)
+
+    asyncio.run(scenario())
+
+    assert all(len(s.received) == 1 for s in fast)
+    assert not manager.is_user_connected("slow")
+    assert manager.active_connection_count == 5
+    assert manager.fanout_stats.timeouts == 1
+    assert manager.fanout_stats.sent == 5
+
+
+def test_outbound_queue_drops_oldest_when_full() -> None:
+    manager = WebSocketNotificationManager(outbound_queue_size=2)
+    socket = _Socket()
+
+    async def scenario() -> None:
+        await manager.connect(socket, "u1")
+        # Enqueue await noktası içermez; writer çalışmadan beş mesaj da kuyruğa girer
+        for n in range(5):
+            await manager.send_to_user("u1", _alert(n))
+        await manager.flush(timeout=1)
+        await manager.close_all()
+
+    asyncio.run(scenario())
+
+    delivered = [json.loads(p)["notification_id"] for p in socket.received]
+    assert delivered == ["n3", "n4"]
+    assert manager.fanout_stats.dropped == 3
+
+
+def test_send_concurrency_is_bounded() -> None:
+    manager = WebSocketNotificationManager(max_concurrent_sends=2)
+    active = 0
+    peak = 0
+
+    class _Tracking(_Socket):
+        async def send_text(self, payload: str) -> None:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            self.received.append(payload)
+
+    sockets = [_Tracking() for _ in range(6)]
+
+    async def scenario() -> None:
+        for i, socket in enumerate(sockets):
+            await manager.connect(socket, f"u{i}")
+        await manager.broadcast(_alert())
+        await manager.flush(timeout=1)
+        await manager.close_all()
+
+    asyncio.run(scenario())
+
+    assert peak == 2
+    assert all(len(s.received) == 1 for s in sockets)
@@ -0,0 +1,177 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-081: Kullanıcı başına seq'li bildirim geçmişi ve resume handshake testleri.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Callable
+
+from src.infrastructure.messaging.websocket.history import (
+    HistoryWindow,
+    InMemoryNotificationHistory,
+    RedisNotificationHistory,
+)
+from src.infrastructure.messaging.websocket.notification_manager import (
+    Notification,
+    WebSocketNotificationManager,
+)
+
+
+class _Socket:
+    def __init__(self) -> None:
+        self.received: list[dict[str, Any]] = []
+
+    async def send_text(self, payload: str) -> None:
+        self.received.append(json.loads(payload))
+
+    async def close(self) -> None:
+        return None
+
+
+def _notification(n: int) -> Notification:
+    return Notification(notification_id=f"n{n}", notification_type="review_assigned", title="t", body="b")
+
+
+def test_ring_buffer_assigns_per_user_sequences_and_reports_gaps() -> None:
+    history = InMemoryNotificationHistory(per_user_size=3)
+
+    async def scenario() -> list[Any]:
+        for n in range(5):
+            await history.append(["u1"], f'{{"n":{n}}}')
+        first = await history.append(["u1", "u2"], "{}")
+        return [
+            first,
+            await history.since("u1", 4),
+            await history.since("u1", 1),  # 2 ve 3 taştı
+            await history.since("u3", 7),  # store bu kullanıcıyı hiç görmedi (restart)
+        ]
+
+    first, recent, overflowed, reset = asyncio.run(scenario())
+
+    assert first == {"u1": 6, "u2": 1}
+    assert recent == HistoryWindow(entries=[(5, '{"n":4}'), (6, "{}")], gap=False)
+    assert [seq for seq, _ in overflowed.entries] == [4, 5, 6]
+    assert overflowed.gap is True
+    assert reset == HistoryWindow(gap=True)
+
+
+def test_reconnect_with_resume_replays_missed_notifications_in_order() -> None:
+    manager = WebSocketNotificationManager()
+    before, after = _Socket(), _Socket()
+
+    async def scenario() -> None:
+        conn_id = await manager.connect(before, "u1")
+        for n in range(3):
+            await manager.send_to_user("u1", _notification(n))
+        await manager.flush(timeout=1)
+        await manager.disconnect(conn_id)
+        for n in range(3, 5):
+            await manager.send_to_user("u1", _notification(n))  # bağlı değil, yalnızca geçmiş
+        await manager.connect(after, "u1", resume_from=before.received[-1]["seq"])
+        await manager.send_to_user("u1", _notification(5))
+        await manager.flush(timeout=1)
+        await manager.close_all()
+
+    asyncio.run(scenario())
+
+    assert [m["seq"] for m in before.received] == [1, 2, 3]
+    assert after.received[0] == {"type": "resume", "from_seq": 3, "replayed": 2, "gap": False}
+    assert [(m["seq"], m["notification_id"]) for m in after.received[1:]] == [(4, "n3"), (5, "n4"), (6, "n5")]
+
+
+def test_live_notification_during_replay_is_not_duplicated() -> None:
+    gate = asyncio.Event()
+
+    class _SlowHistory(InMemoryNotificationHistory):
+        async def since(self, user_id: str, seq: int) -> HistoryWindow:
+            await gate.wait()
+            return await super().since(user_id, seq)
+
+    manager = WebSocketNotificationManager(history=_SlowHistory())
+    socket = _Socket()
+
+    async def scenario() -> None:
+        await manager.send_to_user("u1", _notification(0))
+        connecting = asyncio.create_task(manager.connect(socket, "u1", resume_from=0))
+        await asyncio.sleep(0)  # connect geçmiş okumasında bekliyor
+        await manager.send_to_user("u1", _notification(1))
+        gate.set()
+        await connecting
+        await manager.flush(timeout=1)
+        await manager.close_all()
+
+    asyncio.run(scenario())
+
+    assert socket.received[0]["type"] == "resume"
+    assert [m["seq"] for m in socket.received[1:]] == [1, 2]
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self.redis = redis
+        self.ops: list[Callable[[], Any]] = []
+
+    def xrange(self, key: str, min: str, max: str, count: int | None = None) -> None:
+        def _op() -> list[tuple[bytes, dict[bytes, bytes]]]:
+            low = int(min.split("-")[0]) if min != "-" else 0
+            rows = [(f"{s}-0".encode(), {b"p": p.encode()}) for s, p in self.redis.streams.get(key, []) if s >= low]
+            return rows[:count] if count else rows
+
+        self.ops.append(_op)
+
+    def get(self, key: str) -> None:
+        self.ops.append(lambda: str(self.redis.counters[key]).encode() if key in self.redis.counters else None)
+
+    async def execute(self) -> list[Any]:
+        return [op() for op in self.ops]
+
+
+class _FakeRedis:
+    """INCR + XADD MAXLEN script'ini taklit eden asgari Redis."""
+
+    def __init__(self) -> None:
+        self.streams: dict[str, list[tuple[int, str]]] = {}
+        self.counters: dict[str, int] = {}
+
+    def register_script(self, script: str) -> Callable[..., Any]:
+        async def _run(keys: list[str], args: list[Any], client: _FakePipeline) -> None:
+            def _op() -> int:
+                seq = self.counters[keys[1]] = self.counters.get(keys[1], 0) + 1
+                stream = self.streams.setdefault(keys[0], [])
+                stream.append((seq, args[0]))
+                del stream[: max(0, len(stream) - int(args[1]))]
+                return seq
+
+            client.ops.append(_op)
+
+        return _run
+
+    def pipeline(self, transaction: bool) -> _FakePipeline:
+        return _FakePipeline(self)
+
+
+def test_redis_history_reads_stream_after_sequence() -> None:
+    history = RedisNotificationHistory(_FakeRedis(), key_prefix="h:", per_user_size=2)
+
+    async def scenario() -> list[Any]:
+        seqs = [await history.append(["u1", "u2"], f'{{"n":{n}}}') for n in range(3)]
+        return [seqs[-1], await history.since("u1", 2), await history.since("u1", 0)]
+
+    last, recent, overflowed = asyncio.run(scenario())
+
+    assert last == {"u1": 3, "u2": 3}
+    assert recent == HistoryWindow(entries=[(3, '{"n":2}')], gap=False)
+    assert [seq for seq, _ in overflowed.entries] == [2, 3]
+    assert overflowed.gap is True
@@ -0,0 +1,79 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-013: PostgisFieldSpatialIndex sorgu kurulumu (fields.boundary, GiST operatörleri) testleri.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+from typing import Any
+
+from src.infrastructure.persistence.sqlalchemy.repositories.field_spatial_index_impl import (
+    FIELDS_BOUNDARY_GIST_INDEX_DDL,
+    PostgisFieldSpatialIndex,
+)
+
+
+class _Session:
+    """AsyncSession.execute yerine geçer; SQL metnini ve parametreleri kaydeder."""
+
+    def __init__(self, rows: list[Any]) -> None:
+        self.rows = rows
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    async def execute(self, statement: Any, params: dict[str, Any] | None = None) -> list[Any]:
+        self.calls.append((str(statement), params or {}))
+        return self.rows
+
+
+def _index(rows: list[Any], **kwargs: Any) -> tuple[PostgisFieldSpatialIndex, _Session]:
+    session = _Session(rows)
+    return PostgisFieldSpatialIndex(session, **kwargs), session  # type: ignore[arg-type]
+
+
+def test_bbox_query_filters_boundary_with_gist_operator() -> None:
+    field_id = uuid.uuid4()
+    index, session = _index([SimpleNamespace(field_id=field_id)])
+
+    result = asyncio.run(index.find_by_bbox(32.0, 39.0, 33.0, 40.0))
+
+    [(sql, params)] = session.calls
+    assert result == [field_id]
+    assert "boundary && ST_MakeEnvelope" in sql and "ST_Intersects(boundary" in sql
+    assert "geometry &&" not in sql
+    assert params == {"min_lon": 32.0, "min_lat": 39.0, "max_lon": 33.0, "max_lat": 40.0}
+
+
+def test_nearest_query_orders_by_knn_and_widens_candidates() -> None:
+    first, second = uuid.uuid4(), uuid.uuid4()
+    rows = [SimpleNamespace(field_id=first, distance_m=0), SimpleNamespace(field_id=second, distance_m="12.5")]
+    index, session = _index(rows, candidate_factor=3)
+
+    result = asyncio.run(index.find_nearest(32.5, 39.5, k=2))
+
+    [(sql, params)] = session.calls
+    assert "ORDER BY boundary <-> ST_SetSRID" in sql and "boundary::geography" in sql
+    assert params == {"lon": 32.5, "lat": 39.5, "k": 2, "candidates": 6}
+    assert [(d.field_id, d.distance_m) for d in result] == [(first, 0.0), (second, 12.5)]
+    assert asyncio.run(index.find_nearest(32.5, 39.5, k=0)) == []
+    assert len(session.calls) == 1
+
+
+def test_ensure_index_reuses_geoalchemy_index_name() -> None:
+    index, session = _index([])
+
+    asyncio.run(index.ensure_index())
+
+    assert session.calls == [(FIELDS_BOUNDARY_GIST_INDEX_DDL, {})]
+    assert "IF NOT EXISTS idx_fields_boundary ON fields USING GIST (boundary)" in FIELDS_BOUNDARY_GIST_INDEX_DDL
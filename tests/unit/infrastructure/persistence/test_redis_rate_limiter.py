@@ -0,0 +1,102 @@
+# BOUND: TARLAANALIZ_SSOT_v1_2_0.txt – canonical rules are referenced, not duplicated.
+# KR-041: RedisRateLimitStore (GCRA script, lokal ön-tahsis, fail-open) testleri.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable
+
+import pytest
+
+from src.infrastructure.persistence.redis.rate_limiter import RedisRateLimitStore
+
+
+class _FakeRedis:
+    """GCRA Lua script'ini Python'da taklit eden asgari Redis; saat testten sürülür."""
+
+    def __init__(self) -> None:
+        self.now_ms = 1_700_000_000_000
+        self.tat: dict[str, int] = {}
+        self.calls = 0
+        self.down = False
+
+    def register_script(self, script: str) -> Callable[..., Any]:
+        async def _run(keys: list[str], args: list[int]) -> list[int]:
+            if self.down:
+                raise ConnectionError("redis down")
+            self.calls += 1
+            interval, tolerance, quantity = args
+            tat = max(self.tat.get(keys[0], 0), self.now_ms)
+            granted = min(quantity, (self.now_ms + tolerance + interval - tat) // interval)
+            if granted < 1:
+                return [0, tat - tolerance - self.now_ms]
+            self.tat[keys[0]] = tat + granted * interval
+            return [granted, 0]
+
+        return _run
+
+
+def _check(store: RedisRateLimitStore, key: str = "ip:u1", now: float = 0.0, per_minute: int = 6) -> tuple[bool, int]:
+    return asyncio.run(store.allow(key, now, per_minute, 0))
+
+
+def test_limit_is_shared_across_replicas() -> None:
+    redis = _FakeRedis()
+    replicas = [RedisRateLimitStore(redis) for _ in range(3)]
+
+    decisions = [_check(replicas[n % 3]) for n in range(8)]
+
+    assert [allowed for allowed, _ in decisions] == [True] * 6 + [False] * 2
+    assert decisions[-1][1] == 10  # 60 sn / 6 istek: sonraki token 10 sn sonra
+    assert len(redis.tat) == 1
+
+
+def test_tokens_refill_at_emission_interval() -> None:
+    redis = _FakeRedis()
+    store = RedisRateLimitStore(redis)
+    for _ in range(6):
+        _check(store)
+
+    redis.now_ms += 10_000
+    assert [_check(store)[0] for _ in range(2)] == [True, False]
+
+
+def test_prefetch_serves_hot_key_locally() -> None:
+    redis = _FakeRedis()
+    store = RedisRateLimitStore(redis, max_prefetch=8, lease_seconds=5)
+
+    decisions = [_check(store, per_minute=100, now=0.1 * n) for n in range(15)]
+
+    assert all(allowed for allowed, _ in decisions)
+    # Parti boyları 1, 2, 4, 8 -> 15 istek için 4 round trip
+    assert redis.calls == 4
+    assert store.stats.local_hits == 11
+
+
+def test_prefetch_never_exceeds_shared_limit() -> None:
+    redis = _FakeRedis()
+    replicas = [RedisRateLimitStore(redis, max_prefetch=4, lease_seconds=5) for _ in range(2)]
+
+    allowed = sum(_check(replicas[n % 2], per_minute=10, now=0.01 * n)[0] for n in range(40))
+
+    assert allowed <= 10
+
+
+def test_redis_failure_fails_open_by_default() -> None:
+    redis = _FakeRedis()
+    redis.down = True
+
+    assert _check(RedisRateLimitStore(redis)) == (True, 0)
+    with pytest.raises(ConnectionError):
+        _check(RedisRateLimitStore(redis, fail_open=False))